@@ -4,13 +4,13 @@ from __future__ import annotations
 import glob
 import logging
 import os
+import time
 from typing import TYPE_CHECKING
 
 import numpy as np
-from juliacall import Main as jl
-from juliacall import convert
 from scipy.interpolate import PchipInterpolator
 
+from proteus.atmos_clim import profile_library, spectral_cache
 from proteus.atmos_clim.common import clip_radius_to_hill, get_oarr_from_parr, get_spfile_path
 from proteus.utils.constants import gas_list, noble_gases
 from proteus.utils.helper import (
@@ -20,8 +20,14 @@ from proteus.utils.helper import (
     multiple,
     safe_rm,
 )
+from proteus.utils.julia_sysimage import active_sysimage, select_sysimage
 from proteus.utils.logs import GetCurrentLogfileIndex, GetLogfilePath
 
+# Julia starts with the first juliacall import, so pick its sysimage before it
+select_sysimage()
+from juliacall import Main as jl  # noqa: E402
+from juliacall import convert  # noqa: E402
+
 if TYPE_CHECKING:
     from proteus.config import Config
 
@@ -92,6 +98,14 @@ class AgniSchemaMismatch(RuntimeError):
     """
 
 
+def _agni_version() -> str | None:
+    """Return the version of the loaded AGNI, or None if it cannot be read."""
+    try:
+        return str(jl.AGNI.consts.AGNI_VERSION)
+    except Exception:
+        return None
+
+
 def _check_agni_schema(atmos) -> None:
     """Verify the live Atmos_t carries every field PROTEUS reads.
 
@@ -103,10 +117,7 @@ def _check_agni_schema(atmos) -> None:
     missing = [name for name in _REQUIRED_ATMOS_FIELDS if not hasattr(atmos, name)]
     if not missing:
         return
-    try:
-        version = str(jl.AGNI.consts.AGNI_VERSION)
-    except Exception:
-        version = 'unknown'
+    version = _agni_version() or 'unknown'
     raise AgniSchemaMismatch(
         f'AGNI {version} Atmos_t is missing PROTEUS-required field(s): '
         f'{", ".join(missing)}. The AGNI pin in pyproject.toml may have '
@@ -349,6 +360,7 @@ def _validate_agni_state(atmos) -> tuple[bool, str]:
 
 def activate_julia(dirs: dict, verbosity: int):
     log.info('Activating Julia environment')
+    start = time.perf_counter()
     jl.seval('using Pkg')
     jl.Pkg.activate(dirs['agni'])
 
@@ -367,6 +379,12 @@ def activate_julia(dirs: dict, verbosity: int):
     jl.AGNI.setup_logging(logpath, verbosity)
 
     log.debug("AGNI will log to '%s'" % logpath)
+    image = active_sysimage()
+    log.info(
+        'Julia environment ready in %.1f s (%s)',
+        time.perf_counter() - start,
+        f'sysimage {image}' if image else 'default sysimage',
+    )
 
 
 def _construct_voldict(config: Config, hf_row: dict, dirs: dict):
@@ -496,6 +514,9 @@ def init_agni_atmos(dirs: dict, config: Config, hf_row: dict):
     ----------
         atmos : atmosphere.Atmos_t
             Atmosphere struct
+        seeded : bool
+            True if the initial profile came from the profile library, in
+            which case the first energy solve can skip its easy start.
 
     """
 
@@ -552,6 +573,25 @@ def init_agni_atmos(dirs: dict, config: Config, hf_row: dict):
         input_sf = get_spfile_path(dirs['fwl'], config)
         input_star = sflux_path
 
+        # Reuse the file prepared for this spectrum before, if cached
+        spfile_key = None
+        if spectral_cache.cache_root() is not None:
+            version = _agni_version()
+            if version is None:
+                log.warning('Cannot read the AGNI version; spectral file not cached')
+            else:
+                spfile_key = spectral_cache.entry_key(
+                    'agni-' + version,
+                    input_sf,
+                    sflux_path,
+                    rayleigh=bool(config.atmos_clim.rayleigh),
+                    cloud=bool(config.atmos_clim.cloud_enabled),
+                    aerosols=bool(config.atmos_clim.aerosols_enabled),
+                )
+        if spectral_cache.fetch(spfile_key, try_spfile):
+            input_sf = try_spfile
+            input_star = ''
+
     # Fast I/O folder
     if (config.atmos_clim.agni.verbosity >= 2) or (config.params.out.logging == 'DEBUG'):
         io_dir = dirs['output']
@@ -666,6 +706,8 @@ def init_agni_atmos(dirs: dict, config: Config, hf_row: dict):
     if not bool(succ):
         UpdateStatusfile(dirs, 22)
         raise RuntimeError('Could not allocate atmosphere object')
+    if input_star:
+        spectral_cache.store(spfile_key, try_spfile)
 
     # Confirm the live Atmos_t carries every field PROTEUS reads
     _check_agni_schema(atmos)
@@ -678,22 +720,68 @@ def init_agni_atmos(dirs: dict, config: Config, hf_row: dict):
         nc_times = [int(s.split('/')[-1].split('_')[0]) for s in nc_files]
         nc_path = os.path.join(dirs['output'], 'data', f'{sorted(nc_times)[-1]:.0f}_atm.nc')
         jl.AGNI.setpt.fromncdf_b(atmos, nc_path)
+        seeded = False
 
     # Otherwise, set profile initial guess
     else:
-        _set_guess_profile(atmos, hf_row, dirs, config)
+        seeded = _set_guess_profile(atmos, hf_row, dirs, config)
 
     # Logging
     sync_log_files(dirs['output'])
 
-    return atmos
+    return atmos, seeded
+
+
+def _set_library_profile(atmos, hf_row: dict, config: Config) -> bool:
+    """Set the temperature profile from the nearest stored converged profile.
+
+    Parameters
+    ----------
+        atmos : AGNI.atmosphere.Atmos_t
+            AGNI atmosphere struct, with its pressure grid already generated
+        hf_row : dict
+            Dictionary containing simulation variables for current iteration
+        config: Config
+            PROTEUS config object
+
+    Returns
+    ----------
+        seeded : bool
+            True if the profile library held a usable neighbour.
+    """
+
+    stored = profile_library.lookup_profile(config, hf_row)
+    if stored is None:
+        return False
+    p_lib, t_lib = stored
+    usable, reason = _validate_stored_profile(p_lib, t_lib)
+    if not usable:
+        log.warning('Ignoring stored AGNI profile: %s', reason)
+        return False
+
+    # Held constant beyond the ends of the stored grid
+    logp = np.log10(p_lib)
+    itp = PchipInterpolator(logp, t_lib)
+    tmp_max = max(1000, float(hf_row['T_magma']))
+
+    def _at(p):
+        return float(min(tmp_max, itp(np.clip(np.log10(p), logp[0], logp[-1]))))
+
+    nlev_c = len(atmos.tmp)
+    for i in range(nlev_c):
+        atmos.tmp[i] = _at(atmos.p[i])
+        atmos.tmpl[i] = _at(atmos.pl[i])
+    atmos.tmpl[-1] = _at(atmos.pl[-1])
+    return True
 
 
 def _set_guess_profile(atmos, hf_row: dict, dirs: dict, config: Config):
     """Set the temperature profile to the initial guess requested in the config.
 
     The guess is anchored on the surface boundary condition, so it needs no
-    usable temperature structure on the struct beforehand.
+    usable temperature structure on the struct beforehand. With a profile
+    library (``PROTEUS_AGNI_PROFILE_DIR``) holding a converged profile near
+    the current state, that profile is used instead.
 
     Parameters
     ----------
@@ -705,8 +793,17 @@ def _set_guess_profile(atmos, hf_row: dict, dirs: dict, config: Config):
             Directories dictionary
         config: Config
             PROTEUS config object
+
+    Returns
+    ----------
+        seeded : bool
+            True if the profile came from the profile library.
     """
 
+    if _set_library_profile(atmos, hf_row, config):
+        log.info('Initialising T(p) from the AGNI profile library')
+        return True
+
     log.info(f'Initialising T(p) as {config.atmos_clim.agni.ini_profile}')
     match config.atmos_clim.agni.ini_profile:
         case 'loglinear':
@@ -723,6 +820,7 @@ def _set_guess_profile(atmos, hf_row: dict, dirs: dict, config: Config):
 
     # lower-limit on initial profile
     jl.AGNI.setpt.stratosphere_b(atmos, min(400.0, hf_row['T_surf']))
+    return False
 
 
 def deallocate_atmos(atmos):
@@ -886,6 +984,8 @@ def _rebuild_agni_profile(atmos, hf_row: dict, dirs: dict, config: Config, reaso
     # The guess routines write onto the new grid, so lay it down first
     _apply_surface_pressure(atmos, p_surf)
 
+    # Replaces a profile that has been solved before, so the solve that
+    # follows is not counted as seeded even when the library supplies it
     _set_guess_profile(atmos, hf_row, dirs, config)
 
     return atmos
@@ -1000,7 +1100,7 @@ def update_agni_atmos(atmos, hf_row: dict, dirs: dict, config: Config):
     return atmos
 
 
-def _solve_energy(atmos, loops_total: int, dirs: dict, config: Config):
+def _solve_energy(atmos, loops_total: int, dirs: dict, config: Config, seeded: bool = False):
     """Use AGNI to solve for energy-conserving solution.
 
     Parameters
@@ -1013,6 +1113,9 @@ def _solve_energy(atmos, loops_total: int, dirs: dict, config: Config):
             Dictionary containing paths to directories
         config : Config
             Configuration options and other variables
+        seeded : bool, optional
+            Whether the profile was seeded from the profile library, in which
+            case the first solve of the run needs no easy start.
 
     Returns
     ----------
@@ -1057,7 +1160,7 @@ def _solve_energy(atmos, loops_total: int, dirs: dict, config: Config):
             max_steps = 200
 
         # parameters for the first iteration
-        if loops_total == 0:
+        if loops_total == 0 and not seeded:
             easy_start = True
 
         # try different solver parameters if struggling
@@ -1081,7 +1184,8 @@ def _solve_energy(atmos, loops_total: int, dirs: dict, config: Config):
             easy_start = True
 
         else:
-            # Max attempts
+            # Max attempts; this pass made none of its own
+            attempts -= 1
             log.error('Maximum attempts when executing AGNI')
             break
 
@@ -1180,6 +1284,10 @@ def _solve_energy(atmos, loops_total: int, dirs: dict, config: Config):
             reason = _extract_agni_failure_reason(log_lines)
             log.warning('Attempt %d failed (reason: %s)', attempts, reason)
 
+    # compare solver effort with and without a seeding profile
+    if profile_library.library_root() is not None:
+        profile_library.record_solve(seeded, attempts)
+
     return atmos, bool(agni_success)
 
 
@@ -1284,7 +1392,13 @@ def write_atmos_ncdf(atmos, dirs: dict, time: float) -> None:
 
 
 def run_agni(
-    atmos, loops_total: int, dirs: dict, config: Config, hf_row: dict, write_data: bool = True
+    atmos,
+    loops_total: int,
+    dirs: dict,
+    config: Config,
+    hf_row: dict,
+    write_data: bool = True,
+    seeded: bool = False,
 ):
     """Run AGNI atmosphere model.
 
@@ -1305,6 +1419,9 @@ def run_agni(
             Dictionary containing simulation variables for current iteration
         write_data : bool, optional
             Whether to write AGNI output to NetCDF.
+        seeded : bool, optional
+            Whether the profile was seeded from the profile library, as
+            returned by `init_agni_atmos`.
 
     Returns
     ----------
@@ -1342,7 +1459,16 @@ def run_agni(
         # full solver
         if config.atmos_clim.agni.solve_energy:
             log.info('Using nonlinear solver to conserve fluxes')
-            atmos, agni_converged = _solve_energy(atmos, loops_total, dirs, config)
+            atmos, agni_converged = _solve_energy(
+                atmos, loops_total, dirs, config, seeded=seeded
+            )
+
+            # keep the converged profile for later runs near this state
+            if agni_converged and profile_library.library_root() is not None:
+                p_new = np.array(atmos.p, dtype=float)
+                t_new = np.array(atmos.tmp, dtype=float)
+                if _validate_stored_profile(p_new, t_new)[0]:
+                    profile_library.store_profile(config, hf_row, p_new, t_new)
 
         # simplified T(p)
         else:
@@ -77,6 +77,23 @@ class Atmos_t:
         # record means this run's own rows carry rejected levels too.
         self.solves_seen: int = 0
 
+        # Emulator table, loaded at the first emulated step. None under every
+        # other atmosphere module.
+        self._emulator = None
+
+        # Whether the stellar spectrum changed while the emulator answered, so
+        # that the next fallback solve rebuilds its struct on the new spectrum.
+        self.spectrum_pending: bool = False
+
+        # Whether AGNI took its new struct's profile from the profile library,
+        # so that the next energy solve skips its easy start. Cleared by that
+        # solve. Transient.
+        self.seeded: bool = False
+
+        # Linear-response surrogate of the AGNI solves of this run, created at
+        # the first solve when atmos_clim.agni.surrogate_tol > 0. Transient.
+        self._surrogate = None
+
 
 def ncdf_flag_to_bool(var) -> bool:
     """Convert NetCDF flag (y/n) to Python bool (true/false)"""
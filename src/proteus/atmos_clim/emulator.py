@@ -0,0 +1,747 @@
+# Tabulated atmosphere emulator
+"""Interpolate the atmosphere from a table of precomputed AGNI or JANUS solves.
+
+Each atmosphere step of a coupled run solves a radiative-convective column,
+and across a grid of runs most of those columns sit in the same corner of
+parameter space. The emulator answers a step from a table of converged solves
+instead: it interpolates the outgoing flux, albedo, surface temperature and
+the photospheric and XUV levels among the nearest tabulated states, with a
+fit that is exact for quantities linear in the table coordinates. The table
+is indexed by
+
+- the temperature at the bottom of the atmosphere, ``T_magma`` (``T_surf``
+  itself when ``surf_state = 'fixed'``, which is ``T_magma`` except under the
+  boundary interior),
+- the surface pressure, the instellation and the surface gravity, each in
+  decades,
+- the composition: the volume mixing ratios of the tabulated gases,
+  renormalised to one, the last of them dropped as redundant.
+
+An axis along which the whole table is constant is dropped, and a query must
+then lie on it. A state outside the box spanned by its nearest tabulated
+states, or one holding more than ``VMR_TOLERANCE`` of gases the table lacks,
+is not extrapolated:
+:func:`run_emulator` returns None and the wrapper solves it with the fallback
+module (``atmos_clim.emulator.fallback``) instead, logging that it did.
+
+The levels are tabulated as heights above the surface, at the reference
+radius the table was generated at (``R_earth``), and the XUV level at the
+``p_xuv`` the generating config's escape module sets. The table records the
+settings it was solved with (:func:`table_settings`): the solver and its
+physics options, the spectral file and the star; a run whose settings differ
+in any of them refuses the table. There are no profiles to write or plot, and
+no ocean diagnostics.
+
+:func:`generate_table` builds a table by solving a design of states
+(:func:`design_points`) with the config's own solver, in parallel;
+``tools/generate_atmos_emulator.py`` wraps it for the command line.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from proteus.atmos_clim.common import Atmos_t, clip_radius_to_hill
+from proteus.utils.constants import R_earth, const_G, const_sigma, gas_list
+from proteus.utils.helper import UpdateStatusfile, eval_gas_mmw
+
+if TYPE_CHECKING:
+    from proteus.config import Config
+
+log = logging.getLogger('fwl.' + __name__)
+
+# Bump when the table layout changes
+TABLE_FORMAT_VERSION = 2
+
+# Coordinates of a tabulated state, followed by the mixing ratio of each gas
+INPUT_KEYS = ('T_magma', 'P_surf', 'F_ins', 'gravity')
+
+# Tabulated quantities; the z_ keys are level heights above the surface [m]
+OUTPUT_KEYS = (
+    'F_atm',
+    'F_olr',
+    'F_sct',
+    'albedo',
+    'T_surf',
+    'z_obs',
+    'T_obs',
+    'z_xuv',
+    'T_xuv',
+)
+
+# Largest mixing ratio of untabulated gases a query may hold
+VMR_TOLERANCE = 1e-3
+
+# Relative tolerance for a query on an axis the table holds constant
+_FIXED_RTOL = 1e-6
+
+# Tabulated states each query is interpolated among, per varying axis plus one
+NEIGHBOURS_PER_AXIS = 4
+
+# Solver options that steer the iteration or the output, not the solution
+_CONTROL_OPTIONS = {
+    'agni': (
+        'verbosity',
+        'solution_atol',
+        'solution_rtol',
+        'dx_max',
+        'dx_max_ini',
+        'max_steps',
+        'perturb_all',
+        'ini_profile',
+        'ls_default',
+        'fdo',
+        'check_safe_gas',
+        'fastchem_maxiter_chem',
+        'fastchem_maxiter_solv',
+        'surrogate_tol',
+        'surrogate_trust',
+        'surrogate_max_skips',
+    ),
+    'janus': (),
+}
+
+# State of a generator worker process, set by _init_worker
+_worker: dict = {}
+
+
+class OutsideTableError(ValueError):
+    """The queried state lies outside what the emulator table covers."""
+
+
+def _features(points: np.ndarray) -> np.ndarray:
+    """Map table coordinates to the space the table is interpolated in."""
+    points = np.atleast_2d(np.asarray(points, dtype=float))
+    vmr = points[:, len(INPUT_KEYS) :]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        comp = vmr / vmr.sum(axis=1, keepdims=True)
+        return np.column_stack(
+            (
+                points[:, 0],
+                np.log10(points[:, 1]),
+                np.log10(points[:, 2]),
+                np.log10(points[:, 3]),
+                comp[:, :-1],
+            )
+        )
+
+
+class _LocalLinear:
+    """Interpolation among the nearest tabulated states.
+
+    Each query is answered by a linear radial basis function with a linear
+    polynomial term, fitted to its ``NEIGHBOURS_PER_AXIS * (ndim + 1)``
+    nearest states in coordinates scaled to the span of the table. The fit
+    reproduces quantities linear in the coordinates exactly. Building it
+    costs only a k-d tree, however many axes vary, and a query solves one
+    small linear system.
+    """
+
+    def __init__(self, feats: np.ndarray, values: np.ndarray):
+        from scipy.interpolate import RBFInterpolator
+        from scipy.spatial import cKDTree
+
+        ndim = feats.shape[1]
+        if len(feats) < ndim + 1:
+            raise ValueError(
+                f'Emulator table holds {len(feats)} states, too few to interpolate '
+                f'along {ndim} axes'
+            )
+        self._lo = feats.min(axis=0)
+        self._scale = np.ptp(feats, axis=0)
+        self._z = (feats - self._lo) / self._scale
+        self._k = min(len(feats), NEIGHBOURS_PER_AXIS * (ndim + 1))
+        self._nout = values.shape[1]
+        self._tree = cKDTree(self._z)
+        self._rbf = RBFInterpolator(
+            self._z, values, neighbors=self._k, kernel='linear', degree=1
+        )
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        z = (x - self._lo) / self._scale
+        # Refuse what would be extrapolated from the states around the query
+        _, idx = self._tree.query(z, k=self._k)
+        near = self._z[np.atleast_1d(idx)]
+        if np.any(z < near.min(axis=0) - 1e-9) or np.any(z > near.max(axis=0) + 1e-9):
+            return np.full(self._nout, np.nan)
+        try:
+            return self._rbf(z[None, :])[0]
+        except np.linalg.LinAlgError:
+            return np.full(self._nout, np.nan)
+
+
+class EmulatorTable:
+    """Table of converged atmosphere solves, interpolated among its nearest states.
+
+    Attributes
+    ----------
+    points : numpy.ndarray
+        Coordinates of the tabulated states, shape (N, 4 + G): ``INPUT_KEYS``,
+        then the mixing ratio of each of `gases`.
+    values : numpy.ndarray
+        Solved quantities, shape (N, len(OUTPUT_KEYS)).
+    gases : tuple of str
+        Tabulated gases.
+    metadata : dict
+        Settings the table was generated with, as returned by
+        `table_settings`.
+    hits, misses : int
+        Queries this table answered and refused.
+    """
+
+    def __init__(self, points, values, gases, metadata: dict | None = None):
+        self.points = np.atleast_2d(np.asarray(points, dtype=float))
+        self.values = np.atleast_2d(np.asarray(values, dtype=float))
+        self.gases = tuple(str(g) for g in gases)
+        self.metadata = dict(metadata or {})
+
+        if len(self.points) == 0:
+            raise ValueError('Emulator table holds no states')
+        if self.points.shape[1] != len(INPUT_KEYS) + len(self.gases):
+            raise ValueError('Emulator table coordinates do not match its gases')
+        if self.values.shape != (len(self.points), len(OUTPUT_KEYS)):
+            raise ValueError('Emulator table values do not match its coordinates')
+
+        # Drop the axes the table does not vary along
+        names = INPUT_KEYS + self.gases[:-1]
+        feats = _features(self.points)
+        if not np.all(np.isfinite(feats)):
+            raise ValueError('Emulator table holds non-positive coordinates')
+        span = np.ptp(feats, axis=0)
+        self._active = span > 1e-9 * np.maximum(1.0, np.abs(feats).max(axis=0))
+        self._fixed = feats[0, ~self._active]
+        self._fixed_names = [n for n, a in zip(names, self._active) if not a]
+        self._feats = feats[:, self._active]
+        self._interp = None
+
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, path: str) -> EmulatorTable:
+        """Read a table written by `save`."""
+        with np.load(path) as data:
+            version = int(data['format'])
+            if version != TABLE_FORMAT_VERSION:
+                raise ValueError(
+                    f'Emulator table {path} has format {version}, '
+                    f'expected {TABLE_FORMAT_VERSION}; regenerate it'
+                )
+            if tuple(str(k) for k in data['outputs']) != OUTPUT_KEYS:
+                raise ValueError(f'Emulator table {path} tabulates other quantities')
+            return cls(
+                data['points'],
+                data['values'],
+                [str(g) for g in data['gases']],
+                json.loads(str(data['metadata'])),
+            )
+
+    def save(self, path: str):
+        """Write the table to `path` (``.npz``)."""
+        np.savez(
+            path,
+            format=TABLE_FORMAT_VERSION,
+            points=self.points,
+            values=self.values,
+            gases=np.array(self.gases, dtype=str),
+            outputs=np.array(OUTPUT_KEYS, dtype=str),
+            metadata=json.dumps(self.metadata),
+        )
+
+    def _interpolate(self, x: np.ndarray) -> np.ndarray:
+        ndim = self._feats.shape[1]
+        if self._interp is None:
+            if ndim == 0:
+                self._interp = self.values.mean(axis=0)
+            elif ndim == 1:
+                order = np.argsort(self._feats[:, 0])
+                self._interp = (self._feats[order, 0], self.values[order])
+            else:
+                self._interp = _LocalLinear(self._feats, self.values)
+
+        if ndim == 0:
+            return self._interp
+        if ndim == 1:
+            xs, ys = self._interp
+            return np.array([np.interp(x[0], xs, y, left=np.nan, right=np.nan) for y in ys.T])
+        return self._interp(x)
+
+    def query(self, coords) -> dict[str, float]:
+        """Interpolate the table at one state.
+
+        Parameters
+        ----------
+        coords : array_like
+            ``INPUT_KEYS`` then the mixing ratio of each tabulated gas, as
+            returned by `coordinates`.
+
+        Returns
+        -------
+        dict
+            Interpolated values, keyed by ``OUTPUT_KEYS``.
+
+        Raises
+        ------
+        OutsideTableError
+            If the state is not covered by the table.
+        """
+        coords = np.asarray(coords, dtype=float)
+        if np.any(coords[: len(INPUT_KEYS)] <= 0):
+            raise OutsideTableError('non-positive temperature, pressure, flux or gravity')
+        vmr = coords[len(INPUT_KEYS) :]
+        other = 1.0 - float(np.sum(vmr))
+        if other > VMR_TOLERANCE:
+            raise OutsideTableError(f'{other:.2g} of the gas is not in the table')
+
+        x = _features(coords)[0]
+        for name, want, have in zip(self._fixed_names, self._fixed, x[~self._active]):
+            if not np.isclose(have, want, rtol=_FIXED_RTOL, atol=1e-9):
+                raise OutsideTableError(f'{name} differs from the value fixed in the table')
+
+        result = self._interpolate(x[self._active])
+        if not np.all(np.isfinite(result)):
+            raise OutsideTableError('outside the states of the table')
+        return {k: float(v) for k, v in zip(OUTPUT_KEYS, result)}
+
+
+def coordinates(hf_row: dict, gases, surf_state: str) -> np.ndarray:
+    """Table coordinates of the state in `hf_row`.
+
+    The temperature coordinate is ``T_surf`` under ``surf_state = 'fixed'``,
+    where the surface temperature is imposed, and ``T_magma`` otherwise.
+    """
+    T_bottom = hf_row['T_surf'] if surf_state == 'fixed' else hf_row['T_magma']
+    values = [T_bottom, hf_row['P_surf'], hf_row['F_ins'], hf_row['gravity']]
+    values += [hf_row.get(g + '_vmr', 0.0) for g in gases]
+    return np.array(values, dtype=float)
+
+
+def table_settings(config: Config) -> dict:
+    """Settings an emulator table is solved with, which a run must share.
+
+    These are the solver, the escape module's XUV level ``p_xuv`` [bar] (None
+    for the surface), the instellation factor, every ``atmos_clim`` option
+    but the module choices, every option of the solver's own section but
+    those that only steer its iteration, and the star, whose spectrum at
+    ``star.age_ini`` the table is solved with.
+    """
+    from attrs import asdict
+
+    from proteus.config import column_solver
+
+    solver = column_solver(config.atmos_clim)
+    atmos = asdict(config.atmos_clim)
+    for key in ('module', 'emulator', 'dummy', 'agni', 'janus'):
+        atmos.pop(key)
+    options = asdict(getattr(config.atmos_clim, solver))
+    for key in _CONTROL_OPTIONS[solver]:
+        options.pop(key)
+    star = {k: v for k, v in asdict(config.star).items() if not k.startswith('bol_scale')}
+    return {
+        'solver': solver,
+        'p_xuv': _table_p_xuv(config),
+        's0_factor': float(config.orbit.s0_factor),
+        'atmos_clim': atmos,
+        solver: options,
+        'star': star,
+    }
+
+
+def _flatten(settings: dict, prefix: str = '') -> dict:
+    flat = {}
+    for key, value in settings.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f'{prefix}{key}.'))
+        else:
+            flat[f'{prefix}{key}'] = value
+    return flat
+
+
+def _check_table(table: EmulatorTable, config: Config, dirs: dict):
+    """Refuse a table generated with settings other than this run's."""
+    # A round trip through JSON, as the table's metadata took
+    want = _flatten(json.loads(json.dumps(table_settings(config))))
+    have = _flatten(table.metadata)
+    differ = sorted(k for k in want.keys() | have.keys() if want.get(k) != have.get(k))
+    if differ:
+        UpdateStatusfile(dirs, 20)
+        raise ValueError(
+            'Emulator table was generated with other settings than this run: '
+            + ', '.join(f'{k}={have.get(k)!r} (run: {want.get(k)!r})' for k in differ)
+        )
+
+
+def run_emulator(atmos_o: Atmos_t, config: Config, dirs: dict, hf_row: dict) -> dict | None:
+    """Answer an atmosphere step from the emulator table.
+
+    Parameters
+    ----------
+        atmos_o : Atmos_t
+            Atmosphere struct; holds the table once loaded.
+        config : Config
+            Configuration options for PROTEUS.
+        dirs : dict
+            Dictionary containing paths to directories.
+        hf_row : dict
+            Dictionary containing simulation variables for current iteration.
+
+    Returns
+    ----------
+        atm_output : dict or None
+            Output keyed as for the other modules, or None if the state is
+            outside the table and must be solved by the fallback module.
+    """
+    table = atmos_o._emulator
+    if table is None:
+        path = config.atmos_clim.emulator.table
+        log.info('Loading atmosphere emulator table from %s', path)
+        table = EmulatorTable.load(path)
+        _check_table(table, config, dirs)
+        atmos_o._emulator = table
+
+    surf_state = config.atmos_clim.surf_state
+    try:
+        values = table.query(coordinates(hf_row, table.gases, surf_state))
+    except OutsideTableError as e:
+        table.misses += 1
+        log.info(
+            'Atmosphere state is outside the emulator table (%s); solving with %s',
+            e,
+            config.atmos_clim.emulator.fallback,
+        )
+        return None
+    table.hits += 1
+    log.info(
+        'Emulating atmosphere from table (%d of %d steps)',
+        table.hits,
+        table.hits + table.misses,
+    )
+
+    R_int = float(hf_row['R_int'])
+    gravity = float(hf_row['gravity'])
+    P_surf = float(hf_row['P_surf'])
+    T_surf = float(hf_row['T_surf']) if surf_state == 'fixed' else values['T_surf']
+
+    # Require that the net flux must be upward
+    F_atm = values['F_atm']
+    F_atm_lim = max(1.0e-8, F_atm) if config.planet.prevent_warming else F_atm
+    if not np.isclose(F_atm_lim, F_atm):
+        log.warning('Change in F_atm [W m-2] limited in this step!')
+        log.warning('    %g  ->  %g' % (F_atm, F_atm_lim))
+
+    # The XUV level is the surface until escape sets a level above it; any
+    # other level must be the one the table was generated at
+    p_xuv = float(hf_row['p_xuv'])
+    if p_xuv <= 0.0 or p_xuv >= P_surf:
+        p_xuv, R_xuv, T_xuv = P_surf, R_int, T_surf
+    else:
+        p_table = table.metadata.get('p_xuv')
+        if p_table is None or not np.isclose(p_xuv, p_table, rtol=_FIXED_RTOL):
+            UpdateStatusfile(dirs, 20)
+            raise ValueError(
+                f'Escape requests the XUV level at {p_xuv:g} bar, '
+                f'but the emulator table holds it at {p_table} bar'
+            )
+        R_xuv = R_int + values['z_xuv']
+        T_xuv = values['T_xuv']
+
+    # There is no profile to re-read the pressure at a clipped radius from
+    R_xuv = clip_radius_to_hill(config, hf_row, R_xuv)
+    R_obs = R_int + values['z_obs']
+
+    log.info('    T_surf     =  %.3e  K' % T_surf)
+    log.info('    F_atm      =  %.3e  W m-2' % F_atm_lim)
+    log.info('    F_olr      =  %.3e  W m-2' % values['F_olr'])
+    log.info('    F_sct      =  %.3e  W m-2' % values['F_sct'])
+
+    output = {}
+    output['T_surf'] = T_surf
+    output['F_atm'] = F_atm_lim
+    output['F_olr'] = values['F_olr']
+    output['F_sct'] = values['F_sct']
+    output['albedo'] = values['albedo']
+    output['R_obs'] = R_obs
+    output['p_obs'] = float(config.atmos_clim.p_obs)
+    output['T_obs'] = values['T_obs']
+    output['g_obs'] = gravity * (R_int / R_obs) ** 2
+    output['p_xuv'] = p_xuv
+    output['R_xuv'] = R_xuv
+    output['T_xuv'] = T_xuv
+    output['g_xuv'] = gravity * (R_int / R_xuv) ** 2
+    output['ocean_areacov'] = 0.0
+    output['ocean_maxdepth'] = 0.0
+    output['P_surf_clim'] = P_surf
+
+    for g in gas_list:
+        hf_row[f'{g}_vmr_xuv'] = float(hf_row.get(f'{g}_vmr', 0.0))
+
+    return output
+
+
+def design_points(
+    bounds: dict[str, tuple[float, float]],
+    gases,
+    n_samples: int,
+    seed: int = 0,
+) -> np.ndarray:
+    """States to tabulate: the corners of the domain and a Latin hypercube inside it.
+
+    The corners are every combination of the bounds with every pure gas, so
+    that the convex hull of the design is the whole domain. Temperature is
+    sampled linearly, pressure, instellation and gravity in decades, and the
+    composition uniformly over the simplex.
+
+    Parameters
+    ----------
+    bounds : dict
+        ``(lower, upper)`` for each of ``INPUT_KEYS``; equal bounds fix an axis.
+    gases : list of str
+        Gases to tabulate.
+    n_samples : int
+        Number of interior samples.
+    seed : int
+        Seed of the Latin hypercube.
+
+    Returns
+    -------
+    numpy.ndarray
+        Coordinates of shape (N, 4 + len(gases)), without duplicates.
+    """
+    from itertools import product
+
+    from scipy.stats import qmc
+
+    gases = list(gases)
+    if not gases or len(set(gases)) != len(gases) or any(g not in gas_list for g in gases):
+        raise ValueError(f'Emulator gases must be distinct members of {gas_list}')
+    lo = np.array([float(bounds[k][0]) for k in INPUT_KEYS])
+    hi = np.array([float(bounds[k][1]) for k in INPUT_KEYS])
+    if np.any(lo <= 0) or np.any(hi < lo):
+        raise ValueError('Emulator bounds must be positive and ordered')
+
+    corners = [
+        list(c) + list(np.eye(len(gases))[i])
+        for c in product(*zip(lo, hi))
+        for i in range(len(gases))
+    ]
+
+    # Log-space axes are sampled in decades
+    log_axis = np.array([False, True, True, True])
+    a = np.where(log_axis, np.log10(lo), lo)
+    b = np.where(log_axis, np.log10(hi), hi)
+    u = qmc.LatinHypercube(d=len(INPUT_KEYS) + len(gases) - 1, seed=seed).random(n_samples)
+    x = a + u[:, : len(INPUT_KEYS)] * (b - a)
+    x[:, log_axis] = 10.0 ** x[:, log_axis]
+    cuts = np.sort(u[:, len(INPUT_KEYS) :], axis=1)
+    vmr = np.diff(np.column_stack((np.zeros(n_samples), cuts, np.ones(n_samples))), axis=1)
+
+    design = np.vstack((np.array(corners), np.column_stack((x, vmr))))
+    return np.unique(design, axis=0)
+
+
+def _design_row(config: Config, point: np.ndarray, gases) -> dict:
+    """Helpfile row of a design state, at the reference radius."""
+    from proteus.utils.coupler import ZeroHelpfileRow
+
+    T_magma, P_surf, F_ins, gravity = (float(v) for v in point[: len(INPUT_KEYS)])
+    vmr = np.asarray(point[len(INPUT_KEYS) :], dtype=float)
+    vmr = vmr / vmr.sum()
+
+    state = ZeroHelpfileRow()
+    state['Time'] = 0.0
+    state['age_star'] = config.star.age_ini * 1e9
+    state['T_magma'] = T_magma
+    state['T_surf'] = T_magma
+    state['P_surf'] = P_surf
+    state['F_ins'] = F_ins
+    state['gravity'] = gravity
+    state['R_int'] = R_earth
+    state['M_int'] = gravity * R_earth**2 / const_G
+    state['M_planet'] = state['M_int']
+    state['albedo_pl'] = float(config.atmos_clim.albedo_pl)
+
+    for g in gas_list:
+        state[g + '_vmr'] = 0.0
+        state[g + '_bar'] = 0.0
+    for g, x in zip(gases, vmr):
+        state[g + '_vmr'] = float(x)
+        state[g + '_bar'] = float(x) * P_surf
+    state['atm_kg_per_mol'] = float(sum(x * eval_gas_mmw(g) for g, x in zip(gases, vmr)))
+
+    F_asf = F_ins * config.orbit.s0_factor * (1.0 - state['albedo_pl'])
+    state['T_eqm'] = (F_asf / const_sigma) ** 0.25
+    state['T_skin'] = state['T_eqm'] * (0.5**0.25)
+
+    state['p_xuv'] = _table_p_xuv(config) or P_surf
+    state['R_xuv'] = 0.0
+    return state
+
+
+def _table_p_xuv(config: Config) -> float | None:
+    """Pressure of the XUV level the escape module sets [bar], None for the surface."""
+    if config.escape.module == 'zephyrus':
+        return float(config.escape.zephyrus.Pxuv)
+    return None
+
+
+def _init_worker(config_path: str, scratch: str, gases):
+    """Prepare a generator worker: its config, directories and stellar spectrum."""
+    from proteus import Proteus
+    from proteus.config import column_solver
+    from proteus.star.wrapper import get_new_spectrum, init_star, write_spectrum
+
+    handler = Proteus(config_path=config_path)
+    config = handler.config
+    config.atmos_clim.module = column_solver(config.atmos_clim)
+    config.planet.prevent_warming = False
+    config.params.resume = False
+    config.params.out.plot_mod = None
+    config.params.out.path = tempfile.mkdtemp(prefix='worker_', dir=scratch)
+    handler.init_directories()
+    os.makedirs(handler.directories['output/data'], exist_ok=True)
+
+    # The spectrum of the config's star at its initial age, at 1 AU; the
+    # solvers scale it to the instellation of each state
+    init_star(handler)
+    age = config.star.age_ini * 1e9
+    wl, fl = get_new_spectrum(
+        age,
+        config,
+        star_struct_modern=handler.star_struct,
+        star_props_modern=handler.star_props,
+        stellar_track=handler.stellar_track,
+        modern_wl=handler.star_modern_wl,
+        modern_fl=handler.star_modern_fl,
+    )
+    write_spectrum(wl, fl, {'Time': 0.0, 'age_star': age}, handler.directories['output'])
+
+    _worker.clear()
+    _worker.update(
+        config=config,
+        dirs=handler.directories,
+        gases=tuple(gases),
+        wl=wl,
+        fl=fl,
+        atmos_o=Atmos_t(),
+        solved=0,
+    )
+
+
+def _solve_point(point: np.ndarray) -> np.ndarray | None:
+    """Solve one design state in a worker; None if it fails or does not converge."""
+    from proteus.atmos_clim.wrapper import solve_column
+
+    config = _worker['config']
+    state = _design_row(config, point, _worker['gases'])
+    try:
+        output = solve_column(
+            config.atmos_clim.module,
+            _worker['atmos_o'],
+            config,
+            _worker['dirs'],
+            {'total': _worker['solved']},
+            _worker['wl'],
+            _worker['fl'],
+            False,
+            None,
+            state,
+            write_data=False,
+        )
+    except Exception as e:
+        log.warning('Could not solve emulator design state %s: %s', point, e)
+        # Start the next state from a fresh struct
+        _worker['atmos_o'] = Atmos_t()
+        return None
+    _worker['solved'] += 1
+    if not output.pop('agni_converged', True):
+        return None
+
+    R_int = state['R_int']
+    output['z_obs'] = output['R_obs'] - R_int
+    output['z_xuv'] = output['R_xuv'] - R_int
+    return np.array([output[k] for k in OUTPUT_KEYS], dtype=float)
+
+
+def generate_table(
+    config_path: str,
+    design: np.ndarray,
+    gases,
+    path: str,
+    workers: int = 1,
+) -> EmulatorTable:
+    """Solve a design of states with the config's solver and write the table.
+
+    Parameters
+    ----------
+    config_path : str
+        Config whose atmosphere settings the table is generated with; it must
+        use AGNI or JANUS (or the emulator, whose fallback is then used).
+    design : numpy.ndarray
+        States to solve, as returned by `design_points`.
+    gases : list of str
+        Tabulated gases, in the order of the design's columns.
+    path : str
+        Output table (``.npz``).
+    workers : int
+        Worker processes; 0 uses one per core.
+
+    Returns
+    -------
+    EmulatorTable
+        The table written, holding the states that converged.
+    """
+    from proteus.config import column_solver, read_config_object
+
+    config = read_config_object(config_path)
+    solver = column_solver(config.atmos_clim)
+    if solver not in ('agni', 'janus'):
+        raise ValueError(f'Cannot tabulate atmosphere module {solver}; use agni or janus')
+    if config.atmos_clim.surf_state not in ('fixed', 'skin'):
+        raise ValueError("The emulator supports surf_state 'fixed' and 'skin' only")
+    metadata = table_settings(config)
+
+    design = np.atleast_2d(np.asarray(design, dtype=float))
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(design))
+    log.info(
+        'Solving %d emulator design states with %s on %d worker(s)',
+        len(design),
+        solver,
+        workers,
+    )
+
+    with tempfile.TemporaryDirectory(prefix='proteus_emulator_') as scratch:
+        initargs = (str(config_path), scratch, tuple(gases))
+        if workers <= 1:
+            _init_worker(*initargs)
+            results = [_solve_point(p) for p in design]
+        else:
+            # Spawned, not forked: the parent has already started Julia
+            ctx = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=ctx, initializer=_init_worker, initargs=initargs
+            ) as pool:
+                results = list(
+                    pool.map(
+                        _solve_point, design, chunksize=max(1, len(design) // (4 * workers))
+                    )
+                )
+
+    keep = np.array([r is not None for r in results], dtype=bool)
+    log.info('Tabulated %d of %d emulator design states', int(keep.sum()), len(design))
+    if not keep.any():
+        raise RuntimeError('No emulator design state converged')
+
+    table = EmulatorTable(design[keep], [r for r in results if r is not None], gases, metadata)
+    table.save(path)
+    log.info('Wrote atmosphere emulator table to %s', path)
+    return table
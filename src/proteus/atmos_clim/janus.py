@@ -5,11 +5,13 @@ import glob
 import logging
 import os
 import shutil
+from importlib.metadata import version
 from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
 
+from proteus.atmos_clim import spectral_cache
 from proteus.atmos_clim.common import clip_radius_to_hill, get_oarr_from_parr
 from proteus.utils.constants import vap_list, vol_list, gas_list
 from proteus.utils.helper import UpdateStatusfile, create_tmp_folder
@@ -31,8 +33,15 @@ def InitStellarSpectrum(dirs: dict, wl: list, fl: list, spectral_file_nostar):
     # Spectral file stuff
     PrepareStellarSpectrum(wl, fl, star_spec_src)
 
-    log.debug('Insert stellar spectrum into spectral file')
-    InsertStellarSpectrum(spectral_file_nostar, star_spec_src, dirs['output'])
+    # Reuse the file prepared for the same binned spectrum, if cached
+    key = spectral_cache.entry_key(
+        'janus-' + version('fwl-janus'), spectral_file_nostar, star_spec_src
+    )
+    spectral_file = dirs['output'] + 'star.sf'
+    if not spectral_cache.fetch(key, spectral_file):
+        log.debug('Insert stellar spectrum into spectral file')
+        InsertStellarSpectrum(spectral_file_nostar, star_spec_src, dirs['output'])
+        spectral_cache.store(key, spectral_file)
     os.remove(star_spec_src)
 
     return
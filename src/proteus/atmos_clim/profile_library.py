@@ -0,0 +1,340 @@
+# Persistent library of converged AGNI temperature profiles
+"""Library of converged AGNI temperature profiles, seeding later solves.
+
+Enabled by ``PROTEUS_AGNI_PROFILE_DIR``; see :mod:`proteus.utils.disk_cache`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import math
+import os
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from proteus.utils import disk_cache
+from proteus.utils.constants import gas_list
+
+if TYPE_CHECKING:
+    from proteus.config import Config
+
+log = logging.getLogger('fwl.' + __name__)
+
+# Bump when the on-disk layout changes
+LIBRARY_FORMAT_VERSION = 1
+
+# Environment variables controlling the library
+LIBRARY_DIR_ENV = 'PROTEUS_AGNI_PROFILE_DIR'
+LIBRARY_MAX_SIZE_ENV = 'PROTEUS_AGNI_PROFILE_MAX_SIZE'
+DEFAULT_MAX_SIZE = 64 * 1024**2  # 64 MiB
+
+# Neighbour distance scales: ln(T_surf), log10(P_surf), ln(1 + F_ins),
+# ln(gravity), and each volume mixing ratio
+_DISTANCE_SCALES = (0.05, 0.5, 0.25, 0.1)
+_VMR_SCALE = 0.1
+MAX_DISTANCE = 1.0
+MIN_SPACING = 0.1
+
+# Coordinates of the entries read so far, by path; entries never change once
+# published, so each one is read only once per process
+_index: dict[str, np.ndarray] = {}
+
+# Lookup and store counts of this process
+_stats = {'lookups': 0, 'hits': 0, 'stores': 0}
+
+# Energy solves of this process, split by whether the profile was seeded
+# from the library: solves and solver attempts
+_solves = {
+    'seeded': {'solves': 0, 'attempts': 0},
+    'unseeded': {'solves': 0, 'attempts': 0},
+}
+
+
+def library_root() -> str | None:
+    """Return the library root from ``PROTEUS_AGNI_PROFILE_DIR``, or None if unset."""
+    root = os.environ.get(LIBRARY_DIR_ENV, '').strip()
+    return os.path.abspath(root) if root else None
+
+
+def library_max_size() -> int:
+    """Return the library size bound in bytes from ``PROTEUS_AGNI_PROFILE_MAX_SIZE``."""
+    return disk_cache.max_size_from_env(LIBRARY_MAX_SIZE_ENV, DEFAULT_MAX_SIZE)
+
+
+def statistics() -> dict[str, int]:
+    """Return the lookup, hit and store counts of this process."""
+    return dict(_stats)
+
+
+def solve_statistics() -> dict[str, dict[str, int]]:
+    """Return the solve and attempt counts of this process.
+
+    Counts are kept separately for solves seeded from the library
+    (``'seeded'``) and solves from the usual guess (``'unseeded'``), so the
+    effect of seeding on the solver can be read off one run.
+    """
+    return {kind: dict(counts) for kind, counts in _solves.items()}
+
+
+def record_solve(seeded: bool, attempts: int) -> None:
+    """Record the solver attempts of one energy solve.
+
+    Parameters
+    ----------
+    seeded : bool
+        Whether the solve started from a library profile.
+    attempts : int
+        Number of solver attempts made.
+    """
+    counts = _solves['seeded' if seeded else 'unseeded']
+    counts['solves'] += 1
+    counts['attempts'] += attempts
+    log.info(
+        'AGNI solve took %d attempts (%s)',
+        attempts,
+        ', '.join(
+            f'{kind}: {c["attempts"] / c["solves"]:.2f} attempts per solve over {c["solves"]}'
+            for kind, c in _solves.items()
+            if c['solves']
+        ),
+    )
+
+
+def settings_fingerprint(config: Config) -> str:
+    """Digest of the settings a seeding profile must share exactly.
+
+    Parameters
+    ----------
+    config : Config
+        PROTEUS configuration using AGNI.
+
+    Returns
+    -------
+    str
+        Hex digest, safe to use as a directory name.
+    """
+    ac = config.atmos_clim
+    agni = ac.agni
+    if agni.spectral_file is None:
+        spectral = f'{ac.spectral_group}/{ac.spectral_bands}'
+    else:
+        spectral = str(agni.spectral_file)
+    text = (
+        f'format={LIBRARY_FORMAT_VERSION}\n'
+        f'spectral={spectral}\n'
+        f'surf_state={ac.surf_state}\n'
+        f'rayleigh={bool(ac.rayleigh)}\n'
+        f'chemistry={agni.chemistry}\n'
+        f'convection={bool(agni.convection)}\n'
+        f'conduction={bool(agni.conduction)}\n'
+        f'sens_heat={bool(agni.sens_heat)}\n'
+        f'latent_heat={bool(agni.latent_heat)}\n'
+        f'rainout={bool(agni.rainout)}\n'
+        f'oceans={bool(agni.oceans)}\n'
+        f'real_gas={bool(agni.real_gas)}\n'
+        f'gases={",".join(gas_list)}\n'
+    )
+    return hashlib.sha256(text.encode()).hexdigest()[:32]
+
+
+def coordinates(hf_row: dict) -> np.ndarray:
+    """Library coordinates of the state in `hf_row`.
+
+    Returns
+    -------
+    numpy.ndarray
+        Surface temperature [K], surface pressure [bar], instellation
+        [W m-2], gravity [m s-2], then the volume mixing ratio of every gas
+        in ``gas_list``.
+    """
+    values = [hf_row['T_surf'], hf_row['P_surf'], hf_row['F_ins'], hf_row['gravity']]
+    values += [hf_row[g + '_vmr'] for g in gas_list]
+    return np.array(values, dtype=float)
+
+
+def distance(a: np.ndarray, b: np.ndarray) -> float:
+    """Scaled distance between two library coordinates.
+
+    Temperature, instellation and gravity are compared in log space and
+    surface pressure in decades, so that the same relative step counts the
+    same at every scale; the mixing ratios are compared directly.
+    """
+    if a.shape != b.shape or min(a[0], b[0], a[1], b[1], a[3], b[3]) <= 0:
+        return math.inf
+    deltas = (
+        math.log(a[0] / b[0]),
+        math.log10(a[1] / b[1]),
+        math.log1p(max(a[2], 0.0)) - math.log1p(max(b[2], 0.0)),
+        math.log(a[3] / b[3]),
+    )
+    d2 = sum((d / s) ** 2 for d, s in zip(deltas, _DISTANCE_SCALES))
+    d2 += float(np.sum(((a[4:] - b[4:]) / _VMR_SCALE) ** 2))
+    return math.sqrt(d2)
+
+
+def _entries(directory: str) -> dict[str, np.ndarray]:
+    """Return the coordinates of every readable entry in `directory`, by path."""
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return {}
+
+    entries = {}
+    for name in names:
+        if not name.endswith('.npz') or name.startswith(disk_cache.TMP_PREFIX):
+            continue
+        path = os.path.join(directory, name)
+        if path not in _index:
+            try:
+                with np.load(path) as data:
+                    _index[path] = np.array(data['coords'], dtype=float)
+            except Exception as e:
+                log.debug('Skipping unreadable AGNI profile entry %s: %s', path, e)
+                continue
+        entries[path] = _index[path]
+    return entries
+
+
+def _nearest(directory: str, target: np.ndarray) -> tuple[float, str | None]:
+    best, best_path = math.inf, None
+    for path, coords in _entries(directory).items():
+        d = distance(target, coords)
+        if d < best:
+            best, best_path = d, path
+    return best, best_path
+
+
+def evict(root: str, max_size: int, keep: str | None = None) -> list[str]:
+    """Remove least recently used entries until the library fits in `max_size`.
+
+    Parameters
+    ----------
+    root : str
+        Library root directory.
+    max_size : int
+        Size bound in bytes.
+    keep : str or None
+        Path that is never evicted, normally the entry just stored.
+
+    Returns
+    -------
+    list of str
+        Paths of the evicted entries.
+    """
+
+    def remove(path: str) -> None:
+        with contextlib.suppress(OSError):
+            os.unlink(path)
+        _index.pop(path, None)
+
+    evicted = disk_cache.evict_lru(disk_cache.file_entries(root), max_size, remove, keep=keep)
+
+    if evicted:
+        log.info(
+            'Evicted %d AGNI profile library entries to stay below %d bytes',
+            len(evicted),
+            max_size,
+        )
+    return evicted
+
+
+def lookup_profile(config: Config, hf_row: dict) -> tuple[np.ndarray, np.ndarray] | None:
+    """Return a seeding ``(p, tmp)`` profile from the nearest stored solve.
+
+    Parameters
+    ----------
+    config : Config
+        PROTEUS configuration using AGNI.
+    hf_row : dict
+        Dictionary containing simulation variables for current iteration.
+
+    Returns
+    -------
+    tuple of numpy.ndarray or None
+        Cell-centre pressures [Pa] and temperatures [K] of the nearest stored
+        profile solved with the same settings, scaled to this state's surface
+        pressure and temperature; None without a library or without a
+        neighbour within ``MAX_DISTANCE``.
+    """
+    root = library_root()
+    if root is None:
+        return None
+    _stats['lookups'] += 1
+
+    target = coordinates(hf_row)
+    best, path = _nearest(os.path.join(root, settings_fingerprint(config)), target)
+    if path is None or best > MAX_DISTANCE:
+        log.info(
+            'No AGNI profile library entry near this state (%d of %d lookups hit)',
+            _stats['hits'],
+            _stats['lookups'],
+        )
+        return None
+
+    try:
+        with np.load(path) as data:
+            p = np.array(data['p'], dtype=float)
+            tmp = np.array(data['tmp'], dtype=float)
+    except Exception as e:
+        log.warning('Ignoring unreadable AGNI profile entry %s: %s', path, e)
+        return None
+    with contextlib.suppress(OSError):
+        os.utime(path)
+
+    source = _index[path]
+    p *= target[1] / source[1]
+    tmp *= target[0] / source[0]
+    _stats['hits'] += 1
+    log.info(
+        'Seeding AGNI from a stored profile at distance %.3f (%d of %d lookups hit)',
+        best,
+        _stats['hits'],
+        _stats['lookups'],
+    )
+    return p, tmp
+
+
+def store_profile(config: Config, hf_row: dict, p: np.ndarray, tmp: np.ndarray) -> None:
+    """Store a converged profile unless a stored one is already close to it.
+
+    Parameters
+    ----------
+    config : Config
+        PROTEUS configuration using AGNI.
+    hf_row : dict
+        Dictionary containing the simulation variables the profile was solved at.
+    p : numpy.ndarray
+        Converged cell-centre pressures [Pa].
+    tmp : numpy.ndarray
+        Converged cell-centre temperatures [K].
+    """
+    root = library_root()
+    if root is None:
+        return
+    directory = os.path.join(root, settings_fingerprint(config))
+    coords = coordinates(hf_row)
+    if _nearest(directory, coords)[0] <= MIN_SPACING:
+        return
+
+    name = hashlib.sha256(coords.tobytes()).hexdigest()[:32] + '.npz'
+    try:
+        disk_cache.write_atomic(
+            os.path.join(directory, name),
+            lambda f: np.savez(
+                f,
+                coords=coords,
+                p=np.asarray(p, dtype=float),
+                tmp=np.asarray(tmp, dtype=float),
+            ),
+        )
+    except Exception as e:
+        log.warning('Could not store AGNI profile library entry: %s', e)
+        return
+    path = os.path.join(directory, name)
+    _index[path] = coords
+    _stats['stores'] += 1
+    with contextlib.suppress(OSError):
+        evict(root, library_max_size(), keep=path)
@@ -0,0 +1,235 @@
+# Content-addressed cache of spectral files with a stellar spectrum inserted
+"""Cache of SOCRATES spectral files prepared for a stellar spectrum, shared between runs.
+
+Enabled by ``PROTEUS_SPFILE_CACHE_DIR``; see :mod:`proteus.utils.disk_cache`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+
+from proteus.utils import disk_cache
+
+log = logging.getLogger('fwl.' + __name__)
+
+# Bump when the on-disk layout changes
+CACHE_FORMAT_VERSION = 1
+
+# Environment variables controlling the cache
+CACHE_DIR_ENV = 'PROTEUS_SPFILE_CACHE_DIR'
+CACHE_MAX_SIZE_ENV = 'PROTEUS_SPFILE_CACHE_MAX_SIZE'
+DEFAULT_MAX_SIZE = 8 * 1024**3  # 8 GiB
+
+# Names of the two halves of a spectral file inside an entry
+_ENTRY_FILES = ('spectral.sf', 'spectral.sf_k')
+
+# Lookup, hit and store counts of this process
+_stats = {'lookups': 0, 'hits': 0, 'stores': 0}
+
+
+def cache_root() -> str | None:
+    """Return the cache root from ``PROTEUS_SPFILE_CACHE_DIR``, or None if unset."""
+    root = os.environ.get(CACHE_DIR_ENV, '').strip()
+    return os.path.abspath(root) if root else None
+
+
+def cache_max_size() -> int:
+    """Return the cache size bound in bytes from ``PROTEUS_SPFILE_CACHE_MAX_SIZE``."""
+    return disk_cache.max_size_from_env(CACHE_MAX_SIZE_ENV, DEFAULT_MAX_SIZE)
+
+
+def statistics() -> dict[str, int]:
+    """Return the lookup, hit and store counts of this process."""
+    return dict(_stats)
+
+
+def _socrates_version() -> str:
+    try:
+        with open(os.path.join(os.environ['RAD_DIR'], 'version')) as hdl:
+            return hdl.read().strip()
+    except (KeyError, OSError):
+        return 'unknown'
+
+
+def _file_identity(path: str) -> str:
+    """Path, size and modification time of `path`, or 'missing'."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return 'missing'
+    return f'{os.path.realpath(path)}:{st.st_size}:{st.st_mtime_ns}'
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as hdl:
+        for chunk in iter(lambda: hdl.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def entry_key(tool: str, base_file: str, star_file: str, **options) -> str | None:
+    """Digest of everything a prepared spectral file depends on.
+
+    Parameters
+    ----------
+    tool : str
+        Inserting module and version, e.g. ``'janus-24.11.5'``.
+    base_file : str
+        Spectral file without a stellar spectrum; its ``_k`` file is included.
+    star_file : str
+        Stellar spectrum handed to ``prep_spec``.
+    **options
+        Module options that change the prepared file.
+
+    Returns
+    -------
+    str or None
+        Hex digest, safe to use as a directory name; None when the cache is
+        disabled or the stellar spectrum cannot be read.
+    """
+    if cache_root() is None:
+        return None
+    try:
+        star = _file_digest(star_file)
+    except OSError as e:
+        log.warning(
+            'Cannot read stellar spectrum %s for the spectral-file cache: %s', star_file, e
+        )
+        return None
+    text = (
+        f'format={CACHE_FORMAT_VERSION}\n'
+        f'tool={tool}\n'
+        f'socrates={_socrates_version()}\n'
+        f'base={_file_identity(base_file)}\n'
+        f'base_k={_file_identity(base_file + "_k")}\n'
+        f'star={star}\n'
+    )
+    text += ''.join(f'{k}={v}\n' for k, v in sorted(options.items()))
+    return hashlib.sha256(text.encode()).hexdigest()[:32]
+
+
+def evict(root: str, max_size: int, keep: str | None = None) -> list[str]:
+    """Remove least recently used entries until the cache fits in `max_size`.
+
+    Parameters
+    ----------
+    root : str
+        Cache root directory.
+    max_size : int
+        Size bound in bytes.
+    keep : str or None
+        Entry that is never evicted, normally the one just stored.
+
+    Returns
+    -------
+    list of str
+        Paths of the evicted entries.
+    """
+    evicted = disk_cache.evict_lru(
+        disk_cache.dir_entries(root),
+        max_size,
+        lambda entry: shutil.rmtree(entry, ignore_errors=True),
+        keep=keep,
+    )
+    if evicted:
+        log.info(
+            'Evicted %d spectral-file cache entries to stay below %d bytes',
+            len(evicted),
+            max_size,
+        )
+    return evicted
+
+
+def fetch(key: str | None, spectral_file: str) -> bool:
+    """Copy the cached entry for `key` to `spectral_file` and its ``_k`` file.
+
+    Parameters
+    ----------
+    key : str or None
+        Entry key from :func:`entry_key`; None never hits.
+    spectral_file : str
+        Where the prepared spectral file is expected.
+
+    Returns
+    -------
+    bool
+        True if the prepared file was copied from the cache.
+    """
+    root = cache_root()
+    if key is None or root is None:
+        return False
+    _stats['lookups'] += 1
+    entry = os.path.join(root, key)
+    if not all(os.path.isfile(os.path.join(entry, name)) for name in _ENTRY_FILES):
+        log.info(
+            'Preparing spectral file; not in cache (%d of %d lookups hit)',
+            _stats['hits'],
+            _stats['lookups'],
+        )
+        return False
+    try:
+        for name, dest in zip(_ENTRY_FILES, (spectral_file, spectral_file + '_k')):
+            shutil.copyfile(os.path.join(entry, name), dest)
+    except OSError as e:
+        log.warning('Cannot copy spectral file from cache entry %s: %s', entry, e)
+        for dest in (spectral_file, spectral_file + '_k'):
+            with contextlib.suppress(OSError):
+                os.remove(dest)
+        return False
+    with contextlib.suppress(OSError):
+        os.utime(entry)
+    _stats['hits'] += 1
+    log.info(
+        'Using cached spectral file for this stellar spectrum (%d of %d lookups hit)',
+        _stats['hits'],
+        _stats['lookups'],
+    )
+    return True
+
+
+def store(key: str | None, spectral_file: str) -> None:
+    """Add a prepared `spectral_file` and its ``_k`` file to the cache.
+
+    Parameters
+    ----------
+    key : str or None
+        Entry key from :func:`entry_key`; None stores nothing.
+    spectral_file : str
+        Spectral file with the stellar spectrum inserted.
+    """
+    root = cache_root()
+    if key is None or root is None:
+        return
+    entry = os.path.join(root, key)
+    if os.path.isdir(entry):
+        return
+    sources = (spectral_file, spectral_file + '_k')
+    if not all(os.path.isfile(src) for src in sources):
+        log.debug('Not caching %s; spectral file incomplete', spectral_file)
+        return
+    tmp = None
+    try:
+        os.makedirs(root, exist_ok=True)
+        tmp = tempfile.mkdtemp(prefix=f'{disk_cache.TMP_PREFIX}{key}-', dir=root)
+        for name, src in zip(_ENTRY_FILES, sources):
+            shutil.copyfile(src, os.path.join(tmp, name))
+        # Another process may have published the same entry meanwhile
+        os.rename(tmp, entry)
+        tmp = None
+    except OSError as e:
+        if not os.path.isdir(entry):
+            log.warning('Could not store spectral-file cache entry: %s', e)
+        return
+    finally:
+        if tmp is not None:
+            shutil.rmtree(tmp, ignore_errors=True)
+    _stats['stores'] += 1
+    log.debug('Stored spectral file in cache entry %s', entry)
+    with contextlib.suppress(OSError):
+        evict(root, cache_max_size(), keep=entry)
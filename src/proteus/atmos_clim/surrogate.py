@@ -0,0 +1,244 @@
+# Linear-response surrogate for AGNI atmosphere solves
+"""Predict the fluxes of an AGNI solve from the solves already done.
+
+Between coupling iterations the boundary conditions of the atmosphere often
+move by tiny amounts, yet ``run_atmosphere`` runs a full AGNI Newton solve
+every time. ``carry_converged_levels`` only steps in once a solve has failed.
+
+``FluxSurrogate`` records the boundary state (boundary temperature and
+ln P_surf) and the result (F_atm, F_olr, F_sct and T_surf) of every converged
+solve in the run. The boundary temperature is T_magma under
+``surf_state = 'skin'``, where AGNI solves T_surf itself, and T_surf
+otherwise. From the most recent solves it fits a linear response of the
+result around the latest solve. An iteration may be answered from that fit
+when:
+
+- the boundary state lies within the trust region around the latest solve:
+  a relative step of at most ``trust`` in temperature and in surface
+  pressure, and at most ``EXTRAPOLATION_LIMIT`` times the span the recorded
+  solves sampled;
+- the other inputs of the solve (instellation, gravity, interior radius and
+  composition) have not moved from the latest solve beyond ``CONTEXT_RTOL``
+  and ``VMR_ATOL``;
+- the fit, the shared :class:`~proteus.utils.surrogate.LinearResponse`, has
+  been validated against a later solve.
+
+The predicted error is the largest recent residual of the fit against the
+solves that followed it, in F_atm relative to its magnitude and in T_surf
+relative to T_surf. The caller compares that error with its tolerance and
+bounds the number of consecutive skips. A skipped iteration keeps the levels,
+ocean and optical-depth diagnostics of the latest solve.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from proteus.utils.constants import gas_list
+from proteus.utils.surrogate import LinearResponse
+
+log = logging.getLogger('fwl.' + __name__)
+
+# Largest change of instellation, gravity and interior radius (relative), and
+# of any volume mixing ratio (absolute), that still counts as the same solve
+CONTEXT_RTOL = 1e-3
+VMR_ATOL = 1e-3
+
+# Order of the fitted results
+TARGET_KEYS = ('F_atm', 'F_olr', 'F_sct', 'T_surf')
+
+
+@dataclass(frozen=True)
+class FluxPrediction:
+    """Predicted result of an AGNI solve at the current boundary state.
+
+    Attributes
+    ----------
+    F_atm : float
+        Predicted net upward flux at the top of the atmosphere [W m-2].
+    F_olr : float
+        Predicted outgoing longwave flux [W m-2].
+    F_sct : float
+        Predicted outgoing shortwave flux [W m-2].
+    T_surf : float
+        Predicted surface temperature [K].
+    error : float
+        Predicted relative error of the prediction.
+    """
+
+    F_atm: float
+    F_olr: float
+    F_sct: float
+    T_surf: float
+    error: float
+
+
+def features(hf_row: dict, surf_state: str) -> np.ndarray:
+    """Boundary state an AGNI solve responds to.
+
+    Parameters
+    ----------
+    hf_row : dict
+        Current runtime variables.
+    surf_state : str
+        Surface boundary condition, ``atmos_clim.surf_state``.
+
+    Returns
+    -------
+    numpy.ndarray
+        Boundary temperature [K] and the natural log of P_surf [bar].
+    """
+    T = hf_row['T_magma'] if surf_state == 'skin' else hf_row['T_surf']
+    P_surf = float(hf_row['P_surf'])
+    ln_P = math.log(P_surf) if P_surf > 0 else -math.inf
+    return np.array([float(T), ln_P], dtype=float)
+
+
+def context(hf_row: dict) -> np.ndarray:
+    """Inputs of an AGNI solve that the surrogate does not model.
+
+    Returns
+    -------
+    numpy.ndarray
+        F_ins [W m-2], gravity [m s-2], R_int [m], then the volume mixing
+        ratio of every gas in ``gas_list``.
+    """
+    values = [hf_row['F_ins'], hf_row['gravity'], hf_row['R_int']]
+    values += [hf_row.get(g + '_vmr', 0.0) for g in gas_list]
+    return np.array(values, dtype=float)
+
+
+def _same_context(a: np.ndarray, b: np.ndarray) -> bool:
+    scalars = np.abs(a[:3] - b[:3]) <= CONTEXT_RTOL * np.maximum(np.abs(b[:3]), 1e-30)
+    return bool(np.all(scalars) and np.all(np.abs(a[3:] - b[3:]) <= VMR_ATOL))
+
+
+class FluxSurrogate(LinearResponse):
+    """Per-run history of converged AGNI solves and their linear response.
+
+    Parameters
+    ----------
+    surf_state : str
+        Surface boundary condition, ``atmos_clim.surf_state``.
+    flux_floor : float
+        Flux below which F_atm errors are measured absolutely [W m-2],
+        normally the solver's own absolute tolerance.
+    """
+
+    def __init__(self, surf_state: str, flux_floor: float):
+        super().__init__()
+        self.surf_state = surf_state
+        self.flux_floor = float(flux_floor)
+        self._context = None
+        self._output = None
+        self._P_surf = None
+        self.skipped = 0
+        self.solved = 0
+        self.streak = 0
+
+    def reset(self) -> None:
+        """Forget every recorded solve, e.g. after the stellar spectrum changed."""
+        self.clear()
+        self._context = None
+        self._output = None
+        self._P_surf = None
+
+    def _residual(self, predicted: np.ndarray, actual: np.ndarray) -> float:
+        """Relative error of a prediction in F_atm and T_surf."""
+        dF = abs(predicted[0] - actual[0]) / max(abs(actual[0]), self.flux_floor)
+        dT = abs(predicted[3] - actual[3]) / actual[3]
+        return float(max(dF, dT))
+
+    def record(self, hf_row: dict, output: dict) -> None:
+        """Add a converged solve, first scoring the fit against it.
+
+        Parameters
+        ----------
+        hf_row : dict
+            Runtime variables the solve was made at.
+        output : dict
+            Output of ``run_agni`` for that solve.
+        """
+        x = features(hf_row, self.surf_state)
+        y = np.array([output[k] for k in TARGET_KEYS], dtype=float)
+        ctx = context(hf_row)
+        if not (np.all(np.isfinite(x)) and np.all(np.isfinite(y)) and np.all(np.isfinite(ctx))):
+            return
+
+        # Solves made under other inputs do not belong to the same response
+        if self._context is not None and not _same_context(ctx, self._context):
+            self.reset()
+
+        residual = self.add(x, y, self._residual)
+        if residual is not None:
+            log.debug('AGNI surrogate residual against new solve: %.3e', residual)
+        self._context = ctx
+        self._output = dict(output)
+        self._P_surf = float(hf_row['P_surf'])
+
+    def predict(self, hf_row: dict, trust: float) -> tuple[FluxPrediction | None, str]:
+        """Predict the result a solve at the current state would return.
+
+        Parameters
+        ----------
+        hf_row : dict
+            Current runtime variables.
+        trust : float
+            Relative radius of the trust region around the latest solve.
+
+        Returns
+        -------
+        tuple of (FluxPrediction or None, str)
+            The prediction, or None with the reason one cannot be made.
+        """
+        if not self.validated:
+            return None, f'no validated fit, {len(self)} solves recorded'
+        if not _same_context(context(hf_row), self._context):
+            return None, 'instellation, gravity, radius or composition changed'
+
+        x = features(hf_row, self.surf_state)
+        last = self.latest_inputs
+        dT = abs(x[0] - last[0]) / last[0]
+        dlnP = abs(x[1] - last[1])
+        if not (dT <= trust and dlnP <= trust):
+            return None, f'outside trust region (dT/T={dT:.2e}, dlnP={dlnP:.2e})'
+
+        response = self.response(x)
+        if response is None:
+            return None, 'outside the sampled range'
+        F_atm, F_olr, F_sct, T_surf = self.latest + response
+        prediction = FluxPrediction(
+            F_atm=float(F_atm),
+            F_olr=float(F_olr),
+            F_sct=float(F_sct),
+            T_surf=float(T_surf),
+            error=self.residual,
+        )
+        return prediction, ''
+
+    def skip_output(self, prediction: FluxPrediction, hf_row: dict) -> dict:
+        """Output of a skipped solve, in the form ``run_agni`` returns.
+
+        The fluxes and surface temperature are the predicted ones; every other
+        quantity is that of the latest solve, with the surface pressure seen
+        by the climate scaled to the current one.
+        """
+        output = dict(self._output)
+        F_sct_last = output['F_sct']
+        output['F_atm'] = prediction.F_atm
+        output['F_olr'] = prediction.F_olr
+        output['F_sct'] = prediction.F_sct
+        # Only under 'skin' does the solve set T_surf; otherwise it is an input
+        if self.surf_state == 'skin':
+            output['T_surf'] = prediction.T_surf
+        else:
+            output['T_surf'] = float(hf_row['T_surf'])
+        if F_sct_last > 0:
+            output['albedo'] = output['albedo'] * prediction.F_sct / F_sct_last
+        output['P_surf_clim'] = output['P_surf_clim'] * float(hf_row['P_surf']) / self._P_surf
+        output['agni_converged'] = True
+        return output
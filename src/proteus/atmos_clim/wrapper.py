@@ -232,8 +232,8 @@ def run_atmosphere(
 ):
     """Run Atmosphere submodule.
 
-    Generic function to run an atmospheric simulation with either JANUS, AGNI or dummy.
-    Writes into the hf_row generic variable passed as an arguement.
+    Generic function to run an atmospheric simulation with either JANUS, AGNI, dummy or
+    the emulator. Writes into the hf_row generic variable passed as an arguement.
 
     Parameters
     ----------
@@ -302,7 +302,186 @@ def run_atmosphere(
     # elif surf_state=='skin':
     #    Don't do anything here, because this will be handled by the atmosphere model.
 
-    if config.atmos_clim.module == 'janus':
+    module = config.atmos_clim.module
+    if module == 'emulator':
+        from proteus.atmos_clim.emulator import run_emulator
+
+        atm_output = run_emulator(atmos_o, config, dirs, hf_row)
+        if atm_output is None:
+            # Solve this state instead, on the spectrum the skipped solves missed
+            update_stellar_spectrum = update_stellar_spectrum or atmos_o.spectrum_pending
+            atmos_o.spectrum_pending = False
+            atm_output = solve_column(
+                config.atmos_clim.emulator.fallback,
+                atmos_o,
+                config,
+                dirs,
+                loop_counter,
+                wl,
+                fl,
+                update_stellar_spectrum,
+                hf_all,
+                hf_row,
+                write_data=write_data,
+            )
+        else:
+            atmos_o.spectrum_pending = atmos_o.spectrum_pending or update_stellar_spectrum
+    else:
+        atm_output = solve_column(
+            module,
+            atmos_o,
+            config,
+            dirs,
+            loop_counter,
+            wl,
+            fl,
+            update_stellar_spectrum,
+            hf_all,
+            hf_row,
+            write_data=write_data,
+        )
+
+    # Capture the atmosphere convergence flag onto the transient struct
+    # (not persisted to helpfile). AGNI sets this from its Newton solver;
+    # JANUS / dummy / transparent always succeed and default to True.
+    atmos_o.converged = bool(atm_output.pop('agni_converged', True))
+
+    # Store variables common to `hf_row` and `atm_output`
+    for key in atm_output.keys():
+        if key in hf_row.keys():
+            hf_row[key] = atm_output[key]
+
+    # Keep escape and the observables off a structure the solver rejected. This
+    # runs on the merged row, after the module output and the module's direct
+    # writes to `hf_row` are both in place, and before the quantities derived
+    # from the levels below.
+    previous_row = None
+    if hf_all is not None and len(hf_all) > 0:
+        previous_row = hf_all.iloc[-1].to_dict()
+    carry_converged_levels(atmos_o, hf_row, previous_row=previous_row)
+
+    # A carried radius can come from a row written before the clip existed, or
+    # under a different Hill radius, so bound it here as well. The rate escape
+    # computes goes as the cube of this radius, so the bound wins; the gravity
+    # is then placed at the radius the bound left behind. The finiteness test is
+    # on the RESULT rather than on the carried value, because a radius of NaN
+    # compares unequal to everything: testing it there skips the placement in
+    # the one case where the bound does supply a real radius.
+    if hasattr(config, 'escape') and 'R_xuv' in hf_row:
+        carried = float(hf_row['R_xuv'])
+        clipped = clip_radius_to_hill(config, hf_row, carried)
+        hf_row['R_xuv'] = clipped
+        if np.isfinite(clipped) and clipped != carried:
+            realign_xuv_gravity(hf_row, clipped)
+
+    # Persist the solve outcome, so a row whose levels were carried can be
+    # identified from the output alone rather than from the log.
+    hf_row['atm_converged'] = 1.0 if atmos_o.converged else -1.0
+    hf_row['atm_levels_stale'] = float(atmos_o.levels_stale_iters)
+
+    # Copy special cases
+    hf_row['rho_obs'] = 3 * hf_row['M_planet'] / (4 * pi * hf_row['R_obs'] ** 3)
+    hf_row['F_net'] = hf_row['F_int'] - hf_row['F_atm']
+    hf_row['bond_albedo'] = atm_output['albedo']
+
+    # Calculate bolometric observables (measured at infinite distance)
+    update_bolometry(hf_row)
+
+    # Estimate WTG parameter
+    update_wtg_surf(hf_row)
+
+
+def _flux_surrogate(atmos_o: Atmos_t, config: Config):
+    """Return the run's AGNI flux surrogate, or None if it is disabled.
+
+    The surrogate stands in for the Newton solve only, so it is never used
+    with the prescribed-temperature solver.
+    """
+    agni = config.atmos_clim.agni
+    if agni.surrogate_tol <= 0 or not agni.solve_energy:
+        return None
+    if atmos_o._surrogate is None:
+        from proteus.atmos_clim.surrogate import FluxSurrogate
+
+        atmos_o._surrogate = FluxSurrogate(config.atmos_clim.surf_state, agni.solution_atol)
+    return atmos_o._surrogate
+
+
+def _skip_agni_solve(surrogate, config: Config, hf_row: dict) -> dict | None:
+    """Answer this iteration from the surrogate, or None if a solve is needed.
+
+    Every decision is logged, with the counts of skipped and solved iterations.
+    """
+    agni = config.atmos_clim.agni
+    if surrogate.streak >= agni.surrogate_max_skips:
+        prediction, reason = None, f'{surrogate.streak} consecutive skips'
+    else:
+        prediction, reason = surrogate.predict(hf_row, agni.surrogate_trust)
+    if prediction is not None and prediction.error >= agni.surrogate_tol:
+        reason = f'predicted error {prediction.error:.2e} >= tol {agni.surrogate_tol:.2e}'
+        prediction = None
+
+    if prediction is None:
+        log.info(
+            'AGNI surrogate: full solve (%s; %d skipped, %d solved)',
+            reason,
+            surrogate.skipped,
+            surrogate.solved,
+        )
+        return None
+
+    surrogate.skipped += 1
+    surrogate.streak += 1
+    atm_output = surrogate.skip_output(prediction, hf_row)
+    if config.planet.prevent_warming:
+        atm_output['F_atm'] = max(1e-8, atm_output['F_atm'])
+    log.info(
+        'AGNI surrogate: skipping solve (predicted F_atm=%.4e W m-2, T_surf=%.2f K; '
+        'predicted error %.2e < tol %.2e; %d in a row, %d skipped, %d solved)',
+        atm_output['F_atm'],
+        atm_output['T_surf'],
+        prediction.error,
+        agni.surrogate_tol,
+        surrogate.streak,
+        surrogate.skipped,
+        surrogate.solved,
+    )
+    return atm_output
+
+
+def solve_column(
+    module: str,
+    atmos_o: Atmos_t,
+    config: Config,
+    dirs: dict,
+    loop_counter: dict,
+    wl: list,
+    fl: list,
+    update_stellar_spectrum: bool,
+    hf_all: pd.DataFrame,
+    hf_row: dict,
+    write_data: bool = True,
+) -> dict:
+    """Solve the atmosphere column with one of the JANUS, AGNI or dummy modules.
+
+    With ``atmos_clim.agni.surrogate_tol > 0``, an AGNI iteration is answered
+    without a solve when the linear-response surrogate built from this run's
+    earlier converged solves is trusted at the current state.
+
+    Parameters
+    ----------
+        module : str
+            Module to solve with: 'janus', 'agni' or 'dummy'.
+        Other parameters
+            As for `run_atmosphere`.
+
+    Returns
+    ----------
+        atm_output : dict
+            Output of the module, keyed as in the helpfile.
+    """
+
+    if module == 'janus':
         # Import
         from proteus.atmos_clim.janus import InitAtm, InitStellarSpectrum, RunJANUS
 
@@ -333,7 +512,7 @@ def run_atmosphere(
             atmos_o._atm, dirs, config, hf_row, hf_all, write_data=write_data
         )
 
-    elif config.atmos_clim.module == 'agni':
+    elif module == 'agni':
         # Import
         from proteus.atmos_clim.agni import (
             activate_julia,
@@ -343,6 +522,16 @@ def run_atmosphere(
             update_agni_atmos,
         )
 
+        # Answer from the linear-response surrogate where it is trusted
+        surrogate = _flux_surrogate(atmos_o, config)
+        if surrogate is not None:
+            if update_stellar_spectrum:
+                surrogate.reset()
+            elif atmos_o._atm is not None:
+                atm_output = _skip_agni_solve(surrogate, config, hf_row)
+                if atm_output is not None:
+                    return atm_output
+
         # Run AGNI
         # Initialise atmosphere struct
         spfile_path = os.path.join(dirs['output'], 'runtime.sf')
@@ -364,7 +553,7 @@ def run_atmosphere(
                 deallocate_atmos(atmos_o._atm)
 
             # allocate new
-            atmos_o._atm = init_agni_atmos(dirs, config, hf_row)
+            atmos_o._atm, atmos_o.seeded = init_agni_atmos(dirs, config, hf_row)
 
             # Check allocation was ok
             if not bool(atmos_o._atm.is_alloc):
@@ -382,63 +571,23 @@ def run_atmosphere(
             config,
             hf_row,
             write_data=write_data,
+            seeded=atmos_o.seeded,
         )
-
-    elif config.atmos_clim.module == 'dummy':
+        atmos_o.seeded = False
+        if surrogate is not None:
+            surrogate.solved += 1
+            surrogate.streak = 0
+            if atm_output['agni_converged']:
+                surrogate.record(hf_row, atm_output)
+
+    elif module == 'dummy':
         # Import
         from proteus.atmos_clim.dummy import RunDummyAtm
 
         # Run dummy atmosphere model
         atm_output = RunDummyAtm(dirs, config, hf_row)
 
-    # Capture the atmosphere convergence flag onto the transient struct
-    # (not persisted to helpfile). AGNI sets this from its Newton solver;
-    # JANUS / dummy / transparent always succeed and default to True.
-    atmos_o.converged = bool(atm_output.pop('agni_converged', True))
-
-    # Store variables common to `hf_row` and `atm_output`
-    for key in atm_output.keys():
-        if key in hf_row.keys():
-            hf_row[key] = atm_output[key]
-
-    # Keep escape and the observables off a structure the solver rejected. This
-    # runs on the merged row, after the module output and the module's direct
-    # writes to `hf_row` are both in place, and before the quantities derived
-    # from the levels below.
-    previous_row = None
-    if hf_all is not None and len(hf_all) > 0:
-        previous_row = hf_all.iloc[-1].to_dict()
-    carry_converged_levels(atmos_o, hf_row, previous_row=previous_row)
-
-    # A carried radius can come from a row written before the clip existed, or
-    # under a different Hill radius, so bound it here as well. The rate escape
-    # computes goes as the cube of this radius, so the bound wins; the gravity
-    # is then placed at the radius the bound left behind. The finiteness test is
-    # on the RESULT rather than on the carried value, because a radius of NaN
-    # compares unequal to everything: testing it there skips the placement in
-    # the one case where the bound does supply a real radius.
-    if hasattr(config, 'escape') and 'R_xuv' in hf_row:
-        carried = float(hf_row['R_xuv'])
-        clipped = clip_radius_to_hill(config, hf_row, carried)
-        hf_row['R_xuv'] = clipped
-        if np.isfinite(clipped) and clipped != carried:
-            realign_xuv_gravity(hf_row, clipped)
-
-    # Persist the solve outcome, so a row whose levels were carried can be
-    # identified from the output alone rather than from the log.
-    hf_row['atm_converged'] = 1.0 if atmos_o.converged else -1.0
-    hf_row['atm_levels_stale'] = float(atmos_o.levels_stale_iters)
-
-    # Copy special cases
-    hf_row['rho_obs'] = 3 * hf_row['M_planet'] / (4 * pi * hf_row['R_obs'] ** 3)
-    hf_row['F_net'] = hf_row['F_int'] - hf_row['F_atm']
-    hf_row['bond_albedo'] = atm_output['albedo']
-
-    # Calculate bolometric observables (measured at infinite distance)
-    update_bolometry(hf_row)
-
-    # Estimate WTG parameter
-    update_wtg_surf(hf_row)
+    return atm_output
 
 
 def write_atmosphere_snapshot(atmos_o: Atmos_t, config: Config, dirs: dict, hf_row: dict):
@@ -578,6 +578,40 @@ def spider():
     get_spider()
 
 
+@click.command()
+@click.option(
+    '--path',
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help='Where to write the sysimage. Default: $FWL_DATA/julia_sysimage/.',
+)
+def sysimage(path: Path | None):
+    """Build a Julia sysimage with AGNI and LovePy precompiled
+
+    Runs pick the image up automatically while it matches the installed
+    Julia, juliacall and AGNI. Reports the startup time to the first AGNI
+    solve with and without it.
+    """
+    from .utils.coupler import get_proteus_directories
+    from .utils.julia_sysimage import SYSIMAGE_ENV, build_sysimage, default_sysimage_path
+
+    try:
+        manifest = build_sysimage(
+            get_proteus_directories()['agni'], str(path) if path is not None else None
+        )
+    except RuntimeError as e:
+        raise click.ClickException(str(e)) from e
+
+    click.echo(f'Sysimage written to {manifest["image"]}')
+    click.echo(
+        'Startup to first AGNI solve: '
+        f'{manifest["startup_default"]:.1f} s without, '
+        f'{manifest["startup_sysimage"]:.1f} s with the sysimage'
+    )
+    if manifest['image'] != default_sysimage_path():
+        click.echo(f'Set {SYSIMAGE_ENV}={manifest["image"]} for runs to use it')
+
+
 cli.add_command(get)
 get.add_command(spectral)
 get.add_command(surfaces)
@@ -591,6 +625,7 @@ get.add_command(interiordata)
 get.add_command(socrates)
 get.add_command(petsc)
 get.add_command(spider)
+get.add_command(sysimage)
 
 # ----------------
 # doctor utility
@@ -630,6 +665,52 @@ def update(dry_run: bool):
 cli.add_command(doctor)
 cli.add_command(update)
 
+# ----------------
+# 'prune-cache' utility
+# ----------------
+
+
+@click.command()
+@click.option(
+    '--path',
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help='JAX compilation cache root. Default: $FWL_DATA/jax_cache.',
+)
+@click.option(
+    '--max-age',
+    type=float,
+    default=None,
+    help='Remove entries not written or used for this many days.',
+)
+@click.option(
+    '--max-size',
+    type=float,
+    default=None,
+    help='Then remove least recently used entries until below this size [GiB].',
+)
+@click.option(
+    '--keep-other-versions',
+    is_flag=True,
+    default=False,
+    help='Keep entries compiled by other JAX versions.',
+)
+def prune_cache(path: Path | None, max_age: float, max_size: float, keep_other_versions: bool):
+    """Prune the persistent JAX compilation cache"""
+    from proteus.utils.jax_cache import default_cache_root, prune_compile_cache
+
+    root = str(path) if path is not None else default_cache_root()
+    removed, freed = prune_compile_cache(
+        root,
+        max_age_days=max_age,
+        max_size=max_size,
+        keep_other_versions=keep_other_versions,
+    )
+    click.echo(f'Removed {removed} files ({freed / 1024**2:.1f} MiB) from {root}')
+
+
+cli.add_command(prune_cache)
+
 # ----------------
 # 'archive' commands
 # ----------------
@@ -803,6 +884,25 @@ def grid_summarise(output_path: Path, status: str):
     gsummarise(output_path, status)
 
 
+@cli.command()
+@output_option
+@click.option(
+    '--workers',
+    default=0,
+    type=int,
+    help='Worker processes; 0 uses one per core.',
+)
+def grid_presolve(output_path: Path, workers: int):
+    """Pre-solve the initial structures of every case of a grid.
+
+    Run on a compute node before the cases start; the Slurm pre-solve job
+    written with `presolve_structure = true` calls it.
+    """
+    from proteus.grid.manage import presolve_grid
+
+    presolve_grid(str(output_path), workers=workers)
+
+
 @cli.command()
 @output_option
 def grid_pack(output_path: Path):
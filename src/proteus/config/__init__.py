@@ -6,6 +6,7 @@ from pathlib import Path
 
 import cattrs
 
+from ._atmos_clim import column_solver
 from ._config import Config
 from .orphans import UnknownConfigKeyError, find_key_problems, format_orphan_message
 
@@ -115,6 +116,7 @@ def read_config_object(path: Path | str) -> Config:
 
 __all__ = [
     'Config',
+    'column_solver',
     'UnknownConfigKeyError',
     'read_config_object',
     'read_config',
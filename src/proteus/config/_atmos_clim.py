@@ -8,6 +8,17 @@ from attrs.validators import ge, gt, in_, le
 from ._converters import lowercase, none_if_none
 
 
+def column_solver(atmos_clim) -> str:
+    """Return the module that solves the atmosphere column.
+
+    This is the selected module, or the fallback module of the emulator when the
+    emulator is selected.
+    """
+    if atmos_clim.module == 'emulator':
+        return atmos_clim.emulator.fallback
+    return atmos_clim.module
+
+
 def warn_if_dummy(instance, attribute, value):
     """Reject enabling this option when the dummy atmos_clim module is selected."""
     if (instance.module == 'dummy') and value:
@@ -22,7 +33,9 @@ def valid_rayleigh(instance, attribute, value):
     if instance.module == 'dummy':
         raise ValueError('Dummy atmos_clim is incompatible with Rayleigh scattering')
 
-    if instance.module == 'agni' and (str(instance.agni.spectral_file).lower() == 'greygas'):
+    if column_solver(instance) == 'agni' and (
+        str(instance.agni.spectral_file).lower() == 'greygas'
+    ):
         raise ValueError('AGNI grey gas is incompatible with Rayleigh scattering')
 
 
@@ -41,7 +54,9 @@ def valid_aerosols_enabled(instance, attribute, value):
     if instance.module == 'dummy':
         raise ValueError(f'Dummy atmos_clim module is incompatible with {attribute.name}=True')
 
-    if instance.module == 'agni' and (str(instance.agni.spectral_file).lower() == 'greygas'):
+    if column_solver(instance) == 'agni' and (
+        str(instance.agni.spectral_file).lower() == 'greygas'
+    ):
         raise ValueError(
             'AGNI grey gas is incompatible with aerosols (band-resolved Mie '
             'scattering requires a real spectral file)'
@@ -56,7 +71,7 @@ def check_overlap(instance, attribute, value):
 
 def valid_agni(instance, attribute, value):
     """Validate AGNI settings: pressure ordering, surface-state support, rainout, spectral file."""
-    if instance.module != 'agni':
+    if column_solver(instance) != 'agni':
         return
 
     # ensure psurf_thresh is greater than p_top, to avoid upside-down atmosphere in transparent mode
@@ -190,6 +205,15 @@ class Agni:
         Grey longwave opacity [m2 kg-1], used when `spectral_file='greygas'`.
     grey_opacity_sw: float
         Grey shortwave opacity [m2 kg-1], used when `spectral_file='greygas'`.
+    surrogate_tol: float
+        Answer an iteration without a full solve when a linear-response fit to
+        this run's earlier converged solves predicts F_atm and T_surf to within
+        this relative error. 0 disables.
+    surrogate_trust: float
+        Trust region of the fit: largest relative change of the boundary
+        temperature and surface pressure from the last full solve.
+    surrogate_max_skips: int
+        Consecutive iterations answered by the fit before a full solve is forced.
     """
 
     verbosity: int = field(
@@ -258,11 +282,16 @@ class Agni:
     spectral_file: str | None = field(default=None, converter=none_if_none)
     grey_opacity_lw: float = field(default=1e1, validator=gt(0))
     grey_opacity_sw: float = field(default=1e-4, validator=gt(0))
+    # Linear-response surrogate answering iterations without a full solve.
+    # Set surrogate_tol to 0 to disable.
+    surrogate_tol: float = field(default=0.0, validator=ge(0))
+    surrogate_trust: float = field(default=0.02, validator=(gt(0), le(1)))
+    surrogate_max_skips: int = field(default=5, validator=ge(1))
 
 
 def valid_janus(instance, attribute, value):
     """Validate JANUS settings: spectral file selection and temperature-bound ordering."""
-    if instance.module != 'janus':
+    if column_solver(instance) != 'janus':
         return
 
     # set spectral files?
@@ -333,6 +362,45 @@ class Dummy:
     fixed_flux: float = field(default=-1.0)
 
 
+def valid_emulator(instance, attribute, value):
+    """Validate emulator settings: the table must exist, and the surface state be tabulable."""
+    if instance.module != 'emulator':
+        return
+
+    if instance.surf_state not in ('fixed', 'skin'):
+        raise ValueError("The atmosphere emulator supports `surf_state` 'fixed' or 'skin' only")
+
+    if instance.emulator.table is None:
+        raise ValueError('Must set `atmos_clim.emulator.table` when using the emulator')
+    if not os.path.isfile(instance.emulator.table):
+        raise FileNotFoundError(
+            f'Atmosphere emulator table not found at specified path: {instance.emulator.table}'
+        )
+
+
+@define
+class Emulator:
+    """Tabulated atmosphere emulator.
+
+    Interpolates the outgoing flux, albedo, surface temperature and transit radius
+    from a table of converged solves of the `fallback` module, generated with
+    ``tools/generate_atmos_emulator.py``. A state the table does not cover is
+    solved with the `fallback` module instead, whose settings are then read
+    from its own section as usual. A table solved with other settings than the
+    run's is refused.
+
+    Attributes
+    ----------
+    table: str | None
+        Path to the emulator table (.npz).
+    fallback: str
+        Module to solve states outside the table. Choices: 'agni', 'janus'.
+    """
+
+    table: str | None = field(default=None, converter=none_if_none)
+    fallback: str = field(default='agni', validator=in_(('agni', 'janus')))
+
+
 @define
 class AtmosClim:
     """Atmosphere parameters, model selection.
@@ -340,7 +408,7 @@ class AtmosClim:
     Attributes
     ----------
     module: str
-        Which atmosphere module to use. Choices: 'agni', 'janus', 'dummy'.
+        Which atmosphere module to use. Choices: 'agni', 'janus', 'dummy', 'emulator'.
     spectral_group: str
         Spectral file group defining gas opacities. See https://proteus-framework.org/SOCRATES/Reference/proteus_spectral_file_reference.html
     spectral_bands: str
@@ -379,13 +447,16 @@ class AtmosClim:
         Config parameters for JANUS atmosphere module.
     dummy: Dummy
         Config parameters for dummy atmosphere module.
+    emulator: Emulator
+        Config parameters for the tabulated atmosphere emulator.
     """
 
-    module: str = field(default='agni', validator=in_(('dummy', 'agni', 'janus')))
+    module: str = field(default='agni', validator=in_(('dummy', 'agni', 'janus', 'emulator')))
 
     agni: Agni = field(factory=Agni, validator=valid_agni)
     janus: Janus = field(factory=Janus, validator=valid_janus)
     dummy: Dummy = field(factory=Dummy)
+    emulator: Emulator = field(factory=Emulator, validator=valid_emulator)
 
     # Grid and spectral setup (shared by agni + janus)
     spectral_group: str = field(default='Honeyside')
@@ -511,5 +582,10 @@ DOC_GROUPS = {
                 'fastchem_xtol_elem',
             ),
         ),
+        (
+            'Linear-response surrogate',
+            'used when `surrogate_tol > 0`',
+            ('surrogate_tol', 'surrogate_trust', 'surrogate_max_skips'),
+        ),
     ),
 }
@@ -7,7 +7,7 @@ from attrs import asdict, define, field
 
 from ._accretion import Accretion
 from ._atmos_chem import AtmosChem
-from ._atmos_clim import AtmosClim
+from ._atmos_clim import AtmosClim, column_solver
 from ._converters import dict_replace_none
 from ._escape import Escape
 from ._interior import Interior
@@ -116,25 +116,32 @@ def check_module_dependencies(instance, attribute, value):
 
 
 def boreas_requires_atmosphere(instance, attribute, value):
-    """BOREAS escape requires a radiative atmosphere (not dummy)."""
-    if (instance.escape.module == 'boreas') and (instance.atmos_clim.module == 'dummy'):
+    """BOREAS escape requires a radiative atmosphere (not dummy or emulator)."""
+    if (instance.escape.module == 'boreas') and (
+        instance.atmos_clim.module in ('dummy', 'emulator')
+    ):
         raise ValueError(
             'escape.module = "boreas" requires a radiative atmosphere model (agni or janus), '
-            'not atmos_clim.module = "dummy". BOREAS needs per-level T/P/composition profiles.'
+            f'not atmos_clim.module = "{instance.atmos_clim.module}". '
+            'BOREAS needs per-level T/P/composition profiles.'
         )
 
 
 def observe_resolved_atmosphere(instance, attribute, value):
-    """Synthetic observations require a spatially resolved atmosphere (not dummy)."""
-    if (instance.observe.module is not None) and (instance.atmos_clim.module == 'dummy'):
-        raise ValueError('Observational synthesis requires that atmos_clim != dummy')
+    """Synthetic observations require a spatially resolved atmosphere (not dummy or emulator)."""
+    if (instance.observe.module is not None) and (
+        instance.atmos_clim.module in ('dummy', 'emulator')
+    ):
+        raise ValueError(
+            f'Observational synthesis requires that atmos_clim != {instance.atmos_clim.module}'
+        )
 
 
 def janus_escape_atmosphere(instance, attribute, value):
     """ZEPHYRUS escape with JANUS requires the escape stop criterion to be enabled."""
     if (
         (instance.escape.module == 'zephyrus')
-        and (instance.atmos_clim.module == 'janus')
+        and (column_solver(instance.atmos_clim) == 'janus')
         and (not instance.params.stop.escape.enabled)
     ):
         raise ValueError(
@@ -279,6 +286,23 @@ def boundary_requires_fixed_surface_state(instance, attribute, value):
         )
 
 
+def adaptive_levels_valid(instance, attribute, value):
+    """Adaptive resolution needs SPIDER on a Zalmoxis mesh and a coarser level."""
+    ie = instance.interior_energetics
+    if not ie.adaptive_levels:
+        return
+    if ie.module != 'spider' or instance.interior_struct.module != 'zalmoxis':
+        raise ValueError(
+            'interior_energetics.adaptive_levels requires '
+            "interior_energetics.module='spider' and interior_struct.module='zalmoxis'"
+        )
+    if ie.num_levels_min > ie.num_levels:
+        raise ValueError(
+            'interior_energetics.num_levels_min must not exceed num_levels '
+            f'(num_levels_min={ie.num_levels_min}, num_levels={ie.num_levels})'
+        )
+
+
 @define
 class Config:
     """Root config parameters.
@@ -332,6 +356,7 @@ class Config:
         validator=(
             tides_enabled_orbit,
             boundary_requires_fixed_surface_state,
+            adaptive_levels_valid,
         ),
     )
     outgas: Outgas = field(factory=Outgas)
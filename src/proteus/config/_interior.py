@@ -104,6 +104,9 @@ class Spider:
         Absolute mass tolerance [kg] for the interior-radius secant solver.
     log_output: bool
         Write SPIDER solver log output.
+    json_sidecar: bool
+        Cache the fields of each SPIDER output JSON in a binary sidecar
+        (``data/.json_cache``), so later reads of that JSON skip the parse.
     """
 
     solver_type: str = field(default='bdf', validator=in_(('adams', 'bdf')))
@@ -132,6 +135,10 @@ class Spider:
     # where the log files accumulate disk pressure.
     log_output: bool = field(default=True)
 
+    # Off by default: the sidecars add to the disk used by the SPIDER
+    # output. Worth enabling when the same JSONs are read many times.
+    json_sidecar: bool = field(default=False)
+
 
 def valid_aragog(instance, attribute, value):
     """Aragog requires at least one energy transport term to be enabled."""
@@ -148,6 +155,14 @@ def valid_aragog(instance, attribute, value):
         raise ValueError('Must enable at least one energy transport term in Aragog')
 
 
+def valid_speculative_retries(instance, attribute, value):
+    """Speculative retries are off (0) or probe at least two rungs."""
+    if value == 1:
+        raise ValueError(
+            f'interior_energetics.aragog.speculative_retries must be 0 or >= 2, got {value}'
+        )
+
+
 @define
 class Aragog:
     """Aragog-specific parameters.
@@ -275,6 +290,18 @@ class Aragog:
     matching field so both backends drive the same outer-loop convergence
     criterion."""
 
+    speculative_retries: int = field(default=0, validator=[ge(0), valid_speculative_retries])
+    """Number of retry-ladder rungs solved concurrently when a coupling step
+    fails its first CVODE attempt: 0 (serial ladder) or at least 2; 1 is
+    rejected, since a single probe would only run while the main process
+    waits. Attempts 2..n+1 (halved dt, relaxed atol) run in warm worker
+    processes on spare cores, each from the same restored state as the
+    serial ladder; the main process takes over the solution of each rung it
+    reaches instead of solving it again, so results are unchanged and only
+    wall time on stiff steps drops. Capped at the number of cores minus one,
+    and at the number of workers that have finished starting up. Default 0;
+    falls back to serial inside daemonic worker processes."""
+
 
 def valid_interiordummy(instance, attribute, value):
     """Dummy interior requires the liquidus to sit above the solidus."""
@@ -430,6 +457,14 @@ class Interior:
         Width of rheological transition in terms of melt fraction
     num_levels: int
         Number of radial grid levels for the energetics domain.
+    adaptive_levels: bool
+        Adapt the number of levels to the rheological front at each
+        structure update: the partially molten cells must span at least 8
+        levels, a front at the core-mantle boundary gets num_levels, and a
+        mantle without a front gets num_levels_min. Levels stay evenly spaced.
+        SPIDER with Zalmoxis structure only.
+    num_levels_min: int
+        Smallest number of radial grid levels used by adaptive_levels.
     num_tolerance: float
         Deprecated alias for rtol; emits a DeprecationWarning when set.
     trans_conduction: bool
@@ -484,6 +519,8 @@ class Interior:
         default='aragog', validator=in_(('spider', 'aragog', 'dummy', 'boundary'))
     )
     num_levels: int = field(default=80, validator=ge(40))
+    adaptive_levels: bool = field(default=False)
+    num_levels_min: int = field(default=40, validator=ge(40))
 
     # Unified ODE tolerance: both SPIDER and Aragog read from here.
     # num_tolerance is a deprecated alias (emits DeprecationWarning).
@@ -778,6 +815,8 @@ DOC_GROUPS = {
             (
                 'module',
                 'num_levels',
+                'adaptive_levels',
+                'num_levels_min',
                 'rtol',
                 'num_tolerance',
                 'atol',
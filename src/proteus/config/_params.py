@@ -92,16 +92,18 @@ class TimeStepParams:
     starinst: float
         Maximum interval at which to recalculate instellation flux [yr].
     method: str
-        Time-stepping method. Choices: 'proportional', 'adaptive', 'maximum'.
+        Time-stepping method. 'pi' sizes steps with a PI controller on a
+        local error estimate of the coupled state (T_magma, Phi_global,
+        F_atm, P_surf).
     propconst: float
         Proportionality constant (proportional method).
     atol: float
-        Absolute tolerance on time-step size (adaptive method) [yr].
+        Absolute tolerance on time-step size (adaptive and pi methods) [yr].
     rtol: float
-        Relative tolerance on time-step size (adaptive method) [dimensionless].
+        Relative tolerance on time-step size (adaptive and pi methods) [dimensionless].
     scale_incr: float
-        Scale factor to grow time-step on a successful adaptive step
-        [dimensionless, must be >1].
+        Scale factor to grow time-step on a successful adaptive step; the
+        largest growth per step for the pi method [dimensionless, must be >1].
     scale_decr: float
         Scale factor to shrink time-step on a rejected adaptive step
         [dimensionless, in (0, 1)].
@@ -152,7 +154,7 @@ class TimeStepParams:
     starinst: float = field(default=1e2, validator=ge(0))
 
     method: str = field(
-        default='adaptive', validator=in_(('proportional', 'adaptive', 'maximum'))
+        default='adaptive', validator=in_(('proportional', 'adaptive', 'pi', 'maximum'))
     )
 
     propconst: float = field(default=52.0, validator=gt(0))
@@ -384,6 +386,28 @@ class StopParams:
     strict: bool = field(default=False)
 
 
+@define
+class CompileCacheParams:
+    """Parameters for the persistent JAX compilation cache.
+
+    Attributes
+    ----------
+    enabled: bool
+        Store compiled JAX kernels (Aragog CVODE right-hand side and Jacobian, Zalmoxis JAX structure solver) on disk and reuse them in later runs. A directory exported through ``JAX_COMPILATION_CACHE_DIR`` takes precedence over `path`.
+    path: str
+        Cache root directory. Set to ``"auto"`` (default) for ``$FWL_DATA/jax_cache``. Entries are stored in one subdirectory per JAX version.
+    max_size: float
+        Size bound of the cache [GiB], enforced by JAX's least-recently-used eviction where the installed JAX supports it.
+    min_compile_time: float
+        Only cache kernels whose compilation took at least this long [s].
+    """
+
+    enabled: bool = field(default=False)
+    path: str = field(default='auto', validator=valid_path)
+    max_size: float = field(default=20.0, validator=gt(0))
+    min_compile_time: float = field(default=1.0, validator=ge(0))
+
+
 @define
 class Params:
     """Parameters for code execution, output files, time-stepping, convergence.
@@ -396,6 +420,8 @@ class Params:
         Parameters for time-stepping.
     stop: StopParams
         Parameters for stopping criteria.
+    compile_cache: CompileCacheParams
+        Parameters for the persistent JAX compilation cache.
     resume: bool
         Resume the simulation from the last archived state in the output
         folder, instead of starting from scratch.
@@ -407,6 +433,7 @@ class Params:
     out: OutputParams = field(factory=OutputParams)
     dt: TimeStepParams = field(factory=TimeStepParams)
     stop: StopParams = field(factory=StopParams)
+    compile_cache: CompileCacheParams = field(factory=CompileCacheParams)
 
     resume: bool = field(default=False)
     offline: bool = field(default=False)
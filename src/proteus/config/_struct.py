@@ -131,6 +131,12 @@ class Zalmoxis:
         Number of pressure points in SPIDER P-S tables generated from PALEOS.
     lookup_nS: int
         Number of entropy points in SPIDER P-S tables generated from PALEOS.
+    lookup_workers: int
+        Worker processes that generate the SPIDER P-S tables, each filling a
+        slab of pressure columns. 0 uses one per CPU core, 1 generates them
+        serially. The tables are identical for any value. The workers are
+        spawned and load the PALEOS tables themselves; generation is serial
+        inside daemonic worker processes.
     outer_solver: str
         Outer mass-radius solver: 'newton' (recommended) or 'picard'.
     use_jax: bool
@@ -161,6 +167,11 @@ class Zalmoxis:
     update_stale_ceiling: float
         Time since the last successful re-solve after which a trigger
         refires [yr]; 0 disables.
+    surrogate_tol: float
+        Skip a re-solve fired by the Phi, T_magma or composition trigger
+        when a linear-response fit to this run's earlier re-solves predicts
+        that R_int and gravity would change by less than this relative
+        amount. 0 disables.
     mesh_max_shift: float
         Maximum fractional radius shift per structure update.
     mesh_convergence_interval: float
@@ -219,6 +230,9 @@ class Zalmoxis:
     # normal interval rather than waiting a full one.
     # Set to 0 to disable. Set high to relax.
     update_stale_ceiling: float = field(default=2.5e4, validator=ge(0))
+    # Linear-response surrogate answering state-change triggers without a
+    # re-solve. Set to 0 to disable.
+    surrogate_tol: float = field(default=0.0, validator=ge(0))
 
     # Mesh smoothing
     mesh_max_shift: float = field(default=0.05, validator=(gt(0), lt(1)))
@@ -246,6 +260,7 @@ class Zalmoxis:
     # SPIDER P-S table resolution (generated from PALEOS)
     lookup_nP: int = field(default=1350, validator=ge(100))
     lookup_nS: int = field(default=280, validator=ge(50))
+    lookup_workers: int = field(default=0, validator=ge(0))
 
     # Binodal-aware miscibility (H2-MgSiO3 solvus)
     global_miscibility: bool = field(default=False)
@@ -430,6 +445,7 @@ DOC_GROUPS = {
                 'update_interval',
                 'update_min_interval',
                 'update_stale_ceiling',
+                'surrogate_tol',
                 'mesh_max_shift',
                 'mesh_convergence_interval',
             ),
@@ -449,6 +465,7 @@ DOC_GROUPS = {
             (
                 'lookup_nP',
                 'lookup_nS',
+                'lookup_workers',
             ),
         ),
         (
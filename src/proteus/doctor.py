@@ -36,6 +36,12 @@ from proteus.utils.coupler import (
     _get_socrates_version,
     get_proteus_directories,
 )
+from proteus.utils.julia_sysimage import (
+    SYSIMAGE_ENV,
+    read_manifest,
+    stale_reason,
+    sysimage_path,
+)
 
 # ─── Check result types ──────────────────────────────────────────────
 
@@ -403,6 +409,39 @@ def check_julia() -> CheckResult:
     )
 
 
+def check_julia_sysimage() -> CheckResult:
+    """Check the PROTEUS Julia sysimage is built and matches this environment."""
+    image = sysimage_path()
+    if image is None:
+        return CheckResult(
+            name='julia-sysimage',
+            category='environment',
+            status=PASS,
+            message=f'disabled ({SYSIMAGE_ENV}=none)',
+        )
+    # Building takes several minutes, so `proteus update` only suggests it
+    reason = stale_reason(image)
+    if reason is not None:
+        return CheckResult(
+            name='julia-sysimage',
+            category='environment',
+            status=WARN,
+            message=f'{reason}; Julia loads and compiles AGNI at every startup',
+            fix_cmd='proteus get sysimage',
+            auto_fixable=False,
+        )
+    manifest = read_manifest(image)
+    return CheckResult(
+        name='julia-sysimage',
+        category='environment',
+        status=PASS,
+        message=(
+            f'{image} (startup {manifest["startup_default"]:.1f} s -> '
+            f'{manifest["startup_sysimage"]:.1f} s)'
+        ),
+    )
+
+
 def check_python_package(name: str, spec: Requirement | None) -> CheckResult:
     """Check a Python package against the pyproject.toml version spec."""
     try:
@@ -642,6 +681,17 @@ def run_all_checks() -> list[CheckResult]:
                 message=f'check error: {exc}',
             )
         )
+    try:
+        results.append(check_julia_sysimage())
+    except Exception as exc:
+        results.append(
+            CheckResult(
+                name='julia-sysimage',
+                category='environment',
+                status=FAIL,
+                message=f'check error: {exc}',
+            )
+        )
 
     # Data
     try:
@@ -746,12 +796,21 @@ _ENV_VARS = (
     'PETSC_DIR',
     'PYTHON_JULIAPKG_EXE',
     'PYTHON_JULIACALL_BINDIR',
+    'PYTHON_JULIACALL_SYSIMAGE',
+    'PROTEUS_JULIA_SYSIMAGE',
     'CONDA_DEFAULT_ENV',
     'CONDA_PREFIX',
 )
 # Variables whose value is a filesystem path; the report flags whether it exists.
 _ENV_PATH_VARS = frozenset(
-    {'FWL_DATA', 'RAD_DIR', 'FC_DIR', 'PETSC_DIR', 'PYTHON_JULIAPKG_EXE'}
+    {
+        'FWL_DATA',
+        'RAD_DIR',
+        'FC_DIR',
+        'PETSC_DIR',
+        'PYTHON_JULIAPKG_EXE',
+        'PYTHON_JULIACALL_SYSIMAGE',
+    }
 )
 
 
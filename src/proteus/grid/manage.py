@@ -19,7 +19,9 @@ from getpass import getuser
 import numpy as np
 import toml
 
+from proteus.atmos_clim.spectral_cache import CACHE_DIR_ENV as SPFILE_CACHE_ENV
 from proteus.config import Config, read_config_object
+from proteus.interior_struct import ps_tables, warmstart
 from proteus.utils.helper import get_proteus_dir, recursive_setattr
 from proteus.utils.logs import setup_logger
 
@@ -40,6 +42,59 @@ def _thread_target(cfg_path, test, wait):
     time.sleep(wait)  # wait a bit, in case the process exited immediately
 
 
+# CPUs requested for the Slurm job that pre-solves the initial structures
+PRESOLVE_MAX_CPUS = 16
+
+
+def presolve_store_env(outdir: str) -> dict:
+    """Point the structure pre-solve stores of a grid into its output directory.
+
+    The structure warm-start store and the P-S table cache default to
+    ``struct_cache/`` and ``ps_cache/`` in `outdir`, unless the environment
+    already sets them. Processes started from this one inherit them.
+
+    Parameters
+    ----------
+    - `outdir:str`      grid output directory
+
+    Returns
+    -------
+    - `env:dict`        store environment variables the cases must see
+    """
+    env = {}
+    for var, subdir in (
+        (warmstart.STORE_DIR_ENV, 'struct_cache'),
+        (ps_tables.CACHE_DIR_ENV, 'ps_cache'),
+    ):
+        env[var] = os.environ.get(var, '').strip() or os.path.join(outdir, subdir)
+        log.info('Structure pre-solve: %s=%s' % (var, env[var]))
+    os.environ.update(env)
+    return env
+
+
+def presolve_grid(outdir: str, workers: int = 0):
+    """Pre-solve the initial structures of every case of a written grid.
+
+    Run by ``proteus grid-presolve``, which the Slurm pre-solve job calls
+    on a compute node before the case array starts.
+
+    Parameters
+    ----------
+    - `outdir:str`      grid output directory, holding the case configs in ``cfgs/``
+    - `workers:int`     number of worker processes; 0 means one per core
+    """
+    from proteus.interior_struct.batch import presolve_initial_structures
+
+    cfgdir = os.path.join(outdir, 'cfgs')
+    paths = sorted(
+        os.path.join(cfgdir, name) for name in os.listdir(cfgdir) if name.endswith('.toml')
+    )
+    if not paths:
+        raise FileNotFoundError(f'No case configs in {cfgdir}')
+    presolve_store_env(outdir)
+    presolve_initial_structures(paths, workers=workers)
+
+
 # Object for handling the parameter grid
 class Grid:
     CONFIG_BASENAME = 'case_%06d'
@@ -291,12 +346,60 @@ class Grid:
             thisconf.write(self._get_tmpcfg(i))
             os.sync()
 
+    def presolve_structures(self, workers: int, test_run: bool = False) -> dict:
+        """Pre-solve every case's initial structure before the cases launch.
+
+        Points the structure stores into the grid output directory (see
+        :func:`presolve_store_env`) and fills them with the initial
+        structures of all cases (see ``proteus.interior_struct.batch``).
+        Cases launched from this process inherit the environment.
+
+        Parameters
+        ----------
+        - `workers:int`     number of worker processes
+        - `test_run:bool`   if true, sets up the stores but solves nothing
+
+        Returns
+        -------
+        - `env:dict`        store environment variables the cases must see
+        """
+        env = presolve_store_env(self.outdir)
+        if not test_run:
+            from proteus.interior_struct.batch import presolve_initial_structures
+
+            presolve_initial_structures(
+                [self._get_tmpcfg(i) for i in range(self.size)], workers=workers
+            )
+        return env
+
+    def share_spectral_files(self) -> dict:
+        """Share prepared spectral files between the cases.
+
+        Points the spectral-file cache at ``spectral_cache/`` in the grid
+        output directory, unless the environment already sets it (see
+        ``proteus.atmos_clim.spectral_cache``). Cases launched from this
+        process inherit the environment.
+
+        Returns
+        -------
+        - `env:dict`        cache environment variable the cases must see
+        """
+        var = SPFILE_CACHE_ENV
+        env = {
+            var: os.environ.get(var, '').strip() or os.path.join(self.outdir, 'spectral_cache')
+        }
+        log.info('Spectral-file cache: %s=%s' % (var, env[var]))
+        os.environ.update(env)
+        return env
+
     def run(
         self,
         num_threads: int,
         test_run: bool = False,
         check_interval: float = 15.0,
         print_interval: float = 8,
+        presolve: bool = False,
+        spectral_cache: bool = False,
     ):
         """
         Run GridPROTEUS on the current machine.
@@ -309,6 +412,8 @@ class Grid:
         - `test_run:bool`           if true, does not actually run PROTEUS
         - `check_interval:float`    interval [secs] at which to check status of workers
         - `print_interval:int`      step interval at which to print (8*15 seconds = 2 minutes)
+        - `presolve:bool`           pre-solve the initial structures before launching cases
+        - `spectral_cache:bool`     share prepared spectral files between the cases
         """
 
         log.info("Running PROTEUS across parameter grid '%s'" % self.name)
@@ -353,6 +458,10 @@ class Grid:
             print_interval = 1
 
         self.write_config_files()
+        if presolve:
+            self.presolve_structures(num_threads, test_run=test_run)
+        if spectral_cache:
+            self.share_spectral_files()
 
         gc.collect()
 
@@ -489,6 +598,8 @@ class Grid:
         max_days: int = 1,
         max_mem: int = 12,
         jax_cache: bool = False,
+        presolve: bool = False,
+        spectral_cache: bool = False,
     ):
         """Write slurm config file.
 
@@ -512,6 +623,18 @@ class Grid:
             recompiles are cut. An LRU size bound caps the cache so it cannot
             fill the filesystem. Default false: no cache environment variables
             are written and the script behaves exactly as before.
+        presolve : bool
+            If true, also writes ``slurm_presolve.sh``, a job that pre-solves
+            the initial structures of all cases on a compute node with
+            ``proteus grid-presolve``, and ``slurm_submit.sh``, which submits
+            it and then the array with a dependency on it. Both scripts
+            export the structure warm-start store and P-S table cache. The
+            array depends on the pre-solve ending, not on its success: a case
+            whose structure was not pre-solved solves it at startup.
+        spectral_cache : bool
+            If true, the script exports a spectral-file cache shared by the
+            array tasks, so cases around the same star prepare each spectral
+            file once.
         """
 
         max_days = int(max_days)  # ensure integer
@@ -529,6 +652,16 @@ class Grid:
         log.info(' ')
         self.write_config_files()
 
+        # Optional structure pre-solve, run as its own job ahead of the array;
+        # the array tasks must see the same stores
+        store_env = ''
+        if presolve:
+            env = presolve_store_env(self.outdir)
+            store_env = ''.join(f'export {var}={path}\n' for var, path in env.items())
+        if spectral_cache:
+            env = self.share_spectral_files()
+            store_env += ''.join(f'export {var}={path}\n' for var, path in env.items())
+
         if test_run:
             command = '/bin/echo Dummy output. Config file is at: '
         else:
@@ -561,7 +694,7 @@ class Grid:
 #SBATCH -o {log_file}
 #SBATCH --array=0-{self.size - 1}%{max_jobs}
 
-{jax_env}i=$SLURM_ARRAY_TASK_ID
+{jax_env}{store_env}i=$SLURM_ARRAY_TASK_ID
 
 while [ $i -lt {self.size} ]; do
     printf -v cfg "{self.cfgdir}/{self.CONFIG_BASENAME}.toml" $((i))
@@ -576,10 +709,38 @@ done
         with open(slurm_path, 'w') as f:
             f.write(string)
 
+        submit = f'sbatch {slurm_path}'
+        if presolve:
+            cpus = min(max_jobs, PRESOLVE_MAX_CPUS)
+            if test_run:
+                presolve_command = '/bin/echo Dummy pre-solve of the cases in'
+            else:
+                presolve_command = f'proteus grid-presolve --workers {cpus} --output'
+            presolve_path = os.path.join(self.outdir, 'slurm_presolve.sh')
+            with open(presolve_path, 'w') as f:
+                f.write(f"""#!/bin/sh
+#SBATCH -J proteus.grid.presolve
+#SBATCH --export=ALL
+#SBATCH --time=0-12
+#SBATCH --cpus-per-task={cpus}
+#SBATCH --mem-per-cpu={max_mem}G
+#SBATCH -i /dev/null
+#SBATCH -o {os.path.join(self.logdir, 'presolve-%j.log')}
+
+{store_env}{presolve_command} {self.outdir}
+""")
+            submit = f'sh {os.path.join(self.outdir, "slurm_submit.sh")}'
+            with open(os.path.join(self.outdir, 'slurm_submit.sh'), 'w') as f:
+                f.write(f"""#!/bin/sh
+# Pre-solve the initial structures, then run the cases once it has ended
+jid=$(sbatch --parsable {presolve_path}) || exit 1
+sbatch --dependency=afterany:${{jid%%;*}} {slurm_path}
+""")
+
         user = getuser()
         log.info('')
         log.info('Submit to Slurm using:')
-        log.info('    `sbatch %s`', slurm_path)
+        log.info('    `%s`', submit)
         log.info('')
         log.info('To look at the Slurm queue:')
         log.info('    `squeue` or `squeue -u %s`', user)
@@ -630,6 +791,14 @@ def grid_from_config(config_fpath: str, test_run: bool = False, check_interval:
     # Absent or false leaves the generated script cache-free.
     jax_cache = bool(config.get('jax_cache', False))
 
+    # Optional pre-solve of every case's initial structure before dispatch.
+    # Absent or false leaves the structure solve to each case's startup.
+    presolve = bool(config.get('presolve_structure', False))
+
+    # Optional spectral-file cache shared by the cases.
+    # Absent or false leaves each case to prepare its own spectral files.
+    spectral_cache = bool(config.get('spectral_cache', False))
+
     # Base config file
     cfg_base = os.path.join(PROTEUS_DIR, str(config['ref_config']))
 
@@ -689,8 +858,16 @@ def grid_from_config(config_fpath: str, test_run: bool = False, check_interval:
             max_days=max_days,
             max_mem=max_mem,
             jax_cache=jax_cache,
+            presolve=presolve,
+            spectral_cache=spectral_cache,
         )
     else:
         # Alternatively, let grid_proteus.py manage the jobs
-        pg.run(max_jobs, test_run=test_run, check_interval=check_interval)
+        pg.run(
+            max_jobs,
+            test_run=test_run,
+            check_interval=check_interval,
+            presolve=presolve,
+            spectral_cache=spectral_cache,
+        )
         log.info('GridPROTEUS finished')
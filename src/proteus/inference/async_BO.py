@@ -26,6 +26,7 @@ import pandas as pd
 import torch
 
 from proteus.inference.BO import BO_step, init_locs
+from proteus.inference.multifidelity import MF_BO_step, mf_builder, mf_init_locs
 from proteus.inference.utils import get_kernel, load_dataset_csv, save_dataset_csv
 from proteus.utils.coupler import get_proteus_directories
 
@@ -188,6 +189,7 @@ def parallel_process(
     observables: dict,
     parameters: dict,
     failure_codes: list[int],
+    fidelity: dict | None = None,
 ) -> tuple[dict, list, list]:
     """Orchestrate parallel asynchronous Bayesian optimization.
 
@@ -207,6 +209,8 @@ def parallel_process(
     - observables (dict): Target observables (keys) and values.
     - parameters (dict):  Parameters (keys) with bounds (values) for inference.
     - failure_codes (list[int]): Additional PROTEUS exit codes to treat as failures.
+    - fidelity (dict | None): Multi-fidelity settings from `get_fidelity_config`,
+      or None for single-fidelity optimization.
 
     Returns
     ----------
@@ -216,24 +220,44 @@ def parallel_process(
     """
 
     # Partially apply builder and BO_step with fixed settings
-    build_obj = partial(
-        objective_builder,
-        observables=observables,
-        parameters=parameters,
-        ref_config=ref_config,
-        output=output,
-        failure_codes=failure_codes,
-    )
+    if fidelity is None:
+        build_obj = partial(
+            objective_builder,
+            observables=observables,
+            parameters=parameters,
+            ref_config=ref_config,
+            output=output,
+            failure_codes=failure_codes,
+        )
 
-    # Build kernel
-    d = len(parameters)
-    kernel = get_kernel(kernel, d)
+        # Build kernel
+        d = len(parameters)
+        kernel = get_kernel(kernel, d)
 
-    process_fun = partial(
-        BO_step,
-        k=kernel,
-        acqf=acqf,
-    )
+        process_fun = partial(
+            BO_step,
+            k=kernel,
+            acqf=acqf,
+        )
+
+    # Multi-fidelity: objective dispatches on the fidelity column, and the
+    # surrogate provides its own fidelity-aware kernel
+    else:
+        build_obj = partial(
+            mf_builder,
+            observables=observables,
+            parameters=parameters,
+            ref_config=ref_config,
+            output=output,
+            failure_codes=failure_codes,
+            overrides=fidelity['overrides'],
+        )
+
+        process_fun = partial(
+            MF_BO_step,
+            acqf=acqf,
+            ratio=fidelity['ratio'],
+        )
 
     # Absolute path to shared output dir
     output_abspath = get_proteus_directories(output)['output']
@@ -254,7 +278,10 @@ def parallel_process(
     log_list = mgr.list([None] * n_init)  # no logs from init data
 
     # Generate initial candidate locations and busy-map
-    X_init = init_locs(n_workers, D_shared, acqf=acqf)  # shape (n_workers, d)
+    if fidelity is None:
+        X_init = init_locs(n_workers, D_shared, acqf=acqf)  # shape (n_workers, d)
+    else:
+        X_init = mf_init_locs(n_workers, D_shared, fidelity['ratio'], acqf=acqf)
     B = mgr.dict()
 
     # Shared list for end times
@@ -11,15 +11,16 @@ from __future__ import annotations
 import logging
 import os
 import time
+import tomllib
+from concurrent.futures import ThreadPoolExecutor
 from multiprocessing import Pool
 from pathlib import Path
 
 import numpy as np
-import pandas as pd
-import toml
 import torch
 from scipy.stats.qmc import Halton
 
+from proteus.inference.multifidelity import HIGH_FIDELITY, LOW_FIDELITY, mf_builder
 from proteus.inference.objective import child_timeout_s, eval_obj, prot_builder
 from proteus.inference.transforms import normalize_parameters
 from proteus.inference.utils import save_dataset_csv
@@ -30,14 +31,19 @@ from proteus.utils.helper import recursive_get
 dtype = torch.double
 log = logging.getLogger('fwl.' + __name__)
 
+# Block size when reading helpfiles backwards from the end [bytes]
+_TAIL_BLOCK = 8192
 
-def create_init(config):
+
+def create_init(config, fidelity: dict | None = None):
     """Create the initial BO dataset using sampling or a precomputed grid.
 
     Parameters
     ----------
     - config (dict): Inference config containing `init_grid`, `init_samps`,
       parameter bounds, observables, output location, and seed.
+    - fidelity (dict | None): Multi-fidelity settings from `get_fidelity_config`,
+      or None for single-fidelity optimization.
 
     Returns
     ----------
@@ -58,6 +64,9 @@ def create_init(config):
         init_grid = get_proteus_directories(init_grid)['output']
         init_samps = None
 
+    # only forwarded in multi-fidelity mode
+    mf_kwargs = {} if fidelity is None else {'fidelity': fidelity}
+
     # create new initial guess data by sampling bounds
     if init_samps:
         log.info('Source for initial guess: sampling parameter space')
@@ -71,6 +80,7 @@ def create_init(config):
             config['seed'],
             config['n_workers'],
             config['failure_codes'],
+            **mf_kwargs,
         )
 
     # read from grid
@@ -78,19 +88,161 @@ def create_init(config):
         log.info('Source for initial guess: pre-computed grid')
         log.info(f'    grid = {init_grid}')
         n_init = sample_from_grid(
-            config['output'], config['parameters'], config['observables'], init_grid
+            config['output'],
+            config['parameters'],
+            config['observables'],
+            init_grid,
+            **mf_kwargs,
         )
 
     return n_init
 
 
-def sample_from_grid(output: str, params: dict, observables: dict, grid_dir: str):
+def read_helpfile_tail(fpath: str | Path) -> dict:
+    """Read the final row of a runtime helpfile without parsing the whole file.
+
+    Only the header line and the last complete line are read, the latter by
+    seeking backwards from the end of the file.
+
+    Parameters
+    ----------
+    - fpath (str | Path): Path to `runtime_helpfile.csv`.
+
+    Returns
+    ----------
+    - dict: Final-row values keyed by column name.
+
+    Raises:
+        ValueError: If the file has no data rows or its last row is truncated.
+    """
+    with open(fpath, 'rb') as f:
+        header = f.readline().decode().split()
+
+        # Read blocks from the end until the last line is known to be complete
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = b''
+        while pos > 0:
+            step = min(_TAIL_BLOCK, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+            if len(data.strip().splitlines()) >= 2:
+                break
+
+    lines = data.strip().splitlines()
+    if len(lines) < 2 and pos == 0:
+        raise ValueError('helpfile has no data rows')
+    values = lines[-1].decode().split()
+    if len(values) != len(header):
+        raise ValueError(f'last helpfile row has {len(values)} of {len(header)} columns')
+
+    return dict(zip(header, (float(v) for v in values)))
+
+
+def read_config_keys(fpath: str | Path, keys: list[str]) -> list:
+    """Read selected dot-separated keys from a TOML config file.
+
+    Scans table headers and `key = value` lines, and parses only the values
+    of the requested keys. Falls back to parsing the whole file when a key is
+    not found that way (e.g. it is written inside an inline table).
+
+    Parameters
+    ----------
+    - fpath (str | Path): Path to the TOML file.
+    - keys (list[str]): Dot-separated keys to read.
+
+    Returns
+    ----------
+    - list: Values of `keys`, in order.
+    """
+    wanted = set(keys)
+    found = {}
+    table = ''
+    with open(fpath, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if line.startswith('['):
+                table = line.strip('[] ')
+                continue
+            name, sep, value = line.partition('=')
+            if not sep:
+                continue
+            name = name.strip().strip('"\'')
+            full = f'{table}.{name}' if table else name
+            if full in wanted:
+                try:
+                    found[full] = tomllib.loads(f'v = {value.strip()}')['v']
+                except tomllib.TOMLDecodeError:
+                    break
+                if len(found) == len(wanted):
+                    break
+
+    if len(found) < len(wanted):
+        with open(fpath, 'rb') as f:
+            conf = tomllib.load(f)
+        return [recursive_get(conf, k.split('.')) for k in keys]
+    return [found[k] for k in keys]
+
+
+def _load_grid_case(case: Path, keys: list[str], observables: list[str]):
+    """Read the parameters and final observables of one grid case."""
+    raw_x = read_config_keys(case / 'init_coupler.toml', keys)
+    row = read_helpfile_tail(case / 'runtime_helpfile.csv')
+    missing = [k for k in observables if k not in row]
+    if missing:
+        raise KeyError(f'observables not in helpfile: {missing}')
+    return raw_x, {k: row[k] for k in observables}
+
+
+def load_grid_cases(
+    cases: list[Path], keys: list[str], observables: list[str], n_threads: int | None = None
+) -> tuple[list, list]:
+    """Read grid cases in parallel, keeping only what inference needs.
+
+    Cases are read by a thread pool, since the work is dominated by file I/O.
+    A case that cannot be read is skipped rather than aborting the batch.
+
+    Parameters
+    ----------
+    - cases (list[Path]): Case directories to read.
+    - keys (list[str]): Parameter keys to read from each `init_coupler.toml`.
+    - observables (list[str]): Columns to read from each `runtime_helpfile.csv`.
+    - n_threads (int | None): Size of the thread pool; None for the default.
+
+    Returns
+    ----------
+    - loaded (list): `(raw_x, obs_y)` per readable case, in the order of `cases`.
+    - skipped (list): `(case, reason)` per skipped case.
+    """
+    loaded = []
+    skipped = []
+    with ThreadPoolExecutor(max_workers=n_threads) as pool:
+        futures = [pool.submit(_load_grid_case, c, keys, observables) for c in cases]
+        for c, fut in zip(cases, futures):
+            try:
+                loaded.append(fut.result())
+            except Exception as e:
+                skipped.append((c, f'{type(e).__name__}: {e}'))
+    return loaded, skipped
+
+
+def sample_from_grid(
+    output: str,
+    params: dict,
+    observables: dict,
+    grid_dir: str,
+    fidelity: dict | None = None,
+):
     """Build initial BO data from an existing PROTEUS grid.
 
-    Reads `case_*` directories in `grid_dir`, extracts parameter values from
-    each `init_coupler.toml`, computes objective values from the final row of
-    each `runtime_helpfile.csv`, normalizes inputs to [0, 1], and writes
-    `init.csv` to the inference output directory.
+    Reads `case_*` directories in `grid_dir` in parallel, extracts parameter
+    values from each `init_coupler.toml`, computes objective values from the
+    final row of each `runtime_helpfile.csv`, normalizes inputs to [0, 1], and
+    writes `init.csv` to the inference output directory. Cases that cannot be
+    read are skipped and reported.
 
     Parameters
     ----------
@@ -98,6 +250,8 @@ def sample_from_grid(output: str, params: dict, observables: dict, grid_dir: str
     - params (dict): Parameter bounds used for normalization.
     - observables (dict): Target observables used for objective evaluation.
     - grid_dir (str): Directory containing `case_*` precomputed runs.
+    - fidelity (dict | None): Multi-fidelity settings. Grid cases are full
+      simulations, so they are tagged as high-fidelity points.
 
     Returns
     ----------
@@ -107,27 +261,25 @@ def sample_from_grid(output: str, params: dict, observables: dict, grid_dir: str
     # We need evaluate the objective function at each grid point to provide initial samples
     #     They are normalised to [0,1] within the bounds of each parameter's axis
 
+    # List of parameter keys for ordering
+    keys = list(params.keys())
+
     # First, read data and config files from the grid
     grid_path = Path(grid_dir)
     cases = sorted(grid_path.glob('case_*'))
-    helps = []
-    confs = []
-    for c in cases:
-        # Data
-        helps.append(pd.read_csv(c / 'runtime_helpfile.csv', delimiter=r'\s+'))
-
-        # Config
-        with open(c / 'init_coupler.toml', 'r') as f:
-            confs.append(toml.load(f))
-
-    # List of parameter keys for ordering
-    keys = list(params.keys())
+    loaded, skipped = load_grid_cases(cases, keys, list(observables.keys()))
+    if skipped:
+        log.warning(f'Skipped {len(skipped)} of {len(cases)} grid cases')
+        for c, reason in skipped:
+            log.warning(f'    {c.name}: {reason}')
+    if not loaded:
+        raise ValueError(f'No readable grid cases in {grid_dir}')
 
     # Determine problem dimension (number of parameters)
     dims = len(keys)
 
     # Determine number of samples (number of grid points)
-    nsamp = len(helps)
+    nsamp = len(loaded)
 
     # Parameter bounds
     bounds = torch.tensor(
@@ -139,23 +291,23 @@ def sample_from_grid(output: str, params: dict, observables: dict, grid_dir: str
     #     This variable is 2D, with shape [nsamp, dims]
     X = torch.zeros(nsamp, dims, dtype=dtype)
     Y = torch.zeros(nsamp, 1, dtype=dtype)
-    for i in range(nsamp):
+    for i, (raw_x, obs_y) in enumerate(loaded):
         # Get input parameters from grid configs
-        raw_x = [recursive_get(confs[i], k.split('.')) for k in keys]
         raw_x = torch.tensor(raw_x, dtype=dtype)
 
         # Generate normalised INPUT parameters
         nrm_x = normalize_parameters(raw_x, bounds, keys).flatten()
         X[i, :] = nrm_x[:]  # store (list of floats)
 
-        # Get values of OUTPUT observables from grid point data (list of floats)
-        obs_y = helps[i].iloc[-1][observables.keys()].T
-
-        # Evaluate objective and store (float)
+        # Evaluate objective from OUTPUT observables and store (float)
         Y[i] = eval_obj(obs_y, observables)
 
     log.info(f'Generated initial dataset with {nsamp} points in {dims}-dim space')
 
+    # Tag grid points with the fidelity column
+    if fidelity is not None:
+        X = torch.cat((X, torch.full((nsamp, 1), HIGH_FIDELITY, dtype=dtype)), dim=1)
+
     # Save dataset for use in BO pipeline
     proteus_out = get_proteus_directories(output)['output']
     D_init_path = Path(proteus_out) / 'init.csv'
@@ -172,21 +324,35 @@ def f_aug(x, iter, builder_args):
     ----------
     - x (torch.Tensor): Candidate input of shape (1, d) in normalized space.
     - iter (int): Iteration index used to namespace output files.
-    - builder_args (dict): Context forwarded to `prot_builder`.
+    - builder_args (dict): Context forwarded to `prot_builder`. When it has an
+      `overrides` entry, `x` carries a trailing fidelity column and the
+      objective is built with `mf_builder` instead.
 
     Returns
     ----------
     - torch.Tensor: Objective value tensor with shape (1, 1).
     """
-    f = prot_builder(
-        parameters=builder_args['parameters'],
-        observables=builder_args['observables'],
-        worker=-1,
-        iter=iter,
-        ref_config=builder_args['ref_config'],
-        output=builder_args['output'],
-        failure_codes=builder_args['failure_codes'],
-    )
+    if 'overrides' in builder_args:
+        f = mf_builder(
+            parameters=builder_args['parameters'],
+            observables=builder_args['observables'],
+            worker=-1,
+            iter=iter,
+            ref_config=builder_args['ref_config'],
+            output=builder_args['output'],
+            failure_codes=builder_args['failure_codes'],
+            overrides=builder_args['overrides'],
+        )
+    else:
+        f = prot_builder(
+            parameters=builder_args['parameters'],
+            observables=builder_args['observables'],
+            worker=-1,
+            iter=iter,
+            ref_config=builder_args['ref_config'],
+            output=builder_args['output'],
+            failure_codes=builder_args['failure_codes'],
+        )
 
     return f(x)
 
@@ -214,9 +380,13 @@ def sample_from_bounds(
     seed: int,
     n_workers: int,
     failure_codes: list[int],
+    fidelity: dict | None = None,
 ) -> int:
     """Generate initial BO data by evaluating Halton samples in parameter space.
 
+    In multi-fidelity mode, `nsamp` high-fidelity samples are complemented by
+    `ratio * nsamp` low-fidelity samples drawn further along the same sequence.
+
     Parameters
     ----------
     - output (str): Inference output directory.
@@ -227,6 +397,7 @@ def sample_from_bounds(
     - seed (int): RNG seed for Halton sequence generation.
     - n_workers (int): Number of parallel workers to use for evaluation.
     - failure_codes (list[int]): Additional PROTEUS exit codes to treat as failures.
+    - fidelity (dict | None): Multi-fidelity settings, or None for a single fidelity.
 
     Returns
     ----------
@@ -254,14 +425,24 @@ def sample_from_bounds(
         output=output,
         failure_codes=failure_codes,
     )
+    if fidelity is not None:
+        builder_args['overrides'] = fidelity['overrides']
 
     # Generate n random points in [0,1]^d and evaluate the objective
     #     Each of the parameters are evaluated in space 0-1, normalised to the bounds
     #     This variable is 2D, with shape [nsamp, dims]
 
     sampler = Halton(d=dims, rng=np.random.default_rng(seed), scramble=True)
-    X = sampler.random(n=nsamp)
-    X = torch.tensor(X, dtype=dtype)
+    if fidelity is None:
+        X = sampler.random(n=nsamp)
+        X = torch.tensor(X, dtype=dtype)
+    else:
+        n_low = nsamp * fidelity['ratio']
+        X = torch.tensor(sampler.random(n=nsamp + n_low), dtype=dtype)
+        S = torch.full((nsamp + n_low, 1), LOW_FIDELITY, dtype=dtype)
+        S[:nsamp] = HIGH_FIDELITY
+        X = torch.cat((X, S), dim=1)
+        nsamp += n_low
 
     # X = torch.rand(nsamp, dims,
     #                generator=torch.manual_seed(seed), dtype=dtype)
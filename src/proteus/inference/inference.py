@@ -20,6 +20,8 @@ import proteus.inference.plot as plotBO
 # bayesopt source files
 from proteus.inference.async_BO import checkpoint, parallel_process
 from proteus.inference.gen_D_init import create_init
+from proteus.inference.inprocess import eval_backend, set_eval_backend
+from proteus.inference.multifidelity import get_fidelity_config, select_high_fidelity
 from proteus.inference.objective import prot_builder, set_child_timeout
 from proteus.inference.utils import print_results, str_time
 
@@ -79,6 +81,11 @@ def run_inference(config):
     # plumbed to worker processes through the environment.
     set_child_timeout(config.get('child_timeout_s'))
 
+    # Evaluation backend: a `proteus start` subprocess per evaluation, or a
+    # long-lived in-process helper per worker that keeps caches warm
+    set_eval_backend(config.get('backend'))
+    log.info(f'Evaluation backend: {eval_backend()}')
+
     # Default for configs that pre-date this field
     config.setdefault('failure_codes', [])
     # Ensure there are enough CPU cores for the specified number of workers
@@ -100,8 +107,17 @@ def run_inference(config):
     os.mkdir(os.path.join(dirs['output'], 'plots'))
     log.info(' ')
 
+    # Optional multi-fidelity mode, using dummy-module runs as the cheap fidelity
+    fidelity = get_fidelity_config(config)
+    if fidelity is not None:
+        log.info('Multi-fidelity inference enabled')
+        log.info(f'    low/high ratio = {fidelity["ratio"]}')
+        for k, v in fidelity['overrides'].items():
+            log.info(f'    {k:28s} = {v}')
+        log.info(' ')
+
     # Create initial guess data through the requested method
-    n_init = create_init(config)
+    n_init = create_init(config, fidelity=fidelity)
     log.info(' ')
 
     # Maximum number of evaluations during inference (offset by initial evaluations)
@@ -113,6 +129,8 @@ def run_inference(config):
     log.info(f'    optim steps   = {config["n_steps"]}')
     log.info(f'    kernel        = {config["kernel"]}')
     log.info(f'    acquisition   = {config["acqf"]}')
+    if fidelity is not None:
+        log.info('    surrogate     = multi-fidelity GP (kernel setting unused)')
     log.info(' ')
     t_0 = time.perf_counter()
 
@@ -129,19 +147,26 @@ def run_inference(config):
         config['observables'],
         config['parameters'],
         config['failure_codes'],
+        fidelity=fidelity,
     )
 
     t_1 = time.perf_counter()
     log.info(f'This took: {t_1 - t_0:.2f} seconds')
     log.info('-----------------------------------')
 
-    # Print summary of true vs. simulated observables and inferred parameters
-    best_config = print_results(D_final, logs, config, dirs['output'], n_init)
-
     # Save final data, logs, and timestamps for later analysis
     log.info(f'Saving results: {dirs["output"]}')
     checkpoint(D_final, logs, Ts, dirs['output'])
 
+    # Results and plots only consider the full-fidelity evaluations
+    if fidelity is not None:
+        n_all = len(D_final['Y'])
+        D_final, logs, Ts, n_init = select_high_fidelity(D_final, logs, Ts, n_init)
+        log.info(f'High-fidelity evaluations: {len(D_final["Y"])} of {n_all}')
+
+    # Print summary of true vs. simulated observables and inferred parameters
+    best_config = print_results(D_final, logs, config, dirs['output'], n_init)
+
     # Make plots
     log.info('Making plots')
     plotBO.plots_perf_timeline(logs, dirs['output'], n_init)
@@ -0,0 +1,221 @@
+"""In-process evaluation backend for inference workers.
+
+The default backend launches `proteus start` as a fresh subprocess for every
+evaluation, so each one pays interpreter startup, imports, data checks, and
+solver JIT or EOS warm-up, and then re-reads the helpfile from disk. With this
+backend each inference worker keeps one long-lived helper process that
+constructs `Proteus` objects and runs them in-process. Module-level caches
+(EOS tables, JIT-compiled kernels, the Julia runtime) stay warm across
+evaluations, and observables are returned straight from the in-memory
+`hf_all` of the finished run.
+
+The helper is a separate process so that a crash in compiled code cannot take
+the inference worker down, and so that a wedged run can be killed when it
+exceeds the per-child timeout. A killed or crashed helper is replaced on the
+next evaluation. Pool workers are daemonic and may not start children, so
+there the run executes directly in the pool worker, bounded by the pool-level
+timeout instead.
+
+This module is imported by spawned helper processes, so it must not import
+torch at module level: juliacall has to load before torch in any process that
+runs PROTEUS.
+"""
+
+from __future__ import annotations
+
+import gc
+import logging
+import multiprocessing as mp
+import os
+import traceback
+
+log = logging.getLogger('fwl.' + __name__)
+
+# Evaluation backends
+BACKENDS = ('subprocess', 'inprocess')
+DEFAULT_BACKEND = 'subprocess'
+_BACKEND_ENV = 'PROTEUS_INFERENCE_BACKEND'
+
+# One helper per worker process, created on first use
+_EVALUATOR = None
+
+
+def set_eval_backend(name: str | None = None) -> None:
+    """Record the evaluation backend for inference worker processes.
+
+    Stored in the environment, like the child timeout, so that it is visible
+    to spawned pool workers. ``None`` selects ``DEFAULT_BACKEND``.
+    """
+    value = DEFAULT_BACKEND if name is None else str(name).lower().strip()
+    if value not in BACKENDS:
+        raise ValueError(f"Unknown evaluation backend '{name}', choices are {BACKENDS}")
+    os.environ[_BACKEND_ENV] = value
+
+
+def eval_backend() -> str:
+    """Return the evaluation backend recorded by ``set_eval_backend``."""
+    value = os.environ.get(_BACKEND_ENV, DEFAULT_BACKEND)
+    return value if value in BACKENDS else DEFAULT_BACKEND
+
+
+def _run_proteus_inprocess(config_path: str) -> tuple[dict, int]:
+    """Run a PROTEUS simulation in the current process.
+
+    Returns the final helpfile row from memory and the exit status recorded
+    by the run.
+    """
+    from proteus import Proteus
+
+    runner = Proteus(config_path=config_path)
+    runner.start(offline=True)
+
+    row = runner.hf_all.iloc[-1].to_dict()
+
+    status = 20  # default to Generic Error
+    try:
+        with open(os.path.join(runner.directories['output'], 'status'), 'r') as f:
+            status = int(f.readlines()[0].strip())
+    except Exception as e:
+        log.warning(f'Failed to read status file for {config_path}: {e}')
+
+    # Release the model, keeping only the module-level caches
+    del runner
+    gc.collect()
+
+    return row, status
+
+
+def _serve(conn) -> None:
+    """Helper-process loop: run each received config and send back the result."""
+
+    # Silence terminal output from the runs, including compiled code
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+
+    while True:
+        try:
+            config_path = conn.recv()
+        except EOFError:
+            break
+        if config_path is None:
+            break
+
+        try:
+            row, status = _run_proteus_inprocess(config_path)
+            conn.send(('ok', row, status))
+        except BaseException as e:
+            conn.send(('error', f'{type(e).__name__}: {e}\n{traceback.format_exc()}', 20))
+
+
+class InProcessEvaluator:
+    """Long-lived helper process that runs PROTEUS simulations in-process."""
+
+    def __init__(self):
+        self._proc = None
+        self._conn = None
+
+    def _start(self) -> None:
+        ctx = mp.get_context('spawn')
+        parent_conn, child_conn = ctx.Pipe()
+
+        # The helper inherits the environment at spawn, before its imports
+        # load any threaded libraries
+        omp_prev = os.environ.get('OMP_NUM_THREADS')
+        os.environ['OMP_NUM_THREADS'] = '1'
+        try:
+            self._proc = ctx.Process(target=_serve, args=(child_conn,), daemon=True)
+            self._proc.start()
+        finally:
+            if omp_prev is None:
+                os.environ.pop('OMP_NUM_THREADS', None)
+            else:
+                os.environ['OMP_NUM_THREADS'] = omp_prev
+
+        child_conn.close()
+        self._conn = parent_conn
+        log.debug(f'Started in-process evaluation helper (pid={self._proc.pid})')
+
+    def close(self) -> None:
+        """Stop the helper process, killing it if it does not exit promptly."""
+        if self._proc is None:
+            return
+        try:
+            if self._proc.is_alive():
+                self._conn.send(None)
+                self._proc.join(timeout=5.0)
+        except (BrokenPipeError, OSError):
+            pass
+        if self._proc.is_alive():
+            self._proc.kill()
+            self._proc.join()
+        self._conn.close()
+        self._proc = None
+        self._conn = None
+
+    def evaluate(self, config_path: str, timeout: float | None) -> tuple[dict, int]:
+        """Run one simulation in the helper process.
+
+        Parameters
+        ----------
+        - config_path (str): Path to the run's TOML config.
+        - timeout (float | None): Wall-time limit in seconds, or None to disable.
+
+        Returns
+        ----------
+        - row (dict): Final helpfile row of the run.
+        - status (int): Exit status recorded by the run.
+        """
+        if self._proc is None or not self._proc.is_alive():
+            self.close()
+            self._start()
+
+        try:
+            self._conn.send(str(config_path))
+            if not self._conn.poll(timeout):
+                self.close()
+                raise TimeoutError(f'run exceeded {timeout} s')
+            kind, payload, status = self._conn.recv()
+        except (EOFError, BrokenPipeError, ConnectionResetError) as err:
+            exitcode = self._proc.exitcode if self._proc is not None else None
+            self.close()
+            raise RuntimeError(
+                f'In-process evaluation helper died (exit code {exitcode})'
+            ) from err
+
+        if kind == 'error':
+            raise RuntimeError(f'PROTEUS run failed in-process: {payload}')
+        return payload, status
+
+
+def evaluate_inprocess(config_path: str, timeout: float | None) -> tuple[dict, int]:
+    """Run one simulation through this worker's in-process evaluator.
+
+    Parameters
+    ----------
+    - config_path (str): Path to the run's TOML config.
+    - timeout (float | None): Wall-time limit in seconds, or None to disable.
+
+    Returns
+    ----------
+    - row (dict): Final helpfile row of the run.
+    - status (int): Exit status recorded by the run.
+    """
+    global _EVALUATOR
+
+    # Daemonic pool workers cannot host a helper process
+    if mp.current_process().daemon:
+        fwl_log = logging.getLogger('fwl')
+        handlers, level = list(fwl_log.handlers), fwl_log.level
+        try:
+            return _run_proteus_inprocess(config_path)
+        except Exception as e:
+            raise RuntimeError(f'PROTEUS run failed in-process: {e}') from e
+        finally:
+            # The run reconfigures the shared logger; restore the worker's own
+            fwl_log.handlers[:] = handlers
+            fwl_log.setLevel(level)
+
+    if _EVALUATOR is None:
+        _EVALUATOR = InProcessEvaluator()
+    return _EVALUATOR.evaluate(config_path, timeout)
@@ -0,0 +1,419 @@
+"""Multi-fidelity Bayesian optimization using dummy-module runs as a cheap fidelity.
+
+A low-fidelity evaluation runs the reference config with a set of modules
+swapped for their `dummy` implementations; a high-fidelity evaluation runs the
+reference config unchanged. Both are fitted jointly by a multi-fidelity GP in
+which the fidelity is an extra, trailing input column (0 = low, 1 = high).
+Candidates are chosen by optimising the acquisition function at the target
+(high) fidelity, while the fidelity at which a candidate is evaluated follows
+a fixed schedule of `ratio` cheap evaluations per expensive one.
+
+Functions:
+    get_fidelity_config: Resolve the optional `[fidelity]` inference config table.
+    choose_fidelity: Pick the fidelity of the next evaluation from the schedule.
+    mf_builder: Build an objective that dispatches on the fidelity column.
+    fit_mf_gp: Fit a multi-fidelity GP to data with a trailing fidelity column.
+    MF_BO_step: Multi-fidelity counterpart of `BO.BO_step`.
+    mf_init_locs: Multi-fidelity counterpart of `BO.init_locs`.
+    select_high_fidelity: Restrict results to the high-fidelity evaluations.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+import toml
+import torch
+from botorch.acquisition import FixedFeatureAcquisitionFunction
+from botorch.fit import fit_gpytorch_mll
+from botorch.models import SingleTaskMultiFidelityGP
+from botorch.models.transforms import Normalize, Standardize
+from botorch.optim import optimize_acqf
+from botorch.optim.fit import fit_gpytorch_mll_torch
+from gpytorch.mlls import ExactMarginalLogLikelihood
+
+from proteus.inference.BO import unit_bounds
+from proteus.inference.objective import prot_builder
+from proteus.inference.utils import get_acqf, get_nested
+
+dtype = torch.double
+log = logging.getLogger('fwl.' + __name__)
+
+# Values of the trailing fidelity column
+LOW_FIDELITY = 0.0
+HIGH_FIDELITY = 1.0
+
+# Default number of low-fidelity evaluations per high-fidelity evaluation
+DEFAULT_RATIO = 4
+
+# Default low-fidelity module set: every slot with a dummy implementation
+DEFAULT_LOW_OVERRIDES = {
+    'star.module': 'dummy',
+    'orbit.module': 'dummy',
+    'interior_struct.module': 'dummy',
+    'interior_energetics.module': 'dummy',
+    'atmos_clim.module': 'dummy',
+    'outgas.module': 'dummy',
+    'escape.module': 'dummy',
+}
+
+# Settings the dummy of a module cannot run with, switched off whenever the low
+# fidelity swaps that dummy in
+DUMMY_REQUIREMENTS = {
+    'atmos_clim.module': {
+        'atmos_clim.rayleigh': False,
+        'atmos_clim.cloud_enabled': False,
+        'atmos_clim.aerosols_enabled': False,
+        'observe.module': 'none',
+    },
+}
+
+# Value of a user override that removes a default, so that low-fidelity runs
+# keep the reference config's setting for that key
+KEEP_REFERENCE = 'reference'
+
+
+def get_fidelity_config(config: dict) -> dict | None:
+    """Resolve the optional `[fidelity]` table of an inference config.
+
+    The low-fidelity overrides start from `DEFAULT_LOW_OVERRIDES`, updated with
+    any user-provided `fidelity.overrides`; a user override set to
+    `KEEP_REFERENCE` removes the default for its key instead. A module override
+    is dropped when the reference config disables that module ('none'): a dummy
+    replaces a module, it never switches one on. Each dummy swapped in also
+    switches off the settings it cannot run with (`DUMMY_REQUIREMENTS`), unless
+    the user overrides them.
+
+    Parameters
+    ----------
+    - config (dict): Inference config, with `ref_config` already resolved to a path.
+
+    Returns
+    ----------
+    - dict | None: `{'ratio': int, 'overrides': dict}`, or None when disabled.
+    """
+    fid = config.get('fidelity', {})
+    if not fid.get('enabled', False):
+        return None
+
+    ratio = int(fid.get('ratio', DEFAULT_RATIO))
+    if ratio < 0:
+        raise ValueError(f'fidelity.ratio must be >= 0, got {ratio}')
+
+    user = fid.get('overrides', {})
+    kept = {key for key, value in user.items() if value == KEEP_REFERENCE}
+    overrides = dict(DEFAULT_LOW_OVERRIDES)
+    overrides.update({key: value for key, value in user.items() if key not in kept})
+    for key in kept:
+        overrides.pop(key, None)
+
+    # Keep module disabled if the reference config disables it
+    with open(config['ref_config'], 'r') as f:
+        ref = toml.load(f)
+    for key in list(overrides.keys()):
+        if not key.endswith('.module'):
+            continue
+        try:
+            current = get_nested(ref, key)
+        except KeyError:
+            continue
+        if str(current).lower() == 'none':
+            overrides.pop(key)
+
+    for key, required in DUMMY_REQUIREMENTS.items():
+        if overrides.get(key) != 'dummy':
+            continue
+        for setting, value in required.items():
+            if setting not in user:
+                overrides[setting] = value
+
+    if not overrides:
+        raise ValueError('Multi-fidelity inference requires at least one fidelity override')
+
+    return {'ratio': ratio, 'overrides': overrides}
+
+
+def choose_fidelity(X: torch.Tensor, ratio: int) -> float:
+    """Pick the fidelity of the next evaluation.
+
+    Keeps the share of high-fidelity points at or below `1 / (ratio + 1)`,
+    counting both completed and in-flight points, so that `ratio` cheap
+    evaluations are made for every expensive one.
+
+    Parameters
+    ----------
+    - X (torch.Tensor): Evaluated and busy points, shape (n, d+1).
+    - ratio (int): Number of low-fidelity evaluations per high-fidelity one.
+
+    Returns
+    ----------
+    - float: `HIGH_FIDELITY` or `LOW_FIDELITY`.
+    """
+    n_total = X.shape[0]
+    n_high = int((X[:, -1] == HIGH_FIDELITY).sum().item()) if n_total else 0
+    if (n_high + 1) * (ratio + 1) <= n_total + 1:
+        return HIGH_FIDELITY
+    return LOW_FIDELITY
+
+
+def mf_builder(
+    parameters: dict[str, list[float]],
+    observables: dict[str, float],
+    worker: int,
+    iter: int,
+    output: str,
+    ref_config: str,
+    failure_codes: list[int] = [],
+    overrides: dict | None = None,
+) -> callable:
+    """Factory returning an objective that accepts a trailing fidelity column.
+
+    Points with `LOW_FIDELITY` in the last column are evaluated with the
+    low-fidelity `overrides` applied; all others use the reference config.
+
+    Parameters
+    ----------
+    - parameters (dict): Mapping of parameter keys to [low, high] bounds.
+    - observables (dict): Target observable values.
+    - worker (int): Worker identifier.
+    - iter (int): Iteration number.
+    - output (str): Path to output folder relative to PROTEUS output folder.
+    - ref_config (str): Reference TOML config path.
+    - failure_codes (list[int]): Additional PROTEUS exit codes to treat as failures.
+    - overrides (dict | None): Config updates that define the low fidelity.
+
+    Returns
+    ----------
+    - callable: Function f(x_norm) -> y_objective, with x_norm of shape (1, d+1).
+    """
+    builder_args = dict(
+        parameters=parameters,
+        observables=observables,
+        worker=worker,
+        iter=iter,
+        output=output,
+        ref_config=ref_config,
+        failure_codes=failure_codes,
+    )
+
+    def f(x_norm: torch.Tensor) -> torch.Tensor:
+        s = x_norm[0, -1].item()
+        if s == LOW_FIDELITY:
+            f_s = prot_builder(**builder_args, overrides=overrides)
+        else:
+            f_s = prot_builder(**builder_args)
+        return f_s(x_norm[:, :-1])
+
+    return f
+
+
+def fit_mf_gp(X: torch.Tensor, Y: torch.Tensor, noise: float = 1e-4):
+    """Fit a multi-fidelity GP to data whose last input column is the fidelity.
+
+    Parameters
+    ----------
+    - X (torch.Tensor): Inputs in [0, 1]^(d+1), shape (n, d+1).
+    - Y (torch.Tensor): Objective values, shape (n, 1).
+    - noise (float): Fixed observation noise variance.
+
+    Returns
+    ----------
+    - SingleTaskMultiFidelityGP: Fitted surrogate.
+    """
+    d1 = X.shape[-1]
+    gp = SingleTaskMultiFidelityGP(
+        train_X=X,
+        train_Y=Y,
+        train_Yvar=torch.full_like(Y, noise),
+        data_fidelities=[d1 - 1],
+        # Inputs already live in the unit cube; fixed bounds also keep the
+        # fidelity column well-defined while it holds a single value.
+        input_transform=Normalize(d=d1, bounds=unit_bounds(d1)),
+        outcome_transform=Standardize(m=1),
+    )
+
+    mll = ExactMarginalLogLikelihood(gp.likelihood, gp)
+    fit_gpytorch_mll(
+        mll,
+        optimizer=fit_gpytorch_mll_torch,
+        kwargs={'pick_best_of_all_attempts': True, 'max_attempts': 10},
+    )
+    return gp
+
+
+def _target_acqf(gp, acqf: str, X: torch.Tensor, Y: torch.Tensor):
+    """Acquisition function over the parameters, evaluated at the high fidelity."""
+    d = X.shape[-1] - 1
+    high = X[:, -1] == HIGH_FIDELITY
+    best = Y[high].max().item() if high.any() else Y.max().item()
+    return FixedFeatureAcquisitionFunction(
+        acq_function=get_acqf(acqf, gp, best),
+        d=d + 1,
+        columns=[d],
+        values=[HIGH_FIDELITY],
+    )
+
+
+def MF_BO_step(D, B, f, acqf, lock, worker_id, ratio, x_in=None):
+    """Perform a single multi-fidelity Bayesian optimization step.
+
+    Follows `BO.BO_step`, but fits a multi-fidelity GP, optimises the
+    acquisition function at the high fidelity, and appends the fidelity
+    chosen by `choose_fidelity` to the candidate before evaluating it.
+
+    Parameters
+    ----------
+    - D (dict): Shared dict containing 'X' (n, d+1) and 'Y' (n, 1).
+    - B (dict): Shared dict mapping worker IDs to busy input points.
+    - f (callable): Objective accepting a trailing fidelity column.
+    - acqf (str): Acquisition function.
+    - lock (multiprocessing.Lock): Lock for synchronizing shared state.
+    - worker_id (int): ID of the calling worker.
+    - ratio (int): Number of low-fidelity evaluations per high-fidelity one.
+    - x_in (torch.Tensor, optional): Initial input for the first iteration.
+
+    Returns
+    ----------
+    - tuple: (x_next, y_next, bo_duration, eval_duration, lock_duration, fit_duration, acq_duration, min_dist)
+    """
+
+    t_0_bo = time.perf_counter()
+
+    if x_in is None:
+        t_0_lock = time.perf_counter()
+        with lock:
+            X = D['X']
+            Y = D['Y']
+            busys = list(B.values())
+        t_1_lock = time.perf_counter()
+
+        busys = torch.cat(busys, dim=0)
+        d = X.shape[-1] - 1
+
+        t_0_fit = time.perf_counter()
+        gp = fit_mf_gp(X, Y)
+        t_1_fit = time.perf_counter()
+
+        t_0_ac = time.perf_counter()
+        x, _ = optimize_acqf(
+            acq_function=_target_acqf(gp, acqf, X, Y),
+            bounds=unit_bounds(d),
+            q=1,
+            num_restarts=10,
+            raw_samples=1000 * d,
+            options={'maxiter': 1000},
+        )
+        t_1_ac = time.perf_counter()
+
+        mask = torch.ones(busys.size(0), dtype=torch.bool)
+        mask[worker_id] = False
+        b = busys[mask]
+
+        s = choose_fidelity(torch.cat((X, b), dim=0), ratio)
+        x = torch.cat((x, torch.full((1, 1), s, dtype=dtype)), dim=1)
+
+        dist = torch.min(torch.cdist(b[:, :d], x[:, :d])).item()
+
+    else:
+        x = x_in
+
+        dist = None
+
+        t_0_lock = 0
+        t_1_lock = 0
+        t_0_fit = 0
+        t_1_fit = 0
+        t_0_ac = 0
+        t_1_ac = 0
+
+    t_1_bo = time.perf_counter()
+
+    t_2_lock = time.perf_counter()
+    with lock:
+        B[worker_id] = x
+    t_3_lock = time.perf_counter()
+
+    t_0_ev = time.perf_counter()
+    y = f(x)
+    t_1_ev = time.perf_counter()
+
+    return (
+        x,
+        y,
+        t_1_bo - t_0_bo,
+        t_1_ev - t_0_ev,
+        t_3_lock - t_2_lock + t_1_lock - t_0_lock,
+        t_1_fit - t_0_fit,
+        t_1_ac - t_0_ac,
+        dist,
+    )
+
+
+def mf_init_locs(n_workers: int, D: dict, ratio: int, acqf: str = 'LogEI') -> torch.Tensor:
+    """Generate initial multi-fidelity sample locations for each worker.
+
+    Parameters
+    ----------
+    - n_workers (int): Number of workers; one candidate is generated per worker.
+    - D (dict): Shared dict with keys 'X' (n, d+1) and 'Y' (n, 1).
+    - ratio (int): Number of low-fidelity evaluations per high-fidelity one.
+    - acqf (str): Name of the acquisition function to use.
+
+    Returns
+    ----------
+    - torch.Tensor: Tensor of shape (n_workers, d+1).
+    """
+    X, Y = D['X'], D['Y']
+    d = X.shape[-1] - 1
+
+    gp = fit_mf_gp(X, Y)
+
+    candidates = []
+    for _ in range(n_workers):
+        x_single, _ = optimize_acqf(
+            acq_function=_target_acqf(gp, acqf, X, Y),
+            bounds=unit_bounds(d),
+            q=1,
+            num_restarts=10,
+            raw_samples=1000 * d,
+            options={'maxiter': 1000},
+        )
+        s = choose_fidelity(torch.cat([X] + candidates, dim=0), ratio)
+        candidates.append(torch.cat((x_single, torch.full((1, 1), s, dtype=dtype)), dim=1))
+
+    return torch.cat(candidates, dim=0)
+
+
+def select_high_fidelity(
+    D: dict, logs: list, Ts: list, n_init: int
+) -> tuple[dict, list, list, int]:
+    """Restrict inference results to the high-fidelity evaluations.
+
+    The fidelity column is dropped from `X`, so the result has the same layout
+    as a single-fidelity run and can be passed to the reporting and plotting
+    functions unchanged.
+
+    Parameters
+    ----------
+    - D (dict): Final data with 'X' (n, d+1) and 'Y' (n, 1).
+    - logs (list): Per-evaluation logs, aligned with the rows of D.
+    - Ts (list): Elapsed times of the non-initial evaluations.
+    - n_init (int): Number of initial data points.
+
+    Returns
+    ----------
+    - D_high (dict): High-fidelity 'X' (m, d) and 'Y' (m, 1).
+    - logs_high (list): Logs of the high-fidelity evaluations.
+    - Ts_high (list): Elapsed times of the high-fidelity non-initial evaluations.
+    - n_init_high (int): Number of high-fidelity initial data points.
+    """
+    mask = D['X'][:, -1] == HIGH_FIDELITY
+    high = mask.tolist()
+
+    D_high = {'X': D['X'][mask, :-1], 'Y': D['Y'][mask]}
+    logs_high = [entry for entry, keep in zip(logs, high) if keep]
+    Ts_high = [t for t, keep in zip(Ts, high[n_init:]) if keep]
+    n_init_high = int(sum(high[:n_init]))
+
+    return D_high, logs_high, Ts_high, n_init_high
@@ -11,6 +11,7 @@ import toml
 import torch
 from numpy import log10
 
+from proteus.inference.inprocess import eval_backend, evaluate_inprocess
 from proteus.inference.transforms import unnormalize_parameters
 from proteus.utils.constants import element_list, gas_list
 from proteus.utils.coupler import get_proteus_directories, variable_is_logarithmic
@@ -97,6 +98,81 @@ def update_toml(config_file: str, updates: dict, output_file: str) -> None:
         toml.dump(config, f)
 
 
+def _run_subprocess(
+    out_cfg: Path, out_abs: Path, worker: int, iter: int, out_dir: Path
+) -> tuple[dict, int]:
+    """Run PROTEUS through the `proteus` CLI and read its results from disk.
+
+    Returns the final helpfile row and the exit status of the run.
+    """
+
+    # Generate environment
+    env = dict(**os.environ)
+    env['OMP_NUM_THREADS'] = '1'
+
+    # Run PROTEUS
+    command = ['proteus', 'start', '-c', str(out_cfg), '--offline']
+    try:
+        subprocess.run(
+            command,
+            check=True,
+            text=True,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.STDOUT,
+            timeout=child_timeout_s(),
+        )
+    except FileNotFoundError as err:
+        log.error(f"Cannot execute '{command[0]}': command not found")
+        raise RuntimeError("Failed to run PROTEUS: 'proteus' command not found") from err
+    except subprocess.TimeoutExpired as err:
+        log.error(
+            f'PROTEUS run exceeded the {child_timeout_s()} s timeout for '
+            f'worker={worker} iter={iter} outdir={str(out_dir)}'
+        )
+        raise RuntimeError(
+            f'PROTEUS run timed out after {child_timeout_s()} s for worker={worker} iter={iter}'
+        ) from err
+    except subprocess.CalledProcessError as err:
+        log.error(f'PROTEUS run failed for worker={worker} iter={iter} outdir={str(out_dir)}')
+        raise RuntimeError(
+            f'Failed to run PROTEUS for worker={worker} iter={iter}; exit code {err.returncode}'
+        ) from err
+
+    # Read status file
+    status = 20  # default to Generic Error
+    try:
+        with open(out_abs / 'status', 'r') as f:
+            status = int(f.readlines()[0].strip())
+    except Exception as e:
+        log.warning(f'Failed to read status file for worker={worker} iter={iter}: {e}')
+
+    # Read simulator output
+    df_row = dict(pd.read_csv(out_abs / 'runtime_helpfile.csv', delimiter=r'\s+').iloc[-1])
+
+    return df_row, status
+
+
+def _run_inprocess(out_cfg: Path, worker: int, iter: int, out_dir: Path) -> tuple[dict, int]:
+    """Run PROTEUS in this worker's long-lived helper process.
+
+    Returns the final helpfile row, taken from memory, and the exit status.
+    """
+    try:
+        return evaluate_inprocess(str(out_cfg), child_timeout_s())
+    except TimeoutError as err:
+        log.error(
+            f'PROTEUS run exceeded the {child_timeout_s()} s timeout for '
+            f'worker={worker} iter={iter} outdir={str(out_dir)}'
+        )
+        raise RuntimeError(
+            f'PROTEUS run timed out after {child_timeout_s()} s for worker={worker} iter={iter}'
+        ) from err
+    except RuntimeError:
+        log.error(f'PROTEUS run failed for worker={worker} iter={iter} outdir={str(out_dir)}')
+        raise
+
+
 def run_proteus(
     parameters: dict,
     worker: int,
@@ -104,10 +180,13 @@ def run_proteus(
     observables: list[str],
     ref_config: str,
     output: str,
+    overrides: dict | None = None,
 ) -> tuple[dict, int]:
     """Run the PROTEUS simulator and return selected observables.
 
-    Builds a per-run TOML file, invokes the `proteus` CLI, and reads the resulting CSV.
+    Builds a per-run TOML file and runs it through the configured evaluation
+    backend: by default the `proteus` CLI, whose resulting CSV is then read, or
+    an in-process helper that returns the final row from memory.
 
     Parameters
     ----------
@@ -117,6 +196,8 @@ def run_proteus(
     - observables (list[str]): Names of output columns to return.
     - ref_config (str): Path to the reference TOML config template.
     - output (str): Path to output relative to PROTEUS output folder.
+    - overrides (dict | None): Extra config updates applied on top of `parameters`,
+      e.g. the dummy-module set of a low-fidelity evaluation.
 
     Returns
     ----------
@@ -130,11 +211,14 @@ def run_proteus(
 
     out_abs = Path(get_proteus_directories(str(out_dir))['output'])
     out_cfg = out_abs / 'input.toml'
-    out_csv = out_abs / 'runtime_helpfile.csv'
 
     # Ensure output directory exists
     out_abs.mkdir(parents=True, exist_ok=True)
 
+    # Apply fixed config overrides (e.g. low-fidelity module selection) to a
+    # copy, so the caller's parameters keep only the sampled values
+    parameters = {**parameters, **(overrides or {})}
+
     # Inject output path into simulation parameters
     parameters['params.out.path'] = str(out_dir)
 
@@ -145,53 +229,15 @@ def run_proteus(
     # Generate config
     update_toml(ref_config, parameters, str(out_cfg))
 
-    # Generate environment
-    env = dict(**os.environ)
-    env['OMP_NUM_THREADS'] = '1'
-
-    # Run PROTEUS
-    command = ['proteus', 'start', '-c', str(out_cfg), '--offline']
-    try:
-        subprocess.run(
-            command,
-            check=True,
-            text=True,
-            env=env,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.STDOUT,
-            timeout=child_timeout_s(),
-        )
-    except FileNotFoundError as err:
-        log.error(f"Cannot execute '{command[0]}': command not found")
-        raise RuntimeError("Failed to run PROTEUS: 'proteus' command not found") from err
-    except subprocess.TimeoutExpired as err:
-        log.error(
-            f'PROTEUS run exceeded the {child_timeout_s()} s timeout for '
-            f'worker={worker} iter={iter} outdir={str(out_dir)}'
-        )
-        raise RuntimeError(
-            f'PROTEUS run timed out after {child_timeout_s()} s for worker={worker} iter={iter}'
-        ) from err
-    except subprocess.CalledProcessError as err:
-        log.error(f'PROTEUS run failed for worker={worker} iter={iter} outdir={str(out_dir)}')
-        raise RuntimeError(
-            f'Failed to run PROTEUS for worker={worker} iter={iter}; exit code {err.returncode}'
-        ) from err
+    # Run PROTEUS and collect the final helpfile row
+    if eval_backend() == 'inprocess':
+        df_row, status = _run_inprocess(out_cfg, worker, iter, out_dir)
+    else:
+        df_row, status = _run_subprocess(out_cfg, out_abs, worker, iter, out_dir)
 
     # Re-write config in case simulator mutates or removes it
     update_toml(ref_config, parameters, str(out_cfg))
 
-    # Read status file
-    status = 20  # default to Generic Error
-    try:
-        with open(out_abs / 'status', 'r') as f:
-            status = int(f.readlines()[0].strip())
-    except Exception as e:
-        log.warning(f'Failed to read status file for worker={worker} iter={iter}: {e}')
-
-    # Read simulator output
-    df_row = dict(pd.read_csv(out_csv, delimiter=r'\s+').iloc[-1])
-
     # Handle case where atmosphere has escaped
     #   Set VMRs and MMW to zero
     if bool(df_row['P_surf'] < 1e-30):
@@ -276,6 +322,7 @@ def J(
     output: str,
     ref_config: str,
     failure_codes: list[int] = [],
+    overrides: dict | None = None,
 ) -> torch.Tensor:
     """Run PROTEUS, and then compute the objective value for a given normalized input.
 
@@ -294,6 +341,7 @@ def J(
     - output (str): Path to output folder relative to PROTEUS output folder.
     - ref_config (str): Reference TOML config path.
     - failure_codes (list[int]): Additional PROTEUS exit codes to treat as failures.
+    - overrides (dict | None): Extra config updates forwarded to `run_proteus`.
 
     Returns
     ----------
@@ -309,6 +357,7 @@ def J(
         observables=list(true_observables.keys()),
         ref_config=ref_config,
         output=output,
+        overrides=overrides,
     )
 
     # If status indicates failure, return very bad objective value
@@ -327,6 +376,7 @@ def prot_builder(
     output: str,
     ref_config: str,
     failure_codes: list[int] = [],
+    overrides: dict | None = None,
 ) -> callable:
     """Factory returning a BO-compatible objective function for PROTEUS inference.
 
@@ -341,6 +391,7 @@ def prot_builder(
     - output (str): Path to output folder relative to PROTEUS output folder.
     - ref_config (str): Reference TOML config path.
     - failure_codes (list[int]): Additional PROTEUS exit codes to treat as failures.
+    - overrides (dict | None): Extra config updates applied to every run of this objective.
 
     Returns
     ----------
@@ -377,6 +428,7 @@ def prot_builder(
             ref_config=ref_config,
             output=output,
             failure_codes=failure_codes,
+            overrides=overrides,
         )
 
         J_eval = J_context(x_raw)
@@ -4,10 +4,13 @@ from __future__ import annotations  # noqa: I001
 import glob
 import inspect
 import logging
+import multiprocessing
+import multiprocessing.connection
 import os
 import platform
 import time
 from pathlib import Path
+from types import SimpleNamespace
 from typing import TYPE_CHECKING
 
 import netCDF4 as nc
@@ -31,10 +34,12 @@ from aragog.parser import (
     _SolverParameters,
 )
 from proteus.interior_energetics.common import Interior_t
+from proteus.interior_energetics.eos_cache import load_or_build
 from proteus.utils.constants import FEI2021_LIQUIDUS_P_CALIB_PA
 from proteus.interior_energetics.timestep import next_step
 from proteus.interior_energetics.wrapper import get_core_density, get_core_heatcap
 from proteus.utils.constants import radnuc_data
+from proteus.utils.jax_cache import compile_cache_report, short_fingerprint
 
 log = logging.getLogger('fwl.' + __name__)
 
@@ -87,12 +92,16 @@ def _cached_entropy_eos(eos_dir_str: str):
     depends only on the file contents and is read-only after
     construction (pure lookup methods, no mutation API), so a single
     cached instance can be shared across PROTEUS timesteps and across
-    pytest tests in the same process.
+    pytest tests in the same process. Across processes the instance is
+    shared through the opt-in on-disk cache in
+    :mod:`proteus.interior_energetics.eos_cache`.
     """
     key = _eos_content_key(eos_dir_str)
     cached = _entropy_eos_cache.get(key)
     if cached is None:
-        cached = EntropyEOS(Path(eos_dir_str))
+        cached = load_or_build(
+            'entropy_eos', eos_dir_str, EntropyEOS, lambda: EntropyEOS(Path(eos_dir_str))
+        )
         _entropy_eos_cache[key] = cached
     return cached
 
@@ -103,14 +112,17 @@ def _cached_entropy_eos_jax(eos_dir_str: str):
     Same motivation as ``_cached_entropy_eos``: the JAX-side EOS trace
     + compile is ~7 s on macOS arm64 and ~310 s on Linux x86, the result
     is an equinox Module (immutable pytree), and the construction
-    depends only on the file contents.
+    depends only on the file contents. It goes through the same on-disk
+    cache, in a separate namespace.
     """
     key = _eos_content_key(eos_dir_str)
     cached = _entropy_eos_jax_cache.get(key)
     if cached is None:
         from aragog.jax.eos import EntropyEOS_JAX
 
-        cached = EntropyEOS_JAX(eos_dir_str)
+        cached = load_or_build(
+            'entropy_eos_jax', eos_dir_str, EntropyEOS_JAX, lambda: EntropyEOS_JAX(eos_dir_str)
+        )
         _entropy_eos_jax_cache[key] = cached
     return cached
 
@@ -379,6 +391,310 @@ def _estimate_T_pot(out) -> float:
     return float(out.T_magma)
 
 
+# Speculative retry probes (interior_energetics.aragog.speculative_retries)
+# run in a pool of warm child processes kept for the life of this process.
+# A probe that has not begun its solve within _PROBE_SETUP_TIMEOUT [s] of
+# being handed out, or has not reported within _SPECULATIVE_TIMEOUT_FACTOR
+# times the failed first attempt's wall time of beginning it, is abandoned
+# and its rung solved serially instead. Worker start-up (importing PROTEUS,
+# JAX and loading the EOS tables) happens ahead of time and counts for
+# neither.
+_SPECULATIVE_TIMEOUT_FACTOR = 10.0
+_PROBE_SETUP_TIMEOUT = 60.0
+
+
+def _speculation_available() -> bool:
+    """Whether retry rungs can be probed in child processes.
+
+    The children are spawned, never forked, because juliacall and JAX may
+    already be running in this process. Daemonic processes (e.g. the
+    in-process inference workers) may not have children.
+    """
+    return not multiprocessing.current_process().daemon
+
+
+def _speculative_probes(config: Config) -> int:
+    """Number of speculative retry probes to run at once, 0 if disabled.
+
+    Capped so that the probes and this process fit on the available cores.
+    """
+    n_spec = min(
+        config.interior_energetics.aragog.speculative_retries,
+        max((os.cpu_count() or 1) - 1, 0),
+    )
+    return n_spec if n_spec >= 2 else 0
+
+
+def _entropy_eos_dir(config: Config, interior_o: Interior_t, outdir: str) -> str | None:
+    """Directory of the P-S tables the entropy solver loads.
+
+    Returns None in const_properties mode, which loads no tables.
+    """
+    if config.interior_energetics.const_properties:
+        return None
+    spider_eos_dir = interior_o._spider_eos_dir
+    if spider_eos_dir and os.path.isdir(spider_eos_dir):
+        return str(spider_eos_dir)
+    fallback_dir = Path(outdir) / 'data' / 'spider_eos'
+    if fallback_dir.is_dir():
+        return str(fallback_dir)
+    raise FileNotFoundError(
+        f'PALEOS P-S tables not found. Aragog entropy solver '
+        f'requires P-S tables. Checked: {spider_eos_dir}, {fallback_dir}'
+    )
+
+
+def _configure_rung(solver, start_time, dt, atol_sf, dSdr_ic, S_ic) -> None:
+    """Restore the pre-solve state of `solver` and set up one ladder rung."""
+    solver.parameters.solver.start_time = start_time
+    solver.parameters.solver.end_time = start_time + dt
+    solver._atol_sf = atol_sf
+    if dSdr_ic is not None:
+        # Force the next attempt's hot-start to use the pre-solve
+        # snapshot instead of the failed attempt's final value.
+        if hasattr(solver, 'set_initial_dSdr_cmb'):
+            solver.set_initial_dSdr_cmb(dSdr_ic)
+        else:
+            solver._dSdr_cmb_init = dSdr_ic
+    solver.reset()
+    if S_ic is not None:
+        solver.set_initial_entropy(S_ic)
+
+
+def _probe_worker(conn, eos_dir) -> None:
+    """Child side of the probe pool: solve ladder rungs until told to stop.
+
+    Loads the EOS tables of `eos_dir` before reporting ``('ready',)``. Each
+    task ``(solver_cls, parameters, eos_dir, config, rung)`` builds its own
+    solver, so nothing is inherited from the parent process; the worker
+    sends ``('started',)`` as the solve begins, then ``('done', result)``
+    with the ``(SolverOutput, solution)`` of the solve, or None if it raised.
+    """
+    logging.disable(logging.CRITICAL)
+    try:
+        if eos_dir:
+            _cached_entropy_eos(eos_dir)
+    except Exception:
+        pass
+    conn.send(('ready',))
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+        solver_cls, parameters, eos_dir, config, rung = task
+        try:
+            eos = _cached_entropy_eos(eos_dir) if eos_dir else None
+            solver = solver_cls(parameters, eos)
+            solver.initialize()
+            AragogRunner._maybe_install_jax_cvode_factory(
+                config, SimpleNamespace(aragog_solver=solver, _spider_eos_dir=eos_dir)
+            )
+            _configure_rung(solver, *rung)
+            conn.send(('started',))
+            solver.solve()
+            result = (solver.get_state(), solver.solution)
+        except Exception:
+            result = None
+        conn.send(('done', result))
+
+
+class _ProbePool:
+    """Warm child processes that solve speculative retry rungs.
+
+    Workers are spawned, never forked, and kept between coupling steps, so
+    a probe costs a solver build and a solve rather than a new interpreter.
+    A worker whose probe is abandoned is terminated and replaced.
+    """
+
+    def __init__(self):
+        self._size = 0
+        self._eos_dir = None
+        self._idle = []
+        self._starting = []
+
+    def warm(self, size: int, eos_dir: str | None) -> None:
+        """Start workers, without waiting for them, until `size` exist."""
+        self._size = max(self._size, size)
+        self._eos_dir = eos_dir
+        ctx = multiprocessing.get_context('spawn')
+        while len(self._idle) + len(self._starting) < self._size:
+            conn, child = ctx.Pipe()
+            proc = ctx.Process(target=_probe_worker, args=(child, eos_dir), daemon=True)
+            proc.start()
+            child.close()
+            self._starting.append((proc, conn))
+
+    def _collect_ready(self) -> None:
+        """Move workers that have reported ready from starting to idle."""
+        for worker in list(self._starting):
+            proc, conn = worker
+            try:
+                if not conn.poll():
+                    continue
+                conn.recv()
+            except (EOFError, OSError):
+                self.discard(worker)
+                continue
+            self._starting.remove(worker)
+            self._idle.append(worker)
+
+    def take(self, n: int) -> list:
+        """Hand out up to `n` workers that have finished starting up."""
+        self._collect_ready()
+        taken, self._idle = self._idle[:n], self._idle[n:]
+        return taken
+
+    def release(self, worker) -> None:
+        """Take back a worker whose probe has reported."""
+        self._idle.append(worker)
+
+    def discard(self, worker) -> None:
+        """Terminate a worker that is stalled, busy or dead."""
+        if worker in self._starting:
+            self._starting.remove(worker)
+        proc, conn = worker
+        conn.close()
+        if proc.is_alive():
+            proc.terminate()
+        proc.join()
+
+    def refill(self) -> None:
+        """Replace discarded workers."""
+        self.warm(self._size, self._eos_dir)
+
+    def close(self) -> None:
+        """Stop every worker; the pool may be warmed again afterwards."""
+        for worker in self._idle + self._starting:
+            self.discard(worker)
+        self._idle = []
+        self._size = 0
+
+    def wait_ready(self, timeout: float) -> bool:
+        """Wait until every worker has started up; True if they all did."""
+        deadline = time.monotonic() + timeout
+        while self._starting:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            multiprocessing.connection.wait(
+                [conn for _, conn in self._starting], timeout=remaining
+            )
+            self._collect_ready()
+        return True
+
+
+_probe_pool = None
+
+
+def _get_probe_pool(size: int, eos_dir: str | None) -> _ProbePool:
+    """Return this process's probe pool, starting workers up to `size`."""
+    global _probe_pool
+    if _probe_pool is None:
+        _probe_pool = _ProbePool()
+    _probe_pool.warm(size, eos_dir)
+    return _probe_pool
+
+
+def _speculate_ladder(
+    pool: _ProbePool, solver, eos_dir, config, rungs: dict, accept, timeout: float
+) -> dict:
+    """Solve several retry-ladder rungs concurrently in the probe pool.
+
+    Parameters
+    ----------
+    pool : _ProbePool
+        Pool of warm workers; only those done starting up are used, and
+        the rungs beyond them are left to the serial ladder.
+    solver : EntropySolver
+        Solver of this process; its class and parameters are sent to the
+        workers, which rebuild it.
+    eos_dir : str or None
+        Directory of the solver's P-S tables, None in const_properties mode.
+    config : Config
+        Model configuration, for the JAX CVODE callbacks.
+    rungs : dict
+        ``{attempt: (start_time, dt, atol_sf, dSdr_ic, S_ic)}`` of the
+        rungs to probe, in ascending order of attempt.
+    accept : callable
+        ``accept(status, T_core)`` applies the ladder's acceptance test.
+    timeout : float
+        Wall-time budget [s] of each probe, counted from the start of its
+        solve.
+
+    Returns
+    -------
+    dict
+        ``{attempt: (SolverOutput, solution)}`` for the leading run of
+        rungs that failed, plus the first rung that passed. It stops before
+        the first rung that crashed, was not probed or did not report in
+        time; the ladder solves that rung itself. Workers still solving are
+        replaced.
+    """
+    workers = pool.take(len(rungs))
+    if len(workers) < 2:
+        # A single probe would only run alongside the waiting parent
+        for worker in workers:
+            pool.release(worker)
+        return {}
+    rungs = dict(list(rungs.items())[: len(workers)])
+
+    now = time.monotonic()
+    pending = {}
+    for (attempt, rung), worker in zip(rungs.items(), workers):
+        worker[1].send((type(solver), solver.parameters, eos_dir, config, rung))
+        pending[worker[1]] = [attempt, worker, now + _PROBE_SETUP_TIMEOUT]
+
+    results = {}
+    try:
+        while True:
+            probed = {}
+            for attempt in rungs:
+                if attempt not in results:
+                    break
+                verdict = results[attempt]
+                if verdict is None:
+                    return probed
+                probed[attempt] = verdict
+                out, _ = verdict
+                if accept(int(out.status), float(out.T_core)):
+                    return probed
+            else:
+                return probed
+
+            remaining = min(deadline for _, _, deadline in pending.values()) - time.monotonic()
+            for conn in multiprocessing.connection.wait(
+                list(pending), timeout=max(remaining, 0)
+            ):
+                attempt, worker, _ = pending[conn]
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    message = ('done', None)
+                    pool.discard(worker)
+                    worker = None
+                if message[0] == 'started':
+                    pending[conn][2] = time.monotonic() + timeout
+                    continue
+                del pending[conn]
+                results[attempt] = message[1]
+                if worker is not None:
+                    pool.release(worker)
+
+            now = time.monotonic()
+            for conn, (attempt, worker, deadline) in list(pending.items()):
+                if deadline <= now:
+                    del pending[conn]
+                    results[attempt] = None
+                    pool.discard(worker)
+    finally:
+        for _, worker, _ in pending.values():
+            pool.discard(worker)
+        pool.refill()
+
+
 class AragogRunner:
     def __init__(
         self,
@@ -395,6 +711,7 @@ class AragogRunner:
         self.setup_or_update_solver(config, hf_row, interior_o, dt, dirs)
         self.aragog_solver = interior_o.aragog_solver
         self._config = config
+        self._outdir = dirs['output']
         # Diffrax direct-JAX integration is research-only (autodiff
         # development). It is NOT exposed in the user-facing schema; flip
         # the constant below to enable for development. The CHILI
@@ -466,6 +783,13 @@ class AragogRunner:
                     _t_after_init - _t_init,
                     _t_after_factory - _t_after_init,
                 )
+            if _speculative_probes(config) and _speculation_available():
+                # Start the probe workers now so they are warm by the
+                # time a solve first fails
+                _get_probe_pool(
+                    _speculative_probes(config),
+                    _entropy_eos_dir(config, interior_o, dirs['output']),
+                )
             if config.params.resume and getattr(interior_o, '_last_entropy', None) is not None:
                 # Restore the evolved entropy field from the last NetCDF
                 # snapshot. Without this, _set_entropy_ic overwrites the
@@ -1146,22 +1470,12 @@ class AragogRunner:
         # Skip entirely in const_properties mode (no table lookups needed).
         nightly_strict = os.environ.get('PROTEUS_CI_NIGHTLY') == '1'
         _t_pre_eos = time.perf_counter()
-        if config.interior_energetics.const_properties:
+        eos_dir = _entropy_eos_dir(config, interior_o, outdir)
+        if eos_dir is None:
             entropy_eos = None
             log.info('const_properties=True: skipping EOS table loading')
         else:
-            spider_eos_dir = interior_o._spider_eos_dir
-            if spider_eos_dir and os.path.isdir(spider_eos_dir):
-                entropy_eos = _cached_entropy_eos(str(spider_eos_dir))
-            else:
-                fallback_dir = Path(outdir) / 'data' / 'spider_eos'
-                if fallback_dir.is_dir():
-                    entropy_eos = _cached_entropy_eos(str(fallback_dir))
-                else:
-                    raise FileNotFoundError(
-                        f'PALEOS P-S tables not found. Aragog entropy solver '
-                        f'requires P-S tables. Checked: {spider_eos_dir}, {fallback_dir}'
-                    )
+            entropy_eos = _cached_entropy_eos(eos_dir)
         _t_post_eos = time.perf_counter()
         interior_o.aragog_solver = EntropySolver(param, entropy_eos)
         _t_post_solver = time.perf_counter()
@@ -1920,7 +2234,12 @@ class AragogRunner:
         # step lands in a stiff regime (e.g. the first crystallisation
         # transition). Retry with a halved dt from the same start state.
         # Mirrors SPIDER's _try_spider retry ladder in spider.py.
-        out = self._solve_with_retry(hf_row, interior_o)
+        with compile_cache_report(
+            'aragog',
+            n_stag=getattr(interior_o.aragog_solver, '_n_stag', None),
+            eos=short_fingerprint(_eos_content_key(str(interior_o._spider_eos_dir))),
+        ):
+            out = self._solve_with_retry(hf_row, interior_o)
 
         # Build PROTEUS helpfile output from SolverOutput
         output = self._build_helpfile_output(
@@ -1975,6 +2294,16 @@ class AragogRunner:
         failure, returns the SolverOutput from the last attempt
         (caller propagates status to the helpfile via dt_actual).
 
+        With ``interior_energetics.aragog.speculative_retries = n`` (n >= 2),
+        a failure of attempt 1 launches attempts 2..n+1 concurrently in
+        spawned child processes, each solving from the same restored state
+        as the serial ladder. The solver adopts the state each child sends
+        back instead of solving that rung again, so the accepted result and
+        the solver state left for the next step are those of the serial
+        ladder, including the last rung's state when every rung fails.
+        Speculation needs the pre-solve entropy and dSdr_cmb to rebuild
+        that state, and is unavailable in a daemonic process.
+
         Parameters
         ----------
         hf_row : dict
@@ -2045,27 +2374,66 @@ class AragogRunner:
         # (cleared regardless of retry outcome at end of method)
         solver._atol_sf = 1.0
 
+        def _rung(attempt):
+            # dt and atol scale of a retry attempt (>= 2). atol_sf increases
+            # linearly to atol_sf_max over attempts 2-3, then stays at the
+            # cap for further attempts. dt continues halving so additional
+            # attempts gain resolution, not looser tolerance.
+            dt_new = dt_requested * (0.5 ** (attempt - 1))
+            atol_sf_new = min(atol_sf_max, 1.0 + (atol_sf_max - 1.0) * ((attempt - 1) / 2.0))
+            return dt_new, atol_sf_new
+
+        def _prepare(attempt):
+            # Restore the pre-solve state and configure a retry attempt
+            _configure_rung(solver, t_start, *_rung(attempt), dSdr_ic, S_ic)
+
+        def _accept(status, T_core_post):
+            # T_core_pre is 0 only on the very first solve, before any
+            # converged core temperature exists to compare against, so
+            # the jump guard is necessarily inactive on that one step.
+            dT = abs(T_core_post - T_core_pre) if T_core_pre > 0 else 0.0
+            return status == 0 and dT <= sanity_dT_core
+
+        # Optional speculative retries: once attempt 1 fails, rungs 2..n+1
+        # are solved concurrently by the warm probe workers. The solver takes over
+        # each probed rung's final state below instead of solving it again,
+        # so the result is that of the serial ladder.
+        n_spec = min(_speculative_probes(self._config), max_attempts - 1)
+        pool = None
+        if n_spec >= 2 and _speculation_available():
+            pool = _get_probe_pool(
+                n_spec, _entropy_eos_dir(self._config, interior_o, self._outdir)
+            )
+        probed = {}
+
         out = None
         _diag_on = os.environ.get('PROTEUS_CI_NIGHTLY') == '1'
         try:
             for attempt in range(1, max_attempts + 1):
-                _t0 = time.perf_counter()
-                solver.solve()
-                _solve_wall = time.perf_counter() - _t0
-                out = solver.get_state()
-                if _diag_on:
-                    log.info(
-                        'aragog diag: solve() attempt=%d dt=%.3e yr wall=%.2fs '
-                        'status=%d t=%.3e yr',
-                        attempt,
-                        float(solver.parameters.solver.end_time) - t_start,
-                        _solve_wall,
-                        int(out.status),
-                        float(hf_row.get('Time', 0.0)),
-                    )
+                if attempt in probed:
+                    # Already prepared for this rung; take over the probe's solution
+                    out, solver._solution = probed[attempt]
+                    status, T_core_post = int(out.status), float(out.T_core)
+                    log.info('Aragog attempt %d taken from its speculative probe', attempt)
+                else:
+                    _t0 = time.perf_counter()
+                    solver.solve()
+                    _solve_wall = time.perf_counter() - _t0
+                    out = solver.get_state()
+                    status, T_core_post = int(out.status), float(out.T_core)
+                    if _diag_on:
+                        log.info(
+                            'aragog diag: solve() attempt=%d dt=%.3e yr wall=%.2fs '
+                            'status=%d t=%.3e yr',
+                            attempt,
+                            float(solver.parameters.solver.end_time) - t_start,
+                            _solve_wall,
+                            status,
+                            float(hf_row.get('Time', 0.0)),
+                        )
 
                 # Status check: did CVODE accept the step?
-                if out.status == 0:
+                if status == 0:
                     # Sanity check: reject suspiciously large T_core jumps
                     # that indicate the solver "succeeded" with garbage.
                     # Applies on ALL attempts (not just retries):
@@ -2076,18 +2444,13 @@ class AragogRunner:
                     #     phase boundary in one shot
                     # Either way, we want to reject the result and retry
                     # with a smaller dt.
-                    T_core_post = float(out.T_core)
-                    # T_core_pre is 0 only on the very first solve, before any
-                    # converged core temperature exists to compare against, so
-                    # the jump guard is necessarily inactive on that one step.
-                    dT = abs(T_core_post - T_core_pre) if T_core_pre > 0 else 0.0
-                    if dT > sanity_dT_core:
+                    if not _accept(status, T_core_post):
                         log.warning(
                             'Aragog attempt %d returned status=0 but T_core '
                             'jumped %.1f K (>%.0f K threshold). Treating as '
                             'failure and continuing retry ladder.',
                             attempt,
-                            dT,
+                            abs(T_core_post - T_core_pre),
                             sanity_dT_core,
                         )
                         # Fall through to the retry/exhaustion branch below
@@ -2108,13 +2471,13 @@ class AragogRunner:
                     # status==0 here means CVODE accepted every step but each
                     # result was rejected for an over-threshold T_core jump, so
                     # report that reason rather than the misleading status=0.
-                    if out.status == 0:
+                    if status == 0:
                         reason = (
                             'status=0 but the T_core jump exceeded the '
                             f'{sanity_dT_core:.0f} K sanity threshold on every attempt'
                         )
                     else:
-                        reason = f'CVODE status={out.status}'
+                        reason = f'CVODE status={status}'
                     log.error(
                         'Aragog solver failed after %d attempts (%s). '
                         'Raising RuntimeError so wrapper can apply skip-step fallback.',
@@ -2127,36 +2490,39 @@ class AragogRunner:
                     )
 
                 # Failure: halve dt AND relax atol (capped), restore state, retry.
-                # atol_sf increases linearly to atol_sf_max over attempts 2-3,
-                # then stays at the cap for further attempts. dt continues
-                # halving so additional attempts gain resolution, not looser
-                # tolerance.
-                dt_new = dt_requested * (0.5**attempt)
-                atol_sf_new = min(atol_sf_max, 1.0 + (atol_sf_max - 1.0) * (attempt / 2.0))
+                dt_new, atol_sf_new = _rung(attempt + 1)
                 log.warning(
                     'Aragog solver failed at t=%.3e yr (status=%d, attempt %d/%d). '
                     'Retrying with dt=%.3e yr, atol_sf=%.1fx (was dt=%.3e yr).',
                     hf_row.get('Time', 0.0),
-                    out.status,
+                    status,
                     attempt,
                     max_attempts,
                     dt_new,
                     atol_sf_new,
                     dt_requested,
                 )
-                solver.parameters.solver.start_time = t_start
-                solver.parameters.solver.end_time = t_start + dt_new
-                solver._atol_sf = atol_sf_new
-                if dSdr_ic is not None:
-                    # Force the next attempt's hot-start to use the pre-solve
-                    # snapshot instead of the failed attempt's final value.
-                    if hasattr(solver, 'set_initial_dSdr_cmb'):
-                        solver.set_initial_dSdr_cmb(dSdr_ic)
-                    else:
-                        solver._dSdr_cmb_init = dSdr_ic
-                solver.reset()
-                if S_ic is not None:
-                    solver.set_initial_entropy(S_ic)
+                if (
+                    attempt == 1
+                    and pool is not None
+                    and S_ic is not None
+                    and dSdr_ic is not None
+                ):
+                    probed = _speculate_ladder(
+                        pool,
+                        solver,
+                        _entropy_eos_dir(self._config, interior_o, self._outdir),
+                        self._config,
+                        {a: (t_start, *_rung(a), dSdr_ic, S_ic) for a in range(2, 2 + n_spec)},
+                        _accept,
+                        timeout=_SPECULATIVE_TIMEOUT_FACTOR * _solve_wall,
+                    )
+                    log.info(
+                        'Aragog speculative retries: %d of rungs 2-%d taken from probes',
+                        len(probed),
+                        1 + n_spec,
+                    )
+                _prepare(attempt + 1)
         finally:
             # Always reset atol_sf so subsequent coupling steps start at 1.0x
             solver._atol_sf = 1.0
@@ -20,6 +20,7 @@ import netCDF4 as nc
 import numpy as np
 
 from proteus.interior_energetics.common import Interior_t
+from proteus.utils.jax_cache import compile_cache_report, short_fingerprint
 
 jax.config.update('jax_enable_x64', True)
 
@@ -66,14 +67,16 @@ class AragogJAXRunner:
 
     def _build_jax_components(self, config: Config, interior_o: Interior_t):
         """Build JAX EOS, params, and BCs from the numpy solver."""
-        from aragog.jax.eos import EntropyEOS_JAX
         from aragog.jax.phase import PhaseParams
         from aragog.jax.solver import BoundaryParams
 
-        # EOS: load from the same directory as numpy solver
+        from proteus.interior_energetics.aragog import _cached_entropy_eos_jax
+
+        # EOS: load from the same directory as numpy solver, sharing the
+        # in-memory and on-disk EOS caches with the CVODE JAX path
         spider_eos_dir = interior_o._spider_eos_dir
         if spider_eos_dir and os.path.isdir(spider_eos_dir):
-            eos_jax = EntropyEOS_JAX(spider_eos_dir)
+            eos_jax = _cached_entropy_eos_jax(str(spider_eos_dir))
         else:
             raise FileNotFoundError(
                 f'PALEOS P-S tables not found for JAX solver: {spider_eos_dir}'
@@ -135,6 +138,8 @@ class AragogJAXRunner:
         """Run the JAX solver and return output in the same format."""
         from aragog.jax.solver import BoundaryParams, solve_entropy
 
+        from proteus.interior_energetics.aragog import _eos_content_key
+
         solver = self.aragog_solver
 
         # Get entropy IC
@@ -205,26 +210,28 @@ class AragogJAXRunner:
         # scipy BDF path hits (grinding on dt ~ 5 kyr). Kvaerno3's
         # JIT compile is slower than Tsit5 (~a minute) but amortises
         # across the coupling loop.
-        result = solve_entropy(
-            S0,
-            t_start,
-            t_end,
-            self._eos_jax,
-            self._params_jax,
-            self._mesh_jax,
-            bc,
-            heating,
-            atol=atol,
-            rtol=rtol,
-            # First crystallization step is extremely stiff: kvaerno3
-            # needs ~1e5-1e6 substeps to cover a ~4 kyr coupling step
-            # through the narrow mushy transition. The old 1e5 ceiling
-            # blew out on the very first phase change. 5e6 is large
-            # enough to absorb the worst transition and still fails
-            # visibly if the step-size PID controller saturates.
-            max_steps=5_000_000,
-            method='kvaerno3',
-        )
+        eos_key = _eos_content_key(str(interior_o._spider_eos_dir))
+        with compile_cache_report('aragog_jax', n_stag=n_stag, eos=short_fingerprint(eos_key)):
+            result = solve_entropy(
+                S0,
+                t_start,
+                t_end,
+                self._eos_jax,
+                self._params_jax,
+                self._mesh_jax,
+                bc,
+                heating,
+                atol=atol,
+                rtol=rtol,
+                # First crystallization step is extremely stiff: kvaerno3
+                # needs ~1e5-1e6 substeps to cover a ~4 kyr coupling step
+                # through the narrow mushy transition. The old 1e5 ceiling
+                # blew out on the very first phase change. 5e6 is large
+                # enough to absorb the worst transition and still fails
+                # visibly if the step-size PID controller saturates.
+                max_steps=5_000_000,
+                method='kvaerno3',
+            )
 
         if not result.success:
             t_now = float(hf_row.get('Time', 0.0))
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import copy
 import csv
 import logging
+import math
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
-from scipy.integrate import solve_ivp
+from scipy import sparse
+from scipy.integrate import BDF, solve_ivp
+from scipy.optimize import brentq
 
 from proteus.atmos_clim.common import Atmos_t
 from proteus.interior_energetics.common import Interior_t
@@ -26,6 +31,343 @@ log = logging.getLogger('fwl.' + __name__)
 ATM_MASS_MIN = 1.0  # min atmosphere mass
 DELTA_MIN = 1e-3  # min CBL thickness
 
+# Largest argument math.exp accepts; beyond it numpy returns inf
+_EXP_MAX = 709.78
+
+
+def _exp(x: float) -> float:
+    return math.exp(x) if x < _EXP_MAX else math.inf
+
+
+def _thermal_kernel(t: float, T_p: float, T_surf: float, c: tuple, jac: bool):
+    """
+    Thermal ODE right-hand side and, if `jac`, its analytic Jacobian.
+
+    Closed-form version of :meth:`BoundaryRunner.thermal_rhs` on plain
+    floats, taking the constants from :meth:`BoundaryRunner.rhs_constants`.
+    Operations are carried out in the same order as in the method chain, so
+    the two agree to rounding.
+
+    Returns
+    -------
+    tuple
+        ``(dT_p/dt, dT_surf/dt)``, or the 2x2 Jacobian
+        ``((dTp/dT_p, dTp/dT_surf), (dTs/dT_p, dTs/dT_surf))`` if `jac`.
+    """
+    (
+        R, R_core, M, rho, g, alpha, kappa, k, R_mantle, Ra_crit, beta,
+        c_sil, L, T_sol, T_liq, f_atm, cp_atm, m_atm,
+        model, eta_const, phi_crit, width, log_eta_melt, log_eta_solid,
+        eta_0, E_act, R_gas, creep, eta_vft, T_vft,
+        radio, t_0, H_K, lam_K, H_U238, lam_U238, H_U235, lam_U235, H_Th, lam_Th,
+        tidal,
+    ) = c  # fmt: skip
+
+    # Melt fraction
+    T_range = T_liq - T_sol
+    phi_raw = (T_p - T_sol) / T_range
+    phi = min(max(phi_raw, 0.0), 1.0)
+    dphi = 1.0 / T_range if 0.0 < phi_raw < 1.0 else 0.0
+
+    # Viscosity and d(ln eta)/dT_p
+    if model == 1:
+        eta = eta_const
+        dlog_eta = 0.0
+    elif model == 3 and phi < phi_crit:
+        eta = eta_0 * _exp(E_act / (R_gas * T_p))
+        eta = eta * _exp(-creep * phi)
+        dlog_eta = -E_act / (R_gas * T_p * T_p) - creep * dphi
+    elif model == 3:
+        u = 1.0 - (1.0 - phi) / (1.0 - phi_crit)
+        eta = eta_vft * _exp(T_vft / (T_p - 1000.0)) / u**2.5
+        dlog_eta = -T_vft / (T_p - 1000.0) ** 2
+        if dphi:
+            dlog_eta -= 2.5 * dphi / ((1.0 - phi_crit) * u)
+    else:
+        th = math.tanh((phi - phi_crit) / width)
+        z = 0.5 * (1 + th)
+        eta = 10 ** (z * log_eta_melt + (1 - z) * log_eta_solid)
+        dz = 0.5 * (1.0 - th * th) / width * dphi
+        dlog_eta = math.log(10.0) * (log_eta_melt - log_eta_solid) * dz
+
+    # Convective heat flux; ln q = beta ln Ra + ln|T_p - T_surf| + const
+    dT = T_p - T_surf
+    A = abs(dT)
+    Ra = (rho * g * alpha * A * R_mantle**3) / (eta * kappa)
+    q = (Ra / Ra_crit) ** beta * k * A / R_mantle
+    if A > 0.0:
+        s = math.copysign(1.0, dT) / A
+        dq_dTp = q * (beta * (s - dlog_eta) + s)
+        dq_dTs = -q * (beta + 1.0) * s
+    else:
+        dq_dTp = dq_dTs = 0.0
+
+    # Mantle energy balance
+    if radio:
+        age = t_0 - t
+        Q = H_K * _exp(lam_K * age) + H_U238 * _exp(lam_U238 * age)
+        Q = Q + H_U235 * _exp(lam_U235 * age) + H_Th * _exp(lam_Th * age)
+    else:
+        Q = 0.0
+    numerator = -4 * math.pi * R**2 * q + M * (Q + tidal)
+    if phi >= 1.0:
+        r_s = R_core
+    elif phi <= 0.0:
+        r_s = R
+    else:
+        r_s = (R**3 - phi * (R**3 - R_core**3)) ** (1 / 3)
+    if r_s < R:
+        dr_s_dT_p = -(R**3 - R_core**3) / (3 * T_range * r_s**2)
+        denominator = (4 / 3) * math.pi * rho * c_sil * (
+            R**3 - r_s**3
+        ) - 4 * math.pi * r_s**2 * rho * L * dr_s_dT_p
+        # r_s^3 = R^3 - phi (R^3 - R_core^3), and the latent term is constant
+        dden_dTp = (4 / 3) * math.pi * rho * c_sil * (R**3 - R_core**3) * dphi
+    else:
+        denominator = c_sil * M
+        dden_dTp = 0.0
+    dTp = numerator / denominator
+
+    # Surface energy balance over the thermal boundary layer
+    q_floor = max(q, 1e-6)
+    delta = k * dT / q_floor
+    if delta < DELTA_MIN or not math.isfinite(delta):
+        delta = DELTA_MIN
+        ddelta_dTp = ddelta_dTs = 0.0
+    elif q > 1e-6:
+        ddelta_dTp = (k - delta * dq_dTp) / q
+        ddelta_dTs = (-k - delta * dq_dTs) / q
+    else:
+        ddelta_dTp = k / q_floor
+        ddelta_dTs = -k / q_floor
+    numerator_s = 4 * math.pi * R**2 * (q - f_atm)
+    denominator_s = cp_atm * m_atm + (4 / 3) * math.pi * c_sil * rho * (R**3 - (R - delta) ** 3)
+    dTs = numerator_s / denominator_s
+
+    if not jac:
+        return dTp, dTs
+
+    area = 4 * math.pi * R**2
+    dden_s = 4 * math.pi * c_sil * rho * (R - delta) ** 2
+    return (
+        ((-area * dq_dTp - dTp * dden_dTp) / denominator, -area * dq_dTs / denominator),
+        (
+            (area * dq_dTp - dTs * dden_s * ddelta_dTp) / denominator_s,
+            (area * dq_dTs - dTs * dden_s * ddelta_dTs) / denominator_s,
+        ),
+    )
+
+
+def _thermal_kernel_batch(t: float, T_p: np.ndarray, T_surf: np.ndarray, c: tuple, jac: bool):
+    """
+    Vectorised :func:`_thermal_kernel` over a batch of parameter sets.
+
+    Each entry of `c` is an array holding one constant of
+    :meth:`BoundaryRunner.rhs_constants` per member, so members may differ
+    in any parameter, including the viscosity model.
+
+    Returns
+    -------
+    tuple
+        ``(dT_p/dt, dT_surf/dt)`` arrays, or the four arrays
+        ``(dTp/dT_p, dTp/dT_surf, dTs/dT_p, dTs/dT_surf)`` holding the
+        diagonal blocks of the Jacobian if `jac`.
+    """
+    (
+        R, R_core, M, rho, g, alpha, kappa, k, R_mantle, Ra_crit, beta,
+        c_sil, L, T_sol, T_liq, f_atm, cp_atm, m_atm,
+        model, eta_const, phi_crit, width, log_eta_melt, log_eta_solid,
+        eta_0, E_act, R_gas, creep, eta_vft, T_vft,
+        radio, t_0, H_K, lam_K, H_U238, lam_U238, H_U235, lam_U235, H_Th, lam_Th,
+        tidal,
+    ) = c  # fmt: skip
+
+    with np.errstate(all='ignore'):
+        # Melt fraction
+        T_range = T_liq - T_sol
+        phi_raw = (T_p - T_sol) / T_range
+        phi = np.clip(phi_raw, 0.0, 1.0)
+        dphi = np.where((phi_raw > 0.0) & (phi_raw < 1.0), 1.0 / T_range, 0.0)
+
+        # Viscosity and d(ln eta)/dT_p; aggregate model first, then overrides
+        th = np.tanh((phi - phi_crit) / width)
+        z = 0.5 * (1 + th)
+        eta = 10 ** (z * log_eta_melt + (1 - z) * log_eta_solid)
+        dz = 0.5 * (1.0 - th * th) / width * dphi
+        dlog_eta = np.log(10.0) * (log_eta_melt - log_eta_solid) * dz
+        arrhenius = model == 3
+        if arrhenius.any():
+            solid = arrhenius & (phi < phi_crit)
+            eta_s = eta_0 * np.exp(E_act / (R_gas * T_p))
+            eta_s = eta_s * np.exp(-creep * phi)
+            u = 1.0 - (1.0 - phi) / (1.0 - phi_crit)
+            eta_l = eta_vft * np.exp(T_vft / (T_p - 1000.0)) / u**2.5
+            dlog_l = -T_vft / (T_p - 1000.0) ** 2 - np.where(
+                dphi != 0.0, 2.5 * dphi / ((1.0 - phi_crit) * u), 0.0
+            )
+            dlog_s = -E_act / (R_gas * T_p * T_p) - creep * dphi
+            eta = np.where(solid, eta_s, np.where(arrhenius, eta_l, eta))
+            dlog_eta = np.where(solid, dlog_s, np.where(arrhenius, dlog_l, dlog_eta))
+        constant = model == 1
+        eta = np.where(constant, eta_const, eta)
+        dlog_eta = np.where(constant, 0.0, dlog_eta)
+
+        # Convective heat flux
+        dT = T_p - T_surf
+        A = np.abs(dT)
+        Ra = (rho * g * alpha * A * R_mantle**3) / (eta * kappa)
+        q = (Ra / Ra_crit) ** beta * k * A / R_mantle
+        flowing = A > 0.0
+        s = np.where(flowing, np.sign(dT) / A, 0.0)
+        dq_dTp = np.where(flowing, q * (beta * (s - dlog_eta) + s), 0.0)
+        dq_dTs = np.where(flowing, -q * (beta + 1.0) * s, 0.0)
+
+        # Mantle energy balance
+        age = t_0 - t
+        Q = H_K * np.exp(lam_K * age) + H_U238 * np.exp(lam_U238 * age)
+        Q = Q + H_U235 * np.exp(lam_U235 * age) + H_Th * np.exp(lam_Th * age)
+        Q = np.where(radio != 0.0, Q, 0.0)
+        numerator = -4 * np.pi * R**2 * q + M * (Q + tidal)
+        r_s = np.where(
+            phi >= 1.0,
+            R_core,
+            np.where(phi <= 0.0, R, (R**3 - phi * (R**3 - R_core**3)) ** (1 / 3)),
+        )
+        partial = r_s < R
+        dr_s_dT_p = -(R**3 - R_core**3) / (3 * T_range * r_s**2)
+        denominator = np.where(
+            partial,
+            (4 / 3) * np.pi * rho * c_sil * (R**3 - r_s**3)
+            - 4 * np.pi * r_s**2 * rho * L * dr_s_dT_p,
+            c_sil * M,
+        )
+        dden_dTp = np.where(
+            partial, (4 / 3) * np.pi * rho * c_sil * (R**3 - R_core**3) * dphi, 0.0
+        )
+        dTp = numerator / denominator
+
+        # Surface energy balance over the thermal boundary layer
+        q_floor = np.maximum(q, 1e-6)
+        delta = k * dT / q_floor
+        floored = (delta < DELTA_MIN) | ~np.isfinite(delta)
+        delta = np.where(floored, DELTA_MIN, delta)
+        resolved = q > 1e-6
+        ddelta_dTp = np.where(
+            floored, 0.0, np.where(resolved, (k - delta * dq_dTp) / q, k / q_floor)
+        )
+        ddelta_dTs = np.where(
+            floored, 0.0, np.where(resolved, (-k - delta * dq_dTs) / q, -k / q_floor)
+        )
+        numerator_s = 4 * np.pi * R**2 * (q - f_atm)
+        denominator_s = cp_atm * m_atm + (4 / 3) * np.pi * c_sil * rho * (
+            R**3 - (R - delta) ** 3
+        )
+        dTs = numerator_s / denominator_s
+
+        if not jac:
+            return dTp, dTs
+
+        area = 4 * np.pi * R**2
+        dden_s = 4 * np.pi * c_sil * rho * (R - delta) ** 2
+        return (
+            (-area * dq_dTp - dTp * dden_dTp) / denominator,
+            -area * dq_dTs / denominator,
+            (area * dq_dTp - dTs * dden_s * ddelta_dTp) / denominator_s,
+            (area * dq_dTs - dTs * dden_s * ddelta_dTs) / denominator_s,
+        )
+
+
+def _integrate_batch(
+    constants: tuple,
+    y0: np.ndarray,
+    t_span: tuple[float, float],
+    rtol: float,
+    atol: np.ndarray,
+    T_surf_0: np.ndarray,
+    dT_event: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Integrate a batch of boundary models in one BDF solve.
+
+    The state is ``[T_p(0..n-1), T_surf(0..n-1)]`` and the Jacobian is the
+    block-diagonal sparse matrix of the members' 2x2 Jacobians. Each member
+    carries its own terminal ``tsurf_change_event``: when a member's event
+    fires it is stopped at the located root, exactly as ``solve_ivp`` would
+    stop it, and the solve restarts with the remaining members.
+
+    Returns
+    -------
+    t_final : np.ndarray
+        Final time of each member [s].
+    y_final : np.ndarray
+        Final ``(T_p, T_surf)`` of each member, shape ``(2, n)``.
+    status : np.ndarray
+        Per member, 0 if it reached the end of `t_span`, 1 if its event
+        fired and -1 if the integration failed.
+    """
+    n = y0.size // 2
+    t_final = np.full(n, float(t_span[1]))
+    y_final = y0.reshape(2, n).copy()
+    status = np.zeros(n, dtype=int)
+
+    active = np.arange(n)
+    t0, y = float(t_span[0]), np.asarray(y0, dtype=float)
+    while active.size:
+        m = active.size
+        c = tuple(col[active] for col in constants)
+        Ts0, dTe = T_surf_0[active], dT_event[active]
+
+        def rhs(t, state, c=c, m=m):
+            return np.concatenate(_thermal_kernel_batch(t, state[:m], state[m:], c, False))
+
+        def jac(t, state, c=c, m=m):
+            a, b, d, e = _thermal_kernel_batch(t, state[:m], state[m:], c, True)
+            return sparse.bmat(
+                [[sparse.diags(a), sparse.diags(b)], [sparse.diags(d), sparse.diags(e)]],
+                format='csc',
+            )
+
+        solver = BDF(rhs, t0, y, t_span[1], rtol=rtol, atol=np.tile(atol[active], 2), jac=jac)
+        g_old = np.abs(y[m:] - Ts0) - dTe
+        while True:
+            solver.step()
+            if solver.status == 'failed':
+                log.warning(f'Batched boundary solve failed: {solver.message}')
+                t_final[active] = solver.t
+                y_final[:, active] = solver.y.reshape(2, m)
+                status[active] = -1
+                return t_final, y_final, status
+
+            # Per-member terminal event, rising through zero
+            g_new = np.abs(solver.y[m:] - Ts0) - dTe
+            hit = (g_old <= 0.0) & (g_new >= 0.0)
+            g_old = g_new
+            if hit.any():
+                sol = solver.dense_output()
+                for i in np.flatnonzero(hit):
+                    root = brentq(
+                        lambda tt, i=i: abs(sol(tt)[m + i] - Ts0[i]) - dTe[i],
+                        solver.t_old,
+                        solver.t,
+                        xtol=4 * np.finfo(float).eps,
+                        rtol=4 * np.finfo(float).eps,
+                    )
+                    t_final[active[i]] = root
+                    y_final[:, active[i]] = sol(root)[[i, m + i]]
+                    status[active[i]] = 1
+
+            if solver.status == 'finished':
+                keep = ~hit
+                y_final[:, active[keep]] = solver.y.reshape(2, m)[:, keep]
+                return t_final, y_final, status
+            if hit.any():
+                keep = ~hit
+                t0 = solver.t
+                y = solver.y.reshape(2, m)[:, keep].ravel()
+                active = active[keep]
+                break
+    return t_final, y_final, status
+
 
 class BoundaryRunner:
     def __init__(
@@ -665,6 +1007,124 @@ class BoundaryRunner:
 
         return [dTp, dTs]
 
+    def rhs_constants(self) -> tuple:
+        """
+        Collect the model constants used by the compiled right-hand side.
+
+        Evaluated once per :meth:`run_solver` call, so the integration sees
+        the runner's attributes as they are when the step starts.
+
+        Returns
+        -------
+        tuple
+            Constants in the order unpacked by ``_thermal_kernel``.
+        """
+        model = self.viscosity_model
+        if model not in (1, 2, 3):
+            log.warning(f'Unknown viscosity model {model}, defaulting to aggregate (2)')
+            model = 2
+
+        radio = []
+        for key, abun in (
+            ('k40', self.K_abun),
+            ('u238', self.U_abun),
+            ('u235', self.U_abun),
+            ('th232', self.Th_abun),
+        ):
+            nuc = radnuc_data[key]
+            radio.append(abun * nuc['abundance'] * nuc['heatprod'])
+            radio.append(np.log(2) / (nuc['halflife'] * secs_per_year))
+
+        return tuple(
+            float(v)
+            for v in (
+                self.planet_radius,
+                self.core_radius,
+                self.mantle_mass,
+                self.mantle_bulk_density,
+                self.surface_gravity,
+                self.thermal_expansivity,
+                self.thermal_diffusivity,
+                self.thermal_conductivity,
+                self.mantle_radius,
+                self.critical_rayleigh_number,
+                self.nusselt_exponent,
+                self.silicate_heat_capacity,
+                self.heat_fusion_silicate,
+                self.T_solidus,
+                self.T_liquidus,
+                self.f_atm,
+                self.atmosphere_heat_capacity,
+                self.m_atm,
+                model,
+                self.eta_constant,
+                self.critical_melt_fraction,
+                self.transition_width,
+                np.log10(self.eta_melt_const),
+                np.log10(self.eta_solid_const),
+                self.dynamic_viscosity,
+                self.activation_energy,
+                self.const_R,
+                self.creep_parameter,
+                self.viscosity_prefactor,
+                self.viscosity_activation_temp,
+                bool(self.use_radiogenic_heating),
+                (self.radio_tref - self.age_ini) * 1e9 * secs_per_year,
+                *radio,
+                self.tidal_term,
+            )
+        )
+
+    def step_output(self, t_final: float, T_p_final: float, T_surf_final: float) -> dict:
+        """
+        Build the helpfile quantities for the state reached at the end of a step.
+
+        Parameters
+        ----------
+        t_final : float
+            Time reached [s]
+        T_p_final : float
+            Final potential temperature of the mantle [K]
+        T_surf_final : float
+            Final surface temperature of the planet [K]
+
+        Returns
+        -------
+        dict
+            Interior quantities keyed by helpfile column
+        """
+        phi_final = self.melt_fraction(T_p_final)
+        f_radio_final = self.radioactive_heating(t_final) * self.mantle_mass
+        r_s_fin = self.r_s(T_p_final)
+
+        m_liquid = (
+            (4 / 3) * np.pi * self.mantle_bulk_density * (self.planet_radius**3 - r_s_fin**3)
+        )
+        m_solid = self.mantle_mass - m_liquid
+
+        # Calculate boundary layer thickness
+        delta = self.boundary_layer_thickness(T_p_final, T_surf_final, phi_final)
+
+        output = {
+            'T_magma': T_p_final,
+            'T_pot': T_p_final,
+            'T_surf': T_surf_final,
+            'F_int': self.f_atm,
+            'Phi_global': phi_final,
+            'Phi_global_vol': phi_final,
+            'F_radio': f_radio_final / (4 * np.pi * self.planet_radius**2),
+            'RF_depth': phi_final * (1.0 - self.core_frac),
+            'M_mantle_liquid': m_liquid,
+            'M_mantle_solid': m_solid,
+            'F_tidal': self.tidal_term * self.mantle_mass / (4 * np.pi * self.planet_radius**2)
+            if self.use_tidal_heating
+            else 0.0,
+            'M_mantle': self.mantle_mass,
+            'boundary_layer_thickness': delta,
+        }
+
+        return output
+
     def run_solver(self, hf_row: dict, interior_o: Interior_t, dirs: dict) -> tuple:
         """
         Run the thermal evolution solver for a single timestep.
@@ -717,11 +1177,24 @@ class BoundaryRunner:
         y0 = [self.T_p_0, self.T_surf_0]
         t_span = (self.curr_time, self.curr_time + self.dt)
 
+        # Closed-form equivalent of thermal_rhs, with its analytic Jacobian
+        # in place of BDF's finite-difference estimate
+        constants = self.rhs_constants()
+
+        def rhs(t: float, y: np.ndarray) -> tuple:
+            T_p, T_surf = y.tolist()
+            return _thermal_kernel(float(t), T_p, T_surf, constants, False)
+
+        def jac(t: float, y: np.ndarray) -> tuple:
+            T_p, T_surf = y.tolist()
+            return _thermal_kernel(float(t), T_p, T_surf, constants, True)
+
         sol = solve_ivp(
-            self.thermal_rhs,
+            rhs,
             t_span,
             y0,
             method='BDF',
+            jac=jac,
             rtol=self.rtol,
             atol=self.atol,
             dense_output=True,
@@ -747,8 +1220,6 @@ class BoundaryRunner:
         T_surf_final = sol.y[1, -1]
         phi_final = self.melt_fraction(T_p_final)
         visc_final = self.viscosity(T_p_final, T_surf_final, phi_final)
-        f_radio_final = self.radioactive_heating(t_final) * self.mantle_mass
-        r_s_fin = self.r_s(T_p_final)
 
         # Log final timestep values to CSV
         if self.logging:
@@ -773,31 +1244,7 @@ class BoundaryRunner:
                     }
                 )
 
-        m_liquid = (
-            (4 / 3) * np.pi * self.mantle_bulk_density * (self.planet_radius**3 - r_s_fin**3)
-        )
-        m_solid = self.mantle_mass - m_liquid
-
-        # Calculate boundary layer thickness
-        delta = self.boundary_layer_thickness(T_p_final, T_surf_final, phi_final)
-
-        output = {
-            'T_magma': T_p_final,
-            'T_pot': T_p_final,
-            'T_surf': T_surf_final,
-            'F_int': self.f_atm,
-            'Phi_global': phi_final,
-            'Phi_global_vol': phi_final,
-            'F_radio': f_radio_final / (4 * np.pi * self.planet_radius**2),
-            'RF_depth': phi_final * (1.0 - self.core_frac),
-            'M_mantle_liquid': m_liquid,
-            'M_mantle_solid': m_solid,
-            'F_tidal': self.tidal_term * self.mantle_mass / (4 * np.pi * self.planet_radius**2)
-            if self.use_tidal_heating
-            else 0.0,
-            'M_mantle': self.mantle_mass,
-            'boundary_layer_thickness': delta,
-        }
+        output = self.step_output(t_final, T_p_final, T_surf_final)
 
         # Store arrays
         interior_o.phi = np.array([output['Phi_global']])
@@ -809,3 +1256,99 @@ class BoundaryRunner:
         interior_o.radius = np.array([self.core_radius, hf_row['R_int']])
 
         return sim_time, output
+
+    def variants(self, **values) -> list[BoundaryRunner]:
+        """
+        Copies of this runner with attributes varied member by member.
+
+        Builds the members of a parameter sweep for :meth:`run_batch`, e.g.
+        ``runner.variants(T_p_0=[3000.0, 3500.0], f_atm=[50.0, 100.0])``.
+
+        Parameters
+        ----------
+        **values : sequence
+            Runner attribute names, each with one value per member. All
+            sequences must have the same length.
+
+        Returns
+        -------
+        list of BoundaryRunner
+            One shallow copy of this runner per member.
+        """
+        unknown = sorted(name for name in values if not hasattr(self, name))
+        if unknown:
+            raise ValueError(f'BoundaryRunner has no attribute(s) {unknown}')
+        lengths = {len(v) for v in values.values()}
+        if len(lengths) > 1:
+            raise ValueError(f'Parameter sequences differ in length: {sorted(lengths)}')
+
+        members = []
+        for i in range(lengths.pop() if lengths else 1):
+            member = copy.copy(self)
+            for name, seq in values.items():
+                setattr(member, name, seq[i])
+            members.append(member)
+        return members
+
+    @staticmethod
+    def run_batch(runners: Sequence[BoundaryRunner]) -> list[tuple[float, dict]]:
+        """
+        Advance many boundary models over the same time step in one solve.
+
+        The members' thermal ODEs are stacked into a single BDF integration
+        with a block-diagonal analytic Jacobian, so a sweep over viscosity
+        law, radiogenic inventory, initial temperatures or boundary fluxes
+        costs one solver call rather than one per member. Each member keeps
+        its own terminal surface-temperature event and stops where
+        :meth:`run_solver` would stop it. The step size is shared, so results
+        match the per-member solves to within the solver tolerance.
+
+        Parameters
+        ----------
+        runners : sequence of BoundaryRunner
+            Members to integrate; all must start at the same time with the
+            same time step.
+
+        Returns
+        -------
+        list of tuple
+            ``(sim_time, output)`` per member, as returned by
+            :meth:`run_solver`.
+
+        Raises
+        ------
+        RuntimeError
+            If the integration failed for any member; the message lists the
+            indices of the failed members.
+        """
+        if not runners:
+            return []
+        t_span = (runners[0].curr_time, runners[0].curr_time + runners[0].dt)
+        if any((r.curr_time, r.curr_time + r.dt) != t_span for r in runners):
+            raise ValueError('Batched boundary members must share curr_time and dt')
+
+        constants = tuple(np.array(col) for col in zip(*(r.rhs_constants() for r in runners)))
+        y0 = np.array([r.T_p_0 for r in runners] + [r.T_surf_0 for r in runners], dtype=float)
+        t_final, y_final, status = _integrate_batch(
+            constants,
+            y0,
+            t_span,
+            rtol=min(r.rtol for r in runners),
+            atol=np.array([r.atol for r in runners], dtype=float),
+            T_surf_0=np.array([r.T_surf_0 for r in runners], dtype=float),
+            dT_event=np.array([r.Tsurf_event_change for r in runners], dtype=float),
+        )
+
+        failed = np.flatnonzero(status == -1)
+        if failed.size:
+            raise RuntimeError(
+                f'Batched boundary solve failed for {failed.size} of {len(runners)} '
+                f'members (indices {failed.tolist()})'
+            )
+        if (status == 1).any():
+            log.info(f'Tsurf event truncated {np.sum(status == 1)} of {len(runners)} members')
+
+        return [
+            (t / secs_per_year, r.step_output(t, T_p, T_surf))
+            for r, t, T_p, T_surf in zip(runners, t_final.tolist(), *y_final.tolist())
+        ]
@@ -7,8 +7,10 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import numpy as np
+from scipy.interpolate import RegularGridInterpolator
 from scipy.special import erf
 
+from proteus.interior_energetics.table_cache import read_spider_table
 from proteus.utils.constants import B_ein
 
 if TYPE_CHECKING:
@@ -547,6 +549,94 @@ def get_file_structure_stale(outdir: str):
     return os.path.join(outdir, 'data', 'structure_stale.dat')
 
 
+# Scalar state of Interior_t captured by Interior_t.snapshot(), with the type
+# each is restored as. Everything else a rollback needs is an array.
+_SNAPSHOT_SCALARS = (
+    ('ic', int),
+    ('dt', float),
+    ('nlev_b', int),
+    ('nlev_s', int),
+    ('zalmoxis_fail_count', int),
+    ('spider_fail_count', int),
+    ('aragog_fail_count', int),
+    ('structure_stale', bool),
+    ('_spider_cumulative_time', float),
+    ('dt_hysteresis_remaining', int),
+    ('timestep_clamped', bool),
+    ('escape_dt_limit', float),
+    ('_stale_struct_steps', int),
+    ('last_successful_struct_time', float),
+)
+
+# Arrays captured by Interior_t.snapshot(). `_last_entropy` is the Aragog
+# hot-start entropy profile and may be absent or None.
+_SNAPSHOT_ARRAYS = (
+    'radius',
+    'tides',
+    'phi',
+    'visc',
+    'density',
+    'mass',
+    'shear',
+    'bulk',
+    'pres',
+    'temp',
+    '_last_entropy',
+)
+
+
+@dataclass
+class InteriorSnapshot:
+    """State of an :class:`Interior_t` packed into one contiguous buffer.
+
+    Created by :meth:`Interior_t.snapshot` and applied by
+    :meth:`Interior_t.restore`. The scalars of ``_SNAPSHOT_SCALARS`` occupy
+    the head of `buffer` and the arrays of ``_SNAPSHOT_ARRAYS`` follow it
+    back to back; `sizes` holds the length of each array, -1 for an array
+    that was None. Lookup tables and solver objects are not captured.
+    """
+
+    buffer: np.ndarray
+    sizes: tuple[int, ...]
+
+    @property
+    def nbytes(self) -> int:
+        return self.buffer.nbytes
+
+
+class PSInterpolator:
+    """Bilinear interpolator over one SPIDER-format P-S lookup table.
+
+    Built once per loaded table, so repeated lookups do not reconstruct the
+    scipy interpolator. Calls are vectorised over arrays of nodes.
+
+    Parameters
+    ----------
+    table : np.ndarray
+        Array of shape (nS, nP, 3) with columns (P, S, value), as returned
+        by :meth:`Interior_t._load_ps_table`.
+    """
+
+    def __init__(self, table: np.ndarray):
+        self.table = table
+        self._interp = RegularGridInterpolator(
+            (table[0, :, 0], table[:, 0, 1]),
+            table[:, :, 2].T,
+            bounds_error=False,
+            fill_value=None,
+        )
+
+    def __call__(self, S, P) -> np.ndarray:
+        """Evaluate the table at entropy `S` [J kg-1 K-1] and pressure `P` [Pa].
+
+        `S` and `P` are broadcast against each other; the result has their
+        broadcast shape. Points outside the table are extrapolated linearly.
+        """
+        S, P = np.broadcast_arrays(np.asarray(S, dtype=float), np.asarray(P, dtype=float))
+        points = np.column_stack((P.ravel(), S.ravel()))
+        return self._interp(points).reshape(S.shape)
+
+
 # Structure for holding interior variables at the current time-step
 class Interior_t:
     def __init__(self, nlev_b: int, spider_dir=None, eos_dir=None):
@@ -604,6 +694,12 @@ class Interior_t:
         # recent escape step was not capped.
         self.escape_dt_limit = float('inf')
 
+        # Step [yr] to repeat an interior step with after the 'pi' controller
+        # rejected it (see run_interior), and the number of steps rejected so
+        # far. Not part of snapshot(): a rollback must not undo them.
+        self.dt_reject_limit = float('inf')
+        self.rejected_steps = 0
+
         # Lookup data for SPIDER (P-S tables, used by E_th and
         # melt-volume bookkeeping). Each is a (nS, nP, 3) array, the
         # third channel being the SI value of the quantity.
@@ -622,6 +718,15 @@ class Interior_t:
                 spider_dir, resolved_eos, 'heat_capacity_melt.dat'
             )
 
+        # Interpolators over the lookup tables above, keyed by the suffix of
+        # the `lookup_*` attribute. Built here once per loaded table;
+        # ps_lookup() rebuilds one only if its table is replaced.
+        self._ps_interp: dict[str, PSInterpolator] = {}
+        for name in ('rho_melt', 'cp_solid', 'cp_melt'):
+            table = getattr(self, f'lookup_{name}')
+            if table is not None:
+                self._ps_interp[name] = PSInterpolator(table)
+
         self.aragog_solver = None
 
         # Counter for consecutive Aragog steps integrated on a stale
@@ -673,7 +778,9 @@ class Interior_t:
         files share the same on-disk layout.
 
         Search order: FWL_DATA dynamic EOS directory first, then
-        SPIDER's bundled ``lookup_data/1TPa-dK09-elec-free``.
+        SPIDER's bundled ``lookup_data/1TPa-dK09-elec-free``. The text is
+        parsed once and then read from its binary sidecar, see
+        :func:`~proteus.interior_energetics.table_cache.read_spider_table`.
 
         Parameters
         ----------
@@ -710,24 +817,140 @@ class Interior_t:
             log.warning('%s not found for SPIDER P-S lookup', filename)
             return None
 
-        data = np.genfromtxt(filepath)
-
-        # Read dimensions from header: "# 5 nP nS"
-        with open(filepath) as f:
-            header = f.readline().strip().lstrip('#').split()
-        nP = int(header[1])
-        nS = int(header[2])
-
-        # Read scale factors from line 5: "# P_scale S_scale value_scale"
-        with open(filepath) as f:
-            for _ in range(5):
-                line = f.readline()
-        scales = line.strip().lstrip('#').split()
+        # Header line 1: "# 5 nP nS"; line 5: "# P_scale S_scale value_scale"
+        header, data = read_spider_table(filepath)
+        fields = header[0].strip().lstrip('#').split()
+        nP = int(fields[1])
+        nS = int(fields[2])
+        scales = header[4].strip().lstrip('#').split()
         sfact = np.array([float(scales[0]), float(scales[1]), float(scales[2])])
 
         scaled = data * sfact
         return scaled.reshape(nS, nP, 3)
 
+    def ps_lookup(self, name: str, S, P) -> np.ndarray:
+        """Evaluate a loaded P-S lookup table at arrays of nodes.
+
+        Parameters
+        ----------
+        name : str
+            Table name: ``'rho_melt'``, ``'cp_solid'`` or ``'cp_melt'``.
+        S : array_like
+            Entropy [J kg-1 K-1].
+        P : array_like
+            Pressure [Pa], broadcast against `S`.
+
+        Returns
+        -------
+        np.ndarray
+            Interpolated values in SI units, with the broadcast shape of `S`
+            and `P`.
+        """
+        table = getattr(self, f'lookup_{name}')
+        if table is None:
+            raise ValueError(f'P-S lookup table {name} is not loaded')
+        interp = self._ps_interp.get(name)
+        if interp is None or interp.table is not table:
+            interp = PSInterpolator(table)
+            self._ps_interp[name] = interp
+        return interp(S, P)
+
+    def snapshot(self, into: InteriorSnapshot | None = None) -> InteriorSnapshot:
+        """Capture the arrays and step state for a later :meth:`restore`.
+
+        The state is copied into a single float64 buffer, so taking a
+        snapshot costs one allocation and one pass over the arrays, and no
+        disk I/O. Integer, boolean and infinite scalars are represented
+        exactly.
+
+        Parameters
+        ----------
+        into : InteriorSnapshot, optional
+            Earlier snapshot whose buffer is reused when the layout is
+            unchanged, so a snapshot taken every iteration allocates nothing.
+
+        Returns
+        -------
+        InteriorSnapshot
+            The captured state; `into` itself when its buffer was reused.
+        """
+        arrays = [getattr(self, name, None) for name in _SNAPSHOT_ARRAYS]
+        sizes = tuple(-1 if a is None else int(np.size(a)) for a in arrays)
+        total = len(_SNAPSHOT_SCALARS) + sum(max(n, 0) for n in sizes)
+
+        if into is not None and into.sizes == sizes:
+            snap = into
+        else:
+            snap = InteriorSnapshot(np.empty(total), sizes)
+
+        buf = snap.buffer
+        for i, (name, _) in enumerate(_SNAPSHOT_SCALARS):
+            buf[i] = float(getattr(self, name))
+        start = len(_SNAPSHOT_SCALARS)
+        for a, n in zip(arrays, sizes):
+            if n > 0:
+                buf[start : start + n] = np.ravel(a)
+                start += n
+        return snap
+
+    def restore(self, snap: InteriorSnapshot):
+        """Roll the arrays and step state back to those of `snap`.
+
+        The restored arrays are views into one fresh copy of the snapshot
+        buffer, so the snapshot stays valid and can be restored again, e.g.
+        by successive attempts of a retry ladder.
+
+        Parameters
+        ----------
+        snap : InteriorSnapshot
+            State captured by :meth:`snapshot` on this object.
+        """
+        buf = snap.buffer.copy()
+        for i, (name, kind) in enumerate(_SNAPSHOT_SCALARS):
+            value = buf[i]
+            setattr(self, name, float(value) if kind is float else kind(int(value)))
+        start = len(_SNAPSHOT_SCALARS)
+        for name, n in zip(_SNAPSHOT_ARRAYS, snap.sizes):
+            if n < 0:
+                setattr(self, name, None)
+                continue
+            setattr(self, name, buf[start : start + n])
+            start += n
+
+    def resize(self, nlev_b: int):
+        """Change the number of levels, carrying the per-level arrays over.
+
+        Used by adaptive resolution when a structure update writes a mesh
+        with another number of levels. Each array is interpolated in
+        fractional position along the mesh, so state carried between steps
+        (melt fraction, tidal heating) stays usable until the interior solver
+        next fills the arrays.
+
+        Parameters
+        ----------
+        nlev_b : int
+            New number of basic levels.
+        """
+        nlev_b = int(nlev_b)
+        if nlev_b == self.nlev_b:
+            return
+        for name in _SNAPSHOT_ARRAYS:
+            old = getattr(self, name, None)
+            if name == '_last_entropy' or old is None:
+                continue
+            old = np.ravel(old)
+            n = nlev_b if name == 'radius' else nlev_b - 1
+            if old.size < 2:
+                new = np.full(n, old[0] if old.size else 0.0)
+            elif name == 'radius':
+                new = np.interp(np.linspace(0, 1, n), np.linspace(0, 1, old.size), old)
+            else:
+                x_old = (np.arange(old.size) + 0.5) / old.size
+                new = np.interp((np.arange(n) + 0.5) / n, x_old, old)
+            setattr(self, name, new)
+        self.nlev_b = nlev_b
+        self.nlev_s = nlev_b - 1
+
     def resume_tides(self, outdir: str):
         # Read tidal heating array from file, when resuming from disk.
 
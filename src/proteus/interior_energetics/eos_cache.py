@@ -0,0 +1,313 @@
+# Persistent on-disk cache for constructed Aragog EOS objects
+"""On-disk cache of constructed Aragog entropy-EOS objects, shared between processes.
+
+Enabled by ``PROTEUS_EOS_CACHE_DIR``; see :mod:`proteus.utils.disk_cache`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import inspect
+import logging
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from importlib.metadata import PackageNotFoundError, version
+
+import numpy as np
+
+from proteus.utils import disk_cache
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+log = logging.getLogger('fwl.' + __name__)
+
+# Bump when the on-disk layout or the pickling scheme changes
+CACHE_FORMAT_VERSION = 1
+
+# Environment variables controlling the cache
+CACHE_DIR_ENV = 'PROTEUS_EOS_CACHE_DIR'
+CACHE_MAX_SIZE_ENV = 'PROTEUS_EOS_CACHE_MAX_SIZE'
+DEFAULT_MAX_SIZE = 20 * 1024**3  # 20 GiB
+
+# Arrays at least this large are stored as separate memory-mappable files
+_MIN_MAPPED_BYTES = 64 * 1024
+
+_OBJECT_NAME = 'object.pkl'
+_INFO_NAME = 'info.txt'
+
+
+def cache_root() -> str | None:
+    """Return the cache root from ``PROTEUS_EOS_CACHE_DIR``, or None if unset."""
+    root = os.environ.get(CACHE_DIR_ENV, '').strip()
+    return os.path.abspath(root) if root else None
+
+
+def cache_max_size() -> int:
+    """Return the cache size bound in bytes from ``PROTEUS_EOS_CACHE_MAX_SIZE``."""
+    return disk_cache.max_size_from_env(CACHE_MAX_SIZE_ENV, DEFAULT_MAX_SIZE)
+
+
+def _package_version(name: str) -> str:
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return 'unknown'
+
+
+def _source_digest(cls: type) -> str:
+    """Digest of the source file that defines `cls`, or its qualified name."""
+    try:
+        with open(inspect.getfile(cls), 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except (OSError, TypeError):
+        return f'{cls.__module__}.{cls.__qualname__}'
+
+
+def cache_key(kind: str, eos_dir: str, cls: type) -> str:
+    """Build the content-addressed key of a cached EOS object.
+
+    Parameters
+    ----------
+    kind : str
+        Cache namespace, e.g. ``'entropy_eos'`` or ``'entropy_eos_jax'``.
+    eos_dir : str
+        Directory holding the P-S tables the object is built from.
+    cls : type
+        Class of the cached object; its defining source file is hashed.
+
+    Returns
+    -------
+    str
+        ``'<kind>-<digest>'``, safe to use as a directory name.
+    """
+    h = hashlib.sha256()
+    h.update(f'format={CACHE_FORMAT_VERSION}\n'.encode())
+    h.update(f'class={cls.__module__}.{cls.__qualname__}\n'.encode())
+    h.update(f'source={_source_digest(cls)}\n'.encode())
+    h.update(f'python={sys.version_info[:2]}\n'.encode())
+    for pkg in ('aragog', 'numpy', 'scipy', 'jax'):
+        h.update(f'{pkg}={_package_version(pkg)}\n'.encode())
+
+    for name in sorted(os.listdir(eos_dir)):
+        path = os.path.join(eos_dir, name)
+        if not os.path.isfile(path):
+            continue
+        h.update(f'file={name}\n'.encode())
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+
+    return f'{kind}-{h.hexdigest()[:32]}'
+
+
+def _is_jax_array(obj) -> bool:
+    return type(obj).__module__.startswith('jax') and hasattr(obj, '__array__')
+
+
+class _ArrayPickler(pickle.Pickler):
+    """Pickler that writes large arrays to separate ``.npy`` files."""
+
+    def __init__(self, file, entry_dir: str):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._entry_dir = entry_dir
+        self._count = 0
+
+    def persistent_id(self, obj):
+        if isinstance(obj, np.ndarray):
+            tag = 'npy'
+        elif _is_jax_array(obj):
+            tag = 'jax'
+        else:
+            return None
+
+        arr = np.asarray(obj)
+        if arr.dtype.hasobject or arr.nbytes < _MIN_MAPPED_BYTES:
+            return None
+
+        name = f'a{self._count:04d}.npy'
+        self._count += 1
+        np.save(os.path.join(self._entry_dir, name), np.ascontiguousarray(arr))
+        return (tag, name)
+
+
+class _ArrayUnpickler(pickle.Unpickler):
+    """Unpickler that memory-maps the arrays written by ``_ArrayPickler``."""
+
+    def __init__(self, file, entry_dir: str):
+        super().__init__(file)
+        self._entry_dir = entry_dir
+
+    def persistent_load(self, pid):
+        tag, name = pid
+        # Copy-on-write keeps pages shared between processes while still
+        # handing consumers that expect writable arrays a writable view
+        arr = np.load(os.path.join(self._entry_dir, name), mmap_mode='c')
+        if tag == 'jax':
+            import jax.numpy as jnp
+
+            return jnp.asarray(arr)
+        return arr
+
+
+@contextlib.contextmanager
+def _locked(root: str, key: str) -> Iterator[None]:
+    """Hold an exclusive ``flock`` on ``<root>/<key>.lock``."""
+    if fcntl is None:
+        yield
+        return
+    with open(os.path.join(root, f'{key}.lock'), 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _load(entry_dir: str):
+    """Load a published entry, or return None when it is absent or unreadable."""
+    path = os.path.join(entry_dir, _OBJECT_NAME)
+    if not os.path.isfile(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            obj = _ArrayUnpickler(f, entry_dir).load()
+    except Exception as e:
+        log.warning('Ignoring unreadable EOS cache entry %s: %s', entry_dir, e)
+        return None
+
+    # Directory mtime is the recency stamp used for eviction
+    with contextlib.suppress(OSError):
+        os.utime(entry_dir)
+    return obj
+
+
+def _store(root: str, key: str, obj, info: str) -> None:
+    """Write `obj` to a staging directory and publish it as ``<root>/<key>``."""
+    staging = tempfile.mkdtemp(prefix=f'{disk_cache.TMP_PREFIX}{key}-', dir=root)
+    try:
+        with open(os.path.join(staging, _OBJECT_NAME), 'wb') as f:
+            _ArrayPickler(f, staging).dump(obj)
+        with open(os.path.join(staging, _INFO_NAME), 'w') as f:
+            f.write(info)
+
+        entry_dir = os.path.join(root, key)
+        if os.path.isdir(entry_dir):
+            # A corrupt entry that failed to load; replaced under the key lock.
+            # Readers holding maps into it keep their (unlinked) pages.
+            shutil.rmtree(entry_dir, ignore_errors=True)
+        os.rename(staging, entry_dir)
+    finally:
+        if os.path.isdir(staging):
+            shutil.rmtree(staging, ignore_errors=True)
+
+
+def evict(root: str, max_size: int, keep: str | None = None) -> list[str]:
+    """Remove least recently used entries until the cache fits in `max_size`.
+
+    Stale staging directories left by killed builders are removed as well.
+
+    Parameters
+    ----------
+    root : str
+        Cache root directory.
+    max_size : int
+        Size bound in bytes.
+    keep : str or None
+        Key that is never evicted, normally the entry just stored.
+
+    Returns
+    -------
+    list of str
+        Keys of the evicted entries.
+    """
+    entries = [
+        (mtime, os.path.basename(path), size)
+        for mtime, path, size in disk_cache.dir_entries(root)
+    ]
+
+    def remove(name: str) -> None:
+        shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+        with contextlib.suppress(OSError):
+            os.remove(os.path.join(root, f'{name}.lock'))
+
+    evicted = disk_cache.evict_lru(entries, max_size, remove, keep=keep)
+
+    if evicted:
+        log.info('Evicted %d EOS cache entries to stay below %d bytes', len(evicted), max_size)
+    return evicted
+
+
+def load_or_build(kind: str, eos_dir: str, cls: type, build: Callable[[], object]):
+    """Return the EOS object for `eos_dir`, from the disk cache when possible.
+
+    Without ``PROTEUS_EOS_CACHE_DIR`` this is simply ``build()``.
+
+    Parameters
+    ----------
+    kind : str
+        Cache namespace, e.g. ``'entropy_eos'`` or ``'entropy_eos_jax'``.
+    eos_dir : str
+        Directory holding the P-S tables the object is built from.
+    cls : type
+        Class of the object returned by `build`.
+    build : callable
+        Zero-argument constructor used on a cache miss.
+
+    Returns
+    -------
+    object
+        The cached or newly built EOS object.
+    """
+    root = cache_root()
+    if root is None:
+        return build()
+
+    try:
+        os.makedirs(root, exist_ok=True)
+        key = cache_key(kind, eos_dir, cls)
+    except OSError as e:
+        log.warning('EOS cache unavailable (%s); building %s in memory', e, kind)
+        return build()
+    entry_dir = os.path.join(root, key)
+
+    obj = _load(entry_dir)
+    if obj is not None:
+        log.info('Loaded %s from EOS cache %s', kind, entry_dir)
+        return obj
+
+    with _locked(root, key):
+        # Another process may have published the entry while we waited
+        obj = _load(entry_dir)
+        if obj is not None:
+            log.info('Loaded %s from EOS cache %s', kind, entry_dir)
+            return obj
+
+        t0 = time.perf_counter()
+        obj = build()
+        log.info('Built %s in %.1f s; storing in EOS cache', kind, time.perf_counter() - t0)
+
+        info = (
+            f'kind: {kind}\n'
+            f'class: {cls.__module__}.{cls.__qualname__}\n'
+            f'eos_dir: {os.path.abspath(eos_dir)}\n'
+            f'aragog: {_package_version("aragog")}\n'
+            f'format: {CACHE_FORMAT_VERSION}\n'
+        )
+        try:
+            _store(root, key, obj, info)
+        except Exception as e:
+            log.warning('Could not store %s in EOS cache: %s', kind, e)
+            return obj
+
+    with contextlib.suppress(OSError):
+        evict(root, cache_max_size(), keep=key)
+    return obj
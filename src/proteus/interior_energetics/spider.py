@@ -11,10 +11,10 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
-from scipy.interpolate import RegularGridInterpolator
 
-from proteus.interior_energetics.common import Interior_t, get_file_tides
+from proteus.interior_energetics.common import Interior_t, PSInterpolator, get_file_tides
 from proteus.interior_energetics.timestep import next_step
+from proteus.interior_struct import mesh_handoff
 from proteus.utils.constants import radnuc_data
 from proteus.utils.helper import UpdateStatusfile, natural_sort, recursive_get
 
@@ -133,6 +133,10 @@ RADIUS0 = 63710000.0  # m
 def _read_mesh_file(mesh_path: str) -> tuple[np.ndarray, ...]:
     """Parse a SPIDER external mesh file.
 
+    Meshes written by this process are returned from memory without parsing
+    (see :mod:`proteus.interior_struct.mesh_handoff`); the arrays are
+    read-only.
+
     Parameters
     ----------
     mesh_path : str
@@ -147,35 +151,39 @@ def _read_mesh_file(mesh_path: str) -> tuple[np.ndarray, ...]:
         Staggered-node radius [m], pressure [Pa], density [kg/m3],
         gravity [m/s2] (surface to CMB).
     """
-    with open(mesh_path) as f:
-        header = f.readline()
-        tokens = header.strip('# \n').split()
-        nb = int(tokens[0])
-        ns = int(tokens[1])
-
-        r_b = np.empty(nb)
-        P_b = np.empty(nb)
-        rho_b = np.empty(nb)
-        g_b = np.empty(nb)
-        for i in range(nb):
-            cols = f.readline().split()
-            r_b[i] = float(cols[0])
-            P_b[i] = float(cols[1])
-            rho_b[i] = float(cols[2])
-            g_b[i] = float(cols[3])
-
-        r_s = np.empty(ns)
-        P_s = np.empty(ns)
-        rho_s = np.empty(ns)
-        g_s = np.empty(ns)
-        for i in range(ns):
-            cols = f.readline().split()
-            r_s[i] = float(cols[0])
-            P_s[i] = float(cols[1])
-            rho_s[i] = float(cols[2])
-            g_s[i] = float(cols[3])
-
-    return r_b, P_b, rho_b, g_b, r_s, P_s, rho_s, g_s
+    return mesh_handoff.fetch_spider_mesh(mesh_path)
+
+
+def mesh_num_levels(mesh_path: str) -> int:
+    """Return the number of basic nodes of a SPIDER external mesh file."""
+    return len(_read_mesh_file(mesh_path)[0])
+
+
+def _remap_mass_conservative(
+    values: np.ndarray, mass_old: np.ndarray, mass_new: np.ndarray
+) -> np.ndarray:
+    """Remap cell averages onto other cells of the same mantle.
+
+    Both meshes are mapped onto the fractional mass coordinate and the
+    cumulative integral of `values` is interpolated at the new cell edges,
+    so the mass-weighted mean of the result equals that of `values` exactly.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Cell averages on the old cells.
+    mass_old, mass_new : np.ndarray
+        Cell masses of the old and new cells, in the same order.
+
+    Returns
+    -------
+    np.ndarray
+        Cell averages on the new cells.
+    """
+    q_old = np.concatenate(([0.0], np.cumsum(mass_old))) / np.sum(mass_old)
+    q_new = np.concatenate(([0.0], np.cumsum(mass_new))) / np.sum(mass_new)
+    integral = np.concatenate(([0.0], np.cumsum(values * np.diff(q_old))))
+    return np.diff(np.interp(q_new, q_old, integral)) / np.diff(q_new)
 
 
 def _write_mesh_file(
@@ -191,6 +199,9 @@ def _write_mesh_file(
 ) -> None:
     """Write a SPIDER external mesh file.
 
+    The file is replaced atomically, so SPIDER never reads a partial mesh,
+    and is written with round-trip precision.
+
     Parameters
     ----------
     mesh_path : str
@@ -200,12 +211,7 @@ def _write_mesh_file(
     r_s, P_s, rho_s, g_s : np.ndarray
         Staggered-node arrays (surface to CMB).
     """
-    with open(mesh_path, 'w') as f:
-        f.write(f'# {len(r_b)} {len(r_s)}\n')
-        for i in range(len(r_b)):
-            f.write(f'{r_b[i]:.15e} {P_b[i]:.15e} {rho_b[i]:.15e} {g_b[i]:.15e}\n')
-        for i in range(len(r_s)):
-            f.write(f'{r_s[i]:.15e} {P_s[i]:.15e} {rho_s[i]:.15e} {g_s[i]:.15e}\n')
+    mesh_handoff.publish_spider_mesh(mesh_path, (r_b, P_b, rho_b, g_b, r_s, P_s, rho_s, g_s))
 
 
 def blend_mesh_files(old_path: str, new_path: str, max_shift: float = 0.05) -> float:
@@ -315,17 +321,21 @@ def _rewrite_json_solution(
     sd = data['solution']['subdomain data']
     # Subdomain 0: dS/dxi at basic nodes
     sd[0]['values'] = [f'{v:.17e}' for v in dSdxi_nondim]
+    if 'size' in sd[0]:
+        sd[0]['size'] = len(dSdxi_nondim)
     # Subdomain 1: S0 (single value)
     sd[1]['values'] = [f'{S0_nondim:.17e}']
 
     with open(json_path, 'w') as f:
         json.dump(data, f, indent=2)
+    _drop_json_sidecars(json_path)
 
 
 def remap_entropy_for_new_mesh(
     json_path: str,
     new_mesh_file: str,
     radius_phys: float,
+    allow_resize: bool = False,
 ) -> bool:
     """Interpolate entropy from the old mesh to a new mesh in a SPIDER JSON.
 
@@ -335,6 +345,11 @@ def remap_entropy_for_new_mesh(
     reads S(r) from the old mesh, interpolates onto the new mesh positions,
     then rewrites the JSON solution vector with corrected dS/dxi and S0.
 
+    When the new mesh has another number of nodes (adaptive resolution),
+    the staggered-node entropy is instead remapped conservatively in mass
+    (see :func:`_remap_mass_conservative`), so the total entropy of the
+    mantle is carried over unchanged.
+
     Parameters
     ----------
     json_path : str
@@ -343,12 +358,15 @@ def remap_entropy_for_new_mesh(
         Path to the new external mesh file from Zalmoxis.
     radius_phys : float
         Physical planet surface radius [m] (for consistency check).
+    allow_resize : bool
+        Remap onto a mesh with another number of nodes instead of refusing.
 
     Returns
     -------
     bool
         True if the JSON was modified, False if the mesh change was
-        negligible (max relative radius shift < 1e-10).
+        negligible (max relative radius shift < 1e-10) or the node count
+        changed without `allow_resize`.
     """
     # --- Read old mesh data from JSON ---
     with open(json_path) as f:
@@ -366,36 +384,53 @@ def remap_entropy_for_new_mesh(
     )
 
     # --- Read new mesh ---
-    r_b_new, _, _, _, r_s_new, _, _, _ = _read_mesh_file(new_mesh_file)
+    r_b_new, _, _, _, r_s_new, _, rho_s_new, _ = _read_mesh_file(new_mesh_file)
     N_b = len(r_b_new)
     N_s = N_b - 1
 
     if len(r_b_old) != N_b:
-        log.warning(
-            'Cannot remap entropy: node count changed (%d -> %d)',
+        if not allow_resize:
+            log.warning(
+                'Cannot remap entropy: node count changed (%d -> %d)',
+                len(r_b_old),
+                N_b,
+            )
+            return False
+
+        # --- Conservative remap onto the resized mesh ---
+        # Cell masses of the old mesh from the JSON, of the new one from its
+        # shell volumes and densities; both ordered surface-to-CMB
+        mass_s_old = np.array([float(v) for v in data['mass_s']['values']]) * float(
+            data['mass_s']['scaling']
+        )
+        mass_s_new = 4.0 / 3.0 * np.pi * (r_b_new[:-1] ** 3 - r_b_new[1:] ** 3) * rho_s_new
+        S_s_new = _remap_mass_conservative(S_s_old, mass_s_old, mass_s_new)
+        log.info(
+            'Remapping entropy conservatively onto resized mesh (%d -> %d basic nodes)',
             len(r_b_old),
             N_b,
         )
-        return False
-
-    # --- Check if mesh actually changed ---
-    max_rel_diff = np.max(np.abs(r_b_new - r_b_old) / r_b_old)
-    if max_rel_diff < 1e-10:
-        log.debug('Mesh change negligible (max rel diff %.2e), skipping remap', max_rel_diff)
-        return False
+    else:
+        # --- Check if mesh actually changed ---
+        max_rel_diff = np.max(np.abs(r_b_new - r_b_old) / r_b_old)
+        if max_rel_diff < 1e-10:
+            log.debug(
+                'Mesh change negligible (max rel diff %.2e), skipping remap', max_rel_diff
+            )
+            return False
 
-    log.info(
-        'Remapping entropy for new mesh (max radius shift: %.2e relative)',
-        max_rel_diff,
-    )
+        log.info(
+            'Remapping entropy for new mesh (max radius shift: %.2e relative)',
+            max_rel_diff,
+        )
 
-    # --- Interpolate S(r) from old to new staggered positions ---
-    # SPIDER ordering is surface-to-CMB (decreasing r), np.interp needs ascending
-    r_s_old_asc = r_s_old[::-1]
-    S_s_old_asc = S_s_old[::-1]
-    r_s_new_asc = r_s_new[::-1]
-    S_s_new_asc = np.interp(r_s_new_asc, r_s_old_asc, S_s_old_asc)
-    S_s_new = S_s_new_asc[::-1]  # back to surface-to-CMB
+        # --- Interpolate S(r) from old to new staggered positions ---
+        # SPIDER ordering is surface-to-CMB (decreasing r), np.interp needs ascending
+        r_s_old_asc = r_s_old[::-1]
+        S_s_old_asc = S_s_old[::-1]
+        r_s_new_asc = r_s_new[::-1]
+        S_s_new_asc = np.interp(r_s_new_asc, r_s_old_asc, S_s_old_asc)
+        S_s_new = S_s_new_asc[::-1]  # back to surface-to-CMB
 
     # --- Compute new xi coordinates (matches SetMeshRegular in mesh.c) ---
     R_surf = r_b_new[0]
@@ -436,13 +471,77 @@ def remap_entropy_for_new_mesh(
     return True
 
 
+# Hidden directory, next to the SPIDER output JSONs, holding their binary sidecars
+_JSON_SIDECAR_DIR = '.json_cache'
+
+
+def _json_sidecar_path(filename: str) -> str:
+    """Return the sidecar path for a SPIDER output JSON.
+
+    The name carries the JSON's size and modification time, so a rewritten
+    JSON never matches the sidecar of its earlier contents.
+    """
+    st = os.stat(filename)
+    head, tail = os.path.split(os.path.abspath(filename))
+    return os.path.join(head, _JSON_SIDECAR_DIR, f'{tail}.{st.st_size}-{st.st_mtime_ns}.npz')
+
+
+def _drop_json_sidecars(filename: str) -> None:
+    """Remove every sidecar of `filename`, and those of JSONs that no longer exist."""
+    head, tail = os.path.split(os.path.abspath(filename))
+    cache_dir = os.path.join(head, _JSON_SIDECAR_DIR)
+    if not os.path.isdir(cache_dir):
+        return
+    for name in os.listdir(cache_dir):
+        source = name.split('.json.', 1)[0] + '.json'
+        if source == tail or not os.path.isfile(os.path.join(head, source)):
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except OSError:
+                pass
+
+
+def _split_fields(node, path=(), arrays=None):
+    """Split a SPIDER JSON tree into metadata and field value arrays.
+
+    Every dict carrying ``scaling`` and ``values`` is a field; its values
+    are converted to a float array, keyed by the '/'-joined key path, and
+    dropped from the returned metadata tree.
+    """
+    if arrays is None:
+        arrays = {}
+    if not isinstance(node, dict):
+        return node, arrays
+    if 'scaling' in node and 'values' in node:
+        try:
+            arrays['/'.join(path)] = np.asarray(node['values'], dtype=float)
+        except (TypeError, ValueError):
+            return node, arrays
+        return {k: v for k, v in node.items() if k != 'values'}, arrays
+    meta = {}
+    for k, v in node.items():
+        meta[k], _ = _split_fields(v, path + (k,), arrays)
+    return meta, arrays
+
+
 class MyJSON(object):
-    """load and access json data"""
+    """load and access json data
+
+    Field values are converted to floats on first access, in one vectorised
+    call per field, and memoised. With ``sidecar=True`` every field is also
+    stored in a binary sidecar (``.json_cache/<name>.json.<stamp>.npz``)
+    on the first load of a JSON; later loads of the same, unchanged JSON
+    read the sidecar and never parse the JSON text. The full JSON tree is
+    still available as :attr:`data_d`, parsed on first access.
+    """
 
-    def __init__(self, filename):
+    def __init__(self, filename, sidecar=False):
         self.filename = filename
-        self.data_d = None
-        self._load()
+        self.sidecar = sidecar
+        self._data_d = None
+        self._meta = None
+        self._arrays = {}
+        self.loaded = self._load()
 
     def _load(self):
         """
@@ -452,20 +551,79 @@ class MyJSON(object):
         """
         if not os.path.isfile(self.filename):
             return False
+        if self.sidecar and self._load_sidecar():
+            return True
         with open(self.filename) as json_data:
-            self.data_d = json.load(json_data)
+            self._data_d = json.load(json_data)
+        if self.sidecar:
+            self._write_sidecar()
         return True
 
+    def _load_sidecar(self):
+        """Read metadata and field arrays from a valid sidecar, if any."""
+        try:
+            with np.load(_json_sidecar_path(self.filename)) as npz:
+                meta = json.loads(str(npz['__meta__']))
+                arrays = {k: npz[k] for k in npz.files if k != '__meta__'}
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError, KeyError) as e:
+            log.debug('Ignoring unreadable sidecar of %s: %s', self.filename, e)
+            return False
+        self._meta = meta
+        self._arrays = arrays
+        return True
+
+    def _write_sidecar(self):
+        """Store the field arrays of the parsed JSON in a sidecar."""
+        meta, arrays = _split_fields(self._data_d)
+        self._meta = meta
+        self._arrays = arrays
+        try:
+            path = _json_sidecar_path(self.filename)
+            _drop_json_sidecars(self.filename)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = path + '.tmp%d' % os.getpid()
+            with open(tmp, 'wb') as f:
+                np.savez(f, __meta__=np.array(json.dumps(meta)), **arrays)
+            os.replace(tmp, path)
+        except OSError as e:
+            log.debug('Not writing sidecar of %s: %s', self.filename, e)
+
+    @property
+    def data_d(self):
+        """Full JSON tree, or None if the file could not be loaded."""
+        if self._data_d is None and self.loaded:
+            with open(self.filename) as json_data:
+                self._data_d = json.load(json_data)
+        return self._data_d
+
+    def _field(self, keys):
+        """Return ``(field dict, float values)`` for the field at `keys`."""
+        key = '/'.join(keys)
+        values = self._arrays.get(key)
+        if values is not None and self._meta is not None:
+            return recursive_get(self._meta, keys), values
+        dict_d = recursive_get(self.data_d, keys)
+        if values is None:
+            values = np.asarray(dict_d['values'], dtype=float)
+            self._arrays[key] = values
+        return dict_d, values
+
     # was get_field_data
     def get_dict(self, keys):
         """get all data relating to a particular field"""
+        if self._meta is not None:
+            dict_d = recursive_get(self._meta, keys)
+            if not isinstance(dict_d, (dict, list)):
+                return dict_d
         dict_d = recursive_get(self.data_d, keys)
         return dict_d
 
     # was get_field_units
     def get_dict_units(self, keys):
         """get the units (SI) of a particular field"""
-        dict_d = recursive_get(self.data_d, keys)
+        dict_d, _ = self._field(keys)
         units = dict_d['units']
         units = None if units == 'None' else units
         return units
@@ -473,12 +631,12 @@ class MyJSON(object):
     # was get_scaled_field_values
     def get_dict_values(self, keys, fmt_o=''):
         """get the scaled values for a particular quantity"""
-        dict_d = recursive_get(self.data_d, keys)
+        dict_d, values = self._field(keys)
         scaling = float(dict_d['scaling'])
-        if len(dict_d['values']) == 1:
-            values_a = float(dict_d['values'][0])
+        if len(values) == 1:
+            values_a = float(values[0])
         else:
-            values_a = np.array([float(value) for value in dict_d['values']])
+            values_a = values
         scaled_values_a = scaling * values_a
         if fmt_o:
             scaled_values_a = fmt_o.ascale(scaled_values_a)
@@ -529,7 +687,7 @@ class MyJSON(object):
         return SOLID
 
 
-def read_jsons(output_dir: str, times: list) -> list[MyJSON]:
+def read_jsons(output_dir: str, times: list, sidecar: bool = False) -> list[MyJSON]:
     """
     Read JSON files from the output/data/ directory for the specified times.
 
@@ -539,6 +697,8 @@ def read_jsons(output_dir: str, times: list) -> list[MyJSON]:
         Path to the output directory.
     times : list
         List of times (in years) for which to read the JSON files.
+    sidecar : bool
+        Read and write the binary sidecars of the JSON files (see MyJSON).
 
     Returns
     -------
@@ -548,8 +708,8 @@ def read_jsons(output_dir: str, times: list) -> list[MyJSON]:
     jsons = []
     for t in times:
         _f = os.path.join(output_dir, 'data', '%.0f.json' % t)  # path to file
-        _j = MyJSON(_f)  # load json file
-        if _j.data_d is None:
+        _j = MyJSON(_f, sidecar=sidecar)  # load json file
+        if not _j.loaded:
             _j = None  # set to None if data could not be read
         else:
             jsons.append(_j)  # otherwise, append to list
@@ -579,6 +739,10 @@ def get_all_output_times(odir: str):
     return time_a
 
 
+# Interpolator behind interp_rho_melt, rebuilt only when a different table is passed
+_rho_melt_interp: dict[str, PSInterpolator] = {}
+
+
 def interp_rho_melt(S: float, P: float, lookup: np.ndarray) -> float:
     """
     Return density of pure melt at given entropy and pressure.
@@ -593,22 +757,20 @@ def interp_rho_melt(S: float, P: float, lookup: np.ndarray) -> float:
     -----------------
     - density: float    density of pure melt [kg m-3]
     """
-    return _interp_ps_lookup(S, P, lookup)
+    interp = _rho_melt_interp.get('lookup')
+    if interp is None or interp.table is not lookup:
+        interp = _rho_melt_interp['lookup'] = PSInterpolator(lookup)
+    return float(interp(S, P))
 
 
 def _interp_ps_lookup(S: float, P: float, lookup: np.ndarray) -> float:
     """Interpolate any SPIDER-format P-S table at scalar (S, P).
 
-    Used for both density_melt and the heat_capacity_solid /
-    heat_capacity_melt tables. The lookup array is the (nS, nP, 3)
-    layout returned by ``Interior_t._load_ps_table``.
+    One-off convenience for a bare table array. It builds a new
+    interpolator on every call; for repeated lookups on a loaded table use
+    the prebuilt, vectorised ``Interior_t.ps_lookup`` instead.
     """
-    Pvals, Svals, val_grid = lookup[0, :, 0], lookup[:, 0, 1], lookup[:, :, 2]
-    interp = RegularGridInterpolator(
-        (Pvals, Svals), val_grid.T, bounds_error=False, fill_value=None
-    )
-    out = interp(np.column_stack((np.atleast_1d(P), np.atleast_1d(S))))
-    return float(np.array(out).item())
+    return float(PSInterpolator(lookup)(S, P))
 
 
 # ====================================================================
@@ -659,8 +821,8 @@ def _try_spider(
         all_times = get_all_output_times(dirs['output'])
         latest_spider_time = all_times[-1] if len(all_times) > 0 else 0
         json_path = os.path.join(dirs['output/data'], '%.0f.json' % latest_spider_time)
-        json_file = MyJSON(json_path)
-        if json_file.data_d is None:
+        json_file = MyJSON(json_path, sidecar=config.interior_energetics.spider.json_sidecar)
+        if not json_file.loaded:
             UpdateStatusfile(dirs, 21)
             raise ValueError("JSON file '%s' could not be loaded" % json_path)
         step = json_file.get_dict(['step'])
@@ -732,6 +894,12 @@ def _try_spider(
                 spider_gravity,
             )
 
+    # Adaptive resolution: the mesh written at the last structure update
+    # decides the number of levels
+    num_levels = config.interior_energetics.num_levels
+    if config.interior_energetics.adaptive_levels and mesh_file and os.path.isfile(mesh_file):
+        num_levels = mesh_num_levels(mesh_file)
+
     ### SPIDER base call sequence
     call_sequence = [
         spider_exec,
@@ -748,7 +916,7 @@ def _try_spider(
         '-teqm',
         '%.6e' % (hf_row['T_eqm']),
         '-n',
-        '%d' % (config.interior_energetics.num_levels),
+        '%d' % (num_levels),
         '-nstepsmacro',
         '%d' % (nstepsmacro),
         '-dtmacro',
@@ -1261,8 +1429,8 @@ def ReadSPIDER(dirs: dict, config: Config, R_int: float, interior_o: Interior_t)
 
     # load data file
     json_path = os.path.join(dirs['output/data'], '%.0f.json' % sim_time)
-    json_file = MyJSON(json_path)
-    if json_file.data_d is None:
+    json_file = MyJSON(json_path, sidecar=config.interior_energetics.spider.json_sidecar)
+    if not json_file.loaded:
         UpdateStatusfile(dirs, 21)
         raise ValueError("JSON file '%s' could not be loaded" % json_path)
 
@@ -1318,11 +1486,7 @@ def ReadSPIDER(dirs: dict, config: Config, R_int: float, interior_o: Interior_t)
     entropy = np.array(json_file.get_dict_values(['data', 'S_s']))
 
     # Get density of pure-melt at each layer
-    rho_melt_arr = np.ones_like(interior_o.pres)
-    for i in range(len(interior_o.pres)):
-        rho_melt_arr[i] = interp_rho_melt(
-            entropy[i], interior_o.pres[i], interior_o.lookup_rho_melt
-        )
+    rho_melt_arr = interior_o.ps_lookup('rho_melt', entropy, interior_o.pres)
 
     # Determine volume of melt at each layer
     vmelt = interior_o.phi * mshell / rho_melt_arr
@@ -1386,15 +1550,10 @@ def ReadSPIDER(dirs: dict, config: Config, R_int: float, interior_o: Interior_t)
                     'SPIDER cp_s not in JSON, falling back to wrapper-side '
                     'linear blend of P-S Cp tables (v3 convention)'
                 )
-                for i in range(len(interior_o.temp)):
-                    cp_solid = _interp_ps_lookup(
-                        entropy[i], interior_o.pres[i], interior_o.lookup_cp_solid
-                    )
-                    cp_melt = _interp_ps_lookup(
-                        entropy[i], interior_o.pres[i], interior_o.lookup_cp_melt
-                    )
-                    phi_i = float(np.clip(interior_o.phi[i], 0.0, 1.0))
-                    cp_est[i] = (1.0 - phi_i) * cp_solid + phi_i * cp_melt
+                cp_solid = interior_o.ps_lookup('cp_solid', entropy, interior_o.pres)
+                cp_melt = interior_o.ps_lookup('cp_melt', entropy, interior_o.pres)
+                phi = np.clip(interior_o.phi, 0.0, 1.0)
+                cp_est = (1.0 - phi) * cp_solid + phi * cp_melt
             else:
                 log.warning(
                     'SPIDER E_th: cp_s not in JSON and no wrapper Cp tables '
@@ -0,0 +1,223 @@
+# Binary sidecar cache for SPIDER-format text tables
+"""Memory-mappable binary copies of SPIDER-format text lookup tables.
+
+The P-S lookup tables read by :class:`~proteus.interior_energetics.common.Interior_t`
+and by the EOS materialisation helpers in
+:mod:`proteus.interior_energetics.wrapper` are text files of up to a few
+hundred thousand rows. Parsing them with ``np.genfromtxt`` or ``np.loadtxt``
+dominates the start-up of a SPIDER or Aragog run, and every grid case parses
+the same tables again.
+
+:func:`read_spider_table` parses a table once and stores its numeric block
+as a ``.npy`` file in a hidden ``.npycache`` directory next to the source,
+alongside a small JSON file holding the header lines. Both names carry the
+source's size and modification time, so an edited or replaced table never
+serves a stale copy; superseded copies are removed when the new one is
+written. Later reads, in this or any other process, map the ``.npy`` file
+read-only instead of parsing the text, so workers on one node share the
+page cache.
+
+Files are published with :func:`~proteus.utils.disk_cache.write_atomic`,
+so concurrent first reads at worst duplicate the conversion. A source
+directory that is not writable (e.g. a read-only shared ``FWL_DATA``) is
+read from text as before. Set ``PROTEUS_TABLE_CACHE=0`` to disable the
+sidecars entirely.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+
+import numpy as np
+
+from proteus.utils import disk_cache
+
+log = logging.getLogger('fwl.' + __name__)
+
+# Bump when the sidecar layout changes
+CACHE_FORMAT_VERSION = 1
+
+# Environment variable; "0" disables reading and writing sidecars
+CACHE_ENV = 'PROTEUS_TABLE_CACHE'
+
+CACHE_SUBDIR = '.npycache'
+
+
+def _enabled() -> bool:
+    return os.environ.get(CACHE_ENV, '1').strip() not in ('0', 'false', 'no', 'off')
+
+
+def _sidecar_paths(path: str) -> tuple[str, str, str]:
+    """Return ``(cache_dir, stem, stamp)`` of the sidecar for `path`.
+
+    The stamp encodes the source size and modification time, so any change
+    to the source addresses a different sidecar.
+    """
+    st = os.stat(path)
+    cache_dir = os.path.join(os.path.dirname(os.path.abspath(path)), CACHE_SUBDIR)
+    stem = os.path.basename(path)
+    stamp = f'v{CACHE_FORMAT_VERSION}-{st.st_size}-{st.st_mtime_ns}'
+    return cache_dir, stem, stamp
+
+
+def _parse(path: str) -> tuple[list[str], np.ndarray]:
+    """Parse a SPIDER-format text table.
+
+    Line 1 is ``# n_header ...``; the first `n_header` lines form the
+    header and the remaining lines are whitespace-separated numbers.
+    """
+    with open(path) as f:
+        first = f.readline()
+        n_head = int(first.strip().lstrip('#').split()[0])
+        header = [first] + [f.readline() for _ in range(n_head - 1)]
+    data = np.loadtxt(path, skiprows=n_head, ndmin=2)
+    return header, data
+
+
+def _load(cache_dir: str, stem: str, stamp: str) -> tuple[list[str], np.ndarray] | None:
+    meta_path = os.path.join(cache_dir, f'{stem}.{stamp}.json')
+    data_path = os.path.join(cache_dir, f'{stem}.{stamp}.npy')
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+        data = np.load(data_path, mmap_mode='r')
+    except (OSError, ValueError) as e:
+        if not isinstance(e, FileNotFoundError):
+            log.debug('Ignoring unreadable table sidecar %s: %s', data_path, e)
+        return None
+    if list(data.shape) != meta.get('shape'):
+        log.debug('Ignoring table sidecar %s with mismatched shape', data_path)
+        return None
+    return meta['header'], data
+
+
+def _store(cache_dir: str, stem: str, stamp: str, header: list[str], data: np.ndarray) -> None:
+    os.makedirs(cache_dir, exist_ok=True)
+    targets = (
+        (f'{stem}.{stamp}.npy', lambda f: np.save(f, np.ascontiguousarray(data))),
+        (
+            f'{stem}.{stamp}.json',
+            lambda f: f.write(
+                json.dumps({'header': header, 'shape': list(data.shape)}).encode()
+            ),
+        ),
+    )
+    # The data file is published before the metadata, so a reader that finds
+    # the metadata always finds complete data next to it.
+    for name, write in targets:
+        disk_cache.write_atomic(os.path.join(cache_dir, name), write)
+
+    # Drop sidecars of earlier versions of the same source
+    current = {f'{stem}.{stamp}.npy', f'{stem}.{stamp}.json'}
+    for name in os.listdir(cache_dir):
+        if name.startswith(f'{stem}.v') and name not in current:
+            with contextlib.suppress(OSError):
+                os.unlink(os.path.join(cache_dir, name))
+
+
+def grid_row_template(P: np.ndarray, S: np.ndarray) -> str:
+    """Rows of a 2D SPIDER table on a P-S grid, with the value left to fill.
+
+    Tables on the same grid share their first two columns, so formatting
+    them once and passing the result to :func:`write_spider_table` leaves
+    only the value column to format for each table.
+
+    Parameters
+    ----------
+    P : np.ndarray
+        Scaled pressure nodes, varying fastest.
+    S : np.ndarray
+        Scaled entropy nodes.
+
+    Returns
+    -------
+    str
+        One line per node with a ``%.18e`` field for the value.
+    """
+    P_cols = [f'{p:.18e}\t' for p in P]
+    return ''.join([f'{p}{s:.18e}\t%.18e\n' for s in S for p in P_cols])
+
+
+def write_spider_table(
+    path: str, header: list[str], data: np.ndarray, rows: str | None = None
+) -> None:
+    """Write a SPIDER-format text table and its binary sidecar.
+
+    The text is written with 18 significant digits, so the sidecar holds
+    exactly the values that parsing the text would give and later reads of
+    `path` never need to parse it.
+
+    Parameters
+    ----------
+    path : str
+        Destination of the text table.
+    header : list of str
+        Header lines, including line endings.
+    data : np.ndarray
+        Numeric block of shape ``(n_rows, n_columns)``.
+    rows : str, optional
+        Block from :func:`grid_row_template` for the grid of a 2D table in
+        `data`; only the last column is then formatted.
+    """
+    path = str(path)
+    data = np.asarray(data, dtype=float)
+    with open(path, 'w') as f:
+        f.writelines(header)
+        if rows is None:
+            # One format operation over the whole block; the same text as
+            # np.savetxt(fmt='%.18e', delimiter='\t') in about two thirds
+            # of the time
+            row = '\t'.join(['%.18e'] * data.shape[1]) + '\n'
+            f.write((row * len(data)) % tuple(data.ravel()))
+        else:
+            f.write(rows % tuple(data[:, -1]))
+
+    if not _enabled():
+        return
+    try:
+        _store(*_sidecar_paths(path), list(header), data)
+    except OSError as e:
+        log.debug('Not caching table %s: %s', path, e)
+
+
+def read_spider_table(path: str) -> tuple[list[str], np.ndarray]:
+    """Read a SPIDER-format text table through its binary sidecar.
+
+    Parameters
+    ----------
+    path : str
+        Path to the text table.
+
+    Returns
+    -------
+    header : list of str
+        The header lines, including line endings, as in the text file.
+    data : np.ndarray
+        Numeric block of shape ``(n_rows, n_columns)``, unscaled. Read-only;
+        memory-mapped when served from the sidecar.
+    """
+    path = str(path)
+    if not _enabled():
+        return _parse(path)
+
+    cache_dir, stem, stamp = _sidecar_paths(path)
+    cached = _load(cache_dir, stem, stamp)
+    if cached is not None:
+        return cached
+
+    header, data = _parse(path)
+    try:
+        _store(cache_dir, stem, stamp, header, data)
+    except OSError as e:
+        log.debug('Not caching table %s: %s', path, e)
+        data.setflags(write=False)
+        return header, data
+
+    cached = _load(cache_dir, stem, stamp)
+    if cached is None:
+        data.setflags(write=False)
+        return header, data
+    return cached
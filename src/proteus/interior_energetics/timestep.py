@@ -17,6 +17,23 @@ log = logging.getLogger('fwl.' + __name__)
 # Constants
 SMALL = 1e-8  # Small number
 
+# PI step controller ('pi' method). The local error estimate is of order 2,
+# so the gains follow Gustafsson's PI controller with k = 2.
+PI_KEYS = ('T_magma', 'Phi_global', 'F_atm', 'P_surf')  # coupled state monitored
+PI_BETA1 = 0.7 / 2  # integral gain
+PI_BETA2 = 0.4 / 2  # proportional gain
+PI_SAFETY = 0.9  # safety factor on the optimal step
+PI_SHRINK_MIN = 0.2  # smallest step ratio, applied after a rejected step
+PI_ERR_FLOOR = 1e-4  # error floor, keeps the ratio finite on smooth steps
+PI_MAX_REJECTS = 3  # times a rejected interior step is repeated
+# States of PI_KEYS known once the interior step is done; a step is rejected
+# on these alone, before the other modules advance.
+PI_INTERIOR_KEYS = ('T_magma', 'Phi_global')
+# Floor on each component's error scale [K, 1, W m-2, bar]. F_atm and P_surf
+# can pass through zero, where atol + rtol * |y| alone would reject every step
+# down to dt.minimum.
+PI_SCALE_FLOOR = {'T_magma': 1.0, 'Phi_global': 1e-3, 'F_atm': 1.0, 'P_surf': 1e-2}
+
 
 def _hf_from_iters(hf_all: pd.DataFrame, i1: int, i2: int):
     # Get helpfile rows for two different iterations
@@ -174,6 +191,152 @@ def _estimate_bolscale(hf_all: pd.DataFrame, config: Config) -> float:
     return dt_bolscale
 
 
+def _local_error(
+    hf_all: pd.DataFrame, i: int, rtol: float, atol: float, keys: tuple = PI_KEYS
+) -> float:
+    """
+    Embedded estimate of the local error of the coupling step ending at row `i`.
+
+    The coupled state at row `i` is compared with its linear extrapolation
+    from the two rows before it. The difference is the leading error term
+    of a first-order step, so a step over which the state bends sharply
+    scores high. Each component is scaled by ``atol + rtol * |y|``, and at
+    least by its entry in ``PI_SCALE_FLOOR``.
+
+    Arguments
+    ----------
+    hf_all : pd.DataFrame
+        Dataframe containing simulation variables
+    i : int
+        Negative row index of the step's end point
+    rtol, atol : float
+        Relative and absolute tolerances (``params.dt.rtol``, ``params.dt.atol``)
+    keys : tuple of str
+        Components of the coupled state to score
+
+    Returns
+    ----------
+    err : float
+        RMS scaled error; a step with ``err > 1`` is rejected.
+    """
+
+    rows = hf_all.iloc[[i - 2, i - 1, i]]
+    t = rows['Time'].to_numpy(dtype=float)
+    dt_prev, dt = t[1] - t[0], t[2] - t[1]
+    if dt_prev <= 0.0 or dt <= 0.0:
+        return 0.0
+
+    keys = [k for k in keys if k in rows.columns]
+    y = rows[keys].to_numpy(dtype=float)
+    y_pred = y[1] + (y[1] - y[0]) * (dt / dt_prev)
+    scale = atol + rtol * np.maximum(np.abs(y[2]), np.abs(y[1]))
+    scale = np.maximum(scale, [PI_SCALE_FLOOR.get(k, 0.0) for k in keys])
+    scaled = (y[2] - y_pred) / scale
+    scaled = scaled[np.isfinite(scaled)]
+    if scaled.size == 0:
+        return 0.0
+    return float(np.sqrt(np.mean(scaled**2)))
+
+
+def interior_step_error(
+    config: Config, hf_all: pd.DataFrame, hf_row: dict, sim_time: float
+) -> float:
+    """
+    Local error of an interior step that has not been accepted yet.
+
+    Scores the new ``PI_INTERIOR_KEYS`` in `hf_row`, reached at `sim_time`,
+    against the last two helpfile rows. The atmosphere and the other modules
+    have not advanced yet, so a step rejected on this error can be rolled back
+    and repeated (see ``run_interior``).
+
+    Arguments
+    ----------
+    config : Config
+        Configuration object
+    hf_all : pd.DataFrame
+        Dataframe containing simulation variables (now and historic)
+    hf_row : dict
+        Helpfile row updated by the interior step
+    sim_time : float
+        Time reached by the interior step [yr]
+
+    Returns
+    ----------
+    err : float
+        RMS scaled error as in ``_local_error``; 0 unless the 'pi' method is
+        in use and past its static and initial regimes.
+    """
+    if (
+        config.params.dt.method != 'pi'
+        or hf_row['Time'] < 2.0
+        or int(config.params.dt.window) + 3 >= len(hf_all)
+    ):
+        return 0.0
+    new = {'Time': float(sim_time), **{k: float(hf_row[k]) for k in PI_INTERIOR_KEYS}}
+    rows = pd.concat(
+        [hf_all[['Time', *PI_INTERIOR_KEYS]].iloc[-2:], pd.DataFrame([new])],
+        ignore_index=True,
+    )
+    return _local_error(
+        rows, -1, config.params.dt.rtol, config.params.dt.atol, keys=PI_INTERIOR_KEYS
+    )
+
+
+def _pi_step(config: Config, hf_row: dict, hf_all: pd.DataFrame) -> float:
+    """
+    Next step size [yr] from the PI controller of the 'pi' method.
+
+    The controller is stateless: the error of the last step and of the one
+    before it are both re-estimated from the helpfile, so retries and
+    resumed runs see the same decision. An interior step whose error on
+    ``PI_INTERIOR_KEYS`` exceeds 1 has already been rolled back and repeated
+    by ``run_interior``. A completed step can still score above 1 on the
+    atmospheric states; it is not repeated, because the other modules have
+    advanced, but it is dropped from the controller memory instead. The next
+    step shrinks under integral control alone, and the rejected error does
+    not enter the proportional term of the steps that follow.
+    """
+
+    dt_rtol = config.params.dt.rtol
+    dt_atol = config.params.dt.atol
+    dt_sfinc = float(config.params.dt.scale_incr)
+
+    # Try to maintain a minimum step size of dt_initial at first
+    if hf_row['Time'] > config.params.dt.initial:
+        dtprev = float(hf_all.iloc[-1]['Time'] - hf_all.iloc[-2]['Time'])
+    else:
+        dtprev = config.params.dt.initial
+
+    err = max(_local_error(hf_all, -1, dt_rtol, dt_atol), PI_ERR_FLOOR)
+    if err > 1.0:
+        factor = max(PI_SHRINK_MIN, PI_SAFETY * err ** (-1.0 / 2))
+        log.info('Time-stepping intent: reject (local error %.2f)' % err)
+    else:
+        err_prev = max(_local_error(hf_all, -2, dt_rtol, dt_atol), PI_ERR_FLOOR)
+        if err_prev > 1.0:
+            # The previous step was rejected; do not let it feed back
+            err_prev = err
+        factor = PI_SAFETY * err ** (-PI_BETA1) * err_prev**PI_BETA2
+        factor = min(max(factor, PI_SHRINK_MIN), dt_sfinc)
+        log.info('Time-stepping intent: accept (local error %.2f)' % err)
+    log.debug('PI step ratio %.3f on previous step %.2e yr' % (factor, dtprev))
+
+    return dtprev * factor
+
+
+def _clamp_to_stop_estimates(
+    config: Config, hf_all: pd.DataFrame, dtswitch: float, i1: int, i2: int
+) -> float:
+    """Do not allow step size to exceed predicted point of termination."""
+    if config.params.stop.solid.enabled:
+        dtswitch = min(dtswitch, _estimate_solid(hf_all, i1, i2))
+    if config.params.stop.radeqm.enabled:
+        dtswitch = min(dtswitch, _estimate_radeq(hf_all, i1, i2))
+    if config.params.stop.escape.enabled:
+        dtswitch = min(dtswitch, _estimate_escape(hf_all, i1, i2) * 1.1)
+    return dtswitch
+
+
 def next_step(
     config: Config,
     dirs: dict,
@@ -302,12 +465,12 @@ def next_step(
                 interior_o.dt_hysteresis_remaining -= 1
 
             # Do not allow step size to exceed predicted point of termination
-            if config.params.stop.solid.enabled:
-                dtswitch = min(dtswitch, _estimate_solid(hf_all, i1, i2))
-            if config.params.stop.radeqm.enabled:
-                dtswitch = min(dtswitch, _estimate_radeq(hf_all, i1, i2))
-            if config.params.stop.escape.enabled:
-                dtswitch = min(dtswitch, _estimate_escape(hf_all, i1, i2) * 1.1)
+            dtswitch = _clamp_to_stop_estimates(config, hf_all, dtswitch, i1, i2)
+
+        # PI step controller on an embedded local error estimate
+        elif config.params.dt.method == 'pi':
+            dtswitch = _pi_step(config, hf_row, hf_all)
+            dtswitch = _clamp_to_stop_estimates(config, hf_all, dtswitch, i1, i2)
 
         # Always use the maximum time-step, which can be adjusted in the cfg file
         elif config.params.dt.method == 'maximum':
@@ -320,7 +483,7 @@ def next_step(
             raise ValueError(f'Invalid time-stepping method: {config.params.dt.method}')
 
         # Minimum step size. Applies to every dynamic-stepping method
-        # (proportional, adaptive, maximum); the static (Time < 2 yr) and
+        # (proportional, adaptive, pi, maximum); the static (Time < 2 yr) and
         # initial branches keep their explicit config value and are not
         # floored to dt.minimum before the retry scaling is applied.
         dtminimum = config.params.dt.minimum  # absolute
@@ -359,6 +522,17 @@ def next_step(
                 esc_floor,
             )
 
+    # Repeat an interior step rejected by the 'pi' controller with the step
+    # it asked for (see run_interior)
+    reject_limit = (
+        getattr(interior_o, 'dt_reject_limit', float('inf'))
+        if interior_o is not None
+        else float('inf')
+    )
+    if reject_limit < dtswitch:
+        log.info('Time-stepping: repeating a rejected step with dt = %.2e yr' % reject_limit)
+        dtswitch = reject_limit
+
     # Do not allow step size to skip bolometric scaling start/stop
     if hf_all is not None:
         # Clamp dtswitch
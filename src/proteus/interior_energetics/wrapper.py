@@ -12,6 +12,14 @@ import pandas as pd
 import scipy.optimize as optimise
 
 from proteus.interior_energetics.common import Interior_t
+from proteus.interior_energetics.table_cache import read_spider_table, write_spider_table
+from proteus.interior_energetics.timestep import (
+    PI_MAX_REJECTS,
+    PI_SAFETY,
+    PI_SHRINK_MIN,
+    interior_step_error,
+)
+from proteus.interior_struct import ps_tables
 from proteus.outgas.wrapper import calc_target_elemental_inventories
 from proteus.utils.constants import M_earth, R_earth, const_G, noble_gases, vol_element_list
 from proteus.utils.helper import UpdateStatusfile
@@ -241,12 +249,54 @@ def update_planet_mass(hf_row: dict):
     hf_row['M_planet'] = hf_row['M_int'] + hf_row['M_ele']
 
 
-def get_nlevb(config: Config):
+# Melt-fraction margin within which a cell counts as fully molten or fully
+# solid for adaptive resolution, i.e. not part of the rheological front.
+_ADAPTIVE_PHI_MARGIN = 1e-3
+
+# Minimum number of cells across the radial extent of the rheological front
+# (the partially molten cells) under adaptive resolution.
+_ADAPTIVE_FRONT_CELLS = 8
+
+
+def _adaptive_nlevb(ie, interior_o: Interior_t) -> int:
+    """Number of SPIDER levels that resolves the current rheological front.
+
+    SPIDER only accepts evenly spaced levels, so the front is refined by
+    choosing the spacing from its local geometry: the partially molten cells
+    of the last interior step must span at least ``_ADAPTIVE_FRONT_CELLS``
+    cells, and a front that reaches the core-mantle boundary gets the full
+    ``num_levels``. Without a front the mantle gets ``num_levels_min``.
+    """
+    phi = np.asarray(interior_o.phi, dtype=float)
+    radius = np.asarray(interior_o.radius, dtype=float)
+    if phi.size == 0 or radius.size != phi.size + 1:
+        return int(ie.num_levels)
+    front = (phi > _ADAPTIVE_PHI_MARGIN) & (phi < 1.0 - _ADAPTIVE_PHI_MARGIN)
+    if not front.any():
+        return int(ie.num_levels_min)
+    # The cell bounded by the smallest radius sits on the core-mantle boundary
+    if front[min(np.argmin(radius), phi.size - 1)]:
+        return int(ie.num_levels)
+    width = float(np.sum(np.abs(np.diff(radius))[front]))
+    depth = float(np.ptp(radius))
+    nlev_b = int(np.ceil(_ADAPTIVE_FRONT_CELLS * depth / width)) + 1
+    return int(np.clip(nlev_b, ie.num_levels_min, ie.num_levels))
+
+
+def get_nlevb(config: Config, interior_o: Interior_t | None = None):
     """
     Get number of interior basic-nodes (level edges) from config.
+
+    With ``interior_energetics.adaptive_levels`` and the interior state of the
+    last step, SPIDER gets the number of levels that resolves its rheological
+    front (see :func:`_adaptive_nlevb`), between ``num_levels_min`` and
+    ``num_levels``.
     """
     match config.interior_energetics.module:
         case 'spider':
+            ie = config.interior_energetics
+            if interior_o is not None and ie.adaptive_levels:
+                return _adaptive_nlevb(ie, interior_o)
             return int(config.interior_energetics.num_levels)
         case 'aragog':
             return int(config.interior_energetics.num_levels)
@@ -308,17 +358,12 @@ def _rectangularize_spider_ps_file(src: str, dst: str) -> None:
     which is six orders of magnitude below the physical resolution of
     the tables (~1 K in T, ~1 kg/m^3 in rho).
     """
-    with open(src) as f:
-        header_lines = []
-        for _ in range(5):
-            header_lines.append(f.readline())
+    header_lines, data = read_spider_table(src)
 
     h = header_lines[0].strip().lstrip('#').split()
-    n_head = int(h[0])
     NX = int(h[1])
     NY = int(h[2])
 
-    data = np.genfromtxt(src, skip_header=n_head)
     if data.shape[0] != NX * NY:
         raise ValueError(f'{src}: header says NX*NY = {NX * NY} rows, file has {data.shape[0]}')
 
@@ -342,13 +387,14 @@ def _rectangularize_spider_ps_file(src: str, dst: str) -> None:
             f'and cannot be rectangularised.'
         )
 
-    with open(dst, 'w') as out:
-        for line in header_lines:
-            out.write(line)
-        for yi in range(NY):
-            S_val = S_canonical[yi]
-            for xi in range(NX):
-                out.write(f'{P_canonical[xi]:.18e}\t{S_val:.18e}\t{Q_matrix[yi, xi]:.18e}\n')
+    rect = np.column_stack(
+        (
+            np.tile(P_canonical, NY),
+            np.repeat(S_canonical, NX),
+            Q_matrix.ravel(),
+        )
+    )
+    write_spider_table(dst, header_lines, rect)
 
 
 def _load_spider_ps_phase_table(
@@ -370,8 +416,7 @@ def _load_spider_ps_phase_table(
     S_grid : (NY,) float ndarray, S axis in J/kg/K
     val    : (NX, NY) float ndarray, value(P_i, S_j) in SI units
     """
-    with open(path) as f:
-        header_lines = [f.readline() for _ in range(5)]
+    header_lines, data = read_spider_table(path)
 
     h = header_lines[0].strip().lstrip('#').split()
     n_head = int(h[0])
@@ -382,7 +427,6 @@ def _load_spider_ps_phase_table(
     S_scale = float(scales[1])
     val_scale = float(scales[2])
 
-    data = np.loadtxt(path, skiprows=n_head)
     if data.shape[0] != NX * NY:
         raise ValueError(f'{path}: header says NX*NY={NX * NY} rows, file has {data.shape[0]}')
 
@@ -1288,12 +1332,14 @@ def _sample_adiabat_temperature_arrays(outdir: str, temperature_function):
         the caller then passes the callable alone and the solve behaves
         as before.
     """
+    from proteus.interior_struct.mesh_handoff import fetch_rows
+
     path = os.path.join(outdir, 'data', 'zalmoxis_output.dat')
     try:
-        data = np.loadtxt(path)
+        data = fetch_rows(path)
     except (OSError, ValueError):
         return None
-    if data.ndim != 2 or data.shape[0] < 2 or data.shape[1] < 2:
+    if data.shape[0] < 2 or data.shape[1] < 2:
         return None
     r_arr = np.ascontiguousarray(data[:, 0], dtype=float)
     p_arr = np.ascontiguousarray(data[:, 1], dtype=float)
@@ -1514,24 +1560,34 @@ def _resolve_adiabatic_ic_structure(
     return adiabat_mesh_file if adiabat_mesh_file else linear_mesh_file
 
 
-def determine_interior_radius_with_zalmoxis(
-    dirs: dict, config: Config, hf_all: pd.DataFrame, hf_row: dict, outdir: str
-):
+def solve_initial_zalmoxis_structure(
+    config: Config, outdir: str, hf_row: dict, num_spider_nodes: int = 0
+) -> str | None:
     """
-    Determine the interior radius (R_int) of the planet using Zalmoxis.
+    Solve the initial Zalmoxis structure of a planet, without the interior solver.
 
-    When the interior module is SPIDER, also writes a SPIDER-format mesh
-    file from the Zalmoxis structure solution and stores the path in
-    ``dirs['spider_mesh']`` for subsequent calls.
-    """
+    Runs the first structure solve and, for the ``liquidus_super`` initial
+    condition, the re-solve against the super-liquidus adiabat. Shared by
+    :func:`determine_interior_radius_with_zalmoxis` and the batch pre-solve
+    in :mod:`proteus.interior_struct.batch`.
 
-    log.info('Using Zalmoxis to solve for interior structure')
-    from proteus.interior_struct.zalmoxis import zalmoxis_solver
+    Parameters
+    ----------
+    config : Config
+        PROTEUS configuration.
+    outdir : str
+        Output directory for the Zalmoxis files.
+    hf_row : dict
+        Current helpfile row, updated with the solved structure.
+    num_spider_nodes : int
+        Number of SPIDER basic nodes; if > 0 a SPIDER mesh file is written.
 
-    nlev_b = get_nlevb(config)
-    spider_dir = dirs.get('spider') if config.interior_energetics.module == 'spider' else None
-    int_o = Interior_t(nlev_b, spider_dir=spider_dir, eos_dir=config.interior_struct.eos_dir)
-    int_o.ic = 1
+    Returns
+    -------
+    str or None
+        Path to the SPIDER mesh file, or None if ``num_spider_nodes == 0``.
+    """
+    from proteus.interior_struct.zalmoxis import zalmoxis_solver
 
     # Set Zalmoxis to 'adiabatic' mode for T-dependent mantle EOS.
     # NOTE: In practice, Zalmoxis converges the structure using a linear T
@@ -1554,9 +1610,7 @@ def determine_interior_radius_with_zalmoxis(
         )
         _temp_mode_override = 'adiabatic'
 
-    # Request SPIDER mesh file if interior module is SPIDER.
     # Pass the override as a parameter instead of mutating config.planet.
-    num_spider_nodes = nlev_b if config.interior_energetics.module == 'spider' else 0
     _cmb_radius, spider_mesh_file = zalmoxis_solver(
         config,
         outdir,
@@ -1578,6 +1632,31 @@ def determine_interior_radius_with_zalmoxis(
         spider_mesh_file = _resolve_adiabatic_ic_structure(
             config, outdir, hf_row, num_spider_nodes, spider_mesh_file
         )
+    return spider_mesh_file
+
+
+def determine_interior_radius_with_zalmoxis(
+    dirs: dict, config: Config, hf_all: pd.DataFrame, hf_row: dict, outdir: str
+):
+    """
+    Determine the interior radius (R_int) of the planet using Zalmoxis.
+
+    When the interior module is SPIDER, also writes a SPIDER-format mesh
+    file from the Zalmoxis structure solution and stores the path in
+    ``dirs['spider_mesh']`` for subsequent calls.
+    """
+
+    log.info('Using Zalmoxis to solve for interior structure')
+    nlev_b = get_nlevb(config)
+    spider_dir = dirs.get('spider') if config.interior_energetics.module == 'spider' else None
+    int_o = Interior_t(nlev_b, spider_dir=spider_dir, eos_dir=config.interior_struct.eos_dir)
+    int_o.ic = 1
+
+    # Request SPIDER mesh file if interior module is SPIDER.
+    num_spider_nodes = nlev_b if config.interior_energetics.module == 'spider' else 0
+    spider_mesh_file = solve_initial_zalmoxis_structure(
+        config, outdir, hf_row, num_spider_nodes=num_spider_nodes
+    )
 
     # Store mesh file path for subsequent SPIDER calls
     if spider_mesh_file:
@@ -1844,52 +1923,91 @@ def solve_structure(
         raise ValueError('planet.mass_tot must be set to solve for the interior structure')
 
 
-def run_interior(
-    dirs: dict,
+class _InteriorStepStart:
+    """State at the start of an interior step, for rolling the step back."""
+
+    def __init__(self, dirs: dict, hf_row: dict, interior_o: Interior_t):
+        self.snapshot = interior_o.snapshot()
+        self.hf_row = dict(hf_row)
+        # Aragog's next step hot-starts from the solver's last solution
+        self.solution = getattr(interior_o.aragog_solver, '_solution', None)
+        self.data_dir = os.path.join(dirs['output'], 'data')
+        self.data_files = (
+            set(os.listdir(self.data_dir)) if os.path.isdir(self.data_dir) else set()
+        )
+
+    def restore(self, hf_row: dict, interior_o: Interior_t):
+        """Return `hf_row`, `interior_o` and the module output to this state."""
+        interior_o.restore(self.snapshot)
+        hf_row.clear()
+        hf_row.update(self.hf_row)
+        if interior_o.aragog_solver is not None:
+            interior_o.aragog_solver._solution = self.solution
+        # SPIDER restarts from the latest JSON on disk, and the step's
+        # NetCDF or JSON files must not outlive the step
+        if os.path.isdir(self.data_dir):
+            for name in set(os.listdir(self.data_dir)) - self.data_files:
+                path = os.path.join(self.data_dir, name)
+                if os.path.isfile(path):
+                    os.remove(path)
+
+
+def _reject_interior_step(
     config: Config,
     hf_all: pd.DataFrame,
     hf_row: dict,
     interior_o: Interior_t,
-    atmos_o=None,
-    verbose: bool = True,
-    write_data: bool = True,
-):
-    """Run interior mantle evolution model.
-
-    Parameters
-    ----------
-        dirs : dict
-            Dictionary of directories.
-        config : Config
-            Model configuration
-        hf_all : pd.DataFrame
-            Dataframe of historical runtime variables
-        hf_row : dict
-            Dictionary of current runtime variables
-        interior_o : Interior_t
-            Interior struct.
-        atmos_o : Atmos_t or None
-            Atmosphere struct. Required only for the boundary backend; the
-            other backends ignore it.
-        verbose : bool
-            Verbose printing enabled.
-        write_data : bool
-            Write per-timestep data files (NetCDF/JSON) to disk. When False,
-            the solver still runs but skips the data file write. Used by the
-            dt_write time guard to prevent excessive output during rapid
-            early evolution. SPIDER JSON writes are unaffected (managed by
-            the C binary).
+    sim_time: float,
+    start: _InteriorStepStart,
+) -> bool:
+    """Roll back an interior step rejected by the 'pi' step controller.
+
+    Returns True, with the step undone and ``interior_o.dt_reject_limit``
+    set to the step to repeat it with, when the local error of the step
+    exceeds 1. Steps already at ``dt.minimum`` are kept.
     """
+    err = interior_step_error(config, hf_all, hf_row, sim_time)
+    if err <= 1.0:
+        return False
+    time_start = float(start.hf_row['Time'])
+    dt = float(sim_time) - time_start
+    dt_new = dt * max(PI_SHRINK_MIN, PI_SAFETY * err ** (-1.0 / 2))
+    dt_min = config.params.dt.minimum + config.params.dt.minimum_rel * time_start
+    if dt_new < dt_min:
+        log.info(
+            'Keeping interior step of %.2e yr with local error %.2f: '
+            'it cannot shrink below dt.minimum',
+            dt,
+            err,
+        )
+        return False
+    log.info(
+        'Rejected interior step of %.2e yr (local error %.2f); repeating with %.2e yr',
+        dt,
+        err,
+        dt_new,
+    )
+    start.restore(hf_row, interior_o)
+    interior_o.dt_reject_limit = dt_new
+    interior_o.rejected_steps += 1
+    return True
 
-    # Use the appropriate interior model
-    if verbose:
-        log.info('Evolve interior...')
-    log.debug('Using %s module to evolve interior' % config.interior_energetics.module)
-
-    # Write tidal heating file
-    if config.interior_energetics.heat_tidal:
-        interior_o.write_tides(dirs['output'])
 
+def _advance_interior(
+    dirs: dict,
+    config: Config,
+    hf_all: pd.DataFrame,
+    hf_row: dict,
+    interior_o: Interior_t,
+    atmos_o,
+    write_data: bool,
+) -> float | None:
+    """Advance the interior module by one step and apply the step limiters.
+
+    Updates `hf_row` from the module output. Returns the time reached [yr],
+    or None when the module failed and kept the previous interior state.
+    See :func:`run_interior` for the arguments.
+    """
     if config.interior_energetics.module == 'spider':
         # Import
         from proteus.interior_energetics.spider import ReadSPIDER, RunSPIDER
@@ -1898,10 +2016,13 @@ def run_interior(
         # Note: write_data is not forwarded here. SPIDER JSON output is
         # controlled by the C binary; Python cannot suppress it per-timestep.
         mesh_file = dirs.get('spider_mesh')
+        snap = interior_o.snapshot()
         try:
             RunSPIDER(dirs, config, hf_all, hf_row, interior_o, mesh_file=mesh_file)
             interior_o.spider_fail_count = 0
         except RuntimeError as e:
+            # Roll back anything the failed attempts changed in memory
+            interior_o.restore(snap)
             interior_o.spider_fail_count += 1
             log.warning(
                 'SPIDER CVode failure #%d/%d. '
@@ -1940,13 +2061,14 @@ def run_interior(
             )
             interior_o._spider_cumulative_time += dtswitch
             interior_o.dt = dtswitch
-            return
+            return None
         sim_time, output = ReadSPIDER(dirs, config, hf_row['R_int'], interior_o)
 
     elif config.interior_energetics.module == 'aragog':
         from proteus.interior_energetics.aragog import AragogRunner
 
         runner = AragogRunner(config, dirs, hf_row, hf_all, interior_o)
+        snap = interior_o.snapshot()
         try:
             sim_time, output = runner.run_solver(
                 hf_row,
@@ -1956,6 +2078,9 @@ def run_interior(
             )
             interior_o.aragog_fail_count = 0
         except RuntimeError as e:
+            # Roll back the arrays and hot-start entropy to the pre-step
+            # state, so the next step starts from the last accepted one
+            interior_o.restore(snap)
             interior_o.aragog_fail_count += 1
             log.warning(
                 'Aragog retry-ladder exhaustion #%d/%d. '
@@ -1984,7 +2109,7 @@ def run_interior(
                 interior_o=interior_o,
             )
             interior_o.dt = dtswitch
-            return
+            return None
 
     elif config.interior_energetics.module == 'boundary':
         from proteus.interior_energetics.boundary import BoundaryRunner
@@ -2093,6 +2218,76 @@ def run_interior(
             log.warning('   Clipped from %.2f K' % hf_row['T_surf'])
             hf_row['T_surf'] = T_surf_prev + dT_delta_surf
 
+    return sim_time
+
+
+def run_interior(
+    dirs: dict,
+    config: Config,
+    hf_all: pd.DataFrame,
+    hf_row: dict,
+    interior_o: Interior_t,
+    atmos_o=None,
+    verbose: bool = True,
+    write_data: bool = True,
+):
+    """Run interior mantle evolution model.
+
+    Parameters
+    ----------
+        dirs : dict
+            Dictionary of directories.
+        config : Config
+            Model configuration
+        hf_all : pd.DataFrame
+            Dataframe of historical runtime variables
+        hf_row : dict
+            Dictionary of current runtime variables
+        interior_o : Interior_t
+            Interior struct.
+        atmos_o : Atmos_t or None
+            Atmosphere struct. Required only for the boundary backend; the
+            other backends ignore it.
+        verbose : bool
+            Verbose printing enabled.
+        write_data : bool
+            Write per-timestep data files (NetCDF/JSON) to disk. When False,
+            the solver still runs but skips the data file write. Used by the
+            dt_write time guard to prevent excessive output during rapid
+            early evolution. SPIDER JSON writes are unaffected (managed by
+            the C binary).
+    """
+
+    # Use the appropriate interior model
+    if verbose:
+        log.info('Evolve interior...')
+    log.debug('Using %s module to evolve interior' % config.interior_energetics.module)
+
+    # Write tidal heating file
+    if config.interior_energetics.heat_tidal:
+        interior_o.write_tides(dirs['output'])
+
+    # Mark the shared P-S table set in use, so eviction spares it
+    if dirs.get('spider_eos_dir') and os.environ.get(ps_tables.CACHE_DIR_ENV):
+        ps_tables.touch(dirs['spider_eos_dir'])
+
+    # Under the 'pi' step method, a step whose local error exceeds 1 is
+    # rolled back and repeated with the smaller step the controller asks for.
+    rollback = config.params.dt.method == 'pi'
+    for rejects in range(PI_MAX_REJECTS + 1):
+        start = _InteriorStepStart(dirs, hf_row, interior_o) if rollback else None
+        sim_time = _advance_interior(
+            dirs, config, hf_all, hf_row, interior_o, atmos_o, write_data
+        )
+        if sim_time is None or start is None or rejects == PI_MAX_REJECTS:
+            break
+        if not _reject_interior_step(config, hf_all, hf_row, interior_o, sim_time, start):
+            break
+    interior_o.dt_reject_limit = float('inf')
+    if sim_time is None:
+        # The module kept the previous interior state for this step
+        return
+
     # Print result of interior module
     if verbose:
         log.info('    T_magma    = %.3f K' % float(hf_row['T_magma']))
@@ -2235,9 +2430,11 @@ def _eos_grid_extent_up_step(eos_path: str, hf_row: dict) -> bool:
         an unreadable or degenerate file, or a non-positive ``R_int`` (the caller
         then takes the unchanged success path: pure pass-through).
     """
+    from proteus.interior_struct.mesh_handoff import fetch_rows
+
     try:
-        er = np.loadtxt(eos_path, usecols=0)
-    except (OSError, ValueError):
+        er = fetch_rows(eos_path)[:, 0]
+    except (OSError, ValueError, IndexError):
         # An unreadable or malformed file is not the artifact this guard targets;
         # let the existing failure handling deal with it, never a spurious reject.
         return False
@@ -2276,6 +2473,9 @@ def update_structure_from_interior(
     thresholds, subject to a minimum interval (floor) and maximum
     interval (ceiling).  When ``update_interval == 0``, no dynamic
     updates are performed (structure is computed only at init).
+    With ``surrogate_tol > 0``, a state-change trigger is skipped when the
+    linear-response surrogate built from this run's earlier re-solves
+    predicts a structure change below that tolerance.
 
     Writes SPIDER's temperature profile to a file, runs Zalmoxis in
     prescribed-temperature mode, and writes an updated mesh file for the
@@ -2331,6 +2531,10 @@ def update_structure_from_interior(
     # re-solve; every other trigger (mesh convergence, ceiling, stale, Phi,
     # composition) sets `triggered` first and short-circuits the dT/T block.
     trigger_is_dtmagma = False
+    # Tracks whether a state-change trigger (Phi, dT/T or composition) fired,
+    # as opposed to a forced, mesh-convergence or ceiling trigger. Only the
+    # former may be answered by the structure surrogate below.
+    change_trigger = False
 
     # Mesh convergence trigger: bypasses normal floor when mesh is still
     # converging toward the true Zalmoxis solution after blending
@@ -2385,6 +2589,7 @@ def update_structure_from_interior(
         dPhi = abs(hf_row['Phi_global'] - last_Phi)
         if dPhi >= config.interior_struct.zalmoxis.update_dphi_abs:
             triggered = True
+            change_trigger = True
             reason = f'dPhi={dPhi:.3f} >= {config.interior_struct.zalmoxis.update_dphi_abs}'
 
     # T_magma relative change (secondary: catches cases where Phi is constant but T changes)
@@ -2392,6 +2597,7 @@ def update_structure_from_interior(
         dT_frac = abs(hf_row['T_magma'] - last_Tmagma) / last_Tmagma
         if dT_frac >= config.interior_struct.zalmoxis.update_dtmagma_frac:
             triggered = True
+            change_trigger = True
             trigger_is_dtmagma = True
             reason = (
                 f'dT/T={dT_frac:.3f} >= {config.interior_struct.zalmoxis.update_dtmagma_frac}'
@@ -2412,6 +2618,7 @@ def update_structure_from_interior(
                     dw_threshold = config.interior_struct.zalmoxis.update_dw_comp_abs
                     if dw >= dw_threshold:
                         triggered = True
+                        change_trigger = True
                         comp_changed = True
                         reason = f'd_w_{species}={dw:.3f} >= {dw_threshold}'
                         break
@@ -2470,6 +2677,59 @@ def update_structure_from_interior(
             dirs['_resume_struct_settle_loops'],
         )
 
+    # Structure surrogate. Every accepted re-solve of the run is recorded, and
+    # a state-change trigger is answered without a re-solve when the linear
+    # response fitted to those solves predicts that the structure (radius,
+    # gravity and hence mesh) would move by less than surrogate_tol. The
+    # sentinels are not advanced on a skip, so the trigger re-fires next loop
+    # and the prediction is always made against the last solved structure.
+    # Never consulted while the mesh is still converging or the current
+    # structure is a fall-back, and every decision is logged.
+    surrogate_tol = config.interior_struct.zalmoxis.surrogate_tol
+    surrogate = None
+    if surrogate_tol > 0:
+        from proteus.interior_struct.surrogate import StructureSurrogate
+
+        surrogate = dirs.setdefault('_struct_surrogate', StructureSurrogate())
+        prediction = None
+        if (
+            change_trigger
+            and not mesh_converging
+            and not getattr(interior_o, 'structure_stale', False)
+        ):
+            prediction = surrogate.predict(hf_row)
+        if prediction is not None and prediction.error < surrogate_tol:
+            surrogate.skipped += 1
+            log.info(
+                'Structure surrogate: skipping re-solve (trigger: %s; predicted '
+                'R_int=%.6e m, gravity=%.4f m/s^2, mesh shift %.2e; predicted '
+                'error %.2e < tol %.2e; %d solves recorded, %d skipped)',
+                reason,
+                prediction.R_int,
+                prediction.gravity,
+                prediction.mesh_shift,
+                prediction.error,
+                surrogate_tol,
+                len(surrogate),
+                surrogate.skipped,
+            )
+            return no_update
+        if prediction is not None:
+            log.info(
+                'Structure surrogate: full re-solve (trigger: %s; predicted '
+                'error %.2e >= tol %.2e)',
+                reason,
+                prediction.error,
+                surrogate_tol,
+            )
+        else:
+            log.info(
+                'Structure surrogate: full re-solve (trigger: %s; no usable '
+                'prediction, %d solves recorded)',
+                reason,
+                len(surrogate),
+            )
+
     log.info('Updating structure from interior T(r) via Zalmoxis (trigger: %s)', reason)
 
     outdir = dirs['output']
@@ -2547,7 +2807,7 @@ def update_structure_from_interior(
                 _exc,
             )
 
-    nlev_b = get_nlevb(config)
+    nlev_b = get_nlevb(config, interior_o)
     num_spider_nodes = nlev_b if config.interior_energetics.module == 'spider' else 0
 
     # Save current structure values for fallback on convergence failure or a
@@ -2856,6 +3116,8 @@ def update_structure_from_interior(
         _R_int_post = float(hf_row.get('R_int', 0.0) or 0.0)
         if R_int_prev > 0.0:
             dirs['_last_resolve_dR_rel'] = abs(_R_int_post - R_int_prev) / R_int_prev
+        if surrogate is not None:
+            surrogate.record(hf_row)
         # Anchor the stale-aware ceiling on the last SUCCESSFUL
         # re-solve (vs `last_struct_time` which is reset on every
         # call regardless of success).
@@ -3005,9 +3267,14 @@ def update_structure_from_interior(
         if config.interior_energetics.module == 'spider':
             from proteus.interior_energetics.spider import (
                 get_all_output_times,
+                mesh_num_levels,
                 remap_entropy_for_new_mesh,
             )
 
+            # Adaptive resolution: the new mesh may carry another number of
+            # levels, in which case the entropy is remapped conservatively
+            adaptive = config.interior_energetics.adaptive_levels
+
             try:
                 sim_times = get_all_output_times(dirs['output'])
             except Exception as exc:
@@ -3031,7 +3298,17 @@ def update_structure_from_interior(
                     json_path=latest_json,
                     new_mesh_file=spider_mesh_file,
                     radius_phys=remap_radius,
+                    allow_resize=adaptive,
                 )
+            if adaptive:
+                n_mesh = mesh_num_levels(spider_mesh_file)
+                if n_mesh != interior_o.nlev_b:
+                    log.info(
+                        'Adaptive resolution: %d -> %d basic nodes',
+                        interior_o.nlev_b,
+                        n_mesh,
+                    )
+                    interior_o.resize(n_mesh)
     else:
         # No mesh file produced: reset convergence state
         dirs['mesh_shift_active'] = False
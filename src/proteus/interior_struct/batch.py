@@ -0,0 +1,227 @@
+# Batched initial-structure solves for grids of planets
+"""Solve the initial Zalmoxis structures of many cases ahead of their runs.
+
+Every grid or inference case starts with ``solve_structure``: a cold Picard
+solve of its Zalmoxis structure, the super-liquidus re-solve for the
+``liquidus_super`` initial condition, and the P-S tables. With many cases
+starting together, each one spends its first minutes there before the
+interior solver ever runs.
+
+:func:`presolve_initial_structures` runs those solves for a list of case
+configs before the cases are launched, and leaves the results where each
+case's own startup finds them. The converged profiles and super-liquidus
+solves go into the warm-start store (``PROTEUS_STRUCT_CACHE_DIR``, see
+:mod:`proteus.interior_struct.warmstart`), and the tables into the shared
+P-S cache (``PROTEUS_PS_CACHE_DIR``, see :mod:`proteus.interior_struct.ps_tables`).
+A case then seeds its structure from its own converged profile and reuses
+its tables. The profile seeds the case's own Picard iteration, so the
+structure a case starts from is unchanged; only its iteration count drops.
+
+The cases are grouped by the equations of state they share and ordered by
+planet mass. Each group is cut into contiguous runs of masses, one or more
+per worker process, so a grid over a single EOS still uses every worker.
+A run is solved in one process in mass order: the EOS tables, the material
+dictionaries and any compiled JAX kernels are loaded once per worker instead
+of once per case, and every planet is seeded from the previous, nearest one.
+Workers are spawned, not forked, so they never inherit an initialised Julia
+runtime from the parent.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from proteus.interior_struct import ps_tables, warmstart
+
+log = logging.getLogger('fwl.' + __name__)
+
+
+@dataclass(frozen=True)
+class PresolveResult:
+    """Outcome of pre-solving one case.
+
+    Attributes
+    ----------
+    config_path : str
+        Path to the case's config file.
+    status : str
+        ``'solved'``, ``'skipped'`` (not a Zalmoxis structure) or ``'failed'``.
+    R_int : float
+        Solved interior radius [m]; NaN unless solved.
+    message : str
+        Reason for a skip or failure.
+    """
+
+    config_path: str
+    status: str
+    R_int: float = float('nan')
+    message: str = ''
+
+
+def _resolve_workers(workers: int) -> int:
+    """Worker processes for `workers`; 0 means one per core.
+
+    Daemonic processes may not have children, so they solve serially.
+    """
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    if multiprocessing.current_process().daemon:
+        return 1
+    return workers
+
+
+def _presolve_case(config_path: str) -> PresolveResult:
+    """Solve the initial structure of one case in a scratch directory."""
+    from proteus.config import read_config_object
+    from proteus.interior_energetics.wrapper import get_nlevb, solve_initial_zalmoxis_structure
+    from proteus.interior_struct.zalmoxis import generate_spider_tables
+    from proteus.star.wrapper import update_stellar_mass
+    from proteus.utils.coupler import ZeroHelpfileRow
+
+    config = read_config_object(config_path)
+
+    # Same initial row as a fresh run builds before solve_structure
+    state = ZeroHelpfileRow()
+    update_stellar_mass(state, config)
+    state['Time'] = 0.0
+    state['age_star'] = config.star.age_ini * 1e9
+
+    num_spider_nodes = get_nlevb(config) if config.interior_energetics.module == 'spider' else 0
+    with tempfile.TemporaryDirectory(prefix='proteus_presolve_') as scratch:
+        os.makedirs(os.path.join(scratch, 'data'))
+        # As in solve_structure, without orbital feedback
+        config.orbit.module = 'dummy'
+        solve_initial_zalmoxis_structure(
+            config, scratch, state, num_spider_nodes=num_spider_nodes
+        )
+        if config.interior_energetics.module in ('spider', 'aragog') and os.environ.get(
+            ps_tables.CACHE_DIR_ENV
+        ):
+            generate_spider_tables(config, scratch)
+    return PresolveResult(config_path, 'solved', R_int=float(state['R_int']))
+
+
+def _presolve_group(config_paths: list[str]) -> list[PresolveResult]:
+    """Pre-solve a group of cases in order, logging and recording failures."""
+    results = []
+    for path in config_paths:
+        try:
+            results.append(_presolve_case(path))
+        except Exception as e:
+            log.warning('Could not pre-solve the initial structure of %s: %s', path, e)
+            results.append(PresolveResult(path, 'failed', message=str(e)))
+    return results
+
+
+def group_cases(config_paths: list[str]) -> tuple[list[list[str]], list[PresolveResult]]:
+    """Group Zalmoxis cases by their EOS fingerprint, each sorted by mass.
+
+    Parameters
+    ----------
+    config_paths : list of str
+        Paths to case config files.
+
+    Returns
+    -------
+    groups : list of list of str
+        Config paths sharing one EOS fingerprint, in order of planet mass.
+    skipped : list of PresolveResult
+        Cases that do not solve a Zalmoxis structure from their mass.
+    """
+    from proteus.config import read_config_object
+
+    groups: dict[str, list[tuple[float, str]]] = {}
+    skipped = []
+    for path in config_paths:
+        config = read_config_object(path)
+        if config.interior_struct.module != 'zalmoxis' or config.planet.mass_tot is None:
+            skipped.append(PresolveResult(path, 'skipped', message='not a Zalmoxis structure'))
+            continue
+        fingerprint = warmstart.eos_fingerprint(config)
+        groups.setdefault(fingerprint, []).append((float(config.planet.mass_tot), path))
+    return [[path for _, path in sorted(group)] for group in groups.values()], skipped
+
+
+def split_groups(groups: list[list[str]], workers: int) -> list[list[str]]:
+    """Cut mass-ordered groups into contiguous runs for `workers` processes.
+
+    Parameters
+    ----------
+    groups : list of list of str
+        Config paths per EOS group, in order of planet mass.
+    workers : int
+        Number of worker processes.
+
+    Returns
+    -------
+    list of list of str
+        Runs of at most ``ceil(n_cases / workers)`` neighbouring masses, each
+        group split into runs of near-equal length.
+    """
+    n_cases = sum(len(group) for group in groups)
+    size = max(1, -(-n_cases // max(workers, 1)))
+    runs = []
+    for group in groups:
+        n_runs = -(-len(group) // size)
+        bounds = [round(i * len(group) / n_runs) for i in range(n_runs + 1)]
+        runs.extend(group[a:b] for a, b in zip(bounds[:-1], bounds[1:]))
+    return runs
+
+
+def presolve_initial_structures(
+    config_paths: list[str], workers: int = 1
+) -> list[PresolveResult]:
+    """Solve the initial structures of many cases into the shared stores.
+
+    Needs ``PROTEUS_STRUCT_CACHE_DIR`` to be set, and the same store to be
+    visible to the cases when they start; with ``PROTEUS_PS_CACHE_DIR`` also
+    set, the P-S tables are generated into the shared cache as well. A case
+    whose pre-solve fails is logged and solved at its own startup as before.
+
+    Parameters
+    ----------
+    config_paths : list of str
+        Paths to case config files.
+    workers : int
+        Worker processes; 0 uses one per core.
+
+    Returns
+    -------
+    list of PresolveResult
+        One result per config path, in input order.
+    """
+    if warmstart.store_root() is None:
+        log.warning(
+            'Not pre-solving initial structures: %s is not set', warmstart.STORE_DIR_ENV
+        )
+        return [
+            PresolveResult(path, 'skipped', message='no warm-start store')
+            for path in config_paths
+        ]
+
+    groups, skipped = group_cases(config_paths)
+    n_cases = sum(len(g) for g in groups)
+    log.info('Pre-solving %d initial structures in %d EOS group(s)', n_cases, len(groups))
+
+    workers = min(_resolve_workers(workers), n_cases)
+    if workers <= 1:
+        solved = [_presolve_group(group) for group in groups]
+    else:
+        runs = split_groups(groups, workers)
+        ctx = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            solved = list(pool.map(_presolve_group, runs))
+
+    by_path = {r.config_path: r for r in skipped}
+    for group in solved:
+        by_path.update((r.config_path, r) for r in group)
+    results = [by_path[path] for path in config_paths]
+
+    n_solved = sum(r.status == 'solved' for r in results)
+    log.info('Pre-solved %d of %d initial structures', n_solved, n_cases)
+    return results
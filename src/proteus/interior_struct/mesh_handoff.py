@@ -0,0 +1,185 @@
+# In-process handoff of structure profiles and meshes to the interior solvers
+"""Publish structure files to disk and keep their arrays in memory.
+
+Every structure update hands the new mantle profile to the interior solvers
+through files in ``<outdir>/data``: ``zalmoxis_output.dat`` (read by Aragog's
+external EOS mesh), ``zalmoxis_output_temp.txt`` (Aragog's prescribed
+temperature IC) and ``spider_mesh.dat`` (SPIDER's external mesh). PROTEUS then
+parsed those files back several times per update: the monotonic-radius guard,
+the mesh blending and the SPIDER entropy remap. The files were also written in
+place, so a reader in another process could see a partially written file.
+
+:func:`publish` writes a file with
+:func:`~proteus.utils.disk_cache.write_atomic_text` and keeps the arrays it was
+formatted from under the file's identity: path, inode, size and modification
+and change times. :func:`fetch` only stats the file and returns the kept
+arrays while that identity is unchanged. Any other file, such as a ``.prev``
+backup or the first read after a resume, is parsed once and kept the same
+way. Every write changes the change time, which user code cannot set, so a
+file restored or edited behind PROTEUS's back is parsed again, not answered
+from memory. The arrays are read-only and bit-identical to what parsing
+returns, since every format written here round-trips doubles exactly.
+
+Aragog's EOS loader and the SPIDER binary take file paths, so the files are
+still written on every update; only PROTEUS's own reads go through memory.
+The output schema check deliberately re-reads the written file.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import os
+from collections import OrderedDict
+from typing import Callable
+
+import numpy as np
+
+from proteus.utils.disk_cache import write_atomic_text
+
+log = logging.getLogger('fwl.' + __name__)
+
+# Arrays kept by file identity; a run only ever needs the current file and
+# its backup of each kind, so a handful of entries suffices
+MAX_ENTRIES = 16
+_arrays: OrderedDict[tuple, object] = OrderedDict()
+
+
+def _identity(path: str) -> tuple:
+    st = os.stat(path)
+    return (os.path.abspath(path), st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+
+
+def _keep(key: tuple, value):
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    else:
+        for item in value:
+            item.flags.writeable = False
+    _arrays[key] = value
+    _arrays.move_to_end(key)
+    while len(_arrays) > MAX_ENTRIES:
+        _arrays.popitem(last=False)
+    return value
+
+
+def publish(path: str, value, text: str) -> None:
+    """Atomically write `text` to `path` and keep `value` as its parsed form.
+
+    Parameters
+    ----------
+    path : str
+        Target file path.
+    value : numpy.ndarray or tuple of numpy.ndarray
+        Arrays that parsing `text` returns; made read-only.
+    text : str
+        File contents.
+    """
+    write_atomic_text(path, text)
+    _keep(_identity(path), value)
+
+
+def fetch(path: str, parse: Callable[[str], object]):
+    """Return the arrays of the file at `path`, parsing it only if unseen.
+
+    Parameters
+    ----------
+    path : str
+        File path.
+    parse : callable
+        Parser from file text to arrays, used for files not kept in memory;
+        its exceptions propagate.
+
+    Returns
+    -------
+    numpy.ndarray or tuple of numpy.ndarray
+        Read-only arrays of the file.
+
+    Raises
+    ------
+    OSError
+        If the file cannot be read.
+    """
+    key = _identity(path)
+    value = _arrays.get(key)
+    if value is not None:
+        _arrays.move_to_end(key)
+        return value
+    log.debug('Parsing structure file %s', path)
+    with open(path) as f:
+        return _keep(key, parse(f.read()))
+
+
+def format_rows(data: np.ndarray) -> str:
+    """Format a 2-D array as whitespace-separated rows with ``%.17e``.
+
+    ``%.17e`` round-trips every double exactly, so parsing the result with
+    :func:`parse_rows` returns `data` unchanged.
+    """
+    return ''.join(' '.join(f'{v:.17e}' for v in row) + '\n' for row in data)
+
+
+def parse_rows(text: str) -> np.ndarray:
+    """Parse whitespace-separated rows into a 2-D array."""
+    return np.loadtxt(io.StringIO(text), ndmin=2)
+
+
+def publish_rows(path: str, data: np.ndarray) -> None:
+    """Publish a 2-D array as a row file (``zalmoxis_output.dat`` layout)."""
+    data = np.array(data, dtype=float, ndmin=2)
+    publish(path, data, format_rows(data))
+
+
+def fetch_rows(path: str) -> np.ndarray:
+    """Return the 2-D array of a row file; see :func:`fetch`."""
+    return fetch(path, parse_rows)
+
+
+def format_spider_mesh(arrays: tuple[np.ndarray, ...]) -> str:
+    """Format a SPIDER external mesh file.
+
+    Parameters
+    ----------
+    arrays : tuple of numpy.ndarray
+        ``(r_b, P_b, rho_b, g_b, r_s, P_s, rho_s, g_s)``, basic then
+        staggered nodes, surface to CMB.
+
+    Returns
+    -------
+    str
+        A ``# n_basic n_staggered`` header followed by one ``r P rho g`` line
+        per basic node, then one per staggered node.
+    """
+    basic = np.column_stack(arrays[:4])
+    staggered = np.column_stack(arrays[4:])
+    return f'# {len(basic)} {len(staggered)}\n' + format_rows(basic) + format_rows(staggered)
+
+
+def parse_spider_mesh(text: str) -> tuple[np.ndarray, ...]:
+    """Parse SPIDER external mesh text into its eight node arrays."""
+    lines = text.splitlines()
+    tokens = lines[0].strip('# \n').split()
+    nb = int(tokens[0])
+    ns = int(tokens[1])
+    if len(lines) < 1 + nb + ns:
+        raise ValueError(f'mesh has {len(lines) - 1} node lines, expected {nb + ns}')
+    basic = np.array([line.split()[:4] for line in lines[1 : 1 + nb]], dtype=float)
+    staggered = np.array(
+        [line.split()[:4] for line in lines[1 + nb : 1 + nb + ns]], dtype=float
+    )
+    basic = basic.reshape(nb, 4)
+    staggered = staggered.reshape(ns, 4)
+    return tuple(np.ascontiguousarray(basic[:, j]) for j in range(4)) + tuple(
+        np.ascontiguousarray(staggered[:, j]) for j in range(4)
+    )
+
+
+def publish_spider_mesh(path: str, arrays: tuple[np.ndarray, ...]) -> None:
+    """Publish a SPIDER external mesh; see :func:`format_spider_mesh`."""
+    arrays = tuple(np.array(a, dtype=float) for a in arrays)
+    publish(path, arrays, format_spider_mesh(arrays))
+
+
+def fetch_spider_mesh(path: str) -> tuple[np.ndarray, ...]:
+    """Return the eight node arrays of a SPIDER mesh file; see :func:`fetch`."""
+    return fetch(path, parse_spider_mesh)
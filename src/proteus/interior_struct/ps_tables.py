@@ -0,0 +1,628 @@
+# Parallel generation and shared caching of PALEOS-derived P-S tables
+"""Slab-parallel P-S EOS table generation and the shared table cache.
+
+``generate_spider_tables`` derives the SPIDER-format P-S lookup tables from
+the PALEOS P-T tables. At production resolution (1350 x 280) the inversion
+of S(P, T) for T at every (P, S) node takes minutes, and Zalmoxis runs it
+serially. Every pressure column is independent once the entropy grids are
+fixed, so :func:`generate_spider_eos_tables` splits the columns into
+pressure slabs and fills them in a pool of spawned worker processes. The
+entropy grids, the validity masks and the gap filling are computed exactly
+as in ``zalmoxis.eos_export.generate_spider_eos_tables``, so the written
+tables are identical to the serial ones. Inside a daemonic process (which
+may not have children) or with one worker, the Zalmoxis function is called
+unchanged.
+
+With ``PROTEUS_PS_CACHE_DIR`` set, generated table sets are shared between
+runs. :func:`find_superset` lets a request reuse a cached set whose pressure
+ceiling covers it with at most ``SUPERSET_MAX_RATIO`` headroom, and
+:func:`slice_tables` cuts that set at the first node above the requested
+ceiling without interpolating. :func:`evict` bounds the directory at
+``PROTEUS_PS_CACHE_MAX_SIZE`` bytes by removing the least recently used
+sets, and :func:`touch` records every use.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import multiprocessing
+import os
+import re
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from proteus.utils import disk_cache
+
+log = logging.getLogger('fwl.' + __name__)
+
+# Environment variables controlling the shared cache
+CACHE_DIR_ENV = 'PROTEUS_PS_CACHE_DIR'
+CACHE_MAX_SIZE_ENV = 'PROTEUS_PS_CACHE_MAX_SIZE'
+DEFAULT_MAX_SIZE = 50 * 1024**3  # 50 GiB
+
+# Marker written last into a complete table set; holds the cache key
+CACHE_MARKER = '.cache_info.txt'
+
+# A cached set serves a request when its pressure ceiling is at most this
+# factor above the requested one; the cut set keeps the cached pressure
+# spacing, at most this much coarser than a fresh table of the same
+# resolution
+SUPERSET_MAX_RATIO = 1.25
+
+_KEY_PATTERN = re.compile(r'^P_max=([0-9.eE+-]+)_(nP=.+)$')
+
+
+# Columns per slab handed to one worker task
+_MIN_SLAB_COLUMNS = 16
+
+# State of a worker process: the interpolators, melting temperatures and
+# pressure grid of the table being generated, set by _init_worker
+_worker_state: dict = {}
+
+_SPIDER_NAMES = {
+    'rho': 'density',
+    'temperature': 'temperature',
+    'cp': 'heat_capacity',
+    'alpha': 'thermal_exp',
+    'nabla_ad': 'adiabat_temp_grad',
+}
+_SCALES = {'rho': 1000.0, 'temperature': 1000.0, 'cp': 1000.0, 'alpha': 1e-5, 'nabla_ad': 1e-9}
+
+
+def pool_available() -> bool:
+    """Whether table slabs can be filled in worker processes.
+
+    The workers are spawned, never forked, since juliacall may already be
+    running in this process; daemonic processes may not have children.
+    """
+    return not multiprocessing.current_process().daemon
+
+
+def resolve_workers(workers: int) -> int:
+    """Number of worker processes for ``lookup_workers``; 0 means one per core."""
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return workers if pool_available() else 1
+
+
+def _load_interpolators(eos_file, solid_eos_file, liquid_eos_file) -> dict:
+    """Per-phase property interpolators, chosen as by the Zalmoxis generator."""
+    from zalmoxis import eos_export
+
+    table = eos_export.load_paleos_all_properties(eos_file)
+    tabs = {'solid': table, 'melt': table}
+    if solid_eos_file and liquid_eos_file:
+        solid_tab = eos_export.load_paleos_all_properties(solid_eos_file)
+        liquid_tab = eos_export.load_paleos_all_properties(liquid_eos_file)
+        if solid_tab is not None and liquid_tab is not None:
+            tabs = {'solid': solid_tab, 'melt': liquid_tab}
+
+    state = {
+        'T_lo_global': max(table['t_min'], 300.0),
+        'T_hi_global': min(table['t_max'], 1e5),
+    }
+    for phase, tab in tabs.items():
+        state[phase] = {
+            prop: eos_export._build_interpolator(
+                tab['unique_log_p'], tab['unique_log_t'], tab[prop]
+            )
+            for prop in ('s', 'rho', 'cp', 'alpha', 'nabla_ad')
+        }
+    return state
+
+
+def _init_worker(tables: tuple, P_out, T_sol, T_liq) -> None:
+    """Set up a spawned worker: load the PALEOS tables and the grid.
+
+    The melting curves arrive sampled at the pressure nodes, since the
+    closures that define them cannot be pickled.
+    """
+    _worker_state.update(_load_interpolators(*tables), P_out=P_out, T_sol=T_sol, T_liq=T_liq)
+
+
+def _scan_slab(i0: int, i1: int) -> tuple[np.ndarray, ...]:
+    """Entropy range of each phase over the pressure columns ``[i0, i1)``."""
+    st = _worker_state
+    P_out = st['P_out']
+    n = i1 - i0
+    S_min_solid = np.full(n, np.inf)
+    S_max_solid = np.full(n, -np.inf)
+    S_min_melt = np.full(n, np.inf)
+    S_max_melt = np.full(n, -np.inf)
+    n_T_sample = 500
+    T_lo_global, T_hi_global = st['T_lo_global'], st['T_hi_global']
+
+    for k, ip in enumerate(range(i0, i1)):
+        P_Pa = P_out[ip]
+        T_sol = st['T_sol'][ip]
+        T_liq = st['T_liq'][ip]
+        if np.isnan(T_sol) or np.isnan(T_liq) or T_sol <= 0 or T_liq <= 0:
+            continue
+        logP = np.log10(P_Pa)
+
+        if T_sol > T_lo_global:
+            T_arr = np.linspace(T_lo_global, T_sol, n_T_sample)
+            pts = np.column_stack([np.full(n_T_sample, logP), np.log10(T_arr)])
+            S_arr = st['solid']['s'](pts)
+            finite = np.isfinite(S_arr)
+            if finite.any():
+                S_min_solid[k] = np.min(S_arr[finite])
+                S_max_solid[k] = np.max(S_arr[finite])
+
+        if T_liq < T_hi_global:
+            T_arr = np.linspace(T_liq, T_hi_global, n_T_sample)
+            pts = np.column_stack([np.full(n_T_sample, logP), np.log10(T_arr)])
+            S_arr = st['melt']['s'](pts)
+            finite = np.isfinite(S_arr)
+            if finite.any():
+                S_min_melt[k] = np.min(S_arr[finite])
+                S_max_melt[k] = np.max(S_arr[finite])
+
+    return S_min_solid, S_max_solid, S_min_melt, S_max_melt
+
+
+def _fill_slab(phase: str, S_grid: np.ndarray, i0: int, i1: int) -> tuple:
+    """Invert S(P, T) for T on the pressure columns ``[i0, i1)`` of one phase."""
+    from zalmoxis.eos_export import _find_valid_T_bounds
+
+    st = _worker_state
+    interp = st[phase]
+    if phase == 'solid':
+        T_lo = np.full(i1 - i0, st['T_lo_global'])
+        T_hi = st['T_sol'][i0:i1]
+    else:
+        T_lo = st['T_liq'][i0:i1]
+        T_hi = np.full(i1 - i0, st['T_hi_global'])
+    P_grid = st['P_out'][i0:i1]
+
+    nP_out, nS_out = len(P_grid), len(S_grid)
+    result = {prop: np.full((nS_out, nP_out), np.nan) for prop in _SPIDER_NAMES}
+    nad_finite = np.zeros((nS_out, nP_out), dtype=bool)
+    n_filled = 0
+
+    for ip in range(nP_out):
+        P_Pa = P_grid[ip]
+        logP = np.log10(P_Pa)
+        if np.isnan(T_lo[ip]) or np.isnan(T_hi[ip]) or T_lo[ip] <= 0 or T_hi[ip] <= 0:
+            continue
+        if T_lo[ip] >= T_hi[ip]:
+            continue
+
+        T_lo_valid, T_hi_valid = _find_valid_T_bounds(logP, T_lo[ip], T_hi[ip], interp['s'])
+        if T_lo_valid is None:
+            continue
+        Sa = float(interp['s']((logP, np.log10(T_lo_valid))))
+        Sb = float(interp['s']((logP, np.log10(T_hi_valid))))
+        if np.isnan(Sa) or np.isnan(Sb):
+            continue
+        S_lo, S_hi = min(Sa, Sb), max(Sa, Sb)
+
+        idx_s = np.where((S_grid >= S_lo) & (S_grid <= S_hi))[0]
+        if len(idx_s) == 0:
+            continue
+        S_batch = S_grid[idx_s]
+        Ta_arr = np.full(len(idx_s), T_lo_valid)
+        Tb_arr = np.full(len(idx_s), T_hi_valid)
+        for _ in range(40):
+            Tm_arr = 0.5 * (Ta_arr + Tb_arr)
+            pts_arr = np.column_stack([np.full(len(idx_s), logP), np.log10(Tm_arr)])
+            below = interp['s'](pts_arr) < S_batch
+            Ta_arr = np.where(below, Tm_arr, Ta_arr)
+            Tb_arr = np.where(below, Tb_arr, Tm_arr)
+            if np.max(Tb_arr - Ta_arr) < 0.01:
+                break
+
+        T_found = 0.5 * (Ta_arr + Tb_arr)
+        pts = np.column_stack([np.full(len(idx_s), logP), np.log10(T_found)])
+        result['temperature'][idx_s, ip] = T_found
+        result['rho'][idx_s, ip] = interp['rho'](pts)
+        result['cp'][idx_s, ip] = interp['cp'](pts)
+        result['alpha'][idx_s, ip] = interp['alpha'](pts)
+        nad_vals = interp['nabla_ad'](pts)
+        nad_finite[idx_s, ip] = np.isfinite(nad_vals)
+        if P_Pa > 0:
+            result['nabla_ad'][idx_s, ip] = np.where(
+                np.isfinite(nad_vals), nad_vals * T_found / P_Pa, 0.0
+            )
+        n_filled += len(idx_s)
+
+    return result, nad_finite, n_filled
+
+
+def _slabs(n_P: int, workers: int) -> list[tuple[int, int]]:
+    """Split ``n_P`` columns into contiguous slabs, a few per worker."""
+    n_slabs = max(1, min(4 * workers, n_P // _MIN_SLAB_COLUMNS))
+    edges = np.linspace(0, n_P, n_slabs + 1).astype(int)
+    return [(int(a), int(b)) for a, b in zip(edges[:-1], edges[1:]) if b > a]
+
+
+def generate_spider_eos_tables(
+    eos_file,
+    solidus_func,
+    liquidus_func,
+    P_range=(1e5, 200e9),
+    n_P=150,
+    n_S=150,
+    output_dir=None,
+    solid_eos_file=None,
+    liquid_eos_file=None,
+    workers: int = 0,
+) -> dict:
+    """Generate the SPIDER P-S EOS tables with the pressure columns in parallel.
+
+    Takes the arguments of ``zalmoxis.eos_export.generate_spider_eos_tables``
+    and writes the same files with the same values. With `workers` resolving
+    to one (see :func:`resolve_workers`), the Zalmoxis function is called.
+
+    Parameters
+    ----------
+    eos_file : str or Path
+        Path to the PALEOS unified EOS table.
+    solidus_func, liquidus_func : callable
+        P [Pa] -> melting temperature [K].
+    P_range : tuple of float
+        (P_min, P_max) in Pa.
+    n_P, n_S : int
+        Pressure and entropy grid resolutions.
+    output_dir : str or Path or None
+        Directory for the output files; None writes nothing.
+    solid_eos_file, liquid_eos_file : str or None
+        PALEOS two-phase tables used for the per-phase properties when both
+        are given.
+    workers : int
+        Worker processes; 0 uses one per core.
+
+    Returns
+    -------
+    dict
+        As returned by the Zalmoxis function.
+    """
+    from zalmoxis import eos_export
+
+    workers = resolve_workers(workers)
+    if workers <= 1:
+        return eos_export.generate_spider_eos_tables(
+            eos_file=eos_file,
+            solidus_func=solidus_func,
+            liquidus_func=liquidus_func,
+            P_range=P_range,
+            n_P=n_P,
+            n_S=n_S,
+            output_dir=output_dir,
+            solid_eos_file=solid_eos_file,
+            liquid_eos_file=liquid_eos_file,
+        )
+
+    # SPIDER's Interp2d assumes a uniform pressure grid
+    P_out = np.linspace(P_range[0], P_range[1], n_P)
+    T_sol = np.array([solidus_func(P) for P in P_out], dtype=float)
+    T_liq = np.array([liquidus_func(P) for P in P_out], dtype=float)
+    slabs = _slabs(n_P, workers)
+    t0 = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(slabs)),
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_worker,
+        initargs=((eos_file, solid_eos_file, liquid_eos_file), P_out, T_sol, T_liq),
+    ) as pool:
+        scans = list(pool.map(_scan_slab, *zip(*slabs)))
+        S_min_solid, S_max_solid, S_min_melt, S_max_melt = (
+            np.concatenate(parts) for parts in zip(*scans)
+        )
+
+        valid_solid = np.isfinite(S_min_solid) & np.isfinite(S_max_solid)
+        valid_melt = np.isfinite(S_min_melt) & np.isfinite(S_max_melt)
+        if not valid_solid.any() or not valid_melt.any():
+            log.error('Cannot determine entropy ranges for solid and/or melt phases.')
+            return {}
+
+        # The solid entropy range is extended to the melt maximum, as in
+        # Zalmoxis, so SPIDER never clamps a molten adiabat at the edge
+        S_max_melt_global = np.max(S_max_melt[valid_melt])
+        S_grid = {
+            'solid': np.linspace(
+                np.min(S_min_solid[valid_solid]),
+                max(np.max(S_max_solid[valid_solid]), S_max_melt_global),
+                n_S,
+            ),
+            'melt': np.linspace(np.min(S_min_melt[valid_melt]), S_max_melt_global, n_S),
+        }
+        futures = {
+            phase: [pool.submit(_fill_slab, phase, S_grid[phase], i0, i1) for i0, i1 in slabs]
+            for phase in ('solid', 'melt')
+        }
+        filled = {phase: [f.result() for f in futs] for phase, futs in futures.items()}
+
+    grids, valid_masks = {}, {}
+    for phase, parts in filled.items():
+        grids[phase] = {
+            prop: np.concatenate([p[0][prop] for p in parts], axis=1) for prop in _SPIDER_NAMES
+        }
+        nad_finite = np.concatenate([p[1] for p in parts], axis=1)
+        valid_masks[phase] = (
+            np.all([np.isfinite(grids[phase][prop]) for prop in _SPIDER_NAMES], axis=0)
+            & nad_finite
+        )
+        log.info(
+            '%s phase: filled %d/%d cells (%.1f%%), %d valid',
+            phase,
+            sum(p[2] for p in parts),
+            n_P * n_S,
+            100 * sum(p[2] for p in parts) / (n_P * n_S),
+            int(valid_masks[phase].sum()),
+        )
+    log.info(
+        'Filled %dx%d P-S tables in %d pressure slabs on %d workers in %.1f s',
+        n_P,
+        n_S,
+        len(slabs),
+        min(workers, len(slabs)),
+        time.perf_counter() - t0,
+    )
+
+    # SPIDER cannot hold NaN; fill the gaps from the nearest valid cell
+    for phase, phase_grids in grids.items():
+        for prop, grid in phase_grids.items():
+            if np.isnan(grid).any():
+                eos_export._fill_nan_nearest(grid)
+                if np.isnan(grid).any():
+                    log.warning(
+                        '%s %s: %d NaN remain after fill (of %d total)',
+                        phase,
+                        prop,
+                        int(np.sum(np.isnan(grid))),
+                        grid.size,
+                    )
+
+    if output_dir is not None:
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for prop, spider_name in _SPIDER_NAMES.items():
+            for phase in ('solid', 'melt'):
+                eos_export._write_spider_2d(
+                    str(output_dir / f'{spider_name}_{phase}.dat'),
+                    P_out,
+                    S_grid[phase],
+                    grids[phase][prop],
+                    _SCALES[prop],
+                )
+        for phase, mask in valid_masks.items():
+            eos_export._write_valid_mask(
+                str(output_dir / f'valid_mask_{phase}.dat'), mask, phase
+            )
+
+    return {
+        'P_Pa': P_out,
+        'S_solid': S_grid['solid'],
+        'S_melt': S_grid['melt'],
+        'solid': grids['solid'],
+        'melt': grids['melt'],
+        'valid': valid_masks,
+        'output_dir': str(output_dir) if output_dir else None,
+    }
+
+
+def _slice_mask(src: str, dest: str, k: int) -> None:
+    """Keep the first `k` pressure columns of a validity mask."""
+    with open(src) as f:
+        lines = f.readlines()
+    with open(dest, 'w') as f:
+        for line in lines:
+            if line.startswith('#'):
+                f.write(re.sub(r'x \d+ columns', f'x {k} columns', line))
+            elif line.strip():
+                f.write(' '.join(line.split()[:k]) + '\n')
+
+
+def slice_tables(src_dir: str, dest_dir: str, P_max: float) -> float:
+    """Write the table set in `src_dir`, cut to a lower pressure ceiling, to `dest_dir`.
+
+    Every table keeps its nodes up to and including the first one at or
+    above `P_max`, with their values unchanged, so the cut set covers the
+    requested range on the cached set's uniform pressure grid. The 2D
+    tables and validity masks keep their entropy grids; a 1D phase boundary
+    is cut after its first node at or above the new ceiling.
+
+    Parameters
+    ----------
+    src_dir : str
+        Complete cached table set whose ceiling is at least `P_max`.
+    dest_dir : str
+        Existing directory for the cut set.
+    P_max : float
+        Pressure ceiling of the requested set [Pa].
+
+    Returns
+    -------
+    float
+        Pressure ceiling of the cut set [Pa], the first cached node at or
+        above `P_max`.
+    """
+    from proteus.interior_energetics.table_cache import (
+        grid_row_template,
+        read_spider_table,
+        write_spider_table,
+    )
+
+    names = sorted(
+        name
+        for name in os.listdir(src_dir)
+        if not name.startswith('.') and os.path.isfile(os.path.join(src_dir, name))
+    )
+    tables = {
+        name: read_spider_table(os.path.join(src_dir, name))
+        for name in names
+        if not name.startswith('valid_mask_')
+    }
+
+    # The 2D tables share one pressure grid
+    k = P_top = None
+    for header, data in tables.values():
+        fields = header[0].lstrip('#').split()
+        if len(fields) == 3:
+            nP = int(fields[1])
+            P_src = np.asarray(data[:nP, 0], dtype=float) * float(
+                header[4].lstrip('#').split()[0]
+            )
+            k = min(int(np.searchsorted(P_src, P_max)) + 1, nP)
+            P_top = float(P_src[k - 1])
+            break
+    if k is None:
+        raise ValueError(f'No 2D P-S table in {src_dir}')
+
+    # The 2D tables of a phase share their grid, hence their first two columns
+    templates = {}
+    for name, (header, data) in tables.items():
+        fields = header[0].lstrip('#').split()
+        if len(fields) == 3:
+            nP, nS = int(fields[1]), int(fields[2])
+            data = np.asarray(data, dtype=float).reshape(nS, nP, 3)[:, :k].reshape(-1, 3)
+            key = (data[:k, 0].tobytes(), data[::k, 1].tobytes())
+            if key not in templates:
+                templates[key] = grid_row_template(data[:k, 0], data[::k, 1])
+            write_spider_table(
+                os.path.join(dest_dir, name),
+                [f'# 5 {k} {nS}\n', *header[1:]],
+                data,
+                templates[key],
+            )
+        else:
+            data = np.asarray(data, dtype=float)
+            P_scaled = P_top / float(header[4].lstrip('#').split()[0])
+            n = min(int(np.searchsorted(data[:, 0], P_scaled)) + 1, len(data))
+            write_spider_table(
+                os.path.join(dest_dir, name), [f'# 5 {n}\n', *header[1:]], data[:n]
+            )
+    for name in names:
+        if name.startswith('valid_mask_'):
+            _slice_mask(os.path.join(src_dir, name), os.path.join(dest_dir, name), k)
+    return P_top
+
+
+def cache_max_size() -> int:
+    """Return the cache size bound in bytes from ``PROTEUS_PS_CACHE_MAX_SIZE``."""
+    return disk_cache.max_size_from_env(CACHE_MAX_SIZE_ENV, DEFAULT_MAX_SIZE)
+
+
+def _read_marker(entry_dir: str) -> str | None:
+    try:
+        with open(os.path.join(entry_dir, CACHE_MARKER)) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def find_superset(cache_root: str, cache_key: str) -> tuple[str, float] | None:
+    """Find a cached table set that covers the request `cache_key`.
+
+    A set qualifies when its key differs from `cache_key` only in the
+    pressure ceiling, and that ceiling lies between the requested one and
+    ``SUPERSET_MAX_RATIO`` times it; the lowest such ceiling wins.
+
+    Parameters
+    ----------
+    cache_root : str
+        The ``PROTEUS_PS_CACHE_DIR`` directory.
+    cache_key : str
+        Key of the requested table set, from ``_ps_cache_key``.
+
+    Returns
+    -------
+    tuple or None
+        ``(entry_dir, P_max)`` of the qualifying set, or None.
+    """
+    match = _KEY_PATTERN.match(cache_key)
+    if match is None:
+        return None
+    P_max, rest = float(match.group(1)), match.group(2)
+
+    best = None
+    try:
+        entries = list(os.scandir(cache_root))
+    except OSError:
+        return None
+    for item in entries:
+        if item.name.startswith('.') or not item.is_dir(follow_symlinks=False):
+            continue
+        key = _read_marker(item.path)
+        m = _KEY_PATTERN.match(key) if key else None
+        if m is None or m.group(2) != rest:
+            continue
+        P_max_c = float(m.group(1))
+        if not P_max <= P_max_c <= SUPERSET_MAX_RATIO * P_max:
+            continue
+        if not all(
+            os.path.isfile(os.path.join(item.path, name))
+            for name in ('solidus_P-S.dat', 'liquidus_P-S.dat')
+        ):
+            continue
+        if best is None or P_max_c < best[1]:
+            best = (item.path, P_max_c)
+    return best
+
+
+def touch(entry_dir: str) -> None:
+    """Record a use of a cached table set for least-recently-used eviction."""
+    with contextlib.suppress(OSError):
+        os.utime(os.path.join(entry_dir, CACHE_MARKER))
+
+
+def evict(cache_root: str, max_size: int, keep: str | None = None) -> list[str]:
+    """Remove least recently used table sets until the cache fits in `max_size`.
+
+    Recency is the modification time of each set's marker, refreshed by
+    :func:`touch` on every reuse. Sets without a marker are incomplete and
+    only counted; stale staging directories left by killed generators are
+    removed.
+
+    Parameters
+    ----------
+    cache_root : str
+        The ``PROTEUS_PS_CACHE_DIR`` directory.
+    max_size : int
+        Size bound in bytes.
+    keep : str or None
+        Table directory that is never evicted, normally the one in use.
+
+    Returns
+    -------
+    list of str
+        Names of the evicted table directories.
+    """
+    entries, total = [], 0
+    for item in os.scandir(cache_root):
+        if not item.is_dir(follow_symlinks=False):
+            continue
+        if item.name.startswith('.gen-'):
+            disk_cache.remove_if_stale(item.path)
+            continue
+        size = disk_cache.dir_size(item.path)
+        total += size
+        try:
+            mtime = os.stat(os.path.join(item.path, CACHE_MARKER)).st_mtime
+        except OSError:
+            continue
+        entries.append((mtime, item.name, size))
+
+    def remove(name: str) -> None:
+        path = os.path.join(cache_root, name)
+        # Drop the marker first so no reader trusts a half-removed set
+        with contextlib.suppress(OSError):
+            os.remove(os.path.join(path, CACHE_MARKER))
+        shutil.rmtree(path, ignore_errors=True)
+
+    keep_name = None
+    if keep is not None and os.path.dirname(os.path.abspath(keep)) == os.path.abspath(
+        cache_root
+    ):
+        keep_name = os.path.basename(os.path.abspath(keep))
+    evicted = disk_cache.evict_lru(entries, max_size, remove, keep=keep_name, total=total)
+
+    if evicted:
+        log.info('Evicted %d P-S table sets to stay below %d bytes', len(evicted), max_size)
+    return evicted
@@ -0,0 +1,138 @@
+# Linear-response surrogate for dynamic Zalmoxis structure updates
+"""Predict the outcome of a structure re-solve from the re-solves already done.
+
+During coupled evolution ``update_structure_from_interior`` re-solves the
+Zalmoxis structure whenever T_magma, the global melt fraction or the
+dissolved-volatile fraction of the mantle drifts past its trigger threshold.
+Late in a run most of these re-solves move the radius by far less than the
+mesh tolerance, yet each costs a full Picard/Newton solve plus a mesh rewrite.
+
+``StructureSurrogate`` records the state (T_magma, Phi_global, dissolved
+volatile mass fraction) and the solved structure (R_int, gravity) of every
+accepted re-solve in the run. From the most recent ones it fits a
+linear response of ln R_int and ln gravity around the latest solve, and
+predicts how far a new re-solve would move them. The predicted error of
+keeping the current structure is that predicted shift plus the largest
+recent residual of the fit against the solves that followed it. The mesh
+scales homologously with R_int, so the predicted radius shift is also the
+predicted mesh shift.
+
+A prediction is only made once the fit has been validated against later
+solves, and never outside the range of states already sampled; the fit is
+the shared :class:`~proteus.utils.surrogate.LinearResponse`.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from proteus.utils.surrogate import LinearResponse
+
+log = logging.getLogger('fwl.' + __name__)
+
+# Dissolved species summed into the volatile-fraction feature
+SURROGATE_SPECIES = ('H2O', 'H2')
+
+
+@dataclass(frozen=True)
+class SurrogatePrediction:
+    """Predicted structure for the current interior state.
+
+    Attributes
+    ----------
+    R_int : float
+        Predicted interior radius [m].
+    gravity : float
+        Predicted surface gravity [m s-2].
+    mesh_shift : float
+        Predicted fractional radius shift of the mesh.
+    error : float
+        Predicted relative error of keeping the current structure.
+    """
+
+    R_int: float
+    gravity: float
+    mesh_shift: float
+    error: float
+
+
+def features(hf_row: dict) -> np.ndarray:
+    """State variables the structure responds to.
+
+    Parameters
+    ----------
+    hf_row : dict
+        Current runtime variables.
+
+    Returns
+    -------
+    numpy.ndarray
+        T_magma [K], Phi_global and the dissolved volatile mass fraction of
+        the mantle (zero without a mantle mass).
+    """
+    M_mantle = float(hf_row.get('M_mantle', 0.0) or 0.0)
+    w_vol = 0.0
+    if M_mantle > 0:
+        w_vol = sum(float(hf_row.get(f'{s}_kg_liquid', 0.0)) for s in SURROGATE_SPECIES)
+        w_vol /= M_mantle
+    return np.array([float(hf_row['T_magma']), float(hf_row['Phi_global']), w_vol], dtype=float)
+
+
+def _targets(hf_row: dict) -> np.ndarray:
+    return np.log([float(hf_row['R_int']), float(hf_row['gravity'])])
+
+
+class StructureSurrogate(LinearResponse):
+    """Per-run history of structure re-solves and their linear response."""
+
+    def __init__(self):
+        super().__init__()
+        self.skipped = 0
+
+    def record(self, hf_row: dict) -> None:
+        """Add an accepted re-solve, first scoring the fit against it.
+
+        Parameters
+        ----------
+        hf_row : dict
+            Runtime variables holding the newly solved structure.
+        """
+        x = features(hf_row)
+        y = _targets(hf_row)
+        if not np.all(np.isfinite(x)) or not np.all(np.isfinite(y)):
+            return
+        residual = self.add(x, y, lambda predicted, actual: np.max(np.abs(predicted - actual)))
+        if residual is not None:
+            log.debug('Structure surrogate residual against new solve: %.3e', residual)
+
+    def predict(self, hf_row: dict) -> SurrogatePrediction | None:
+        """Predict the structure a re-solve at the current state would return.
+
+        Parameters
+        ----------
+        hf_row : dict
+            Current runtime variables.
+
+        Returns
+        -------
+        SurrogatePrediction or None
+            None until ``MIN_SOLVES`` solves and a fit residual are recorded,
+            or when the current state lies outside the sampled range.
+        """
+        if not self.validated:
+            return None
+        response = self.response(features(hf_row))
+        if response is None:
+            return None
+        ln_R, ln_g = self.latest + response
+        shift = float(np.max(np.abs(response)))
+        return SurrogatePrediction(
+            R_int=math.exp(ln_R),
+            gravity=math.exp(ln_g),
+            mesh_shift=abs(math.expm1(response[0])),
+            error=shift + self.residual,
+        )
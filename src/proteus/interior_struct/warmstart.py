@@ -0,0 +1,286 @@
+# Persistent warm-start store for Zalmoxis structure solves
+"""Store of converged Zalmoxis structures and super-liquidus solves, seeding later runs.
+
+Enabled by ``PROTEUS_STRUCT_CACHE_DIR``; see :mod:`proteus.utils.disk_cache`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import math
+import os
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from proteus.utils import disk_cache
+
+if TYPE_CHECKING:
+    from proteus.config import Config
+
+log = logging.getLogger('fwl.' + __name__)
+
+# Bump when the on-disk layout changes
+STORE_FORMAT_VERSION = 1
+
+# Environment variables controlling the store
+STORE_DIR_ENV = 'PROTEUS_STRUCT_CACHE_DIR'
+STORE_MAX_SIZE_ENV = 'PROTEUS_STRUCT_CACHE_MAX_SIZE'
+DEFAULT_MAX_SIZE = 256 * 1024**2  # 256 MiB
+
+# Neighbour distance scales: ln(mass), core fraction, mantle mass fraction
+_DISTANCE_SCALES = (0.5, 0.1, 0.1)
+MAX_DISTANCE = 1.0
+
+# Mass-radius exponent of the Zalmoxis initial radius guess, R ~ M^0.282
+_RADIUS_EXPONENT = 0.282
+
+# Keys already written by this process; later re-solves of the same planet
+# during its evolution are not stored again
+_stored: set = set()
+
+
+def store_root() -> str | None:
+    """Return the store root from ``PROTEUS_STRUCT_CACHE_DIR``, or None if unset."""
+    root = os.environ.get(STORE_DIR_ENV, '').strip()
+    return os.path.abspath(root) if root else None
+
+
+def store_max_size() -> int:
+    """Return the store size bound in bytes from ``PROTEUS_STRUCT_CACHE_MAX_SIZE``."""
+    return disk_cache.max_size_from_env(STORE_MAX_SIZE_ENV, DEFAULT_MAX_SIZE)
+
+
+def eos_fingerprint(config: Config) -> str:
+    """Digest of the settings a seeding profile must share exactly.
+
+    Parameters
+    ----------
+    config : Config
+        PROTEUS configuration with a Zalmoxis structure section.
+
+    Returns
+    -------
+    str
+        Hex digest, safe to use as a directory name.
+    """
+    zc = config.interior_struct.zalmoxis
+    text = (
+        f'format={STORE_FORMAT_VERSION}\n'
+        f'core_eos={zc.core_eos}\n'
+        f'mantle_eos={zc.mantle_eos}\n'
+        f'ice_layer_eos={zc.ice_layer_eos}\n'
+        f'core_frac_mode={config.interior_struct.core_frac_mode}\n'
+        f'mushy_zone_factor={float(zc.mushy_zone_factor)!r}\n'
+        f'dry_mantle={bool(zc.dry_mantle)}\n'
+    )
+    return hashlib.sha256(text.encode()).hexdigest()[:32]
+
+
+def _coordinates(config: Config) -> tuple[float, float, float]:
+    return (
+        float(config.planet.mass_tot),
+        float(config.interior_struct.core_frac),
+        float(config.interior_struct.zalmoxis.mantle_mass_fraction),
+    )
+
+
+def _entry_name(coords: tuple[float, float, float]) -> str:
+    return '_'.join(f'{x:.9e}' for x in coords) + '.npz'
+
+
+def _parse_entry_name(name: str) -> tuple[float, float, float] | None:
+    if not name.endswith('.npz') or name.startswith(disk_cache.TMP_PREFIX):
+        return None
+    try:
+        mass, core, mantle = (float(x) for x in name[:-4].split('_'))
+    except ValueError:
+        return None
+    return mass, core, mantle
+
+
+def distance(a: tuple[float, float, float], b: tuple[float, float, float]) -> float:
+    """Scaled distance between two (mass, core fraction, mantle fraction) points.
+
+    Mass is compared in log space so that the same relative step counts the
+    same at every planet size.
+    """
+    if a[0] <= 0 or b[0] <= 0:
+        return math.inf
+    deltas = (math.log(a[0] / b[0]), a[1] - b[1], a[2] - b[2])
+    return math.sqrt(sum((d / s) ** 2 for d, s in zip(deltas, _DISTANCE_SCALES)))
+
+
+def evict(root: str, max_size: int, keep: str | None = None) -> list[str]:
+    """Remove least recently used entries until the store fits in `max_size`.
+
+    Parameters
+    ----------
+    root : str
+        Store root directory.
+    max_size : int
+        Size bound in bytes.
+    keep : str or None
+        Path that is never evicted, normally the entry just stored.
+
+    Returns
+    -------
+    list of str
+        Paths of the evicted entries.
+    """
+
+    def remove(path: str) -> None:
+        with contextlib.suppress(OSError):
+            os.unlink(path)
+
+    evicted = disk_cache.evict_lru(disk_cache.file_entries(root), max_size, remove, keep=keep)
+
+    if evicted:
+        log.info(
+            'Evicted %d structure warm-start entries to stay below %d bytes',
+            len(evicted),
+            max_size,
+        )
+    return evicted
+
+
+def _finish_store(root: str, path: str) -> None:
+    with contextlib.suppress(OSError):
+        evict(root, store_max_size(), keep=path)
+
+
+def lookup_profile(config: Config) -> tuple[np.ndarray, np.ndarray] | None:
+    """Return a seeding ``(radii, density)`` from the nearest stored structure.
+
+    Parameters
+    ----------
+    config : Config
+        PROTEUS configuration of the planet about to be solved.
+
+    Returns
+    -------
+    tuple of numpy.ndarray or None
+        Radii [m] and density [kg/m^3] of the nearest stored profile with the
+        same equations of state, rescaled to this planet's mass; None without
+        a store or without a neighbour within ``MAX_DISTANCE``.
+    """
+    root = store_root()
+    if root is None:
+        return None
+    directory = os.path.join(root, 'profiles', eos_fingerprint(config))
+    target = _coordinates(config)
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return None
+
+    best, best_name = math.inf, None
+    for name in names:
+        coords = _parse_entry_name(name)
+        if coords is None:
+            continue
+        d = distance(target, coords)
+        if d < best:
+            best, best_name = d, name
+    if best_name is None or best > MAX_DISTANCE:
+        return None
+
+    path = os.path.join(directory, best_name)
+    try:
+        with np.load(path) as data:
+            radii = np.array(data['radii'], dtype=float)
+            density = np.array(data['density'], dtype=float)
+    except Exception as e:
+        log.warning('Ignoring unreadable structure warm-start entry %s: %s', path, e)
+        return None
+    with contextlib.suppress(OSError):
+        os.utime(path)
+
+    ratio = target[0] / _parse_entry_name(best_name)[0]
+    radii *= ratio**_RADIUS_EXPONENT
+    density *= ratio ** (1.0 - 3.0 * _RADIUS_EXPONENT)
+    log.info('Seeding Zalmoxis from stored structure %s (distance %.3f)', best_name[:-4], best)
+    return radii, density
+
+
+def store_profile(config: Config, radii: np.ndarray, density: np.ndarray) -> None:
+    """Store a converged structure, once per planet per process.
+
+    Parameters
+    ----------
+    config : Config
+        PROTEUS configuration of the solved planet.
+    radii : numpy.ndarray
+        Converged radial grid [m].
+    density : numpy.ndarray
+        Converged density profile [kg/m^3].
+    """
+    root = store_root()
+    if root is None:
+        return
+    fingerprint = eos_fingerprint(config)
+    name = _entry_name(_coordinates(config))
+    if (fingerprint, name) in _stored:
+        return
+    directory = os.path.join(root, 'profiles', fingerprint)
+    try:
+        disk_cache.write_atomic(
+            os.path.join(directory, name),
+            lambda f: np.savez(
+                f,
+                radii=np.asarray(radii, dtype=float),
+                density=np.asarray(density, dtype=float),
+            ),
+        )
+    except Exception as e:
+        log.warning('Could not store structure warm-start entry: %s', e)
+        return
+    _stored.add((fingerprint, name))
+    _finish_store(root, os.path.join(directory, name))
+
+
+def _superliquidus_path(root: str, key: tuple) -> tuple[str, str]:
+    digest = hashlib.sha256(f'format={STORE_FORMAT_VERSION}\n{key!r}'.encode()).hexdigest()
+    return os.path.join(root, 'superliquidus'), f'{digest[:32]}.json'
+
+
+def lookup_superliquidus(key: tuple) -> dict | None:
+    """Return the stored super-liquidus solve for the memo `key`, if any.
+
+    Looked up by the exact memo key rather than by nearest neighbour: a
+    neighbour's surface-temperature bracket would move the solved adiabat
+    within the bisection tolerance.
+    """
+    root = store_root()
+    if root is None:
+        return None
+    directory, name = _superliquidus_path(root, key)
+    path = os.path.join(directory, name)
+    try:
+        with open(path) as f:
+            out = json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log.warning('Ignoring unreadable super-liquidus warm-start entry %s: %s', path, e)
+        return None
+    with contextlib.suppress(OSError):
+        os.utime(path)
+    return out
+
+
+def store_superliquidus(key: tuple, out: dict) -> None:
+    """Store a super-liquidus solve under the memo `key`."""
+    root = store_root()
+    if root is None:
+        return
+    directory, name = _superliquidus_path(root, key)
+    try:
+        disk_cache.write_atomic_text(os.path.join(directory, name), json.dumps(out))
+    except Exception as e:
+        log.warning('Could not store super-liquidus warm-start entry: %s', e)
+        return
+    _finish_store(root, os.path.join(directory, name))
@@ -1,6 +1,7 @@
 # Zalmoxis interior module
 from __future__ import annotations
 
+import contextlib
 import hashlib
 import logging
 import math
@@ -16,6 +17,7 @@ from scipy.interpolate import interp1d
 from zalmoxis.solver import main
 
 from proteus.config import Config
+from proteus.interior_struct import mesh_handoff, ps_tables, warmstart
 from proteus.utils.constants import (
     FEI2021_LIQUIDUS_P_CALIB_PA,
     M_earth,
@@ -23,6 +25,9 @@ from proteus.utils.constants import (
     element_list,
 )
 from proteus.utils.data import get_zalmoxis_eos_dir, get_zalmoxis_melting_curves
+from proteus.utils.disk_cache import write_atomic_text
+from proteus.utils.helper import resolve_fwl_data_dir
+from proteus.utils.jax_cache import compile_cache_report, short_fingerprint
 
 FWL_DATA_DIR = Path(os.environ.get('FWL_DATA', platformdirs.user_data_dir('fwl_data')))
 
@@ -41,10 +46,15 @@ _SUPERLIQ_N_BISECT = 12  # surface-T bisection iterations (sub-Kelvin final)
 _SUPERLIQ_MAX_S_DRIFT = 1.0e-3  # max fractional entropy drift for an in-table adiabat
 _SUPERLIQ_DEFAULT_MUSHY = 0.8  # fallback solidus = factor * liquidus
 
+# Mantle EOS families whose melting curves are read from
+# interior_struct.melting_dir (see load_zalmoxis_solidus_liquidus_functions)
+_MELTING_DIR_EOS = ('WolfBower2018', 'RTPress100TPa')
+
 # Per-process memo so the three IC call sites (structure solve, energetics
 # entropy IC, Aragog cross-check) share one solve for a given input instead of
-# repeating the ~30-probe search. Keyed on the physical inputs only, so it is
-# deterministic; tests clear it between cases (see _clear_superliquidus_cache).
+# repeating the ~30-probe search. Keyed on the physical inputs only (see
+# _superliquidus_cache_key), so it is deterministic; tests clear it between
+# cases (see _clear_superliquidus_cache).
 _SUPERLIQ_CACHE: dict = {}
 
 # CMB temperature [K] of the most recently solved super-liquidus adiabat. A
@@ -60,6 +70,11 @@ _SUPERLIQ_LAST_ANCHOR: float | None = None
 # single time instead of on every re-solve.
 _JAX_NONVIABLE_LOGGED: bool = False
 
+# Zalmoxis EOS interpolators used by the post-solve column rebuild, kept for
+# the life of the process so each structure update does not reload the tables.
+# Zalmoxis keys the entries by table path.
+_REBUILD_INTERP_CACHE: dict = {}
+
 
 def _clear_superliquidus_cache() -> None:
     """Drop the cached super-liquidus solves (used by tests to avoid leakage)."""
@@ -607,6 +622,39 @@ def _resolve_zalmoxis_cmb_temperature(
     return float(res['cmb_T'])
 
 
+def _superliquidus_cache_key(config: Config, P_cmb: float, delta: float) -> tuple:
+    """Memo key of a super-liquidus solve.
+
+    Besides the CMB pressure and superheat, the key carries every input the
+    adiabat and the liquidus it is checked against depend on: the EOS
+    settings (:func:`warmstart.eos_fingerprint`, which includes
+    ``mushy_zone_factor`` for the derived PALEOS solidus) and, for the mantle
+    EOS that read their melting curves from ``interior_struct.melting_dir``,
+    that directory and a digest of its solidus and liquidus files.
+    """
+    mantle_eos = str(config.interior_struct.zalmoxis.mantle_eos)
+    melting = None
+    if mantle_eos.startswith(_MELTING_DIR_EOS) and config.interior_struct.melting_dir:
+        folder = (
+            resolve_fwl_data_dir()
+            / 'interior_lookup_tables'
+            / 'Melting_curves'
+            / config.interior_struct.melting_dir
+        )
+        digest = hashlib.sha256()
+        for name in ('solidus_P-T.dat', 'liquidus_P-T.dat'):
+            with contextlib.suppress(OSError):
+                digest.update((folder / name).read_bytes())
+        melting = (str(config.interior_struct.melting_dir), digest.hexdigest()[:16])
+    return (
+        round(P_cmb / 1e6),
+        round(delta, 3),
+        mantle_eos,
+        warmstart.eos_fingerprint(config),
+        melting,
+    )
+
+
 def solve_superliquidus_adiabat(config: Config, hf_row: dict | None) -> dict:
     """Solve for the coolest fully molten adiabat with a controlled superheat.
 
@@ -690,7 +738,11 @@ def solve_superliquidus_adiabat(config: Config, hf_row: dict | None) -> dict:
     mantle_eos = config.interior_struct.zalmoxis.mantle_eos
     P_surface = 1e5  # 1 bar surface anchor for the adiabat
     global _SUPERLIQ_LAST_ANCHOR
-    _cache_key = (round(P_cmb / 1e6), round(delta, 3), str(mantle_eos))
+    _cache_key = _superliquidus_cache_key(config, P_cmb, delta)
+    if _cache_key not in _SUPERLIQ_CACHE:
+        stored = warmstart.lookup_superliquidus(_cache_key)
+        if stored is not None:
+            _SUPERLIQ_CACHE[_cache_key] = stored
     if _cache_key in _SUPERLIQ_CACHE:
         cached = dict(_SUPERLIQ_CACHE[_cache_key])
         _SUPERLIQ_LAST_ANCHOR = float(cached['cmb_T'])
@@ -866,6 +918,7 @@ def solve_superliquidus_adiabat(config: Config, hf_row: dict | None) -> dict:
         'P_cmb': P_cmb,
     }
     _SUPERLIQ_CACHE[_cache_key] = dict(out)
+    warmstart.store_superliquidus(_cache_key, out)
     _SUPERLIQ_LAST_ANCHOR = float(out['cmb_T'])
     return out
 
@@ -1558,8 +1611,7 @@ def load_zalmoxis_solidus_liquidus_functions(mantle_eos: str, config: Config):
     tuple or None
         (solidus_func, liquidus_func) callable P [Pa] -> T [K], or None.
     """
-    _TDEP_PREFIXES = ('WolfBower2018', 'RTPress100TPa')
-    if mantle_eos.startswith(_TDEP_PREFIXES):
+    if mantle_eos.startswith(_MELTING_DIR_EOS):
         return get_zalmoxis_melting_curves(config)
 
     # PALEOS unified and PALEOS-2phase: both use the same analytic Belonoshko+2005 /
@@ -1677,14 +1729,9 @@ def write_spider_mesh_file(
     g_b = -np.abs(g_b)
     g_s = -np.abs(g_s)
 
-    # Write mesh file
+    # Write mesh file, keeping its arrays for the blending and entropy remap
     mesh_path = os.path.join(outdir, 'data', 'spider_mesh.dat')
-    with open(mesh_path, 'w') as f:
-        f.write(f'# {num_basic} {num_staggered}\n')
-        for i in range(num_basic):
-            f.write(f'{r_b[i]:.15e} {P_b[i]:.15e} {rho_b[i]:.15e} {g_b[i]:.15e}\n')
-        for i in range(num_staggered):
-            f.write(f'{r_s[i]:.15e} {P_s[i]:.15e} {rho_s[i]:.15e} {g_s[i]:.15e}\n')
+    mesh_handoff.publish_spider_mesh(mesh_path, (r_b, P_b, rho_b, g_b, r_s, P_s, rho_s, g_s))
 
     log.info(
         'Wrote SPIDER mesh file: %s (%d basic + %d staggered nodes)',
@@ -1777,35 +1824,13 @@ def _publish_ps_tables(src_dir: str, dest_dir: str) -> None:
     """
 
     for name in sorted(os.listdir(src_dir)):
-        os.replace(os.path.join(src_dir, name), os.path.join(dest_dir, name))
-
-
-def _atomic_write_text(path: str, text: str) -> None:
-    """Write `text` to `path` so readers never observe a partial file.
-
-    The content is written to a uniquely named temporary file in the same
-    directory and then moved into place with :func:`os.replace`, an atomic
-    rename within one filesystem. Concurrent runs sharing the destination
-    therefore either see the previous file or a complete new one, never a
-    truncated write.
-
-    Parameters
-    ----------
-    path : str
-        Destination file path.
-    text : str
-        Content to write.
-    """
-
-    dest_dir = os.path.dirname(path)
-    fd, tmp = tempfile.mkstemp(prefix='.tmp-', dir=dest_dir)
-    try:
-        with os.fdopen(fd, 'w') as f:
-            f.write(text)
-        os.replace(tmp, path)
-    finally:
-        if os.path.exists(tmp):
-            os.remove(tmp)
+        src = os.path.join(src_dir, name)
+        if os.path.isdir(src):
+            # The binary sidecars of table_cache, written with the tables
+            os.makedirs(os.path.join(dest_dir, name), exist_ok=True)
+            _publish_ps_tables(src, os.path.join(dest_dir, name))
+            continue
+        os.replace(src, os.path.join(dest_dir, name))
 
 
 def _ps_cache_key(
@@ -1902,7 +1927,7 @@ def generate_spider_tables(config: Config, outdir: str):
         Keys ``'eos_dir'``, ``'solidus_path'``, ``'liquidus_path'`` with
         absolute paths. Returns None if the mantle EOS is not PALEOS.
     """
-    from zalmoxis.eos_export import generate_spider_eos_tables, generate_spider_phase_boundaries
+    from zalmoxis.eos_export import generate_spider_phase_boundaries
     from zalmoxis.melting_curves import get_solidus_liquidus_functions
 
     mantle_eos = config.interior_struct.zalmoxis.mantle_eos
@@ -2054,43 +2079,55 @@ def generate_spider_tables(config: Config, outdir: str):
     # EOS reuse one generated table instead of each rebuilding the slow
     # full-resolution PALEOS P-S table. The cache_key encodes everything that
     # changes the table (P_max, nP, nS, mushy_zone_factor, layout, and the
-    # resolved EOS identity), so reuse is exact.
-    _ps_cache_root = os.environ.get('PROTEUS_PS_CACHE_DIR')
+    # resolved EOS identity), so an exact-key hit is exact reuse. A set that
+    # differs only in a slightly higher P_max also covers this planet; it is
+    # cut at the first pressure node above P_max, without interpolation, into
+    # this key's directory (see ps_tables.find_superset).
+    _ps_cache_root = os.environ.get(ps_tables.CACHE_DIR_ENV)
     if _ps_cache_root:
         _safe_key = cache_key.replace('.', 'p').replace('=', '-').replace('+', '')
         spider_eos_dir = os.path.join(_ps_cache_root, _safe_key)
         os.makedirs(spider_eos_dir, exist_ok=True)
-        # The shared-cache tables live outside the run directory, so a resumed
-        # run cannot find them via the per-run output/<run>/data/spider_eos
-        # path. Leave a pointer so resume can follow the tables to the cache.
-        _write_ps_cache_pointer(outdir, spider_eos_dir)
     else:
         spider_eos_dir = os.path.join(outdir, 'data', 'spider_eos')
 
+    def _use_cached(eos_dir: str) -> dict:
+        if _ps_cache_root:
+            # The shared-cache tables live outside the run directory, so a
+            # resumed run cannot find them via the per-run
+            # output/<run>/data/spider_eos path. Leave a pointer so resume
+            # can follow the tables to the cache.
+            _write_ps_cache_pointer(outdir, eos_dir)
+            ps_tables.touch(eos_dir)
+        # File names must match the writer in
+        # zalmoxis.eos_export.generate_spider_phase_boundaries, which emits
+        # solidus_P-S.dat / liquidus_P-S.dat.
+        return {
+            'eos_dir': eos_dir,
+            'solidus_path': os.path.join(eos_dir, 'solidus_P-S.dat'),
+            'liquidus_path': os.path.join(eos_dir, 'liquidus_P-S.dat'),
+        }
+
     # Cache check: skip regeneration if tables exist and pressure range unchanged.
     # The pressure range depends on planet mass, which doesn't change during evolution.
-    cache_marker = os.path.join(spider_eos_dir, '.cache_info.txt')
+    cache_marker = os.path.join(spider_eos_dir, ps_tables.CACHE_MARKER)
     if os.path.isfile(cache_marker):
         with open(cache_marker) as f:
             existing_key = f.read().strip()
         if existing_key == cache_key:
-            # Tables are up to date. File names must match the writer in
-            # zalmoxis.eos_export.generate_spider_phase_boundaries, which
-            # emits solidus_P-S.dat / liquidus_P-S.dat.
-            solidus_path = os.path.join(spider_eos_dir, 'solidus_P-S.dat')
-            liquidus_path = os.path.join(spider_eos_dir, 'liquidus_P-S.dat')
-            if os.path.isfile(solidus_path) and os.path.isfile(liquidus_path):
+            cached = _use_cached(spider_eos_dir)
+            if os.path.isfile(cached['solidus_path']) and os.path.isfile(
+                cached['liquidus_path']
+            ):
                 log.info(
                     'Reusing cached PALEOS-derived P-S entropy tables (P_max=%.2e, %dx%d)',
                     P_max,
                     nP,
                     nS,
                 )
-                return {
-                    'eos_dir': spider_eos_dir,
-                    'solidus_path': solidus_path,
-                    'liquidus_path': liquidus_path,
-                }
+                return cached
+
+    superset = ps_tables.find_superset(_ps_cache_root, cache_key) if _ps_cache_root else None
 
     # Choose where to generate. For a shared PROTEUS_PS_CACHE_DIR the tables are
     # written into a private staging directory on the same filesystem and then
@@ -2104,39 +2141,54 @@ def generate_spider_tables(config: Config, outdir: str):
         gen_dir = spider_eos_dir
 
     try:
-        # Generate phase boundaries
-        log.info(
-            'Generating PALEOS-derived P-S phase boundaries (%d P points)...',
-            nP,
-        )
-        generate_spider_phase_boundaries(
-            solidus_func=solidus_func,
-            liquidus_func=liquidus_func,
-            eos_file=eos_file,
-            P_range=(1e5, P_max),
-            n_P=nP,
-            output_dir=gen_dir,
-            solid_eos_file=solid_eos,
-            liquid_eos_file=liquid_eos,
-        )
+        if superset is not None:
+            superset_dir, superset_P_max = superset
+            P_top = ps_tables.slice_tables(superset_dir, gen_dir, P_max)
+            ps_tables.touch(superset_dir)
+            log.info(
+                'Cut cached PALEOS-derived P-S entropy tables from P_max=%.2e '
+                'to P_max=%.2e for P_max=%.2e (%dx%d)',
+                superset_P_max,
+                P_top,
+                P_max,
+                nP,
+                nS,
+            )
+        else:
+            # Generate phase boundaries
+            log.info(
+                'Generating PALEOS-derived P-S phase boundaries (%d P points)...',
+                nP,
+            )
+            generate_spider_phase_boundaries(
+                solidus_func=solidus_func,
+                liquidus_func=liquidus_func,
+                eos_file=eos_file,
+                P_range=(1e5, P_max),
+                n_P=nP,
+                output_dir=gen_dir,
+                solid_eos_file=solid_eos,
+                liquid_eos_file=liquid_eos,
+            )
 
-        # Generate full EOS tables
-        log.info(
-            'Generating PALEOS-derived P-S EOS tables (%d x %d)...',
-            nP,
-            nS,
-        )
-        generate_spider_eos_tables(
-            eos_file=eos_file,
-            solidus_func=solidus_func,
-            liquidus_func=liquidus_func,
-            P_range=(1e5, P_max),
-            n_P=nP,
-            n_S=nS,
-            output_dir=gen_dir,
-            solid_eos_file=solid_eos,
-            liquid_eos_file=liquid_eos,
-        )
+            # Generate full EOS tables
+            log.info(
+                'Generating PALEOS-derived P-S EOS tables (%d x %d)...',
+                nP,
+                nS,
+            )
+            ps_tables.generate_spider_eos_tables(
+                eos_file=eos_file,
+                solidus_func=solidus_func,
+                liquidus_func=liquidus_func,
+                P_range=(1e5, P_max),
+                n_P=nP,
+                n_S=nS,
+                output_dir=gen_dir,
+                solid_eos_file=solid_eos,
+                liquid_eos_file=liquid_eos,
+                workers=config.interior_struct.zalmoxis.lookup_workers,
+            )
 
         # Publish staged tables into the shared cache with atomic renames.
         if gen_dir != spider_eos_dir:
@@ -2148,17 +2200,14 @@ def generate_spider_tables(config: Config, outdir: str):
     # Write the cache marker last, atomically, so a concurrent reader only
     # trusts the directory once every table file is already in place.
     try:
-        _atomic_write_text(cache_marker, cache_key)
+        write_atomic_text(cache_marker, cache_key)
     except OSError:
         pass
+    if _ps_cache_root:
+        with contextlib.suppress(OSError):
+            ps_tables.evict(_ps_cache_root, ps_tables.cache_max_size(), keep=spider_eos_dir)
 
-    # File names match the writer in zalmoxis.eos_export, which emits
-    # solidus_P-S.dat / liquidus_P-S.dat; use the published locations.
-    return {
-        'eos_dir': spider_eos_dir,
-        'solidus_path': os.path.join(spider_eos_dir, 'solidus_P-S.dat'),
-        'liquidus_path': os.path.join(spider_eos_dir, 'liquidus_P-S.dat'),
-    }
+    return _use_cached(spider_eos_dir)
 
 
 def compute_structure_mass_desync(radii, density, mass_enclosed) -> float:
@@ -2199,6 +2248,119 @@ def compute_structure_mass_desync(radii, density, mass_enclosed) -> float:
     return abs(shell_mass_trapezoid - accumulator_total) / accumulator_total
 
 
+def _rebuild_columns_on_temperature(
+    radii,
+    pressure,
+    density,
+    cmb_index: int,
+    temperature_arrays: tuple,
+    mat_dicts: dict,
+    core_eos: str,
+    mantle_eos: str,
+    melt_funcs,
+    mushy_zone_factor: float = 1.0,
+    mantle_mixture=None,
+    mushy_zone_factors=None,
+    volatile_profile=None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Re-evaluate the density and temperature columns of a solved structure
+    against a tabulated temperature profile.
+
+    The temperature at each node is interpolated from `temperature_arrays`
+    along radius and clamped to its first value below its first radius. The
+    density is evaluated at the node pressure and that temperature with one
+    batched EOS call per layer. A wet mantle (`mantle_mixture` given) goes
+    through the blended evaluator, with the per-shell melt fraction from the
+    melting curves and the fractions from `volatile_profile`. Nodes where
+    the EOS returns no finite density keep the solver's value. The EOS
+    interpolators persist between calls in ``_REBUILD_INTERP_CACHE``.
+
+    Parameters
+    ----------
+    radii, pressure, density : array_like
+        Radius [m], pressure [Pa] and density [kg m-3] from the solve.
+    cmb_index : int
+        Index of the first mantle node.
+    temperature_arrays : tuple of array_like
+        ``(r, T)``: radius [m], increasing, and temperature [K].
+    mat_dicts : dict
+        Zalmoxis EOS registry.
+    core_eos, mantle_eos : str
+        EOS identifiers of the core and the dry mantle.
+    melt_funcs : tuple or None
+        ``(solidus, liquidus)`` functions of pressure, or None.
+    mushy_zone_factor : float
+        Mushy-zone factor for the bare EOS evaluations.
+    mantle_mixture : LayerMixture, optional
+        Extended mantle mixture of a wet solve.
+    mushy_zone_factors : dict or float, optional
+        Per-component mushy-zone factors for the blended evaluation.
+    volatile_profile : VolatileProfile, optional
+        Per-shell volatile fractions for the blended evaluation.
+
+    Returns
+    -------
+    density, temperature : np.ndarray
+        The rebuilt columns.
+    """
+    from zalmoxis.eos.dispatch import calculate_density_batch
+
+    radii = np.asarray(radii, dtype=float)
+    pressure = np.asarray(pressure, dtype=float)
+    r_ref, T_ref = temperature_arrays
+    sol_f, liq_f = (
+        melt_funcs if isinstance(melt_funcs, tuple) and len(melt_funcs) == 2 else (None, None)
+    )
+
+    temperature = np.where(
+        radii <= float(r_ref[0]), float(T_ref[0]), np.interp(radii, r_ref, T_ref)
+    )
+
+    interp_cache = _REBUILD_INTERP_CACHE
+    rho = np.empty(len(radii))
+    core, mantle = slice(0, cmb_index), slice(cmb_index, None)
+    rho[core] = calculate_density_batch(
+        pressure[core],
+        temperature[core],
+        mat_dicts,
+        core_eos,
+        sol_f,
+        liq_f,
+        interp_cache,
+        mushy_zone_factor,
+    )
+    if mantle_mixture is not None:
+        from zalmoxis.mixing import calculate_mixed_density_batch
+
+        # The condensed and binodal sigmoid parameters stay at the
+        # zalmoxis.mixing defaults, the same values the solver resolves
+        # when config_params carries no overrides (PROTEUS sets none).
+        rho[mantle] = calculate_mixed_density_batch(
+            pressure[mantle],
+            temperature[mantle],
+            mantle_mixture,
+            mat_dicts,
+            sol_f,
+            liq_f,
+            interp_cache,
+            mushy_zone_factors=mushy_zone_factors,
+            volatile_profile=volatile_profile,
+        )
+    else:
+        rho[mantle] = calculate_density_batch(
+            pressure[mantle],
+            temperature[mantle],
+            mat_dicts,
+            mantle_eos,
+            sol_f,
+            liq_f,
+            interp_cache,
+            mushy_zone_factor,
+        )
+    rho = np.where(np.isfinite(rho), rho, np.asarray(density, dtype=float))
+    return rho, temperature
+
+
 def zalmoxis_solver(
     config: Config,
     outdir: str,
@@ -2480,18 +2642,29 @@ def zalmoxis_solver(
         )
         _seed_density = _density_cache['density'] if _seed_match else None
         _seed_radii = _density_cache['radii'] if _seed_match else None
-        model_results = main(
-            config_params,
-            material_dictionaries=mat_dicts,
-            melting_curves_functions=melt_funcs,
-            input_dir=input_data_dir,
-            volatile_profile=volatile_profile,
-            temperature_function=_tf_effective,
-            temperature_arrays=temperature_arrays,
-            p_center_hint=None if _drop_callable else hf_row.get('P_center'),
-            initial_density=_seed_density,
-            initial_radii=_seed_radii,
-        )
+        if not _drop_callable and not _seed_match:
+            # First solve of this planet in the process: start from the
+            # nearest structure converged by an earlier run, if one is stored
+            stored = warmstart.lookup_profile(config)
+            if stored is not None:
+                _seed_radii, _seed_density = stored
+        with compile_cache_report(
+            'zalmoxis',
+            num_layers=config_params.get('num_layers'),
+            eos=short_fingerprint(repr(config_params.get('layer_eos_config'))),
+        ):
+            model_results = main(
+                config_params,
+                material_dictionaries=mat_dicts,
+                melting_curves_functions=melt_funcs,
+                input_dir=input_data_dir,
+                volatile_profile=volatile_profile,
+                temperature_function=_tf_effective,
+                temperature_arrays=temperature_arrays,
+                p_center_hint=None if _drop_callable else hf_row.get('P_center'),
+                initial_density=_seed_density,
+                initial_radii=_seed_radii,
+            )
 
     # Extract results from the model
     radii = model_results['radii']
@@ -2668,85 +2841,39 @@ def zalmoxis_solver(
     # evolution (~10% T-driven density error at the CMB in the
     # PALEOS-2phase melt regime). Recompute both columns here from
     # (P, T_aragog) using numpy EOS before any downstream consumer reads
-    # them. When the callable was honored on the numpy path instead, the
-    # solver's own columns already reflect the evolved T(r) and no rebuild
-    # runs. Wet solves rebuild the mantle through the same per-shell blend
-    # the numpy solver's density update evaluates (calculate_mixed_density
-    # on the extended mantle mixture with the VolatileProfile at the local
-    # melt fraction), so the written column keeps the dissolved-volatile
-    # contribution instead of collapsing to the bare dry mantle EOS.
+    # them, with one batched EOS evaluation per layer. When the callable was
+    # honored on the numpy path instead, the solver's own columns already
+    # reflect the evolved T(r) and no rebuild runs. Wet solves rebuild the
+    # mantle through the same per-shell blend the numpy solver's density
+    # update evaluates (calculate_mixed_density on the extended mantle
+    # mixture with the VolatileProfile at the local melt fraction), so the
+    # written column keeps the dissolved-volatile contribution instead of
+    # collapsing to the bare dry mantle EOS.
     if _drop_callable:
-        from zalmoxis.eos.dispatch import calculate_density as _calc_rho
-
         # Wet path: the extended mantle mixture (primary silicate plus
         # profile-managed volatiles), parsed from the same EOS string the
         # solver parses, blended per shell by the profile.
         _mantle_mixture = None
         if volatile_profile is not None:
-            from zalmoxis.mixing import calculate_mixed_density as _calc_rho_mixed
             from zalmoxis.mixing import parse_layer_components as _parse_mixture
 
             _mantle_mixture = _parse_mixture(config_params['layer_eos_config']['mantle'])
 
-        _r_ref, _T_ref = temperature_arrays
-        _T_ref_cmb = float(_T_ref[0])
-        _core_eos = config.interior_struct.zalmoxis.core_eos
-        _mantle_eos = config.interior_struct.zalmoxis.mantle_eos
-        _mzf = config.interior_struct.zalmoxis.mushy_zone_factor
-        _sol_f, _liq_f = (
-            melt_funcs
-            if isinstance(melt_funcs, tuple) and len(melt_funcs) == 2
-            else (None, None)
+        _rho_fixed, _T_fixed = _rebuild_columns_on_temperature(
+            radii,
+            pressure,
+            density,
+            cmb_index,
+            temperature_arrays,
+            mat_dicts,
+            config.interior_struct.zalmoxis.core_eos,
+            config.interior_struct.zalmoxis.mantle_eos,
+            melt_funcs,
+            mushy_zone_factor=config.interior_struct.zalmoxis.mushy_zone_factor,
+            mantle_mixture=_mantle_mixture,
+            mushy_zone_factors=config_params.get('mushy_zone_factors'),
+            volatile_profile=volatile_profile,
         )
-        _interp_cache: dict = {}
-        _rho_fixed = np.zeros(len(radii))
-        _T_fixed = np.zeros(len(radii))
-        for _i in range(len(radii)):
-            _r = float(radii[_i])
-            _P = float(pressure[_i])
-            # r-indexed T: below r_ref[0] (= first Aragog staggered node
-            # near CMB), clamp to T_cmb; else interp along the Aragog grid.
-            if _r <= float(_r_ref[0]):
-                _T = _T_ref_cmb
-            else:
-                _T = float(np.interp(_r, _r_ref, _T_ref))
-            _T_fixed[_i] = _T
-            if _mantle_mixture is not None and _i >= cmb_index:
-                # Wet mantle node: same evaluation as the numpy solver's
-                # density update. calculate_mixed_density computes the
-                # local melt fraction from the melting curves at this
-                # node's (P, T) (lever rule in compute_melt_fraction) and
-                # takes the per-component fractions from
-                # volatile_profile.apply_to_mixture. The condensed and
-                # binodal sigmoid parameters stay at the zalmoxis.mixing
-                # defaults, the same values the solver resolves when
-                # config_params carries no overrides (PROTEUS sets none).
-                _rho = _calc_rho_mixed(
-                    _P,
-                    _T,
-                    _mantle_mixture,
-                    mat_dicts,
-                    _sol_f,
-                    _liq_f,
-                    _interp_cache,
-                    mushy_zone_factors=config_params.get('mushy_zone_factors'),
-                    volatile_profile=volatile_profile,
-                )
-                if _rho is not None and not np.isfinite(_rho):
-                    _rho = None
-            else:
-                _eos_here = _core_eos if _i < cmb_index else _mantle_eos
-                _rho = _calc_rho(
-                    _P,
-                    mat_dicts,
-                    _eos_here,
-                    _T,
-                    _sol_f,
-                    _liq_f,
-                    interpolation_functions=_interp_cache,
-                    mushy_zone_factor=_mzf,
-                )
-            _rho_fixed[_i] = float(_rho) if _rho is not None else float(density[_i])
         density = _rho_fixed
         temperature = _T_fixed
         log.debug(
@@ -2780,6 +2907,7 @@ def zalmoxis_solver(
     _density_cache['density'] = density.copy()
     _density_cache['radii'] = np.asarray(radii).copy()
     _density_cache['key'] = _structure_cache_key(config)
+    warmstart.store_profile(config, radii, density)
 
     # Final results of the Zalmoxis interior model. One summary line at INFO so
     # a long coupled run stays readable across hundreds of re-solves; the
@@ -3006,8 +3134,9 @@ def zalmoxis_solver(
     )
 
     # Write temperature profile to a separate file for Aragog to read
-    np.savetxt(
-        os.path.join(outdir, 'data', 'zalmoxis_output_temp.txt'), mantle_temperature_scaled
+    mesh_handoff.publish_rows(
+        os.path.join(outdir, 'data', 'zalmoxis_output_temp.txt'),
+        np.reshape(mantle_temperature_scaled, (-1, 1)),
     )
 
     # Scalar-g control knob: when
@@ -3048,12 +3177,21 @@ def zalmoxis_solver(
                 _exc,
             )
 
-    # Save final grids to the output file for the mantle for Aragog
-    with open(output_zalmoxis, 'w') as f:
-        for i in range(len(mantle_radii)):
-            f.write(
-                f'{mantle_radii[i]:.17e} {mantle_pressure[i]:.17e} {mantle_density[i]:.17e} {mantle_gravity_out[i]:.17e} {mantle_temperature[i]:.17e}\n'
+    # Save final grids to the output file for the mantle for Aragog. The file
+    # is replaced atomically, and its arrays are kept in memory for the schema
+    # check below and the wrapper's guards, which then need not parse it.
+    mesh_handoff.publish_rows(
+        output_zalmoxis,
+        np.column_stack(
+            (
+                mantle_radii,
+                mantle_pressure,
+                mantle_density,
+                mantle_gravity_out,
+                mantle_temperature,
             )
+        ),
+    )
 
     # Schema check at the Zalmoxis -> Aragog file-handover boundary. On
     # violation: restore the .prev backup (so Aragog reads consistent
@@ -4,12 +4,16 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-import juliacall
 import numpy as np
-from juliacall import Main as jl
 
 from proteus.interior_energetics.common import Interior_t
 from proteus.utils.helper import UpdateStatusfile
+from proteus.utils.julia_sysimage import select_sysimage
+
+# Julia starts with the first juliacall import, so pick its sysimage before it
+select_sysimage()
+import juliacall  # noqa: E402
+from juliacall import Main as jl  # noqa: E402
 
 if TYPE_CHECKING:
     from proteus.config import Config
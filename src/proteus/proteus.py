@@ -8,12 +8,6 @@ from pathlib import Path
 
 import numpy as np
 
-# juliacall has to load before torch does. Nothing here imports torch, but the
-# inference scheme brings it into the same process later, and the two clash if
-# torch wins the race.
-# see issue here: https://github.com/pytorch/pytorch/issues/78829
-from juliacall import Main  # noqa: F401
-
 import proteus.utils.archive as archive
 from proteus.config import (
     UnknownConfigKeyError,
@@ -32,12 +26,21 @@ from proteus.utils.helper import (
     is_write_snapshot,
     multiple,
 )
+from proteus.utils.julia_sysimage import select_sysimage
 from proteus.utils.logs import (
     GetCurrentLogfileIndex,
     GetLogfilePath,
     setup_logger,
 )
 
+# juliacall has to load before torch does. Nothing here imports torch, but the
+# inference scheme brings it into the same process later, and the two clash if
+# torch wins the race.
+# see issue here: https://github.com/pytorch/pytorch/issues/78829
+# Julia starts with this import, so the sysimage it starts from is chosen first.
+select_sysimage()
+from juliacall import Main  # noqa: E402, F401
+
 # Opt-in per-iter module wall-time breakdown. Emits one `[IT_TIMING]` log
 # line per main-loop iter with wall-time shares per module. Enable by
 # exporting `PROTEUS_TIMING=1` before launching `proteus start`.
@@ -444,6 +447,9 @@ class Proteus:
         #    lookup and reference data
         from proteus.utils.data import download_sufficient_data
 
+        #    persistent JAX compilation cache
+        from proteus.utils.jax_cache import log_compile_cache_summary, setup_compile_cache
+
         # termination criteria
         from proteus.utils.terminate import check_termination, print_termination_criteria
 
@@ -481,6 +487,9 @@ class Proteus:
         # Ensure that submodules are on the correct versions
         validate_module_versions(self.directories, self.config)
 
+        # Persistent JAX compilation cache, before anything is compiled
+        setup_compile_cache(self.config)
+
         # Print termination criteria
         print_termination_criteria(self.config)
         PrintHalfSeparator()
@@ -674,7 +683,7 @@ class Proteus:
             # independently of the (atomic) helpfile; drop any such
             # incomplete trailing rows so the interior and atmosphere both
             # load a complete state instead of aborting on the corrupt file.
-            require_atm = self.config.atmos_clim.module != 'dummy'
+            require_atm = self.config.atmos_clim.module not in ('dummy', 'emulator')
             self.hf_all, dropped_snapshots = select_resumable_snapshot(
                 self.directories['output'],
                 self.hf_all,
@@ -750,6 +759,14 @@ class Proteus:
             # Interior initial condition
             self.interior_o.ic = 2
 
+            # An adaptive-resolution run continues on the levels of its last mesh
+            if self.config.interior_energetics.adaptive_levels:
+                from proteus.interior_energetics.spider import mesh_num_levels
+
+                mesh_path = os.path.join(self.directories['output'], 'data', 'spider_mesh.dat')
+                if os.path.isfile(mesh_path):
+                    self.interior_o.resize(mesh_num_levels(mesh_path))
+
             # Restore tides data
             if self.config.orbit.module is not None:
                 self.interior_o.resume_tides(self.directories['output'])
@@ -1449,6 +1466,9 @@ class Proteus:
             log.info('Archiving output data into tar files')
             archive.update(self.directories['output/data'], remove_files=True)
 
+        # Compilation cache statistics
+        log_compile_cache_summary()
+
         # Stop time and model duration
         print_stoptime(start_time)
 
@@ -20,6 +20,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
+from proteus.config import column_solver
 from proteus.utils.constants import (
     element_list,
     gas_list,
@@ -256,7 +257,7 @@ def validate_module_versions(dirs: dict, config: Config):
         valid &= _valid_ver(zalmoxis_version, _get_expver('fwl-zalmoxis'), 'Zalmoxis')
 
     # Atmosphere module
-    match config.atmos_clim.module:
+    match column_solver(config.atmos_clim):
         case 'janus':
             from janus import __version__ as janus_version
 
@@ -351,7 +352,9 @@ def print_module_configuration(dirs: dict, config: Config, config_path: str):
 
     # Atmosphere module
     write = 'Atmos_clim module %s' % config.atmos_clim.module
-    match config.atmos_clim.module:
+    if config.atmos_clim.module == 'emulator':
+        write += ' with fallback %s' % column_solver(config.atmos_clim)
+    match column_solver(config.atmos_clim):
         case 'janus':
             from janus import __version__ as janus_version
 
@@ -359,7 +362,7 @@ def print_module_configuration(dirs: dict, config: Config, config_path: str):
         case 'agni':
             write += ' version ' + _get_agni_version(dirs)
     log.info(write)
-    if config.atmos_clim.module in ['janus', 'agni']:
+    if column_solver(config.atmos_clim) in ['janus', 'agni']:
         log.info('  - SOCRATES      version %s at %s' % (_get_socrates_version(), dirs['rad']))
 
     # Outgassing module
@@ -445,7 +448,7 @@ def print_citation(config: Config):
     _cite('Nicholls et al. (2024)', 'https://doi.org/10.1029/2024JE008576')
 
     # Atmosphere module
-    match config.atmos_clim.module:
+    match column_solver(config.atmos_clim):
         case 'janus':
             _cite('Graham et al. (2021)', 'https://doi.org/10.3847/PSJ/ac214c')
         case 'agni':
@@ -1758,7 +1761,8 @@ def UpdatePlots(hf_all: pd.DataFrame, dirs: dict, config: Config, end=False, num
     fwl_dir = dirs['fwl']
 
     # Check model configuration
-    dummy_atm = config.atmos_clim.module == 'dummy'
+    # Neither the dummy module nor the emulator writes atmosphere profiles
+    dummy_atm = config.atmos_clim.module in ('dummy', 'emulator')
     # The dummy and boundary interiors write no per-time interior NetCDF
     # snapshot, so profile plots cannot intersect against interior times.
     no_int_snapshots = config.interior_energetics.module in ('dummy', 'boundary')
@@ -2044,8 +2048,8 @@ def set_directories(config: Config) -> dict[str, str]:
         dirs['fwl'] = os.environ.get('FWL_DATA')
 
     # SOCRATES directory
-    if config.atmos_clim.module in ('janus', 'agni'):
-        # needed for atmosphere models 0 and 1
+    if column_solver(config.atmos_clim) in ('janus', 'agni'):
+        # needed for atmosphere models 0 and 1, and for the emulator's fallback
 
         if os.environ.get('RAD_DIR') is None:
             UpdateStatusfile(dirs, 20)
@@ -19,6 +19,7 @@ from scipy.interpolate import interp1d
 if TYPE_CHECKING:
     from proteus.config import Config
 
+from proteus.config import column_solver
 from proteus.utils.helper import resolve_fwl_data_dir, safe_rm
 from proteus.utils.phoenix_helper import phoenix_param
 
@@ -1611,13 +1612,13 @@ def _get_sufficient(config: Config, clean: bool = False):
             download_stellar_tracks('Baraffe')
 
     # Spectral files
-    if config.atmos_clim.module in ('janus', 'agni'):
+    if column_solver(config.atmos_clim) in ('janus', 'agni'):
         # High-res file often used for post-processing
         download_spectral_file('Honeyside', '4096')
 
         # Skip the group/bands download when AGNI takes its spectral file
         # directly from the user (a custom path, or 'greygas').
-        if config.atmos_clim.module == 'agni' and config.atmos_clim.agni.spectral_file:
+        if column_solver(config.atmos_clim) == 'agni' and config.atmos_clim.agni.spectral_file:
             pass
         else:
             # Get the spectral file we need for this simluation
@@ -1627,11 +1628,11 @@ def _get_sufficient(config: Config, clean: bool = False):
             download_spectral_file(group, bands)
 
     # Surface single-scattering data
-    if config.atmos_clim.module == 'agni':
+    if column_solver(config.atmos_clim) == 'agni':
         download_surface_albedos()
 
     # Aerosol scattering data
-    if config.atmos_clim.module == 'agni' and config.atmos_clim.aerosols_enabled:
+    if column_solver(config.atmos_clim) == 'agni' and config.atmos_clim.aerosols_enabled:
         download_scattering()
 
     # Exoplanet population data
@@ -0,0 +1,204 @@
+# Shared building blocks of the size-bounded on-disk caches
+"""Helpers shared by the on-disk caches of PROTEUS.
+
+These caches keep results on disk so that later runs, usually the other cases
+of a grid, reuse them instead of recomputing them:
+
+- ``PROTEUS_EOS_CACHE_DIR``: Aragog EOS objects
+  (:mod:`proteus.interior_energetics.eos_cache`);
+- ``PROTEUS_STRUCT_CACHE_DIR``: converged Zalmoxis structures
+  (:mod:`proteus.interior_struct.warmstart`);
+- ``PROTEUS_PS_CACHE_DIR``: P-S tables (:mod:`proteus.interior_struct.ps_tables`);
+- ``PROTEUS_AGNI_PROFILE_DIR``: converged AGNI profiles
+  (:mod:`proteus.atmos_clim.profile_library`);
+- ``PROTEUS_SPFILE_CACHE_DIR``: spectral files with a stellar spectrum
+  inserted (:mod:`proteus.atmos_clim.spectral_cache`).
+
+They all work the same way. Each is off unless its directory variable is set,
+normally to storage every grid worker can reach. Entries are named by a digest
+of everything their content depends on, so changed inputs give a new entry
+rather than a stale one. An entry is written under a ``TMP_PREFIX`` name in the
+cache and published with one atomic rename, so concurrent readers see either
+the whole entry or none of it. Using an entry refreshes its modification
+time, and after each store the least recently used entries are evicted until
+the cache fits in the bytes given by the matching ``*_MAX_SIZE`` variable
+(e.g. ``PROTEUS_EOS_CACHE_MAX_SIZE``). Any failure of a cache is logged, and
+the caller computes the result as it would without the cache.
+
+The SPIDER table sidecars (:mod:`proteus.interior_energetics.table_cache`) sit
+next to their source tables instead, but are published the same way.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import shutil
+import tempfile
+import time
+from typing import BinaryIO, Callable
+
+log = logging.getLogger('fwl.' + __name__)
+
+# Prefix of files being written; never counted or evicted as entries
+TMP_PREFIX = '.tmp-'
+
+# Staging directories older than this are debris from a killed writer
+STALE_STAGING_SECS = 24 * 3600
+
+
+def max_size_from_env(var: str, default: int) -> int:
+    """Return a size bound in bytes from the environment variable `var`.
+
+    Parameters
+    ----------
+    var : str
+        Name of the environment variable; a number of bytes, e.g. ``5e9``.
+    default : int
+        Bound used when `var` is unset or invalid.
+
+    Returns
+    -------
+    int
+        Size bound in bytes.
+    """
+    value = os.environ.get(var, '').strip()
+    if not value:
+        return default
+    try:
+        return int(float(value))
+    except ValueError:
+        log.warning('Ignoring invalid %s=%r; using %d bytes', var, value, default)
+        return default
+
+
+def write_atomic(path: str, write: Callable[[BinaryIO], object]) -> None:
+    """Write `path` through `write(file)` so readers never see a partial file.
+
+    The content goes to a uniquely named temporary file in the same
+    directory, which is then moved into place with :func:`os.replace`, an
+    atomic rename within one filesystem. Readers therefore see either the
+    previous file or the complete new one. Missing parent directories are
+    created.
+
+    Parameters
+    ----------
+    path : str
+        Destination file path.
+    write : callable
+        Writes the content to the binary file object it is given.
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f'{TMP_PREFIX}{os.path.basename(path)}-', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+def write_atomic_text(path: str, text: str) -> None:
+    """Write `text` to `path` atomically; see :func:`write_atomic`."""
+    write_atomic(path, lambda f: f.write(text.encode()))
+
+
+def dir_size(path: str) -> int:
+    """Total size in bytes of the files below `path`, without following links."""
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            with contextlib.suppress(OSError):
+                total += os.lstat(os.path.join(dirpath, name)).st_size
+    return total
+
+
+def remove_if_stale(path: str) -> None:
+    """Remove the staging directory `path` if it is older than ``STALE_STAGING_SECS``."""
+    with contextlib.suppress(OSError):
+        if time.time() - os.stat(path).st_mtime > STALE_STAGING_SECS:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def file_entries(root: str) -> list[tuple[float, str, int]]:
+    """List the files below `root` as ``(mtime, path, size)`` entries.
+
+    Files still being written (``TMP_PREFIX``) are skipped.
+    """
+    entries = []
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            if name.startswith(TMP_PREFIX):
+                continue
+            path = os.path.join(dirpath, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, path, st.st_size))
+    return entries
+
+
+def dir_entries(root: str) -> list[tuple[float, str, int]]:
+    """List the directories directly below `root` as ``(mtime, path, size)`` entries.
+
+    Staging directories (``TMP_PREFIX``) are skipped, and removed once stale.
+    """
+    entries = []
+    for item in os.scandir(root):
+        if not item.is_dir(follow_symlinks=False):
+            continue
+        if item.name.startswith(TMP_PREFIX):
+            remove_if_stale(item.path)
+            continue
+        try:
+            mtime = item.stat().st_mtime
+        except OSError:
+            continue
+        entries.append((mtime, item.path, dir_size(item.path)))
+    return entries
+
+
+def evict_lru(
+    entries: list[tuple[float, str, int]],
+    max_size: int,
+    remove: Callable[[str], object],
+    keep: str | None = None,
+    total: int | None = None,
+) -> list[str]:
+    """Remove least recently used entries until the total fits in `max_size`.
+
+    Parameters
+    ----------
+    entries : list of tuple
+        ``(last use, name, size in bytes)`` of every evictable entry.
+    max_size : int
+        Size bound in bytes.
+    remove : callable
+        Removes the entry of the given name.
+    keep : str or None
+        Name that is never evicted, normally the entry just stored.
+    total : int or None
+        Total size to bring below `max_size`, when the cache holds data
+        besides `entries`; defaults to the size of `entries`.
+
+    Returns
+    -------
+    list of str
+        Names of the evicted entries, oldest first.
+    """
+    if total is None:
+        total = sum(size for _, _, size in entries)
+    evicted = []
+    for _, name, size in sorted(entries):
+        if total <= max_size:
+            break
+        if name == keep:
+            continue
+        remove(name)
+        total -= size
+        evicted.append(name)
+    return evicted
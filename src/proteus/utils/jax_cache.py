@@ -0,0 +1,283 @@
+# Persistent JAX compilation cache management
+"""Manage the persistent JAX compilation cache used by the interior solvers.
+
+The Aragog CVODE factory (``backend = "jax"``), the research diffrax runner
+and the Zalmoxis JAX structure path all trace and compile their kernels with
+XLA. JAX keeps compiled executables in memory only, so every new process,
+grid case or CLI invocation recompiles the same kernels. Pointing JAX at a
+persistent compilation cache lets later processes load the executables from
+disk instead.
+
+XLA keys each cache entry by a hash of the lowered program, which covers the
+argument shapes and dtypes, any EOS table values baked into the trace as
+constants, the compile options, and the JAX/jaxlib version and backend. An
+edited EOS table or a new mesh resolution therefore never reuses a stale
+executable. On top of that the cache directory is namespaced by JAX version,
+so that :func:`prune_compile_cache` can drop whole generations left behind by
+upgrades.
+
+Cache hits and misses are counted through ``jax.monitoring`` and reported in
+the log by :func:`compile_cache_report` around each solver call, labelled
+with the mesh size and an EOS fingerprint, and summarised at the end of a
+run by :func:`log_compile_cache_summary`.
+
+JAX is optional for PROTEUS; every function here is a no-op without it.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import os
+import shutil
+import time
+from collections.abc import Iterator
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import platformdirs
+
+if TYPE_CHECKING:
+    from proteus.config import Config
+
+log = logging.getLogger('fwl.' + __name__)
+
+# Environment variable honoured by JAX itself; set by GridPROTEUS jax_cache
+_JAX_CACHE_ENV = 'JAX_COMPILATION_CACHE_DIR'
+
+# Monitoring events emitted by JAX's compilation cache
+_HIT_EVENT = '/jax/compilation_cache/cache_hits'
+_MISS_EVENT = '/jax/compilation_cache/cache_misses'
+
+# Process-wide hit/miss counters, filled by the monitoring listener
+_counts = {'hits': 0, 'misses': 0}
+_listener_registered = False
+_active_dir: str | None = None
+
+
+def _jax_version() -> str | None:
+    try:
+        return version('jax')
+    except PackageNotFoundError:
+        return None
+
+
+def short_fingerprint(text: str) -> str:
+    """Return a short, stable hex digest of `text` for log labels."""
+    return hashlib.sha1(text.encode()).hexdigest()[:10]
+
+
+def default_cache_root() -> str:
+    """Return the default cache root, ``$FWL_DATA/jax_cache``."""
+    fwl_data = os.environ.get('FWL_DATA', platformdirs.user_data_dir('fwl_data'))
+    return os.path.join(fwl_data, 'jax_cache')
+
+
+def resolve_cache_root(path: str) -> str:
+    """Resolve the ``params.compile_cache.path`` setting to an absolute path."""
+    if path == 'auto':
+        return default_cache_root()
+    return os.path.abspath(os.path.expanduser(path))
+
+
+def _on_event(event: str, **kwargs) -> None:
+    if event == _HIT_EVENT:
+        _counts['hits'] += 1
+    elif event == _MISS_EVENT:
+        _counts['misses'] += 1
+
+
+def _register_listener() -> None:
+    global _listener_registered
+    if _listener_registered:
+        return
+    import jax.monitoring
+
+    jax.monitoring.register_event_listener(_on_event)
+    _listener_registered = True
+
+
+def setup_compile_cache(config: Config) -> str | None:
+    """Configure the persistent JAX compilation cache for this process.
+
+    Must run before the first JAX compilation. A cache directory exported
+    through ``JAX_COMPILATION_CACHE_DIR`` (e.g. by a GridPROTEUS dispatch
+    script) takes precedence over the config, so that all grid cases share
+    it; the config limits still apply.
+
+    Parameters
+    ----------
+    config : Config
+        PROTEUS configuration; reads ``params.compile_cache``.
+
+    Returns
+    -------
+    str or None
+        The cache directory in use, or None when disabled or JAX is absent.
+    """
+    global _active_dir
+
+    cc = config.params.compile_cache
+    if not cc.enabled:
+        return None
+
+    jax_version = _jax_version()
+    if jax_version is None:
+        log.debug('JAX is not installed; compilation cache not configured')
+        return None
+
+    env_dir = os.environ.get(_JAX_CACHE_ENV)
+    if env_dir:
+        cache_dir = env_dir
+    else:
+        cache_dir = os.path.join(resolve_cache_root(cc.path), f'jax-{jax_version}')
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError as e:
+        log.warning('Cannot create JAX compilation cache %s (%s); not using it', cache_dir, e)
+        return None
+
+    import jax
+
+    jax.config.update('jax_compilation_cache_dir', cache_dir)
+    jax.config.update('jax_persistent_cache_min_compile_time_secs', cc.min_compile_time)
+    jax.config.update('jax_persistent_cache_min_entry_size_bytes', 0)
+    with contextlib.suppress(AttributeError, KeyError):
+        # Older JAX releases have no size bound; prune_compile_cache covers them
+        jax.config.update('jax_compilation_cache_max_size', int(cc.max_size * 1024**3))
+
+    _register_listener()
+    _active_dir = cache_dir
+    log.info('Using JAX compilation cache at %s', cache_dir)
+    return cache_dir
+
+
+@contextlib.contextmanager
+def compile_cache_report(tag: str, **labels) -> Iterator[None]:
+    """Log the compilation-cache hits and misses incurred inside the block.
+
+    Nothing is logged when the block compiled nothing, which is the normal
+    case once the kernels are warm in memory.
+
+    Parameters
+    ----------
+    tag : str
+        Name of the solver path, e.g. ``'aragog'`` or ``'zalmoxis'``.
+    **labels
+        Key identifying the compiled kernels, e.g. mesh size and EOS
+        fingerprint; rendered into the log line.
+    """
+    hits, misses = _counts['hits'], _counts['misses']
+    try:
+        yield
+    finally:
+        d_hits = _counts['hits'] - hits
+        d_misses = _counts['misses'] - misses
+        if _active_dir is not None and (d_hits or d_misses):
+            key = ', '.join(f'{k}={v}' for k, v in labels.items())
+            log.info(
+                'JAX compilation cache [%s%s]: %d hit(s), %d miss(es)',
+                tag,
+                f' {key}' if key else '',
+                d_hits,
+                d_misses,
+            )
+
+
+def log_compile_cache_summary() -> None:
+    """Log the run-total compilation-cache hits and misses."""
+    if _active_dir is None:
+        return
+    log.info(
+        'JAX compilation cache: %d hit(s), %d miss(es) in total',
+        _counts['hits'],
+        _counts['misses'],
+    )
+
+
+def _entries(cache_dir: Path) -> list[tuple[float, int, Path]]:
+    """Return ``(mtime, size, path)`` for every file below `cache_dir`."""
+    out = []
+    for path in cache_dir.rglob('*'):
+        if not path.is_file():
+            continue
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        out.append((st.st_mtime, st.st_size, path))
+    return out
+
+
+def prune_compile_cache(
+    root: str,
+    *,
+    max_age_days: float | None = None,
+    max_size: float | None = None,
+    keep_other_versions: bool = False,
+) -> tuple[int, int]:
+    """Remove stale entries from a JAX compilation cache root.
+
+    Parameters
+    ----------
+    root : str
+        Cache root, holding one ``jax-<version>`` directory per JAX release.
+    max_age_days : float or None
+        Remove entries not written or used for longer than this many days.
+    max_size : float or None
+        Then remove the least recently used entries until the root is below
+        this size, in GiB.
+    keep_other_versions : bool
+        Keep directories of JAX releases other than the installed one.
+        By default they are removed, since no current process can use them.
+
+    Returns
+    -------
+    tuple of int
+        Number of files removed and bytes freed.
+    """
+    root_path = Path(root)
+    if not root_path.is_dir():
+        return 0, 0
+
+    removed, freed = 0, 0
+
+    current = f'jax-{_jax_version()}'
+    if not keep_other_versions:
+        for sub in root_path.iterdir():
+            if sub.is_dir() and sub.name.startswith('jax-') and sub.name != current:
+                for _, size, _ in _entries(sub):
+                    removed += 1
+                    freed += size
+                shutil.rmtree(sub, ignore_errors=True)
+
+    entries = sorted(_entries(root_path))
+    if max_age_days is not None:
+        cutoff = time.time() - max_age_days * 86400.0
+        keep = []
+        for mtime, size, path in entries:
+            if mtime < cutoff:
+                with contextlib.suppress(OSError):
+                    path.unlink()
+                    removed += 1
+                    freed += size
+            else:
+                keep.append((mtime, size, path))
+        entries = keep
+
+    if max_size is not None:
+        limit = int(max_size * 1024**3)
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= limit:
+                break
+            with contextlib.suppress(OSError):
+                path.unlink()
+                removed += 1
+                freed += size
+            total -= size
+
+    return removed, freed
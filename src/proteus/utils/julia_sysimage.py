@@ -0,0 +1,540 @@
+# Julia sysimage management for AGNI and LovePy
+"""Build and select a custom Julia sysimage holding AGNI and LovePy.
+
+Every PROTEUS process that runs AGNI (``activate_julia``) or LovePy
+(``import_lovepy``) loads those packages through juliacall and compiles the
+methods of its first solve. For grids of many short cases this startup
+dominates the runtime of each case. A sysimage built with PackageCompiler
+holds the loaded packages and the native code of the calls PROTEUS makes,
+so a process started from it skips both.
+
+``proteus get sysimage`` calls :func:`build_sysimage`, which
+
+- sets up a build project holding the local AGNI checkout (at the versions
+  of AGNI's own ``Manifest.toml``), Plots and, when installed, LovePy;
+- runs PackageCompiler with :data:`PRECOMPILE_WORKLOAD`, a grey-gas AGNI
+  column set up, solved and written the way ``agni.py`` does it, plus a
+  LovePy tidal-heating call;
+- validates the new image by running the same workload from it, and times
+  that run against one without it;
+- writes the image and a JSON manifest recording the environment it was
+  built against and both startup times.
+
+:func:`select_sysimage` runs just before each ``from juliacall import`` and
+points juliacall at the image (``PYTHON_JULIACALL_SYSIMAGE``). It does so only when
+the image is fresh: a different Julia version or juliacall release, an
+edited AGNI source tree, or a changed AGNI or default-environment manifest
+all make the baked-in code stale, and the image is then skipped with a
+warning instead of loading outdated AGNI code.
+
+The image lives at ``$FWL_DATA/julia_sysimage/`` by default. Set
+``PROTEUS_JULIA_SYSIMAGE`` to use another image, or to ``none`` to disable
+it. An explicit ``PYTHON_JULIACALL_SYSIMAGE`` is always left alone.
+"""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+from importlib.metadata import PackageNotFoundError, version
+
+import platformdirs
+
+log = logging.getLogger('fwl.' + __name__)
+
+# Image path override, or 'none' to disable the image
+SYSIMAGE_ENV = 'PROTEUS_JULIA_SYSIMAGE'
+
+# Option read by juliacall when it starts Julia
+_JULIACALL_ENV = 'PYTHON_JULIACALL_SYSIMAGE'
+
+# Variables passed to the Julia build and workload scripts
+_AGNI_ENV = 'PROTEUS_SYSIMAGE_AGNI'
+_PROJECT_ENV = 'PROTEUS_SYSIMAGE_PROJECT'
+_IMAGE_ENV = 'PROTEUS_SYSIMAGE_OUTPUT'
+_WORKLOAD_ENV = 'PROTEUS_SYSIMAGE_WORKLOAD'
+_LOVEPY_ENV = 'PROTEUS_SYSIMAGE_LOVEPY'
+
+_EXTENSIONS = {'darwin': 'dylib', 'win32': 'dll'}
+SYSIMAGE_NAME = 'proteus_sysimage.' + _EXTENSIONS.get(sys.platform, 'so')
+
+# Calls compiled into the image. Mirrors activate_julia, init_agni_atmos,
+# run_agni and write_atmos_ncdf on a small grey-gas column, which needs no
+# spectral file, then run_lovepy on a two-cell mantle. Each stage runs on
+# its own so that a signature change in one package costs only its stage.
+# The AGNI calls pass the same keyword set as agni.py, at the config
+# defaults, so the compiled keyword methods are the ones a run calls. Not
+# yet checked against a real Julia build: a stage that fails only warns,
+# and then that stage compiles at run time as it does without an image.
+PRECOMPILE_WORKLOAD = r"""
+using Pkg
+ENV["GKSwstype"] = "100"
+using Plots
+default(label=nothing, dpi=250)
+import AGNI
+
+const agni_dir = ENV["PROTEUS_SYSIMAGE_AGNI"]
+const work_dir = mktempdir()
+AGNI.setup_logging(joinpath(work_dir, "agni_recent.log"), 1)
+
+try
+    # Positional arguments of setup!, in the order agni.py passes them
+    instellation = 1361.0
+    s0_fact = 0.375
+    albedo_b = 0.0
+    zenith_degrees = 48.19
+    tmp_surf = 1500.0
+    gravity = 9.81
+    radius = 6.371e6
+    nlev_centre = 40
+    p_surf = 100.0
+    p_top = 1e-5
+    mf_dict = Dict("H2O" => 0.8, "CO2" => 0.2)
+
+    atmos = AGNI.atmosphere.Atmos_t()
+    AGNI.atmosphere.setup!(
+        atmos, agni_dir, work_dir, "greygas",
+        instellation, s0_fact, albedo_b, zenith_degrees, tmp_surf, gravity,
+        radius, nlev_centre, p_surf, p_top, mf_dict, "";
+        IO_DIR=work_dir,
+        flag_rayleigh=true,
+        flag_cloud=false,
+        flag_aerosol=false,
+        overlap_method="ee",
+        albedo_s=0.1,
+        surface_material="greybody",
+        surf_roughness=1e-3,
+        surf_windspeed=2.0,
+        condensates=["H2O"],
+        phs_timescale=1e6,
+        evap_efficiency=0.01,
+        use_all_gases=false,
+        fastchem_floor=1000.0,
+        fastchem_maxiter_chem=60000,
+        fastchem_maxiter_solv=20000,
+        fastchem_xtol_chem=1e-4,
+        fastchem_xtol_elem=1e-4,
+        real_gas=false,
+        thermo_functions=true,
+        check_integrity=false,
+        mlt_criterion='s',
+        skin_d=0.01,
+        skin_k=2.0,
+        tmp_magma=tmp_surf,
+        tmp_floor=0.5,
+        κ_grey_lw=1e1,
+        κ_grey_sw=1e-4,
+        aerosol_species=Dict{String,Float64}(),
+    )
+    AGNI.atmosphere.allocate!(atmos, ""; check_safe_gas=true)
+    AGNI.setpt.isothermal!(atmos, tmp_surf)
+    AGNI.setpt.dry_adiabat!(atmos)
+    AGNI.setpt.stratosphere!(atmos, 400.0)
+    AGNI.solver.solve_energy!(
+        atmos;
+        sol_type=1,
+        method=1,
+        chem=false,
+        conduct=false,
+        convect=true,
+        sens_heat=true,
+        latent=true,
+        rainout=true,
+        oceans=true,
+        max_steps=30,
+        max_runtime=120.0,
+        conv_atol=0.5,
+        conv_rtol=0.15,
+        fdo=2,
+        ls_method=2,
+        dx_max=35.0,
+        easy_start=true,
+        grey_start=false,
+        perturb_all=false,
+        save_frames=false,
+        modplot=0,
+        plot_jacobian=false,
+    )
+    AGNI.energy.calc_fluxes!(atmos; radiative=true, convective=true)
+    AGNI.solver.solve_transparent!(
+        atmos; sol_type=1, conv_atol=0.5, conv_rtol=0.15, max_steps=20
+    )
+    AGNI.save.write_ncdf(atmos, joinpath(work_dir, "0_atm.nc"))
+    AGNI.atmosphere.deallocate!(atmos)
+catch e
+    @warn "AGNI precompile stage failed" exception = e
+end
+"""
+
+# Appended to the workload when LovePy is part of the image
+PRECOMPILE_LOVEPY = r"""
+using LovePy
+try
+    prec(x) = convert(Array{LovePy.prec, 1}, x)
+    calc_lovepy_tides(
+        convert(LovePy.prec, 2pi / 86400.0),
+        convert(LovePy.prec, 0.01),
+        prec([5000.0, 4000.0]),
+        prec([3.5e6, 5.0e6, 6.371e6]),
+        prec([1e21, 1e21]),
+        prec([8e10, 6e10]),
+        prec([2e11, 1.5e11]);
+        ncalc=1000,
+    )
+catch e
+    @warn "LovePy precompile stage failed" exception = e
+end
+"""
+
+# Sets up the build project and runs PackageCompiler on the workload. LovePy
+# is taken from the default environment, where tools/get_lovepy.sh puts it.
+_BUILD_SCRIPT = r"""
+lovepy = ENV["PROTEUS_SYSIMAGE_LOVEPY"] == "1" ? Base.find_package("LovePy") : nothing
+
+using Pkg
+const project = ENV["PROTEUS_SYSIMAGE_PROJECT"]
+const agni_dir = ENV["PROTEUS_SYSIMAGE_AGNI"]
+Pkg.activate(project)
+cp(joinpath(agni_dir, "Manifest.toml"), joinpath(project, "Manifest.toml"); force=true)
+Pkg.develop(path=agni_dir)
+Pkg.add(["Plots", "PackageCompiler"])
+packages = ["AGNI", "Plots"]
+if lovepy !== nothing
+    Pkg.develop(path=dirname(dirname(lovepy)))
+    push!(packages, "LovePy")
+end
+println("Sysimage packages: ", join(packages, ", "))
+
+using PackageCompiler
+create_sysimage(
+    packages;
+    sysimage_path=ENV["PROTEUS_SYSIMAGE_OUTPUT"],
+    project=project,
+    precompile_execution_file=ENV["PROTEUS_SYSIMAGE_WORKLOAD"],
+)
+"""
+
+
+def default_sysimage_path() -> str:
+    """Return the default image path, ``$FWL_DATA/julia_sysimage/<name>``."""
+    fwl_data = os.environ.get('FWL_DATA', platformdirs.user_data_dir('fwl_data'))
+    return os.path.join(fwl_data, 'julia_sysimage', SYSIMAGE_NAME)
+
+
+def sysimage_path() -> str | None:
+    """Return the image path in use for this environment, or None if disabled."""
+    override = os.environ.get(SYSIMAGE_ENV, '').strip()
+    if override.lower() == 'none':
+        return None
+    if override:
+        return os.path.abspath(os.path.expanduser(override))
+    return default_sysimage_path()
+
+
+def manifest_path(image: str) -> str:
+    """Return the path of the JSON manifest written next to `image`."""
+    return image + '.json'
+
+
+def julia_executable() -> str:
+    """Return the Julia binary juliacall is bound to, as ``proteus doctor`` does."""
+    return os.environ.get('PYTHON_JULIAPKG_EXE') or 'julia'
+
+
+def _julia_version(exe: str) -> str | None:
+    try:
+        out = subprocess.check_output([exe, '--version'], text=True, stderr=subprocess.DEVNULL)
+        return out.strip().split()[-1]
+    except (FileNotFoundError, subprocess.CalledProcessError, OSError):
+        return None
+
+
+def _juliacall_version() -> str | None:
+    try:
+        return version('juliacall')
+    except PackageNotFoundError:
+        return None
+
+
+def _file_digest(path: str) -> str | None:
+    try:
+        with open(path, 'rb') as hdl:
+            return hashlib.sha1(hdl.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _tree_digest(root: str) -> str | None:
+    """Digest of the names, sizes and times of the Julia sources below `root`."""
+    if not os.path.isdir(root):
+        return None
+    digest = hashlib.sha1()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if not name.endswith('.jl'):
+                continue
+            path = os.path.join(dirpath, name)
+            st = os.stat(path)
+            digest.update(
+                f'{os.path.relpath(path, root)}:{st.st_size}:{st.st_mtime_ns};'.encode()
+            )
+    return digest.hexdigest()
+
+
+def _default_env_manifest(julia_version: str) -> str | None:
+    """Return the manifest of Julia's default environment, where LovePy lives."""
+    depots = [d for d in os.environ.get('JULIA_DEPOT_PATH', '').split(os.pathsep) if d]
+    depot = depots[0] if depots else os.path.join(os.path.expanduser('~'), '.julia')
+    minor = '.'.join(julia_version.split('.')[:2])
+    env_dir = os.path.join(depot, 'environments', f'v{minor}')
+    for name in (f'Manifest-v{minor}.toml', 'Manifest.toml'):
+        path = os.path.join(env_dir, name)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def environment_fingerprint(agni_dir: str, julia_version: str) -> dict:
+    """Describe everything an image built for this environment depends on.
+
+    Parameters
+    ----------
+    agni_dir : str
+        AGNI checkout compiled into the image.
+    julia_version : str
+        Version of the Julia binary juliacall is bound to.
+
+    Returns
+    -------
+    dict
+        Julia and juliacall versions, and digests of the AGNI sources, AGNI's
+        manifest and the default-environment manifest.
+    """
+    default_manifest = _default_env_manifest(julia_version)
+    return {
+        'julia': julia_version,
+        'juliacall': _juliacall_version(),
+        'agni_src': _tree_digest(os.path.join(agni_dir, 'src')),
+        'agni_manifest': _file_digest(os.path.join(agni_dir, 'Manifest.toml')),
+        'default_manifest': _file_digest(default_manifest) if default_manifest else None,
+    }
+
+
+def read_manifest(image: str) -> dict | None:
+    """Return the manifest of `image`, or None if it has none or it is unreadable."""
+    try:
+        with open(manifest_path(image)) as hdl:
+            return json.load(hdl)
+    except (OSError, ValueError):
+        return None
+
+
+def stale_reason(image: str) -> str | None:
+    """Return why `image` cannot be used in this environment, or None if it can.
+
+    Parameters
+    ----------
+    image : str
+        Path to the sysimage.
+
+    Returns
+    -------
+    str or None
+        A short reason, e.g. ``'AGNI sources changed'``, or None when the image
+        exists, was validated, and matches the current environment.
+    """
+    if not os.path.isfile(image):
+        return 'not built'
+    manifest = read_manifest(image)
+    if manifest is None or 'fingerprint' not in manifest:
+        return 'no build manifest'
+
+    built = manifest['fingerprint']
+    current_julia = _julia_version(julia_executable())
+    if current_julia is None:
+        return 'Julia not found'
+    current = environment_fingerprint(manifest['agni_dir'], current_julia)
+    labels = {
+        'julia': f'built for Julia {built.get("julia")}, found {current_julia}',
+        'juliacall': 'juliacall version changed',
+        'agni_src': 'AGNI sources changed',
+        'agni_manifest': "AGNI's Manifest.toml changed",
+        'default_manifest': 'default Julia environment (LovePy) changed',
+    }
+    for key, label in labels.items():
+        if built.get(key) != current[key]:
+            return label
+    return None
+
+
+def select_sysimage() -> str | None:
+    """Point juliacall at the PROTEUS sysimage when it is fresh.
+
+    Called just before each ``from juliacall import``. Julia starts with the
+    first of those imports, so once juliacall is loaded the choice is made
+    and later calls only report it. Never raises: any problem leaves
+    juliacall on Julia's default image.
+
+    Returns
+    -------
+    str or None
+        The image juliacall will start from, or None for the default image.
+    """
+    if 'juliacall' in sys.modules:
+        return active_sysimage()
+    if os.environ.get(_JULIACALL_ENV):
+        return os.environ[_JULIACALL_ENV]
+    try:
+        image = sysimage_path()
+        if image is None or not os.path.isfile(image):
+            return None
+        reason = stale_reason(image)
+    except (OSError, ValueError, KeyError) as e:
+        log.warning('Cannot check Julia sysimage (%s); not using it', e)
+        return None
+    if reason is not None:
+        log.warning(
+            'Not using Julia sysimage %s: %s. Rebuild it with `proteus get sysimage`',
+            image,
+            reason,
+        )
+        return None
+    os.environ[_JULIACALL_ENV] = image
+    return image
+
+
+def active_sysimage() -> str | None:
+    """Return the sysimage juliacall was started from, or None for the default."""
+    return os.environ.get(_JULIACALL_ENV) or None
+
+
+def _time_workload(
+    exe: str, project: str, workload: str, env: dict, image: str | None
+) -> float:
+    """Run the precompile workload in a fresh Julia and return its wall time [s].
+
+    Raises
+    ------
+    RuntimeError
+        If Julia exits with an error, e.g. because `image` cannot be loaded.
+    """
+    cmd = [exe, '--startup-file=no', f'--project={project}']
+    if image is not None:
+        cmd.append(f'--sysimage={image}')
+    cmd.append(workload)
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, env=env, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(
+            f'Julia workload failed (exit {proc.returncode}): {proc.stderr.strip()[-2000:]}'
+        )
+    return elapsed
+
+
+def build_sysimage(agni_dir: str, image: str | None = None) -> dict:
+    """Build, validate and time a sysimage holding AGNI and LovePy.
+
+    The image is built and validated next to its final path, then moved into
+    place, so that processes already running from an older image keep it.
+
+    Parameters
+    ----------
+    agni_dir : str
+        AGNI checkout to compile into the image.
+    image : str or None
+        Where to write the image. Default: :func:`sysimage_path`.
+
+    Returns
+    -------
+    dict
+        The manifest written next to the image, including the workload wall
+        time without (``startup_default``) and with (``startup_sysimage``)
+        the image, in seconds.
+
+    Raises
+    ------
+    RuntimeError
+        If Julia or AGNI is missing, or the build or its validation fails.
+    """
+    image = os.path.abspath(image or sysimage_path() or default_sysimage_path())
+    exe = julia_executable()
+    julia_version = _julia_version(exe)
+    if julia_version is None:
+        raise RuntimeError(f'Julia not found at {exe}')
+    if not os.path.isfile(os.path.join(agni_dir, 'Project.toml')):
+        raise RuntimeError(f'No AGNI checkout at {agni_dir}')
+
+    image_dir = os.path.dirname(image)
+    build_dir = os.path.join(image_dir, 'build')
+    project = os.path.join(build_dir, 'project')
+    os.makedirs(project, exist_ok=True)
+    workload = os.path.join(build_dir, 'precompile.jl')
+    script = os.path.join(build_dir, 'build.jl')
+    staged = os.path.join(build_dir, os.path.basename(image))
+    with open(script, 'w') as hdl:
+        hdl.write(_BUILD_SCRIPT)
+
+    fingerprint = environment_fingerprint(agni_dir, julia_version)
+    env = dict(os.environ)
+    env.pop(_JULIACALL_ENV, None)
+    env['LD_LIBRARY_PATH'] = ''
+    env[_AGNI_ENV] = agni_dir
+    env[_PROJECT_ENV] = project
+    env[_IMAGE_ENV] = staged
+    env[_WORKLOAD_ENV] = workload
+
+    with_lovepy = _has_lovepy(exe, env)
+    env[_LOVEPY_ENV] = '1' if with_lovepy else '0'
+    with open(workload, 'w') as hdl:
+        hdl.write(PRECOMPILE_WORKLOAD)
+        if with_lovepy:
+            hdl.write(PRECOMPILE_LOVEPY)
+
+    log.info('Building Julia sysimage with Julia %s; this takes several minutes', julia_version)
+    start = time.perf_counter()
+    proc = subprocess.run([exe, '--startup-file=no', script], env=env)
+    if proc.returncode != 0:
+        raise RuntimeError(f'Julia sysimage build failed (exit {proc.returncode})')
+    build_time = time.perf_counter() - start
+    log.info('Built sysimage in %.0f s', build_time)
+
+    log.info('Timing the precompile workload without and with the sysimage')
+    startup_default = _time_workload(exe, project, workload, env, None)
+    startup_sysimage = _time_workload(exe, project, workload, env, staged)
+
+    os.replace(staged, image)
+    manifest = {
+        'image': image,
+        'agni_dir': agni_dir,
+        'lovepy': with_lovepy,
+        'fingerprint': fingerprint,
+        'built': datetime.datetime.now().isoformat(timespec='seconds'),
+        'build_time': build_time,
+        'startup_default': startup_default,
+        'startup_sysimage': startup_sysimage,
+    }
+    with open(manifest_path(image), 'w') as hdl:
+        json.dump(manifest, hdl, indent=2)
+    log.info(
+        'Startup to first AGNI solve: %.1f s without the sysimage, %.1f s with it',
+        startup_default,
+        startup_sysimage,
+    )
+    return manifest
+
+
+def _has_lovepy(exe: str, env: dict) -> bool:
+    """Return True if LovePy is installed in Julia's default environment."""
+    cmd = [exe, '--startup-file=no', '-e', 'exit(Base.find_package("LovePy") === nothing)']
+    try:
+        return subprocess.run(cmd, env=env, capture_output=True).returncode == 0
+    except OSError:
+        return False
@@ -0,0 +1,141 @@
+# Linear response of a solver around its latest solve
+"""Least-squares linear response shared by the solver surrogates.
+
+The structure surrogate (:mod:`proteus.interior_struct.surrogate`) and the
+AGNI flux surrogate (:mod:`proteus.atmos_clim.surrogate`) both predict the
+result of a solve from the solves already made in the run. ``LinearResponse``
+holds what they share: the history of the most recent solves, the
+least-squares fit of the change of the results against the change of the
+inputs around the latest solve, and the residuals of that fit against the
+solves that followed it. Each surrogate chooses its inputs, results and
+error measure.
+
+A response is only fitted inside the range already sampled: an input that
+has not varied between solves, or a step more than ``EXTRAPOLATION_LIMIT``
+times the sampled span, gives no prediction.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Callable
+
+import numpy as np
+
+# Solves kept for the fit, and solves required before predicting
+HISTORY_LENGTH = 8
+MIN_SOLVES = 3
+
+# Fit residuals (against the next solve) that bound the model error
+RESIDUAL_MEMORY = 3
+
+# Largest step, in units of the sampled span, that is not an extrapolation
+EXTRAPOLATION_LIMIT = 2.0
+
+
+class LinearResponse:
+    """History of solves and the linear response of their results."""
+
+    def __init__(self):
+        self._x = deque(maxlen=HISTORY_LENGTH)
+        self._y = deque(maxlen=HISTORY_LENGTH)
+        self._residuals = deque(maxlen=RESIDUAL_MEMORY)
+
+    def __len__(self) -> int:
+        return len(self._x)
+
+    def clear(self) -> None:
+        """Forget every recorded solve."""
+        self._x.clear()
+        self._y.clear()
+        self._residuals.clear()
+
+    @property
+    def validated(self) -> bool:
+        """Whether ``MIN_SOLVES`` solves and a fit residual are recorded."""
+        return len(self._x) >= MIN_SOLVES and bool(self._residuals)
+
+    @property
+    def residual(self) -> float:
+        """Largest recent residual of the fit against a later solve."""
+        return max(self._residuals)
+
+    @property
+    def latest(self) -> np.ndarray:
+        """Results of the latest solve."""
+        return self._y[-1]
+
+    @property
+    def latest_inputs(self) -> np.ndarray:
+        """Inputs of the latest solve."""
+        return self._x[-1]
+
+    def response(self, x: np.ndarray) -> np.ndarray | None:
+        """Predicted change of the results from the latest solve, or None.
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            Inputs to predict at.
+
+        Returns
+        -------
+        numpy.ndarray or None
+            Change of each result, or None if fewer than two solves are
+            recorded or `x` lies outside the sampled range.
+        """
+        if len(self._x) < 2:
+            return None
+        X = np.array(self._x)
+        Y = np.array(self._y)
+        dX = X[:-1] - X[-1]
+        dY = Y[:-1] - Y[-1]
+        dx = x - X[-1]
+
+        span = np.max(np.abs(dX), axis=0)
+        scale = np.maximum(np.abs(X[-1]), 1.0) * 1e-12
+        sampled = span > scale
+        # An input that has not varied between solves has no fitted
+        # response, so any step along it is unconstrained
+        if np.any(np.abs(dx[~sampled]) > scale[~sampled]):
+            return None
+        if not np.any(sampled):
+            return np.zeros(dY.shape[1])
+        step = dx[sampled] / span[sampled]
+        if np.any(np.abs(step) > EXTRAPOLATION_LIMIT):
+            return None
+
+        J, *_ = np.linalg.lstsq(dX[:, sampled] / span[sampled], dY, rcond=None)
+        return step @ J
+
+    def add(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        error: Callable[[np.ndarray, np.ndarray], float],
+    ) -> float | None:
+        """Add a solve, first scoring the fit against it.
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            Inputs of the solve.
+        y : numpy.ndarray
+            Results of the solve.
+        error : callable
+            Error of predicted results against the solved ones.
+
+        Returns
+        -------
+        float or None
+            Residual of the fit against this solve, or None if it made no
+            prediction here.
+        """
+        residual = None
+        response = self.response(x)
+        if response is not None:
+            residual = float(error(self._y[-1] + response, y))
+            self._residuals.append(residual)
+        self._x.append(x)
+        self._y.append(y)
+        return residual
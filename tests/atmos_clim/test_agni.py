@@ -9,6 +9,9 @@ This module tests the AGNI atmosphere interface including:
   update_agni_atmos), covering pressure and temperature positivity, profile
   monotonicity under interpolation, and the atmosphere-failure contract when
   the surface boundary condition cannot seed a new profile
+- Seeding from the converged-profile library (_set_guess_profile,
+  _solve_energy), including the easy start it replaces and the attempts
+  recorded per solve
 
 See also:
 - docs/How-to/testing.md
@@ -390,7 +393,7 @@ def test_init_agni_atmos_greygas_bypasses_spectral_copy(monkeypatch, tmp_path):
         ),
     )
 
-    atmos = init_agni_atmos(dirs, config, hf_row)
+    atmos, _ = init_agni_atmos(dirs, config, hf_row)
 
     assert atmos is not None
 
@@ -446,7 +449,7 @@ def test_init_agni_atmos_passes_unscaled_surface_pressure(monkeypatch, tmp_path)
     )
     monkeypatch.setattr(agni_mod, 'sync_log_files', lambda *_a, **_k: None)
 
-    atmos = init_agni_atmos(dirs, config, hf_row)
+    atmos, _ = init_agni_atmos(dirs, config, hf_row)
     assert atmos is not None
 
     # setup_b positional arg index 11 is p_surf (see the setup_b call in agni.py).
@@ -496,7 +499,7 @@ def test_init_agni_atmos_greygas_does_not_glob_sflux(monkeypatch, tmp_path):
     )
 
     # Must not raise.
-    atmos = init_agni_atmos(dirs, config, hf_row)
+    atmos, _ = init_agni_atmos(dirs, config, hf_row)
 
     assert atmos is not None
     assert fake_agni.last_setup_args[2] == 'greygas'
@@ -546,7 +549,7 @@ def test_init_agni_atmos_non_greygas_no_sflux_raises_filenotfound(monkeypatch, t
     # grey-gas branch (which does not need a stellar spectrum) does NOT
     # raise on the same hf_row and same empty data dir.
     config.atmos_clim.agni.spectral_file = 'greygas'
-    atmos = init_agni_atmos(dirs, config, hf_row)
+    atmos, _ = init_agni_atmos(dirs, config, hf_row)
     assert atmos is not None
     # The grey-gas branch must have allocated with an empty stellar path
     # (no spectral file copied) to confirm the dispatch took the correct
@@ -554,6 +557,60 @@ def test_init_agni_atmos_non_greygas_no_sflux_raises_filenotfound(monkeypatch, t
     assert fake_agni.last_allocate_input_star == ''
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize('cached', [False, True])
+def test_init_agni_atmos_reads_version_only_for_spectral_cache(
+    monkeypatch, tmp_path, caplog, cached
+):
+    """The AGNI version enters only the spectral-cache key, so it is read only
+    with the cache enabled; an unreadable version prepares the file uncached
+    instead of failing the run.
+    """
+    fake_agni = _FakeAGNI()  # carries no `consts`, so the version is unreadable
+    fake_jl = SimpleNamespace(AGNI=fake_agni, Dict=dict, Char=str)
+
+    output_dir = tmp_path / 'out'
+    data_dir = output_dir / 'data'
+    data_dir.mkdir(parents=True)
+    (data_dir / '0.sflux').write_text('star\n')
+
+    dirs = {'output': str(output_dir), 'agni': '/fake/agni', 'fwl': '/fake/fwl'}
+    config = _build_greygas_config()
+    config.atmos_clim.agni.spectral_file = None
+    hf_row = {
+        'F_ins': 1000.0,
+        'albedo_pl': 0.2,
+        'T_surf': 900.0,
+        'gravity': 9.8,
+        'R_int': 6.4e6,
+        'P_surf': 1.0,
+    }
+
+    monkeypatch.setattr(agni_mod, 'jl', fake_jl)
+    monkeypatch.setattr(agni_mod, 'convert', lambda _typ, value: value)
+    monkeypatch.setattr(agni_mod, '_construct_voldict', lambda *_a, **_k: {'H2O': 1.0})
+    monkeypatch.setattr(agni_mod, 'sync_log_files', lambda *_a, **_k: None)
+    monkeypatch.setattr(agni_mod, 'get_spfile_path', lambda *_a, **_k: '/fake/spfile')
+    cache_dir = tmp_path / 'spcache'
+    if cached:
+        monkeypatch.setenv(agni_mod.spectral_cache.CACHE_DIR_ENV, str(cache_dir))
+    else:
+        monkeypatch.delenv(agni_mod.spectral_cache.CACHE_DIR_ENV, raising=False)
+    versions = []
+    read_version = agni_mod._agni_version
+    monkeypatch.setattr(agni_mod, '_agni_version', lambda: versions.append(1) or read_version())
+
+    with caplog.at_level(logging.WARNING, logger='fwl.proteus.atmos_clim.agni'):
+        atmos, _ = init_agni_atmos(dirs, config, hf_row)
+
+    assert atmos is not None
+    assert fake_agni.last_setup_args[2] == '/fake/spfile'
+    assert fake_agni.last_allocate_input_star == str(data_dir / '0.sflux')
+    assert len(versions) == int(cached)
+    assert ('spectral file not cached' in caplog.text) is cached
+    assert not cache_dir.exists()
+
+
 # ---------------------------------------------------------------------------
 # AgniSchemaMismatch: lightweight Atmos_t field-list check at allocate
 # ---------------------------------------------------------------------------
@@ -2391,3 +2448,112 @@ def test_a_lost_atmosphere_goes_to_transparent_mode_not_the_pressure_grid(monkey
     assert 'generate_pgrid' in fake_agni.calls
     assert 'make_transparent' not in fake_agni.calls
     status.assert_not_called()
+
+
+@pytest.mark.unit
+def test_guess_profile_seeded_from_profile_library(monkeypatch):
+    """A library neighbour replaces the configured guess and reports the
+    profile as seeded; without one the configured guess runs as before.
+    """
+    fake_agni = _ProfileAGNI()
+    _install_profile_fakes(monkeypatch, fake_agni)
+    atmos = _ProfileAtmosphere([1.0e2, 1.0e4, 1.0e6], [1.0, 1.0, 1.0])
+    hf_row = {'T_surf': 1500.0, 'T_magma': 1500.0}
+    p_lib = np.array([1.0e3, 1.0e4, 1.0e5])
+    t_lib = np.array([500.0, 900.0, 1400.0])
+    monkeypatch.setattr(
+        agni_mod.profile_library, 'lookup_profile', lambda config, row: (p_lib, t_lib)
+    )
+    dirs = {'output': '/tmp/run'}
+
+    seeded = agni_mod._set_guess_profile(atmos, hf_row, dirs, _build_profile_config())
+
+    assert seeded is True
+    assert dirs == {'output': '/tmp/run'}
+    assert fake_agni.calls == []
+    # Inside the stored grid the profile is interpolated in log pressure;
+    # beyond its ends it is held at the end values
+    assert atmos.tmp[1] == pytest.approx(900.0)
+    assert atmos.tmp[0] == pytest.approx(500.0)
+    assert atmos.tmp[-1] == pytest.approx(1400.0)
+    assert atmos.tmpl[-1] == pytest.approx(1400.0)
+
+    monkeypatch.setattr(agni_mod.profile_library, 'lookup_profile', lambda config, row: None)
+    assert agni_mod._set_guess_profile(atmos, hf_row, dirs, _build_profile_config()) is False
+    assert fake_agni.calls == ['isothermal', 'stratosphere']
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('seeded', [False, True])
+def test_solve_energy_skips_easy_start_when_seeded(monkeypatch, seeded):
+    """The first solve of a run starts easy unless the profile came from the
+    library.
+    """
+    calls = []
+
+    def fake_solve(atmos, **kwargs):
+        calls.append(kwargs)
+        return True
+
+    fake_jl = SimpleNamespace(
+        AGNI=SimpleNamespace(
+            solver=SimpleNamespace(solve_energy=SimpleNamespace(), solve_energy_b=fake_solve)
+        )
+    )
+    monkeypatch.setattr(agni_mod, 'jl', fake_jl)
+    monkeypatch.setattr(agni_mod, 'sync_log_files', lambda *a: [])
+    monkeypatch.setattr(agni_mod, '_validate_agni_state', lambda atmos: (True, ''))
+    config = _make_run_agni_config()
+    config.atmos_clim.agni.dx_max_ini = 50.0
+    config.atmos_clim.agni.max_steps = 200
+    for name in ('conduction', 'convection', 'sens_heat', 'latent_heat'):
+        setattr(config.atmos_clim.agni, name, True)
+    config.atmos_clim.agni.fdo = 2
+    dirs = {'output': '/tmp/run'}
+
+    _, ok = agni_mod._solve_energy(SimpleNamespace(), 0, dirs, config, seeded=seeded)
+
+    assert ok is True
+    assert len(calls) == 1
+    assert calls[0]['easy_start'] is (not seeded)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ('seeded', 'results', 'attempts'),
+    [(False, [False, True], 2), (True, [True], 1), (False, [False, False, False], 3)],
+)
+def test_solve_energy_records_attempts(monkeypatch, seeded, results, attempts):
+    """With a profile library, every energy solve records the solver attempts
+    it made, under seeded or unseeded; exhausting them records all three.
+    """
+    results = iter(results)
+    fake_jl = SimpleNamespace(
+        AGNI=SimpleNamespace(
+            solver=SimpleNamespace(
+                solve_energy=SimpleNamespace(),
+                solve_energy_b=lambda atmos, **kwargs: next(results),
+            )
+        )
+    )
+    recorded = []
+    monkeypatch.setattr(agni_mod, 'jl', fake_jl)
+    monkeypatch.setattr(agni_mod, 'sync_log_files', lambda *a: [])
+    monkeypatch.setattr(agni_mod, '_validate_agni_state', lambda atmos: (True, ''))
+    monkeypatch.setattr(agni_mod.profile_library, 'library_root', lambda: '/tmp/lib')
+    monkeypatch.setattr(
+        agni_mod.profile_library, 'record_solve', lambda *args: recorded.append(args)
+    )
+    config = _make_run_agni_config()
+    config.atmos_clim.agni.dx_max_ini = 50.0
+    config.atmos_clim.agni.max_steps = 200
+    for name in ('conduction', 'convection', 'sens_heat', 'latent_heat'):
+        setattr(config.atmos_clim.agni, name, True)
+    config.atmos_clim.agni.fdo = 2
+
+    _, ok = agni_mod._solve_energy(
+        SimpleNamespace(), 0, {'output': '/tmp/run'}, config, seeded=seeded
+    )
+
+    assert ok is (attempts < 3)
+    assert recorded == [(seeded, attempts)]
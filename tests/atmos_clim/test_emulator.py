@@ -0,0 +1,293 @@
+"""
+Unit tests for proteus.atmos_clim.emulator.
+
+Testing standards and documentation:
+- docs/How-to/testing.md: Running, writing, and marking tests; coverage and CI
+- docs/Explanations/test_framework.md: Test tiers, physics invariants, and quality rules
+
+Functions tested:
+- design_points(): domain corners, log sampling, composition on the simplex
+- EmulatorTable.query(): exact on linear data, fixed axes, coverage and
+  composition refusals, many varying axes
+- EmulatorTable.save() / load(): round trip and format check
+- run_emulator(): output levels, XUV level handling, fallback signal,
+  refusal of a table solved with other settings
+- run_atmosphere(): dispatch to the fallback module and deferred spectrum update
+"""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+import proteus.atmos_clim.emulator as emulator
+import proteus.atmos_clim.wrapper as atmos_wrapper
+from proteus.atmos_clim.common import Atmos_t
+from proteus.config._atmos_clim import AtmosClim
+from proteus.config._star import Star
+
+pytestmark = [pytest.mark.unit, pytest.mark.timeout(30)]
+
+_BOUNDS = {
+    'T_magma': (1500.0, 3000.0),
+    'P_surf': (1.0, 100.0),
+    'F_ins': (1e2, 1e4),
+    'gravity': (9.81, 9.81),
+}
+
+
+def _linear(point):
+    """Quantities linear in the table features, so interpolation is exact."""
+    T, P, F, g, h2o, co2 = point
+    lp = np.log10(P)
+    return [
+        0.1 * T + 20.0 * lp - 50.0 * h2o,
+        0.05 * T,
+        5.0 * np.log10(F),
+        0.3 * co2,
+        T - 10.0 * lp,
+        1.0e4 + 2.0e3 * lp,
+        800.0 + 100.0 * h2o,
+        2.0e4 + 1.0e3 * lp,
+        600.0,
+    ]
+
+
+def _config(table_path='table.npz', prevent_warming=False, hill_clamp=False):
+    atmos_clim = AtmosClim(surf_state='skin', p_obs=2e-2, albedo_pl=0.0, rayleigh=False)
+    atmos_clim.module = 'emulator'
+    atmos_clim.emulator.table = table_path
+    return SimpleNamespace(
+        atmos_clim=atmos_clim,
+        planet=SimpleNamespace(prevent_warming=prevent_warming),
+        escape=SimpleNamespace(
+            module='zephyrus', zephyrus=SimpleNamespace(Pxuv=1e-5), hill_clamp=hill_clamp
+        ),
+        interior_energetics=SimpleNamespace(module='aragog'),
+        orbit=SimpleNamespace(s0_factor=0.375),
+        star=Star(),
+    )
+
+
+def _table(config=None):
+    """Table of linear data, with the settings of `config` (default `_config`)."""
+    config = _config() if config is None else config
+    design = emulator.design_points(_BOUNDS, ['H2O', 'CO2'], 40, seed=1)
+    return emulator.EmulatorTable(
+        design,
+        [_linear(p) for p in design],
+        ['H2O', 'CO2'],
+        json.loads(json.dumps(emulator.table_settings(config))),
+    )
+
+
+def _hf_row(T_magma=2000.0, P_surf=10.0, H2O=0.4, p_xuv=1e-5):
+    return {
+        'T_magma': T_magma,
+        'T_surf': 0.0,
+        'P_surf': P_surf,
+        'F_ins': 1e3,
+        'gravity': 9.81,
+        'R_int': 6.0e6,
+        'p_xuv': p_xuv,
+        'H2O_vmr': H2O,
+        'CO2_vmr': 1.0 - H2O,
+    }
+
+
+def test_design_points_cover_the_domain():
+    """The design holds every corner with every pure gas, stays inside the
+    bounds, keeps a fixed axis fixed and puts each composition on the simplex."""
+    design = emulator.design_points(_BOUNDS, ['H2O', 'CO2'], 30, seed=0)
+
+    # 8 varying corners x 2 pure gases, plus the interior samples
+    assert len(design) == 16 + 30
+    np.testing.assert_allclose(design[:, 4:].sum(axis=1), 1.0, rtol=1e-12)
+    assert np.all(design[:, 3] == 9.81)
+    for i, key in enumerate(('T_magma', 'P_surf', 'F_ins')):
+        lo, hi = _BOUNDS[key]
+        assert design[:, i].min() == lo and design[:, i].max() == hi
+    # Pressure is sampled in decades: about half the interior lies below 10 bar
+    interior = design[(design[:, 4] > 0) & (design[:, 4] < 1)]
+    assert 0.3 < np.mean(interior[:, 1] < 10.0) < 0.7
+
+    with pytest.raises(ValueError, match='distinct'):
+        emulator.design_points(_BOUNDS, ['H2O', 'H2O'], 5)
+    with pytest.raises(ValueError, match='positive'):
+        emulator.design_points({**_BOUNDS, 'P_surf': (0.0, 1.0)}, ['H2O'], 5)
+
+
+def test_query_is_exact_on_linear_data():
+    """Quantities linear in the features are reproduced inside the hull."""
+    table = _table()
+    point = [2200.0, 30.0, 2e3, 9.81, 0.25, 0.75]
+
+    values = table.query(point)
+
+    for key, want in zip(emulator.OUTPUT_KEYS, _linear(point)):
+        assert values[key] == pytest.approx(want, rel=1e-9, abs=1e-9)
+
+
+def test_query_refuses_states_the_table_does_not_cover():
+    """States outside the hull, off a fixed axis, or holding untabulated gas
+    are refused rather than extrapolated."""
+    table = _table()
+
+    with pytest.raises(emulator.OutsideTableError, match='states of the table'):
+        table.query([3500.0, 30.0, 2e3, 9.81, 0.25, 0.75])
+    with pytest.raises(emulator.OutsideTableError, match='gravity'):
+        table.query([2200.0, 30.0, 2e3, 11.0, 0.25, 0.75])
+    with pytest.raises(emulator.OutsideTableError, match='not in the table'):
+        table.query([2200.0, 30.0, 2e3, 9.81, 0.25, 0.70])
+    # Within the tolerance the composition is renormalised and accepted
+    assert table.query([2200.0, 30.0, 2e3, 9.81, 0.25, 0.7495])['F_atm'] > 0
+
+
+def test_query_with_many_varying_axes():
+    """With every coordinate and four gases varying, a table of hundreds of
+    states builds at once and stays exact on linear data inside it.
+    """
+    bounds = {**_BOUNDS, 'gravity': (5.0, 20.0)}
+    gases = ['H2O', 'CO2', 'N2', 'H2']
+    design = emulator.design_points(bounds, gases, 400, seed=2)
+
+    def linear(point):
+        x = emulator._features(point)[0]
+        return [x @ np.arange(1.0, 8.0) + k for k in range(len(emulator.OUTPUT_KEYS))]
+
+    table = emulator.EmulatorTable(design, [linear(p) for p in design], gases)
+    point = 0.5 * design[-1] + 0.5 * design[-2]
+
+    values = table.query(point)
+
+    assert table._feats.shape[1] == 7
+    for key, want in zip(emulator.OUTPUT_KEYS, linear(point)):
+        assert values[key] == pytest.approx(want, rel=1e-9)
+
+
+def test_save_and_load_round_trip(tmp_path):
+    """A saved table loads back with its states, values and metadata, and a
+    table of another format is refused."""
+    table = _table()
+    path = str(tmp_path / 'table.npz')
+    table.save(path)
+
+    loaded = emulator.EmulatorTable.load(path)
+    np.testing.assert_array_equal(loaded.points, table.points)
+    np.testing.assert_array_equal(loaded.values, table.values)
+    assert loaded.gases == ('H2O', 'CO2')
+    assert loaded.metadata == table.metadata
+    assert loaded.metadata['p_xuv'] == 1e-5
+
+    with patch.object(emulator, 'TABLE_FORMAT_VERSION', 3):
+        with pytest.raises(ValueError, match='regenerate'):
+            emulator.EmulatorTable.load(path)
+
+
+def test_run_emulator_builds_the_module_output():
+    """The output carries the interpolated fluxes, the levels placed above the
+    actual interior radius, and the XUV level at the table's pressure."""
+    atmos_o = Atmos_t()
+    atmos_o._emulator = _table()
+    hf_row = _hf_row()
+
+    output = emulator.run_emulator(atmos_o, _config(), {}, hf_row)
+
+    want = dict(zip(emulator.OUTPUT_KEYS, _linear([2000.0, 10.0, 1e3, 9.81, 0.4, 0.6])))
+    assert output['F_atm'] == pytest.approx(want['F_atm'], rel=1e-9)
+    assert output['T_surf'] == pytest.approx(want['T_surf'], rel=1e-9)
+    assert output['R_obs'] == pytest.approx(6.0e6 + want['z_obs'], rel=1e-12)
+    assert output['R_xuv'] == pytest.approx(6.0e6 + want['z_xuv'], rel=1e-12)
+    assert output['g_obs'] == pytest.approx(9.81 * (6.0e6 / output['R_obs']) ** 2)
+    assert output['p_xuv'] == 1e-5
+    assert output['p_obs'] == 2e-2
+    assert hf_row['H2O_vmr_xuv'] == 0.4
+    assert (atmos_o._emulator.hits, atmos_o._emulator.misses) == (1, 0)
+
+    # Before escape sets a level, the XUV level is the surface
+    output = emulator.run_emulator(atmos_o, _config(), {}, _hf_row(p_xuv=0.0))
+    assert output['R_xuv'] == 6.0e6
+    assert output['p_xuv'] == 10.0
+
+
+def test_run_emulator_signals_fallback_and_rejects_a_mismatched_table(tmp_path):
+    """Outside the table the emulator returns None; a table generated for
+    another surface state or XUV level is an error, not a fallback."""
+    atmos_o = Atmos_t()
+    atmos_o._emulator = _table()
+
+    assert emulator.run_emulator(atmos_o, _config(), {}, _hf_row(T_magma=3500.0)) is None
+    assert atmos_o._emulator.misses == 1
+
+    with patch.object(emulator, 'UpdateStatusfile'):
+        with pytest.raises(ValueError, match='XUV level'):
+            emulator.run_emulator(atmos_o, _config(), {}, _hf_row(p_xuv=1e-3))
+
+        # A table solved with the same settings loads and serves
+        path = str(tmp_path / 'same.npz')
+        _table().save(path)
+        assert emulator.run_emulator(Atmos_t(), _config(path), {}, _hf_row()) is not None
+
+        # Any other setting, physics as well as the boundary condition, refuses it
+        fixed = _config()
+        fixed.atmos_clim.surf_state = 'fixed'
+        other_bands = _config()
+        other_bands.atmos_clim.spectral_bands = '256'
+        no_convection = _config()
+        no_convection.atmos_clim.agni.convection = False
+        for config, key in (
+            (fixed, 'atmos_clim.surf_state'),
+            (other_bands, 'atmos_clim.spectral_bands'),
+            (no_convection, 'agni.convection'),
+        ):
+            path = str(tmp_path / f'{key}.npz')
+            _table(config).save(path)
+            with pytest.raises(ValueError, match=key.replace('.', r'\.')):
+                emulator.run_emulator(Atmos_t(), _config(path), {}, _hf_row())
+
+
+def test_run_atmosphere_falls_back_on_the_pending_spectrum():
+    """A step the emulator answers defers a spectrum update; the next step it
+    refuses is solved by the fallback module on the updated spectrum."""
+    atmos_o = Atmos_t()
+    config = _config()
+    hf_row = {
+        **_hf_row(),
+        'M_planet': 6.0e24,
+        'F_int': 100.0,
+        'F_atm': 100.0,
+        'axial_period': 86400.0,
+        'atm_kg_per_mol': 0.03,
+        'R_obs': 0.0,
+        'R_star': 7.0e8,
+        'F_olr': 100.0,
+        'F_sct': 0.0,
+        'separation': 1.5e11,
+    }
+    solved = {'T_surf': 1900.0, 'F_atm': 100.0, 'R_obs': 6.1e6, 'albedo': 0.1}
+
+    def _run(update, emulated):
+        with (
+            patch(
+                'proteus.atmos_clim.emulator.run_emulator',
+                return_value=dict(solved) if emulated else None,
+            ),
+            patch.object(atmos_wrapper, 'solve_column', return_value=dict(solved)) as solve,
+        ):
+            atmos_wrapper.run_atmosphere(
+                atmos_o, config, {}, {'total': 3}, [1.0], [1.0], update, None, hf_row
+            )
+        return solve
+
+    assert not _run(update=True, emulated=True).called
+    assert atmos_o.spectrum_pending is True
+
+    solve = _run(update=False, emulated=False)
+    assert solve.call_args.args[0] == 'agni'
+    assert solve.call_args.args[7] is True
+    assert atmos_o.spectrum_pending is False
+    assert hf_row['bond_albedo'] == 0.1
@@ -0,0 +1,172 @@
+"""
+Unit tests for proteus.atmos_clim.profile_library.
+
+Testing standards and documentation:
+- docs/How-to/testing.md: Running, writing, and marking tests; coverage and CI
+- docs/Explanations/test_framework.md: Test tiers, physics invariants, and quality rules
+
+Functions tested:
+- lookup_profile() / store_profile(): opt-in gate, nearest-neighbour lookup,
+  scaling to the new surface state, settings isolation, distance cut,
+  store spacing, hit statistics
+- record_solve() / solve_statistics(): solver effort of seeded and
+  unseeded solves
+- distance(): log-space comparison and composition term
+"""
+
+from __future__ import annotations
+
+import os
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import proteus.atmos_clim.profile_library as library
+from proteus.utils.constants import gas_list
+
+pytestmark = [pytest.mark.unit, pytest.mark.timeout(30)]
+
+
+def _config(surf_state='fixed', spectral_bands='48'):
+    agni = SimpleNamespace(
+        spectral_file=None,
+        chemistry=None,
+        convection=True,
+        conduction=False,
+        sens_heat=True,
+        latent_heat=False,
+        rainout=True,
+        oceans=True,
+        real_gas=False,
+    )
+    return SimpleNamespace(
+        atmos_clim=SimpleNamespace(
+            spectral_group='Honeyside',
+            spectral_bands=spectral_bands,
+            surf_state=surf_state,
+            rayleigh=True,
+            agni=agni,
+        )
+    )
+
+
+def _hf_row(T_surf=2000.0, P_surf=100.0, F_ins=1361.0, gravity=9.81, H2O=0.8):
+    row = {'T_surf': T_surf, 'P_surf': P_surf, 'F_ins': F_ins, 'gravity': gravity}
+    for g in gas_list:
+        row[g + '_vmr'] = 0.0
+    row['H2O_vmr'] = H2O
+    row['CO2_vmr'] = 1.0 - H2O
+    return row
+
+
+def _profile(p_surf=100.0, t_surf=2000.0):
+    p = np.logspace(-1.0, np.log10(p_surf * 1e5), 30)
+    tmp = np.linspace(0.2, 1.0, 30) * t_surf
+    return p, tmp
+
+
+@pytest.fixture
+def library_dir(tmp_path, monkeypatch):
+    root = tmp_path / 'agni_profiles'
+    monkeypatch.setenv(library.LIBRARY_DIR_ENV, str(root))
+    monkeypatch.delenv(library.LIBRARY_MAX_SIZE_ENV, raising=False)
+    monkeypatch.setattr(library, '_index', {})
+    monkeypatch.setattr(library, '_stats', {'lookups': 0, 'hits': 0, 'stores': 0})
+    return root
+
+
+def test_disabled_without_env(tmp_path, monkeypatch):
+    """Without PROTEUS_AGNI_PROFILE_DIR nothing is stored, found or counted."""
+    monkeypatch.delenv(library.LIBRARY_DIR_ENV, raising=False)
+    monkeypatch.setattr(library, '_stats', {'lookups': 0, 'hits': 0, 'stores': 0})
+    monkeypatch.chdir(tmp_path)
+
+    library.store_profile(_config(), _hf_row(), *_profile())
+
+    assert library.lookup_profile(_config(), _hf_row()) is None
+    assert os.listdir(tmp_path) == []
+    assert library.statistics() == {'lookups': 0, 'hits': 0, 'stores': 0}
+
+
+def test_round_trip_scales_to_new_surface(library_dir):
+    """A stored profile seeds a nearby state, scaled to its surface values,
+    and the hit is counted.
+    """
+    p, tmp = _profile()
+    library.store_profile(_config(), _hf_row(), p, tmp)
+
+    p_seed, t_seed = library.lookup_profile(_config(), _hf_row())
+    np.testing.assert_array_equal(p_seed, p)
+    np.testing.assert_array_equal(t_seed, tmp)
+
+    p_seed, t_seed = library.lookup_profile(_config(), _hf_row(T_surf=2040.0, P_surf=120.0))
+    np.testing.assert_allclose(p_seed, p * 1.2, rtol=1e-12)
+    np.testing.assert_allclose(t_seed, tmp * 1.02, rtol=1e-12)
+    assert library.statistics() == {'lookups': 2, 'hits': 2, 'stores': 1}
+
+
+def test_nearest_entry_wins(library_dir):
+    """Of two stored profiles, the one nearer in composition seeds the solve."""
+    library.store_profile(_config(), _hf_row(H2O=0.9), *_profile(t_surf=2000.0))
+    library.store_profile(_config(), _hf_row(H2O=0.5), *_profile(t_surf=1000.0))
+
+    _, t_seed = library.lookup_profile(_config(), _hf_row(H2O=0.55))
+
+    np.testing.assert_array_equal(t_seed, _profile(t_surf=1000.0)[1])
+
+
+def test_settings_isolation_and_distance_cut(library_dir):
+    """Other solver settings or a distant state get no seed."""
+    library.store_profile(_config(), _hf_row(), *_profile())
+
+    assert library.lookup_profile(_config(surf_state='skin'), _hf_row()) is None
+    assert library.lookup_profile(_config(spectral_bands='256'), _hf_row()) is None
+    assert library.lookup_profile(_config(), _hf_row(T_surf=3000.0)) is None
+    assert library.statistics()['hits'] == 0
+    assert library.statistics()['lookups'] == 3
+
+
+def test_store_spacing(library_dir):
+    """A profile within MIN_SPACING of a stored one is not stored again."""
+    library.store_profile(_config(), _hf_row(), *_profile())
+    library.store_profile(_config(), _hf_row(T_surf=2001.0), *_profile())
+    library.store_profile(_config(), _hf_row(T_surf=2300.0), *_profile())
+
+    (directory,) = os.listdir(library_dir)
+    assert len(os.listdir(library_dir / directory)) == 2
+    assert library.statistics()['stores'] == 2
+
+
+def test_distance_terms():
+    """Equal states are at zero distance, a 5 % temperature step or a 0.1
+    shift of mixing ratio at one, and non-positive coordinates never match.
+    """
+    a = library.coordinates(_hf_row())
+    assert library.distance(a, a) == 0.0
+    b = library.coordinates(_hf_row(T_surf=2000.0 * np.exp(0.05)))
+    assert library.distance(a, b) == pytest.approx(1.0)
+    c = library.coordinates(_hf_row(H2O=0.8 - 0.1 / np.sqrt(2.0)))
+    assert library.distance(a, c) == pytest.approx(1.0)
+    assert library.distance(a, library.coordinates(_hf_row(P_surf=0.0))) == np.inf
+
+
+def test_solve_statistics_split_by_seeding(monkeypatch):
+    """Attempts are summed separately for seeded and unseeded solves."""
+    monkeypatch.setattr(
+        library,
+        '_solves',
+        {
+            'seeded': {'solves': 0, 'attempts': 0},
+            'unseeded': {'solves': 0, 'attempts': 0},
+        },
+    )
+
+    library.record_solve(False, 2)
+    library.record_solve(True, 1)
+    library.record_solve(True, 1)
+
+    assert library.solve_statistics() == {
+        'seeded': {'solves': 2, 'attempts': 2},
+        'unseeded': {'solves': 1, 'attempts': 2},
+    }
@@ -0,0 +1,107 @@
+"""
+Unit tests for proteus.atmos_clim.spectral_cache.
+
+Testing standards and documentation:
+- docs/How-to/testing.md: Running, writing, and marking tests; coverage and CI
+- docs/Explanations/test_framework.md: Test tiers, physics invariants, and quality rules
+
+Functions tested:
+- entry_key(): disabled without a cache root, changes with the stellar
+  spectrum, the base spectral file and the module options
+- fetch() / store(): round trip of both halves of a spectral file, misses,
+  stores of an existing entry
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+import proteus.atmos_clim.spectral_cache as spectral_cache
+
+pytestmark = [pytest.mark.unit, pytest.mark.timeout(30)]
+
+
+@pytest.fixture
+def files(monkeypatch, tmp_path):
+    """Cache root, base spectral file and stellar spectrum in tmp_path."""
+    monkeypatch.setenv(spectral_cache.CACHE_DIR_ENV, str(tmp_path / 'cache'))
+    monkeypatch.delenv(spectral_cache.CACHE_MAX_SIZE_ENV, raising=False)
+    monkeypatch.setattr(spectral_cache, '_stats', {'lookups': 0, 'hits': 0, 'stores': 0})
+    base = tmp_path / 'base.sf'
+    base.write_text('*BLOCK: TYPE =    0\n')
+    (tmp_path / 'base.sf_k').write_text('k-terms\n')
+    star = tmp_path / 'star.txt'
+    star.write_text('1.0e-7 1.0\n')
+    return base, star
+
+
+def _prepare(path, text='with star'):
+    """Write both halves of a prepared spectral file."""
+    path.write_text(text + '\n')
+    (path.parent / (path.name + '_k')).write_text(text + ' k\n')
+
+
+def test_disabled_without_cache_root(files, monkeypatch, tmp_path):
+    """Without PROTEUS_SPFILE_CACHE_DIR nothing is keyed, fetched or stored."""
+    base, star = files
+    monkeypatch.delenv(spectral_cache.CACHE_DIR_ENV)
+    assert spectral_cache.entry_key('janus-1', str(base), str(star)) is None
+
+    out = tmp_path / 'star.sf'
+    _prepare(out)
+    spectral_cache.store(None, str(out))
+    assert not spectral_cache.fetch(None, str(out))
+    assert not (tmp_path / 'cache').exists()
+
+
+def test_key_tracks_inputs(files):
+    """The key changes with the stellar spectrum, the base file and the options."""
+    base, star = files
+    key = spectral_cache.entry_key('agni-1', str(base), str(star), rayleigh=True)
+    assert key == spectral_cache.entry_key('agni-1', str(base), str(star), rayleigh=True)
+
+    assert key != spectral_cache.entry_key('agni-1', str(base), str(star), rayleigh=False)
+    assert key != spectral_cache.entry_key('agni-2', str(base), str(star), rayleigh=True)
+    star.write_text('1.0e-7 2.0\n')
+    changed_star = spectral_cache.entry_key('agni-1', str(base), str(star), rayleigh=True)
+    assert changed_star != key
+    base.write_text('*BLOCK: TYPE =    0\n*BLOCK: TYPE =    1\n')
+    assert spectral_cache.entry_key('agni-1', str(base), str(star), rayleigh=True) not in (
+        key,
+        changed_star,
+    )
+
+
+def test_round_trip(files, tmp_path):
+    """A stored spectral file is copied back with its _k file and counted."""
+    base, star = files
+    key = spectral_cache.entry_key('janus-1', str(base), str(star))
+    first = tmp_path / 'run1' / 'star.sf'
+    first.parent.mkdir()
+    assert not spectral_cache.fetch(key, str(first))
+
+    _prepare(first)
+    spectral_cache.store(key, str(first))
+    # A second store of the same entry is a no-op
+    _prepare(first, 'other')
+    spectral_cache.store(key, str(first))
+
+    second = tmp_path / 'run2' / 'star.sf'
+    second.parent.mkdir()
+    assert spectral_cache.fetch(key, str(second))
+    assert second.read_text() == 'with star\n'
+    assert (tmp_path / 'run2' / 'star.sf_k').read_text() == 'with star k\n'
+    assert spectral_cache.statistics() == {'lookups': 2, 'hits': 1, 'stores': 1}
+    assert not any(n.startswith('.tmp-') for n in os.listdir(tmp_path / 'cache'))
+
+
+def test_incomplete_file_not_stored(files, tmp_path):
+    """A spectral file without its _k file is not stored."""
+    base, star = files
+    key = spectral_cache.entry_key('janus-1', str(base), str(star))
+    out = tmp_path / 'star.sf'
+    out.write_text('no k-terms\n')
+    spectral_cache.store(key, str(out))
+    assert not (tmp_path / 'cache' / key).exists()
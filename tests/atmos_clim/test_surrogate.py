@@ -0,0 +1,136 @@
+"""
+Unit tests for proteus.atmos_clim.surrogate.
+
+Testing standards and documentation:
+- docs/How-to/testing.md: Running, writing, and marking tests; coverage and CI
+- docs/Explanations/test_framework.md: Test tiers, physics invariants, and quality rules
+
+Functions tested:
+- FluxSurrogate.record() / predict(): linear response of the fluxes recovered
+  from earlier solves, validation before the first prediction, trust region,
+  refusal across a changed instellation or composition, reset
+- FluxSurrogate.skip_output(): fluxes replaced, surface state passed through
+- features(): boundary temperature by surface state
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from proteus.atmos_clim.surrogate import FluxSurrogate, features
+from proteus.utils.constants import gas_list
+from proteus.utils.surrogate import MIN_SOLVES
+
+pytestmark = [pytest.mark.unit, pytest.mark.timeout(30)]
+
+
+def _row(T_surf, P_surf, H2O=0.8, F_ins=1361.0):
+    row = {
+        'T_surf': T_surf,
+        'T_magma': T_surf + 50.0,
+        'P_surf': P_surf,
+        'F_ins': F_ins,
+        'gravity': 9.81,
+        'R_int': 6.371e6,
+    }
+    for g in gas_list:
+        row[g + '_vmr'] = 0.0
+    row['H2O_vmr'] = H2O
+    row['CO2_vmr'] = 1.0 - H2O
+    return row
+
+
+def _output(T_surf, P_surf):
+    """AGNI output whose fluxes respond linearly to T_surf and ln P_surf."""
+    F_olr = 2.0e4 + 40.0 * (T_surf - 2000.0) - 500.0 * math.log(P_surf / 100.0)
+    F_sct = 300.0
+    return {
+        'F_atm': F_olr + F_sct - 1000.0,
+        'F_olr': F_olr,
+        'F_sct': F_sct,
+        'T_surf': T_surf,
+        'albedo': 0.3,
+        'P_surf_clim': P_surf,
+        'R_obs': 7.0e6,
+        'agni_converged': True,
+    }
+
+
+def _trained(states):
+    surrogate = FluxSurrogate('fixed', flux_floor=0.5)
+    for T, P in states:
+        surrogate.record(_row(T, P), _output(T, P))
+    return surrogate
+
+
+_STATES = ((2000.0, 100.0), (1990.0, 101.0), (1985.0, 99.0), (1980.0, 100.5))
+
+
+def test_features_boundary_temperature():
+    """The boundary temperature is T_magma under 'skin', T_surf otherwise."""
+    row = _row(2000.0, 100.0)
+    np.testing.assert_allclose(features(row, 'fixed'), [2000.0, math.log(100.0)])
+    np.testing.assert_allclose(features(row, 'skin'), [2050.0, math.log(100.0)])
+
+
+def test_no_prediction_before_validated():
+    """Fewer than MIN_SOLVES solves give no prediction, with a reason."""
+    surrogate = _trained(_STATES[: MIN_SOLVES - 1])
+    prediction, reason = surrogate.predict(_row(1992.0, 100.0), trust=0.02)
+    assert prediction is None
+    assert 'no validated fit' in reason
+
+
+def test_linear_response_recovered():
+    """A linear response is predicted exactly, with a negligible error."""
+    surrogate = _trained(_STATES)
+
+    prediction, _ = surrogate.predict(_row(1983.0, 100.2), trust=0.02)
+
+    expected = _output(1983.0, 100.2)
+    assert prediction.F_atm == pytest.approx(expected['F_atm'], rel=1e-9)
+    assert prediction.F_olr == pytest.approx(expected['F_olr'], rel=1e-9)
+    assert prediction.error < 1e-9
+
+
+def test_refusals_and_reset():
+    """Steps outside the trust region, or under another instellation or
+    composition, give no prediction; reset forgets every solve.
+    """
+    surrogate = _trained(_STATES)
+
+    assert 'trust region' in surrogate.predict(_row(1900.0, 100.0), trust=0.02)[1]
+    assert 'trust region' in surrogate.predict(_row(1980.0, 110.0), trust=0.02)[1]
+    assert 'changed' in surrogate.predict(_row(1982.0, 100.0, H2O=0.7), trust=0.02)[1]
+    assert 'changed' in surrogate.predict(_row(1982.0, 100.0, F_ins=1400.0), trust=0.02)[1]
+
+    surrogate.reset()
+    assert len(surrogate) == 0
+    assert surrogate.predict(_row(1982.0, 100.0), trust=0.02)[0] is None
+
+
+def test_context_change_restarts_history():
+    """A solve under another composition starts a new fit."""
+    surrogate = _trained(_STATES)
+    surrogate.record(_row(1980.0, 100.0, H2O=0.5), _output(1980.0, 100.0))
+    assert len(surrogate) == 1
+
+
+def test_skip_output():
+    """A skipped solve carries the predicted fluxes and the current surface
+    state, and keeps the levels of the latest solve.
+    """
+    surrogate = _trained(_STATES)
+    row = _row(1983.0, 100.2)
+    prediction, _ = surrogate.predict(row, trust=0.02)
+
+    output = surrogate.skip_output(prediction, row)
+
+    assert output['F_atm'] == prediction.F_atm
+    assert output['T_surf'] == 1983.0
+    assert output['P_surf_clim'] == pytest.approx(100.2)
+    assert output['R_obs'] == 7.0e6
+    assert output['agni_converged'] is True
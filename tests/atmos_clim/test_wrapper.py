@@ -5,7 +5,8 @@ Covers ``update_wtg_surf`` (weak-temperature-gradient surface parameter),
 ``ShallowMixedOceanLayer`` (thin-ocean thermal evolution via scipy.solve_ivp),
 ``write_atmosphere_snapshot`` (per-module snapshot dispatch), and
 ``carry_converged_levels`` (photospheric and XUV levels are not taken from a
-structure the solver rejected). The ``run_atmosphere`` paths reached here are
+structure the solver rejected), and the AGNI flux surrogate that answers
+iterations without a solve. The ``run_atmosphere`` paths reached here are
 those a mocked atmosphere module can drive; the full coupled dispatch is
 exercised by integration tests in the nightly tier.
 
@@ -703,6 +704,7 @@ def test_run_atmosphere_carries_levels_into_the_row_escape_reads():
             rayleigh=False,
             cloud_enabled=False,
             surf_state='fixed',
+            agni=SimpleNamespace(surrogate_tol=0.0, solve_energy=True),
         ),
         interior_energetics=SimpleNamespace(module='aragog'),
     )
@@ -805,6 +807,7 @@ def test_run_atmosphere_takes_the_resume_fallback_from_the_last_committed_row():
             rayleigh=False,
             cloud_enabled=False,
             surf_state='fixed',
+            agni=SimpleNamespace(surrogate_tol=0.0, solve_energy=True),
         ),
         interior_energetics=SimpleNamespace(module='aragog'),
     )
@@ -991,6 +994,7 @@ def test_run_atmosphere_clips_a_carried_radius_from_an_unclipped_row():
             rayleigh=False,
             cloud_enabled=False,
             surf_state='fixed',
+            agni=SimpleNamespace(surrogate_tol=0.0, solve_energy=True),
         ),
         interior_energetics=SimpleNamespace(module='aragog'),
         escape=SimpleNamespace(hill_clamp=True, hill_clamp_frac=1.0),
@@ -1093,6 +1097,7 @@ def test_run_atmosphere_does_not_place_gravity_from_a_radius_that_is_not_a_numbe
             rayleigh=False,
             cloud_enabled=False,
             surf_state='fixed',
+            agni=SimpleNamespace(surrogate_tol=0.0, solve_energy=True),
         ),
         interior_energetics=SimpleNamespace(module='aragog'),
         escape=SimpleNamespace(hill_clamp=hill_clamp, hill_clamp_frac=1.0),
@@ -1191,6 +1196,7 @@ def test_run_atmosphere_keeps_a_level_the_bound_does_not_move():
             rayleigh=False,
             cloud_enabled=False,
             surf_state='fixed',
+            agni=SimpleNamespace(surrogate_tol=0.0, solve_energy=True),
         ),
         interior_energetics=SimpleNamespace(module='aragog'),
         escape=SimpleNamespace(hill_clamp=True, hill_clamp_frac=1.0),
@@ -1329,3 +1335,125 @@ def test_realign_xuv_gravity_leaves_the_level_alone_where_it_cannot_be_placed():
     assert 'g_xuv' not in empty
     assert 'p_xuv' not in empty
     assert 'T_xuv' not in empty
+
+
+# ---------------------------------------------------------------------------
+# AGNI flux surrogate: iterations answered without a solve
+# ---------------------------------------------------------------------------
+
+
+def test_run_atmosphere_skips_agni_solves_the_surrogate_answers():
+    """With `surrogate_tol > 0`, small steps after enough converged solves are
+    answered from the linear-response fit without calling AGNI, until
+    `surrogate_max_skips` forces a solve; a stellar spectrum update always
+    solves and discards the fit.
+    """
+    atmos_o = Atmos_t()
+    atmos_o._atm = SimpleNamespace(is_alloc=True)
+
+    config = SimpleNamespace(
+        atmos_clim=SimpleNamespace(
+            module='agni',
+            albedo_pl=0.0,
+            rayleigh=False,
+            cloud_enabled=False,
+            surf_state='fixed',
+            agni=SimpleNamespace(
+                solve_energy=True,
+                solution_atol=0.5,
+                surrogate_tol=1e-3,
+                surrogate_trust=0.02,
+                surrogate_max_skips=2,
+            ),
+        ),
+        interior_energetics=SimpleNamespace(module='aragog'),
+        planet=SimpleNamespace(prevent_warming=False),
+    )
+    hf_row = {
+        'T_magma': 2000.0,
+        'P_surf': 100.0,
+        'gravity': 9.81,
+        'H2O_vmr': 1.0,
+        'M_planet': 6.0e24,
+        'F_int': 120.0,
+        'F_atm': 0.0,
+        'axial_period': 86400.0,
+        'atm_kg_per_mol': 0.018,
+        'T_surf': 0.0,
+        'R_int': 6.371e6,
+        'R_star': 6.96e8,
+        'F_olr': 0.0,
+        'F_sct': 0.0,
+        'F_ins': 1361.0,
+        'separation': 1.5e11,
+        **_levels(2.0e7, 2.4e7),
+    }
+    solves = []
+    seeds = []
+
+    def _run_agni(atm, *args, **kwargs):
+        T = hf_row['T_surf']
+        solves.append(T)
+        seeds.append(kwargs['seeded'])
+        out = _levels(2.0e7, 2.4e7)
+        out.pop('H2O_vmr_xuv')
+        F_olr = 2.0e4 + 40.0 * (T - 2000.0)
+        out.update(
+            {
+                'F_atm': F_olr - 700.0,
+                'F_olr': F_olr,
+                'F_sct': 300.0,
+                'T_surf': T,
+                'albedo': 0.3,
+                'P_surf_clim': 100.0,
+                'agni_converged': True,
+            }
+        )
+        return atm, out
+
+    def _step(T_magma, update_spectrum=False):
+        hf_row['T_magma'] = T_magma
+        with (
+            patch(
+                'proteus.atmos_clim.agni.update_agni_atmos', side_effect=lambda a, *_, **__: a
+            ),
+            patch('proteus.atmos_clim.agni.run_agni', side_effect=_run_agni),
+            patch('proteus.atmos_clim.agni.deallocate_atmos'),
+            # the new struct takes its profile from the profile library
+            patch('proteus.atmos_clim.agni.init_agni_atmos', return_value=(atmos_o._atm, True)),
+        ):
+            atmos_wrapper.run_atmosphere(
+                atmos_o,
+                config,
+                {'output': '/tmp/x'},
+                {'total': 5},
+                [1.0],
+                [1.0],
+                update_spectrum,
+                None,
+                hf_row,
+            )
+
+    # The third solve validates the fit made from the first two
+    for T in (2000.0, 1995.0, 1990.0):
+        _step(T)
+    assert len(solves) == 3
+
+    # Two skips, exact on this linear response, then a forced solve
+    _step(1987.0)
+    _step(1984.0)
+    assert len(solves) == 3
+    assert hf_row['F_atm'] == pytest.approx(2.0e4 + 40.0 * (1984.0 - 2000.0) - 700.0)
+    assert hf_row['T_surf'] == 1984.0
+    assert hf_row['atm_converged'] == 1.0
+    _step(1981.0)
+    assert solves[-1] == 1981.0
+
+    # A new stellar spectrum solves and discards the fit
+    assert not any(seeds)
+    _step(1978.0, update_spectrum=True)
+    assert solves[-1] == 1978.0
+    assert seeds[-1] is True
+    assert atmos_o.seeded is False
+    assert len(atmos_o._surrogate) == 1
+    assert (atmos_o._surrogate.skipped, atmos_o._surrogate.solved) == (2, 5)
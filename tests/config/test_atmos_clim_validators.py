@@ -289,3 +289,63 @@ def test_surf_state_int_maps_skin_and_rejects_unknown():
     # silent default integer.
     with pytest.raises(ValueError, match='surf_state'):
         AtmosClim.surf_state_int.fget(SimpleNamespace(surf_state='mixed_layer'))
+
+
+# ============================================================================
+# Emulator: valid_emulator and column_solver
+# ============================================================================
+
+
+def _make_emulator_instance(table, surf_state='skin', fallback='agni'):
+    return SimpleNamespace(
+        module='emulator',
+        surf_state=surf_state,
+        emulator=SimpleNamespace(table=table, fallback=fallback),
+    )
+
+
+@pytest.mark.unit
+def test_valid_emulator_requires_an_existing_table(tmp_path):
+    """The emulator needs a table, and the table must exist; a tabulable
+    surface state with an existing table passes."""
+    from proteus.config._atmos_clim import valid_emulator
+
+    with pytest.raises(ValueError, match='emulator.table'):
+        valid_emulator(_make_emulator_instance(None), attribute=None, value=None)
+    with pytest.raises(FileNotFoundError, match='not found'):
+        valid_emulator(
+            _make_emulator_instance(str(tmp_path / 'missing.npz')), attribute=None, value=None
+        )
+
+    table = tmp_path / 'table.npz'
+    table.write_bytes(b'')
+    assert (
+        valid_emulator(_make_emulator_instance(str(table)), attribute=None, value=None) is None
+    )
+    # The mixed-layer surface has no tabulated temperature coordinate
+    with pytest.raises(ValueError, match="'fixed' or 'skin'"):
+        valid_emulator(
+            _make_emulator_instance(str(table), surf_state='mixed_layer'),
+            attribute=None,
+            value=None,
+        )
+    # Discrimination: another module skips the check entirely
+    other = _make_emulator_instance(None)
+    other.module = 'agni'
+    assert valid_emulator(other, attribute=None, value=None) is None
+
+
+@pytest.mark.unit
+def test_column_solver_is_the_emulator_fallback():
+    """Under the emulator the column is solved by its fallback module, so the
+    fallback's own validator applies; every other module solves itself."""
+    from proteus.config._atmos_clim import column_solver, valid_janus
+
+    instance = _make_emulator_instance('table.npz', fallback='janus')
+    assert column_solver(instance) == 'janus'
+    assert column_solver(SimpleNamespace(module='dummy')) == 'dummy'
+
+    instance.spectral_group = ''
+    instance.spectral_bands = '48'
+    with pytest.raises(ValueError, match='spectral_group'):
+        valid_janus(instance, attribute=None, value=None)
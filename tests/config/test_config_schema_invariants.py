@@ -39,6 +39,7 @@ import pytest
 
 from proteus.config import read_config_object
 from proteus.config._config import (
+    adaptive_levels_valid,
     boreas_requires_atmosphere,
     boundary_requires_fixed_surface_state,
     check_module_dependencies,
@@ -64,7 +65,7 @@ pytestmark = [pytest.mark.unit, pytest.mark.timeout(30)]
 # ---------------------------------------------------------------------------
 OUTGAS_BACKENDS = ('calliope', 'atmodeller', 'dummy')
 INTERIOR_ENERGETICS_BACKENDS = ('spider', 'aragog', 'dummy', 'boundary')
-ATMOS_CLIM_BACKENDS = ('dummy', 'agni', 'janus')
+ATMOS_CLIM_BACKENDS = ('dummy', 'agni', 'janus', 'emulator')
 ATMOS_CHEM_BACKENDS = (None, 'vulcan', 'dummy')
 ESCAPE_BACKENDS = (None, 'dummy', 'zephyrus', 'boreas')
 STAR_BACKENDS = (None, 'mors', 'dummy')
@@ -85,6 +86,7 @@ HARD_DEP_BACKENDS = {
     ('atmos_clim.module', 'dummy'),
     ('atmos_clim.module', 'agni'),
     ('atmos_clim.module', 'janus'),
+    ('atmos_clim.module', 'emulator'),
     ('atmos_chem.module', None),
     ('atmos_chem.module', 'dummy'),
     ('escape.module', None),
@@ -416,6 +418,45 @@ def test_boreas_requires_atmosphere_skips_when_not_boreas():
     assert instance.atmos_clim.module == 'dummy'
 
 
+# ---------------------------------------------------------------------------
+# adaptive_levels_valid: positive + negative
+# ---------------------------------------------------------------------------
+def _adaptive_instance(module='spider', struct='zalmoxis', num_levels=120, num_levels_min=40):
+    instance = _make_config_instance(
+        **{'interior_energetics.module': module, 'interior_struct.module': struct}
+    )
+    instance.interior_energetics.adaptive_levels = True
+    instance.interior_energetics.num_levels = num_levels
+    instance.interior_energetics.num_levels_min = num_levels_min
+    return instance
+
+
+@pytest.mark.unit
+def test_adaptive_levels_valid_passes_for_spider_on_zalmoxis():
+    """Adaptive resolution with SPIDER on a Zalmoxis mesh is accepted, and
+    the validator is silent when the option is off for any backend.
+    """
+    assert adaptive_levels_valid(_adaptive_instance(), None, None) is None
+    instance = _adaptive_instance(module='aragog')
+    instance.interior_energetics.adaptive_levels = False
+    assert adaptive_levels_valid(instance, None, None) is None
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('module,struct', [('aragog', 'zalmoxis'), ('spider', 'self')])
+def test_adaptive_levels_valid_rejects_other_backends(module, struct):
+    """Adaptive resolution on another interior or structure module raises."""
+    with pytest.raises(ValueError, match='adaptive_levels requires'):
+        adaptive_levels_valid(_adaptive_instance(module, struct), None, None)
+
+
+@pytest.mark.unit
+def test_adaptive_levels_valid_rejects_min_above_levels():
+    """num_levels_min above num_levels raises and names both values."""
+    with pytest.raises(ValueError, match='num_levels_min=150, num_levels=120'):
+        adaptive_levels_valid(_adaptive_instance(num_levels_min=150), None, None)
+
+
 # ---------------------------------------------------------------------------
 # planet_mass_valid: positive + negative for the four documented bands
 # ---------------------------------------------------------------------------
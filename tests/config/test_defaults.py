@@ -242,6 +242,12 @@ def test_aragog_defaults():
         Aragog(temperature_step_cap=-5.0)
     with pytest.raises(ValueError):
         Aragog(entropy_step_cap=-5.0)
+    # Speculative retries are off or probe at least two rungs; a single
+    # probe would only run while the main process waits, so it is rejected.
+    assert a.speculative_retries == 0
+    assert Aragog(speculative_retries=2).speculative_retries == 2
+    with pytest.raises(ValueError, match='0 or >= 2'):
+        Aragog(speculative_retries=1)
     # Positive values persist.
     assert Aragog(phi_step_cap=0.05).phi_step_cap == pytest.approx(0.05)
     assert Aragog(temperature_step_cap=150.0).temperature_step_cap == pytest.approx(150.0)
@@ -801,6 +801,84 @@ class TestSlurmConfig:
         # The work loop still follows the env block.
         assert 'i=$SLURM_ARRAY_TASK_ID' in contents
 
+    def test_slurm_script_exports_presolve_stores(self, grid_with_mocks, monkeypatch):
+        """With the structure pre-solve enabled nothing is solved while the
+        scripts are written. A pre-solve job exports the stores, defaulting
+        to the grid output directory, and runs `proteus grid-presolve`; the
+        dispatch script exports the same stores and is submitted after it.
+        """
+        g = grid_with_mocks
+        g.add_dimension('m', 'planet.mass_tot')
+        g.set_dimension_direct('m', [0.5, 1.0])
+        g.generate()
+
+        class _FakeConf:
+            def __init__(self):
+                self.params = mock.MagicMock()
+
+            def write(self, path):
+                with open(path, 'w') as h:
+                    h.write('')
+
+        monkeypatch.setattr(gm, 'read_config_object', lambda p: _FakeConf())
+        monkeypatch.setattr(gm, 'recursive_setattr', lambda *a, **k: None)
+        monkeypatch.setattr(gm.os, 'sync', lambda: None)
+        monkeypatch.delenv('PROTEUS_STRUCT_CACHE_DIR', raising=False)
+        monkeypatch.setenv('PROTEUS_PS_CACHE_DIR', '/shared/ps')
+        seen = []
+        monkeypatch.setattr(
+            'proteus.interior_struct.batch.presolve_initial_structures',
+            lambda paths, workers: seen.append((list(paths), workers)),
+        )
+
+        g.slurm_config(max_jobs=2, test_run=False, max_days=1, max_mem=4, presolve=True)
+        assert seen == []
+        struct_dir = os.path.join(g.outdir, 'struct_cache')
+        dispatch = os.path.join(g.outdir, 'slurm_dispatch.sh')
+        presolve = os.path.join(g.outdir, 'slurm_presolve.sh')
+        for path in (dispatch, presolve):
+            contents = open(path).read()
+            assert f'export PROTEUS_STRUCT_CACHE_DIR={struct_dir}' in contents
+            assert 'export PROTEUS_PS_CACHE_DIR=/shared/ps' in contents
+        contents = open(presolve).read()
+        assert '#SBATCH --cpus-per-task=2' in contents
+        assert f'proteus grid-presolve --workers 2 --output {g.outdir}' in contents
+        submit = open(os.path.join(g.outdir, 'slurm_submit.sh')).read()
+        assert f'jid=$(sbatch --parsable {presolve})' in submit
+        assert f'sbatch --dependency=afterany:${{jid%%;*}} {dispatch}' in submit
+
+        # The job's command hands every case config to the batch pre-solve
+        gm.presolve_grid(g.outdir, workers=2)
+        assert seen == [([g._get_tmpcfg(0), g._get_tmpcfg(1)], 2)]
+
+    def test_slurm_script_exports_spectral_cache(self, grid_with_mocks, monkeypatch):
+        """With the spectral-file cache enabled the script exports it, defaulting
+        to the grid output directory.
+        """
+        g = grid_with_mocks
+        g.add_dimension('m', 'planet.mass_tot')
+        g.set_dimension_direct('m', [0.5, 1.0])
+        g.generate()
+
+        class _FakeConf:
+            def __init__(self):
+                self.params = mock.MagicMock()
+
+            def write(self, path):
+                with open(path, 'w') as h:
+                    h.write('')
+
+        monkeypatch.setattr(gm, 'read_config_object', lambda p: _FakeConf())
+        monkeypatch.setattr(gm, 'recursive_setattr', lambda *a, **k: None)
+        monkeypatch.setattr(gm.os, 'sync', lambda: None)
+        monkeypatch.setenv('PROTEUS_SPFILE_CACHE_DIR', '')
+
+        g.slurm_config(max_jobs=2, test_run=True, max_days=1, max_mem=4, spectral_cache=True)
+        contents = open(os.path.join(g.outdir, 'slurm_dispatch.sh')).read()
+        spfile_dir = os.path.join(g.outdir, 'spectral_cache')
+        assert f'export PROTEUS_SPFILE_CACHE_DIR={spfile_dir}' in contents
+        assert os.environ['PROTEUS_SPFILE_CACHE_DIR'] == spfile_dir
+
 
 # ---------------------------------------------------------------------------
 # Grid.run
@@ -162,6 +162,104 @@ def test_sample_from_grid_builds_and_saves_dataset(monkeypatch, tmp_path):
     assert len(data) == 2
 
 
+@pytest.mark.unit
+def test_read_helpfile_tail_matches_full_parse(tmp_path, monkeypatch):
+    """``read_helpfile_tail`` returns the same final row as a full pandas
+    parse of a tab-separated helpfile, also when the file spans several of
+    the blocks it reads backwards.
+    """
+    monkeypatch.setattr(init_mod, '_TAIL_BLOCK', 64)
+    df = pd.DataFrame(
+        {'Time': np.arange(40.0), 'R_obs': np.linspace(6e6, 7e6, 40), 'P_surf': 1e5}
+    )
+    fpath = tmp_path / 'runtime_helpfile.csv'
+    df.to_csv(fpath, index=False, sep='\t', float_format='%.10e')
+
+    row = init_mod.read_helpfile_tail(fpath)
+
+    expected = pd.read_csv(fpath, delimiter=r'\s+').iloc[-1].to_dict()
+    assert row == pytest.approx(expected)
+
+
+@pytest.mark.unit
+def test_read_helpfile_tail_rejects_empty_and_truncated(tmp_path):
+    """A helpfile with only a header, or whose last row was cut short by a
+    killed writer, raises ValueError instead of returning a partial row.
+    """
+    empty = tmp_path / 'empty.csv'
+    empty.write_text('Time R_obs\n', encoding='utf-8')
+    with pytest.raises(ValueError, match='no data rows'):
+        init_mod.read_helpfile_tail(empty)
+
+    truncated = tmp_path / 'truncated.csv'
+    truncated.write_text('Time R_obs\n1.0 2.0\n3.0', encoding='utf-8')
+    with pytest.raises(ValueError, match='1 of 2 columns'):
+        init_mod.read_helpfile_tail(truncated)
+
+
+@pytest.mark.unit
+def test_read_config_keys_reads_nested_tables(tmp_path):
+    """``read_config_keys`` resolves dotted keys through nested tables and
+    agrees with a full TOML parse; a key held in an inline table is found
+    through the full-parse fallback.
+    """
+    fpath = tmp_path / 'init_coupler.toml'
+    fpath.write_text(
+        toml.dumps(
+            {
+                'planet': {'mass_tot': 1.5, 'elements': {'H_budget': 1e3}},
+                'outgas': {'fO2_shift_IW': -2.0},
+            }
+        ),
+        encoding='utf-8',
+    )
+    keys = ['outgas.fO2_shift_IW', 'planet.mass_tot', 'planet.elements.H_budget']
+    assert init_mod.read_config_keys(fpath, keys) == [-2.0, 1.5, 1e3]
+
+    inline = tmp_path / 'inline.toml'
+    inline.write_text('planet = { mass_tot = 2.5 }\n', encoding='utf-8')
+    assert init_mod.read_config_keys(inline, ['planet.mass_tot']) == [2.5]
+
+
+@pytest.mark.unit
+def test_sample_from_grid_skips_and_reports_corrupt_cases(monkeypatch, tmp_path, caplog):
+    """A case with a missing helpfile or a header-only helpfile is skipped
+    and reported by name, while the readable cases still form the dataset.
+    """
+    grid_dir = tmp_path / 'grid'
+    output_dir = tmp_path / 'output'
+    output_dir.mkdir(parents=True)
+    for i in range(4):
+        case = grid_dir / f'case_{i}'
+        case.mkdir(parents=True)
+        (case / 'init_coupler.toml').write_text(
+            toml.dumps({'planet': {'mass_tot': 1.0 + i}}), encoding='utf-8'
+        )
+        if i == 1:
+            continue  # no helpfile
+        text = 'R_obs\n' if i == 2 else f'R_obs\n{1.5 + i}\n'
+        (case / 'runtime_helpfile.csv').write_text(text, encoding='utf-8')
+
+    monkeypatch.setattr(
+        init_mod, 'get_proteus_directories', lambda _output: {'output': str(output_dir)}
+    )
+
+    with caplog.at_level('WARNING', logger='fwl.proteus.inference.gen_D_init'):
+        n = init_mod.sample_from_grid(
+            output='ignored',
+            params={'planet.mass_tot': [0.0, 10.0]},
+            observables={'R_obs': 1.0},
+            grid_dir=str(grid_dir),
+        )
+
+    assert n == 2
+    data = pd.read_csv(output_dir / 'init.csv')
+    assert data['x_0'].tolist() == pytest.approx([0.1, 0.4])
+    assert 'Skipped 2 of 4 grid cases' in caplog.text
+    assert 'case_1' in caplog.text
+    assert 'case_2' in caplog.text
+
+
 @pytest.mark.unit
 def test_sample_from_bounds_rejects_invalid_worker_count():
     """``sample_from_bounds`` rejects ``n_workers < 1`` with an
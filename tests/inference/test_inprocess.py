@@ -0,0 +1,227 @@
+"""
+Unit tests for the in-process inference evaluation backend.
+
+Covers: backend selection through the environment, the direct path used
+by daemonic pool workers, timeout and crash handling of the helper
+process, and the ``run_proteus`` dispatch that returns observables from
+memory instead of re-reading the helpfile.
+
+References:
+  - docs/How-to/inference.md
+  - docs/How-to/testing.md
+"""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+# The Bayesian-optimisation stack ships as the optional `inference` extra,
+# which installs all three together. Guarding the whole stack keeps a
+# partial environment skipping rather than failing collection.
+torch = pytest.importorskip('torch')
+pytest.importorskip('botorch')
+pytest.importorskip('gpytorch')
+
+import proteus.inference.inprocess as inproc_mod  # noqa: E402
+import proteus.inference.objective as objective_mod  # noqa: E402
+
+pytestmark = [pytest.mark.unit, pytest.mark.timeout(30)]
+
+
+class _FakeProc:
+    def __init__(self):
+        self.alive = True
+        self.exitcode = None
+        self.killed = False
+
+    def is_alive(self):
+        return self.alive
+
+    def join(self, timeout=None):
+        pass
+
+    def kill(self):
+        self.killed = True
+        self.alive = False
+
+
+class _FakeConn:
+    def __init__(self, ready=True, reply=None, fail=None):
+        self.ready = ready
+        self.reply = reply
+        self.fail = fail
+        self.sent = []
+
+    def send(self, obj):
+        self.sent.append(obj)
+
+    def poll(self, timeout=None):
+        return self.ready
+
+    def recv(self):
+        if self.fail is not None:
+            raise self.fail
+        return self.reply
+
+    def close(self):
+        pass
+
+
+def _evaluator(conn):
+    ev = inproc_mod.InProcessEvaluator()
+    ev._proc = _FakeProc()
+    ev._conn = conn
+    return ev
+
+
+@pytest.mark.unit
+def test_eval_backend_defaults_and_validates(monkeypatch):
+    """Unset, the backend is ``subprocess``; ``set_eval_backend`` records a
+    valid choice case-insensitively and rejects an unknown name.
+    """
+    monkeypatch.delenv(inproc_mod._BACKEND_ENV, raising=False)
+    assert inproc_mod.eval_backend() == 'subprocess'
+
+    inproc_mod.set_eval_backend(' InProcess ')
+    assert inproc_mod.eval_backend() == 'inprocess'
+
+    with pytest.raises(ValueError, match='Unknown evaluation backend'):
+        inproc_mod.set_eval_backend('threads')
+
+    inproc_mod.set_eval_backend(None)
+    assert inproc_mod.eval_backend() == 'subprocess'
+
+
+@pytest.mark.unit
+def test_evaluator_returns_row_from_helper():
+    """A successful helper reply is returned as (row, status), and the
+    config path is sent as a string.
+    """
+    conn = _FakeConn(reply=('ok', {'R_obs': 1.0}, 10))
+    row, status = _evaluator(conn).evaluate('/tmp/input.toml', timeout=5.0)
+
+    assert row == {'R_obs': 1.0}
+    assert status == 10
+    assert conn.sent == ['/tmp/input.toml']
+
+
+@pytest.mark.unit
+def test_evaluator_kills_helper_on_timeout():
+    """A helper that does not answer within the timeout is killed and the
+    evaluation raises TimeoutError; the next call starts a new helper.
+    """
+    conn = _FakeConn(ready=False)
+    ev = _evaluator(conn)
+    proc = ev._proc
+
+    with pytest.raises(TimeoutError):
+        ev.evaluate('/tmp/input.toml', timeout=0.01)
+
+    assert proc.killed
+    assert ev._proc is None
+
+
+@pytest.mark.unit
+def test_evaluator_reports_dead_helper_and_run_errors():
+    """A helper that dies mid-run surfaces as RuntimeError, as does a run
+    that raised inside the helper.
+    """
+    ev = _evaluator(_FakeConn(fail=EOFError()))
+    with pytest.raises(RuntimeError, match='helper died'):
+        ev.evaluate('/tmp/input.toml', timeout=1.0)
+    assert ev._proc is None
+
+    ev = _evaluator(_FakeConn(reply=('error', 'ValueError: bad config', 20)))
+    with pytest.raises(RuntimeError, match='bad config'):
+        ev.evaluate('/tmp/input.toml', timeout=1.0)
+
+
+@pytest.mark.unit
+def test_evaluate_inprocess_runs_directly_in_daemonic_worker(monkeypatch):
+    """Daemonic pool workers cannot host a helper, so the run executes in
+    the calling process; the shared ``fwl`` logger configuration is
+    restored afterwards even though the run reconfigures it.
+    """
+
+    class _Daemon:
+        daemon = True
+
+    fwl_log = logging.getLogger('fwl')
+    handler = logging.NullHandler()
+    monkeypatch.setattr(fwl_log, 'handlers', [handler])
+    monkeypatch.setattr(inproc_mod.mp, 'current_process', lambda: _Daemon())
+
+    def fake_run(path):
+        fwl_log.handlers[:] = []
+        return {'P_surf': 2.0}, 10
+
+    monkeypatch.setattr(inproc_mod, '_run_proteus_inprocess', fake_run)
+
+    assert inproc_mod.evaluate_inprocess('cfg.toml', None) == ({'P_surf': 2.0}, 10)
+    assert fwl_log.handlers == [handler]
+
+
+@pytest.mark.unit
+def test_run_proteus_inprocess_backend_skips_subprocess_and_csv(monkeypatch, tmp_path):
+    """With the in-process backend, ``run_proteus`` neither launches the
+    CLI nor reads the helpfile: observables come from the returned row.
+    """
+    monkeypatch.setenv(inproc_mod._BACKEND_ENV, 'inprocess')
+    monkeypatch.setattr(
+        objective_mod, 'get_proteus_directories', lambda _path: {'output': str(tmp_path)}
+    )
+    monkeypatch.setattr(objective_mod, 'update_toml', lambda *a, **kw: None)
+    monkeypatch.setattr(
+        objective_mod.subprocess,
+        'run',
+        lambda *a, **kw: pytest.fail('subprocess must not be used'),
+    )
+    monkeypatch.setattr(
+        objective_mod.pd, 'read_csv', lambda *a, **kw: pytest.fail('CSV must not be read')
+    )
+    monkeypatch.setattr(
+        objective_mod,
+        'evaluate_inprocess',
+        lambda path, timeout: ({'P_surf': 5.0, 'R_obs': 7.0}, 10),
+    )
+
+    obs, status = objective_mod.run_proteus(
+        parameters={},
+        worker=0,
+        iter=1,
+        observables=['R_obs'],
+        ref_config='ref.toml',
+        output='out',
+    )
+
+    assert obs == {'R_obs': 7.0}
+    assert status == 10
+
+
+@pytest.mark.unit
+def test_run_proteus_inprocess_timeout_maps_to_runtime_error(monkeypatch, tmp_path):
+    """A helper timeout is reported like a subprocess timeout, as a
+    RuntimeError naming the worker and iteration.
+    """
+    monkeypatch.setenv(inproc_mod._BACKEND_ENV, 'inprocess')
+    monkeypatch.setattr(
+        objective_mod, 'get_proteus_directories', lambda _path: {'output': str(tmp_path)}
+    )
+    monkeypatch.setattr(objective_mod, 'update_toml', lambda *a, **kw: None)
+
+    def fake_eval(path, timeout):
+        raise TimeoutError('run exceeded 1 s')
+
+    monkeypatch.setattr(objective_mod, 'evaluate_inprocess', fake_eval)
+
+    with pytest.raises(RuntimeError, match='timed out.*worker=3 iter=4'):
+        objective_mod.run_proteus(
+            parameters={},
+            worker=3,
+            iter=4,
+            observables=['R_obs'],
+            ref_config='ref.toml',
+            output='out',
+        )
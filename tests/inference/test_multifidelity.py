@@ -0,0 +1,245 @@
+"""
+Unit tests for the multi-fidelity inference mode.
+
+Covers: ``get_fidelity_config`` resolution of the ``[fidelity]`` table,
+the ``choose_fidelity`` evaluation schedule, fidelity dispatch in
+``mf_builder``, the explicit-input leg of ``MF_BO_step``, and the
+high-fidelity filter ``select_high_fidelity`` used for reporting.
+
+References:
+  - docs/How-to/inference.md
+  - docs/How-to/testing.md
+"""
+
+from __future__ import annotations
+
+import pytest
+import toml
+from helpers import PROTEUS_ROOT
+
+# The Bayesian-optimisation stack ships as the optional `inference` extra,
+# which installs all three together. Guarding the whole stack keeps a
+# partial environment skipping rather than failing collection.
+torch = pytest.importorskip('torch')
+pytest.importorskip('botorch')
+pytest.importorskip('gpytorch')
+
+import proteus.inference.multifidelity as mf_mod  # noqa: E402
+from proteus.config import read_config_object  # noqa: E402
+from proteus.inference.objective import update_toml  # noqa: E402
+
+pytestmark = [pytest.mark.unit, pytest.mark.timeout(30)]
+
+
+class _DummyLock:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+def _write_ref(tmp_path, orbit='none'):
+    ref = {
+        'star': {'module': 'mors'},
+        'orbit': {'module': orbit},
+        'atmos_clim': {'module': 'agni'},
+    }
+    path = tmp_path / 'ref.toml'
+    path.write_text(toml.dumps(ref), encoding='utf-8')
+    return str(path)
+
+
+@pytest.mark.unit
+def test_get_fidelity_config_disabled_returns_none(tmp_path):
+    """Without ``fidelity.enabled = true`` the inference runs single-fidelity,
+    and the reference config is not even read.
+    """
+    assert mf_mod.get_fidelity_config({'ref_config': 'missing.toml'}) is None
+    assert mf_mod.get_fidelity_config({'ref_config': 'missing.toml', 'fidelity': {}}) is None
+
+
+@pytest.mark.unit
+def test_get_fidelity_config_keeps_disabled_modules_disabled(tmp_path):
+    """A dummy override replaces a module but never switches one on: with
+    ``orbit.module = 'none'`` in the reference config, the default orbit
+    override is dropped while the other defaults and user overrides remain.
+    """
+    config = {
+        'ref_config': _write_ref(tmp_path, orbit='none'),
+        'fidelity': {'enabled': True, 'ratio': 3, 'overrides': {'params.stop.time': 1e6}},
+    }
+    fid = mf_mod.get_fidelity_config(config)
+
+    assert fid['ratio'] == 3
+    assert 'orbit.module' not in fid['overrides']
+    assert fid['overrides']['star.module'] == 'dummy'
+    assert fid['overrides']['atmos_clim.module'] == 'dummy'
+    assert fid['overrides']['params.stop.time'] == pytest.approx(1e6)
+
+
+@pytest.mark.unit
+def test_get_fidelity_config_reference_sentinel_removes_defaults(tmp_path):
+    """An override set to ``KEEP_REFERENCE`` removes that default, so the
+    low fidelity keeps the reference module; the atmosphere dummy's
+    requirements then no longer apply either.
+    """
+    config = {
+        'ref_config': _write_ref(tmp_path, orbit='dummy'),
+        'fidelity': {
+            'enabled': True,
+            'overrides': {
+                'orbit.module': mf_mod.KEEP_REFERENCE,
+                'atmos_clim.module': mf_mod.KEEP_REFERENCE,
+            },
+        },
+    }
+    overrides = mf_mod.get_fidelity_config(config)['overrides']
+
+    assert 'orbit.module' not in overrides
+    assert 'atmos_clim.module' not in overrides
+    assert 'atmos_clim.rayleigh' not in overrides
+    assert overrides['star.module'] == 'dummy'
+
+
+@pytest.mark.unit
+def test_get_fidelity_config_low_example_config_validates(tmp_path):
+    """The default low fidelity of the shipped example config is a valid
+    config: the dummy atmosphere comes with Rayleigh scattering, clouds,
+    aerosols and synthetic observations switched off.
+    """
+    ref_config = str(PROTEUS_ROOT / 'input' / 'inference' / 'example.toml')
+    fid = mf_mod.get_fidelity_config({'ref_config': ref_config, 'fidelity': {'enabled': True}})
+
+    low = tmp_path / 'low.toml'
+    update_toml(ref_config, fid['overrides'], str(low))
+    cfg = read_config_object(low)
+
+    assert cfg.atmos_clim.module == 'dummy'
+    assert cfg.atmos_clim.rayleigh is False
+    assert cfg.observe.module is None
+
+
+@pytest.mark.unit
+def test_get_fidelity_config_rejects_negative_ratio(tmp_path):
+    """A negative low/high ratio has no meaning and raises ValueError."""
+    config = {
+        'ref_config': _write_ref(tmp_path),
+        'fidelity': {'enabled': True, 'ratio': -1},
+    }
+    with pytest.raises(ValueError, match='ratio'):
+        mf_mod.get_fidelity_config(config)
+
+
+@pytest.mark.unit
+def test_choose_fidelity_follows_ratio_schedule():
+    """Appending points one at a time yields ``ratio`` low-fidelity points
+    per high-fidelity point. Discrimination: an off-by-one in the share
+    test would shift the high-fidelity slots or double their count.
+    """
+    ratio = 4
+    X = torch.zeros((0, 2), dtype=torch.double)
+    picks = []
+    for _ in range(10):
+        s = mf_mod.choose_fidelity(X, ratio)
+        picks.append(s)
+        X = torch.cat((X, torch.tensor([[0.5, s]], dtype=torch.double)), dim=0)
+
+    lo, hi = mf_mod.LOW_FIDELITY, mf_mod.HIGH_FIDELITY
+    assert picks == [lo, lo, lo, lo, hi, lo, lo, lo, lo, hi]
+
+
+@pytest.mark.unit
+def test_choose_fidelity_ratio_zero_is_single_fidelity():
+    """``ratio = 0`` evaluates every point at the high fidelity."""
+    X = torch.tensor([[0.1, 1.0], [0.2, 1.0]], dtype=torch.double)
+    assert mf_mod.choose_fidelity(X, 0) == mf_mod.HIGH_FIDELITY
+
+
+@pytest.mark.unit
+def test_mf_builder_applies_overrides_only_at_low_fidelity(monkeypatch):
+    """``mf_builder`` strips the fidelity column and forwards the dummy
+    overrides to ``prot_builder`` only for low-fidelity points.
+    """
+    calls = []
+
+    def fake_prot_builder(**kwargs):
+        def f(x):
+            calls.append((kwargs.get('overrides'), tuple(x.shape)))
+            return torch.zeros((1, 1), dtype=torch.double)
+
+        return f
+
+    monkeypatch.setattr(mf_mod, 'prot_builder', fake_prot_builder)
+    overrides = {'star.module': 'dummy'}
+    f = mf_mod.mf_builder(
+        parameters={'a': [0.0, 1.0]},
+        observables={'obs': 1.0},
+        worker=0,
+        iter=0,
+        output='out',
+        ref_config='ref.toml',
+        overrides=overrides,
+    )
+
+    f(torch.tensor([[0.3, mf_mod.LOW_FIDELITY]], dtype=torch.double))
+    f(torch.tensor([[0.3, mf_mod.HIGH_FIDELITY]], dtype=torch.double))
+
+    assert calls == [(overrides, (1, 1)), (None, (1, 1))]
+
+
+@pytest.mark.unit
+def test_mf_bo_step_with_x_in_skips_gp_fitting(monkeypatch):
+    """With an explicit ``x_in`` the step evaluates it directly, without
+    fitting the multi-fidelity GP, and registers it as the busy point.
+    """
+    monkeypatch.setattr(
+        mf_mod, 'fit_mf_gp', lambda *a, **kw: pytest.fail('GP must not be fitted')
+    )
+    D = {
+        'X': torch.tensor([[0.1, 1.0]], dtype=torch.double),
+        'Y': torch.tensor([[0.2]], dtype=torch.double),
+    }
+    B = {}
+    x_in = torch.tensor([[0.4, mf_mod.LOW_FIDELITY]], dtype=torch.double)
+
+    x, y, *_rest, dist = mf_mod.MF_BO_step(
+        D=D,
+        B=B,
+        f=lambda _x: torch.tensor([[0.7]], dtype=torch.double),
+        acqf='LogEI',
+        lock=_DummyLock(),
+        worker_id=0,
+        ratio=2,
+        x_in=x_in,
+    )
+
+    assert torch.equal(x, x_in)
+    assert y[0, 0].item() == pytest.approx(0.7)
+    assert dist is None
+    assert torch.equal(B[0], x_in)
+
+
+@pytest.mark.unit
+def test_select_high_fidelity_filters_aligned_results():
+    """Data, logs and timestamps are filtered consistently to the
+    high-fidelity rows, the fidelity column is dropped, and the number of
+    high-fidelity initial points is recounted.
+    """
+    lo, hi = mf_mod.LOW_FIDELITY, mf_mod.HIGH_FIDELITY
+    D = {
+        'X': torch.tensor(
+            [[0.1, hi], [0.2, lo], [0.3, lo], [0.4, hi], [0.5, lo]], dtype=torch.double
+        ),
+        'Y': torch.tensor([[1.0], [2.0], [3.0], [4.0], [5.0]], dtype=torch.double),
+    }
+    logs = [None, None, {'task_id': 0}, {'task_id': 1}, {'task_id': 2}]
+    Ts = [10.0, 20.0, 30.0]
+
+    D_hi, logs_hi, Ts_hi, n_init_hi = mf_mod.select_high_fidelity(D, logs, Ts, n_init=2)
+
+    assert D_hi['X'].tolist() == [[0.1], [0.4]]
+    assert D_hi['Y'].flatten().tolist() == [1.0, 4.0]
+    assert logs_hi == [None, {'task_id': 1}]
+    assert Ts_hi == [20.0]
+    assert n_init_hi == 1
@@ -121,6 +121,45 @@ def test_run_proteus_success_handles_escaped_atmosphere(monkeypatch, tmp_path):
     assert status == 20
 
 
+@pytest.mark.unit
+def test_run_proteus_overrides_leave_parameters_unchanged(monkeypatch, tmp_path):
+    """Fidelity ``overrides`` reach the run config but not the caller's
+    parameter dict, which the inference history records; the output path and
+    logging settings added for the run stay out of it too.
+    """
+    out_abs = tmp_path / 'sim'
+    out_abs.mkdir(parents=True)
+    pd.DataFrame([{'P_surf': 1.0}]).to_csv(
+        out_abs / 'runtime_helpfile.csv', sep=' ', index=False
+    )
+
+    updates = []
+    monkeypatch.setattr(
+        objective_mod, 'get_proteus_directories', lambda _path: {'output': str(out_abs)}
+    )
+    monkeypatch.setattr(
+        objective_mod,
+        'update_toml',
+        lambda config_file, values, output_file: updates.append(dict(values)),
+    )
+    monkeypatch.setattr(objective_mod.subprocess, 'run', lambda *args, **kwargs: None)
+
+    parameters = {'planet.mass_tot': 2.0}
+    objective_mod.run_proteus(
+        parameters=parameters,
+        worker=1,
+        iter=2,
+        observables=['P_surf'],
+        ref_config='reference.toml',
+        output='dummy_output',
+        overrides={'atmos_clim.module': 'dummy'},
+    )
+
+    assert parameters == {'planet.mass_tot': 2.0}
+    assert updates[0]['atmos_clim.module'] == 'dummy'
+    assert updates[0]['planet.mass_tot'] == pytest.approx(2.0)
+
+
 @pytest.mark.unit
 def test_run_proteus_raises_when_command_missing(monkeypatch, tmp_path):
     """A ``FileNotFoundError`` from ``subprocess.run`` (i.e. the proteus
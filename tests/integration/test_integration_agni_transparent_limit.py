@@ -205,7 +205,7 @@ def _sweep_transparent(runner, t_surf_grid=T_SURF_GRID):
     cfg = runner.config
 
     activate_julia(dirs, 0)
-    atmos = init_agni_atmos(dirs, cfg, _make_hf_row(t_surf_grid[0]))
+    atmos, _ = init_agni_atmos(dirs, cfg, _make_hf_row(t_surf_grid[0]))
     assert bool(atmos.is_alloc), 'AGNI atmosphere struct was not allocated'
 
     results = []
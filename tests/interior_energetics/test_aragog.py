@@ -11,6 +11,8 @@ Testing standards and documentation:
 
 Functions tested:
 - AragogRunner.setup_solver(): Zalmoxis branches for inner_radius, EOS fallback
+- AragogRunner._solve_with_retry(): speculative retry rungs match the serial ladder,
+  stalled probes fall back to it
 """
 
 from __future__ import annotations
@@ -760,3 +762,172 @@ def test_setup_or_update_solver_tracks_stale_structure_steps():
         interior_o.structure_stale = True
         AragogRunner.setup_or_update_solver(config, hf_row, interior_o, 1.0, dirs)
         assert interior_o._stale_struct_steps == 1
+
+
+# ---------------------------------------------------------------------------
+# _solve_with_retry: speculative retries
+# ---------------------------------------------------------------------------
+
+
+class _LadderSolver:
+    """Deterministic solver stand-in: a solve succeeds iff dt <= dt_ok.
+
+    Built like an EntropySolver from ``(parameters, eos)``, so probe
+    workers can rebuild it. Each solve takes ``solve_wall`` seconds, so the
+    probe budget is the one a real step would get. Records every solve run
+    in this process as ``(dt, atol_sf)``; solves in probe workers are not
+    recorded here.
+    """
+
+    def __init__(self, parameters, eos=None):
+        self.parameters = parameters
+        self.solves = []
+        self._atol_sf = 1.0
+        self._dSdr_cmb_init = 1.0
+        self._solution = None
+
+    def initialize(self):
+        pass
+
+    def solve(self):
+        import time
+
+        time.sleep(self.parameters.solve_wall)
+        dt = self.parameters.solver.end_time - self.parameters.solver.start_time
+        self.solves.append((dt, self._atol_sf))
+        self._solution = (0 if dt <= self.parameters.dt_ok else -1, dt, self._atol_sf)
+
+    @property
+    def solution(self):
+        return self._solution
+
+    def get_state(self):
+        from types import SimpleNamespace
+
+        status, dt, atol_sf = self._solution
+        return SimpleNamespace(status=status, T_core=4000.0, dt_actual=dt, atol_sf=atol_sf)
+
+    def reset(self):
+        pass
+
+    def set_initial_entropy(self, S):
+        pass
+
+
+def _ladder_runner(dt_ok, speculative_retries):
+    from types import SimpleNamespace
+
+    from proteus.interior_energetics.aragog import AragogRunner
+
+    parameters = SimpleNamespace(
+        solver=SimpleNamespace(start_time=0.0, end_time=1000.0), dt_ok=dt_ok, solve_wall=0.1
+    )
+    runner = AragogRunner.__new__(AragogRunner)
+    runner.aragog_solver = _LadderSolver(parameters)
+    runner._outdir = ''
+    runner._config = SimpleNamespace(
+        planet=SimpleNamespace(mass_tot=1.0),
+        interior_energetics=SimpleNamespace(
+            const_properties=True,
+            aragog=SimpleNamespace(speculative_retries=speculative_retries, backend='numpy'),
+        ),
+    )
+    interior_o = SimpleNamespace(_last_entropy=np.full(4, 3000.0))
+    hf_row = {'T_cmb': 4000.0, 'Time': 0.0}
+    return runner, interior_o, hf_row
+
+
+@pytest.fixture
+def warm_probe_pool(monkeypatch):
+    """A fresh probe pool of five workers that have finished starting up,
+    as they would be once AragogRunner set up the solver; stopped after
+    the test.
+    """
+    import proteus.interior_energetics.aragog as aragog_mod
+
+    monkeypatch.setattr(aragog_mod.os, 'cpu_count', lambda: 8)
+    monkeypatch.setattr(aragog_mod, '_probe_pool', None)
+    pool = aragog_mod._get_probe_pool(5, None)
+    assert pool.wait_ready(90.0)
+    yield pool
+    pool.close()
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(120)
+def test_speculative_retries_match_serial_ladder(warm_probe_pool):
+    """Speculative probes accept the same rung with the same dt and atol
+    scale as the serial ladder, and leave the solver holding that rung's
+    solution, while the main process only solves the failed first attempt.
+    The probes run within the default budget of ten first-attempt solves.
+    """
+    runner, interior_o, hf_row = _ladder_runner(125.0, 0)
+    out_serial = runner._solve_with_retry(hf_row, interior_o)
+    serial = runner.aragog_solver
+
+    runner, interior_o, hf_row = _ladder_runner(125.0, 4)
+    out_spec = runner._solve_with_retry(hf_row, interior_o)
+    spec = runner.aragog_solver
+
+    assert out_spec == out_serial
+    assert out_spec.dt_actual == pytest.approx(125.0)
+    assert len(serial.solves) == 4
+    assert spec.solves == [serial.solves[0]]
+    assert spec.solution == serial.solution
+    # The atol scale is released for the next coupling step either way
+    assert spec._atol_sf == 1.0
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(120)
+def test_speculative_retries_exhaustion_keeps_last_rung(warm_probe_pool):
+    """When every probed rung fails up to the last attempt, the ladder is
+    exhausted with the serial error, no further solves in this process,
+    and the solver left holding the last rung's solution.
+    """
+    runner, interior_o, hf_row = _ladder_runner(1e-6, 5)
+
+    with pytest.raises(RuntimeError, match='after 6 attempts'):
+        runner._solve_with_retry(hf_row, interior_o)
+    solver = runner.aragog_solver
+    assert len(solver.solves) == 1
+    assert solver.solution == (-1, pytest.approx(1000.0 / 32), 5.0)
+
+
+@pytest.mark.unit
+def test_speculative_retries_fall_back_to_serial(monkeypatch):
+    """In a daemonic process, which may not have children, the option
+    degrades to the serial ladder.
+    """
+    import proteus.interior_energetics.aragog as aragog_mod
+
+    monkeypatch.setattr(aragog_mod, '_speculation_available', lambda: False)
+    runner, interior_o, hf_row = _ladder_runner(250.0, 4)
+
+    out = runner._solve_with_retry(hf_row, interior_o)
+
+    assert out.dt_actual == pytest.approx(250.0)
+    assert [dt for dt, _ in runner.aragog_solver.solves] == [1000.0, 500.0, 250.0]
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(120)
+def test_speculative_retries_stalled_probe_falls_back(warm_probe_pool, monkeypatch):
+    """A probe that overruns its budget is abandoned and its worker
+    replaced; the ladder solves that rung itself with the serial result.
+    """
+    import proteus.interior_energetics.aragog as aragog_mod
+
+    monkeypatch.setattr(aragog_mod, '_SPECULATIVE_TIMEOUT_FACTOR', 1e-3)
+    runner, interior_o, hf_row = _ladder_runner(250.0, 4)
+
+    out = runner._solve_with_retry(hf_row, interior_o)
+
+    assert out.dt_actual == pytest.approx(250.0)
+    assert [dt for dt, _ in runner.aragog_solver.solves] == [1000.0, 500.0, 250.0]
+    # The abandoned workers are replaced
+    assert warm_probe_pool.wait_ready(90.0)
+    workers = warm_probe_pool.take(5)
+    assert len(workers) == 5
+    for worker in workers:
+        warm_probe_pool.release(worker)
@@ -26,6 +26,8 @@ magma ocean states to solid interiors.
   - Radioactive heating decay chains (K-40, U-238, U-235, Th-232)
   - Melt fraction and solidification radius evolution
   - Coupled thermal ODEs (potential and surface temperature)
+  - Compiled RHS kernel and its analytic Jacobian
+  - Batched multi-member integration with per-member events
   - ODE solver integration with terminal events
 """
 
@@ -990,6 +992,179 @@ def test_thermal_rhs_continuity_across_time(boundary_runner):
     assert all(np.isfinite(v) for v in rhs_nominal)
 
 
+# =============================================================================
+# Tests: Compiled RHS and analytic Jacobian (_thermal_kernel)
+# =============================================================================
+
+# (T_p, T_surf) covering the solid, partially molten and fully molten mantle
+_KERNEL_STATES = [(1300.0, 1200.0), (1700.0, 1500.0), (1900.0, 1400.0), (3500.0, 1600.0)]
+
+
+@pytest.mark.parametrize('viscosity_model', [1, 2, 3])
+def test_compiled_rhs_matches_thermal_rhs(boundary_runner, viscosity_model):
+    """The closed-form kernel reproduces the method chain of thermal_rhs
+    for every viscosity model and melt regime, with radiogenic and tidal
+    heating switched on.
+    """
+    from proteus.interior_energetics.boundary import _thermal_kernel
+
+    runner = boundary_runner
+    runner.viscosity_model = viscosity_model
+    runner.use_radiogenic_heating = True
+    runner.tidal_term = 1e-12
+    constants = runner.rhs_constants()
+
+    for T_p, T_surf in _KERNEL_STATES:
+        for t in (0.0, 1e15):
+            expected = runner.thermal_rhs(t, [T_p, T_surf])
+            got = _thermal_kernel(t, T_p, T_surf, constants, False)
+            np.testing.assert_allclose(got, expected, rtol=1e-12, atol=0.0)
+
+
+@pytest.mark.parametrize('viscosity_model', [1, 2, 3])
+def test_analytic_jacobian_matches_finite_differences(boundary_runner, viscosity_model):
+    """The analytic Jacobian agrees with central differences of the RHS
+    away from the kinks of the melt-fraction clip.
+    """
+    from proteus.interior_energetics.boundary import _thermal_kernel
+
+    boundary_runner.viscosity_model = viscosity_model
+    constants = boundary_runner.rhs_constants()
+
+    for T_p, T_surf in _KERNEL_STATES:
+        J = np.array(_thermal_kernel(0.0, T_p, T_surf, constants, True))
+        y = np.array([T_p, T_surf])
+        for j in range(2):
+            h = 1e-5 * y[j]
+            up, down = y.copy(), y.copy()
+            up[j] += h
+            down[j] -= h
+            f_up = np.array(_thermal_kernel(0.0, *up, constants, False))
+            f_down = np.array(_thermal_kernel(0.0, *down, constants, False))
+            np.testing.assert_allclose(J[:, j], (f_up - f_down) / (2 * h), rtol=1e-5)
+
+
+def test_run_solver_matches_finite_difference_integration(
+    boundary_runner, mock_hf_row, mock_interior
+):
+    """A step integrated with the compiled RHS and analytic Jacobian lands
+    on the state from integrating thermal_rhs with BDF's own Jacobian
+    estimate, to within the solver tolerance.
+    """
+    from scipy.integrate import solve_ivp
+
+    runner = boundary_runner
+    runner.dt = 1e4 * secs_per_year
+    runner.Tsurf_event_change = 1e6  # no event truncation
+    y0 = [runner.T_p_0, runner.T_surf_0]
+    t_span = (runner.curr_time, runner.curr_time + runner.dt)
+    ref = solve_ivp(runner.thermal_rhs, t_span, y0, method='BDF', rtol=1e-6, atol=1e-9)
+
+    with patch(
+        'proteus.interior_energetics.boundary.solve_ivp', wraps=solve_ivp
+    ) as mock_solve_ivp:
+        _, output = runner.run_solver(mock_hf_row, mock_interior, {})
+
+    assert callable(mock_solve_ivp.call_args.kwargs['jac'])
+    assert output['T_magma'] == pytest.approx(ref.y[0, -1], rel=1e-5)
+    assert output['T_surf'] == pytest.approx(ref.y[1, -1], rel=1e-5)
+
+
+# =============================================================================
+# Tests: Batched integration (run_batch)
+# =============================================================================
+
+
+def test_batch_kernel_matches_scalar_kernel(boundary_runner):
+    """The vectorised kernel reproduces the scalar kernel member by member,
+    for a batch mixing all three viscosity models and heating settings.
+    """
+    from proteus.interior_energetics.boundary import _thermal_kernel, _thermal_kernel_batch
+
+    members = boundary_runner.variants(
+        viscosity_model=[1, 2, 3, 3],
+        use_radiogenic_heating=[False, True, True, False],
+        tidal_term=[0.0, 1e-12, 0.0, 0.0],
+    )
+    states = np.array(_KERNEL_STATES)
+    for member_states in (states, states[::-1]):
+        T_p, T_surf = member_states.T
+        rows = [r.rhs_constants() for r in members]
+        batch_constants = tuple(np.array(col) for col in zip(*rows))
+        for jac in (False, True):
+            got = np.array(_thermal_kernel_batch(1e15, T_p, T_surf, batch_constants, jac))
+            expected = np.array(
+                [
+                    np.ravel(_thermal_kernel(1e15, tp, ts, row, jac))
+                    for tp, ts, row in zip(T_p, T_surf, rows)
+                ]
+            ).T
+            np.testing.assert_allclose(got, expected, rtol=1e-12, atol=0.0)
+
+
+def test_run_batch_matches_per_member_solves(boundary_runner, mock_hf_row, mock_interior):
+    """One batched solve reproduces the per-member run_solver steps to within
+    the solver tolerance, including a member stopped early by its own
+    surface-temperature event while the others run to the end of the step.
+    """
+    runner = boundary_runner
+    runner.dt = 1e4 * secs_per_year
+    runner.Tsurf_event_change = 1e6
+    members = runner.variants(
+        T_p_0=[3500.0, 3000.0, 2600.0],
+        T_surf_0=[1600.0, 1500.0, 1800.0],
+        f_atm=[100.0, 1e4, 10.0],
+        viscosity_model=[1, 2, 1],
+        Tsurf_event_change=[1e6, 1e6, 1.0],
+    )
+
+    batch = BoundaryRunner.run_batch(members)
+    single = [m.run_solver(mock_hf_row, mock_interior, {}) for m in members]
+
+    t_end = (runner.curr_time + runner.dt) / secs_per_year
+    assert batch[0][0] == pytest.approx(t_end)
+    assert batch[1][0] == pytest.approx(t_end)
+    assert batch[2][0] < t_end  # the event fired for this member only
+    assert abs(batch[2][1]['T_surf'] - members[2].T_surf_0) == pytest.approx(1.0, rel=1e-6)
+    t_start = runner.curr_time / secs_per_year
+    for (time_b, out_b), (time_s, out_s) in zip(batch, single):
+        assert time_b - t_start == pytest.approx(time_s - t_start, rel=1e-3)
+        assert out_b.keys() == out_s.keys()
+        assert out_b['T_magma'] == pytest.approx(out_s['T_magma'], rel=1e-5)
+        assert out_b['T_surf'] == pytest.approx(out_s['T_surf'], rel=1e-5)
+
+
+def test_run_batch_raises_on_failed_members(boundary_runner, monkeypatch):
+    """A member whose integration failed is not returned as a result; the
+    batch raises and names the failed members.
+    """
+    from proteus.interior_energetics import boundary
+
+    members = boundary_runner.variants(T_p_0=[3500.0, 3000.0, 2600.0])
+
+    def failing(constants, y0, t_span, **kwargs):
+        n = y0.size // 2
+        return np.full(n, t_span[1]), y0.reshape(2, n), np.array([0, -1, -1])
+
+    monkeypatch.setattr(boundary, '_integrate_batch', failing)
+    with pytest.raises(RuntimeError, match=r'2 of 3 members \(indices \[1, 2\]\)'):
+        BoundaryRunner.run_batch(members)
+
+
+def test_run_batch_rejects_mismatched_steps_and_bad_variants(boundary_runner):
+    """Members must share the time step; variants must name existing
+    attributes with sequences of one length.
+    """
+    members = boundary_runner.variants(dt=[1.0e10, 2.0e10])
+    with pytest.raises(ValueError, match='share curr_time and dt'):
+        BoundaryRunner.run_batch(members)
+    with pytest.raises(ValueError, match='no attribute'):
+        boundary_runner.variants(T_potential=[3000.0])
+    with pytest.raises(ValueError, match='differ in length'):
+        boundary_runner.variants(T_p_0=[3000.0], f_atm=[1.0, 2.0])
+    assert BoundaryRunner.run_batch([]) == []
+
+
 # =============================================================================
 # Tests: ODE Solver Integration (run_solver)
 # =============================================================================
@@ -12,6 +12,9 @@ Testing standards and documentation:
 Functions tested:
 - Interior_t._load_ps_table(): Load arbitrary P-S table with path fallback
 - Interior_t.__init__(): Wires lookup_rho_melt + lookup_cp_solid + lookup_cp_melt
+- PSInterpolator / Interior_t.ps_lookup(): prebuilt, vectorised table lookups
+- Interior_t.snapshot() / restore(): rollback through one contiguous buffer
+- Interior_t.resize(): per-level arrays carried onto a new level count
 """
 
 from __future__ import annotations
@@ -259,6 +262,69 @@ def test_interior_t_init_partial_table_set(tmp_path):
     assert interior_o.lookup_cp_melt is None
 
 
+def _synthetic_ps_table(nP=5, nS=6):
+    """Analytic (nS, nP, 3) table, non-linear in P and S."""
+    P = np.linspace(0.0, 135e9, nP)
+    S = np.linspace(1800.0, 3200.0, nS)
+    table = np.zeros((nS, nP, 3))
+    table[..., 0] = P[None, :]
+    table[..., 1] = S[:, None]
+    table[..., 2] = 3000.0 + 1e-8 * P[None, :] + 0.2 * S[:, None] + 1e-15 * np.outer(S, P)
+    return table
+
+
+def test_ps_interpolator_batched_matches_per_point():
+    """A batched PSInterpolator call reproduces the per-point scalar path,
+    inside the table and in linear extrapolation beyond it.
+    """
+    from proteus.interior_energetics.common import PSInterpolator
+    from proteus.interior_energetics.spider import _interp_ps_lookup
+
+    table = _synthetic_ps_table()
+    rng = np.random.default_rng(3)
+    S = rng.uniform(1700.0, 3300.0, 40)
+    P = rng.uniform(-1e9, 140e9, 40)
+
+    batched = PSInterpolator(table)(S, P)
+    scalar = np.array([_interp_ps_lookup(s, p, table) for s, p in zip(S, P)])
+
+    assert batched.shape == (40,)
+    np.testing.assert_allclose(batched, scalar, rtol=1e-12)
+    # Exact at a grid node: no off-by-one in the (P, S) axis order
+    assert PSInterpolator(table)(table[2, 3, 1], table[2, 3, 0]) == pytest.approx(
+        table[2, 3, 2], rel=1e-12
+    )
+
+
+def test_ps_lookup_prebuilt_and_rebuilt_on_replacement(tmp_path):
+    """Interior_t builds the interpolator with the table, reuses it across
+    calls, and rebuilds it when the table attribute is replaced.
+    """
+    spider_dir = str(tmp_path / 'spider')
+    eos_subdir = os.path.join(spider_dir, 'lookup_data', '1TPa-dK09-elec-free')
+    os.makedirs(eos_subdir)
+    _make_ps_table_file(os.path.join(eos_subdir, 'density_melt.dat'), nP=3, nS=4)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('FWL_DATA', str(tmp_path / 'nonexistent'))
+        mp.setattr('proteus.utils.data.FWL_DATA_DIR', tmp_path / 'nonexistent', raising=False)
+        interior_o = Interior_t(50, spider_dir=spider_dir, eos_dir='WolfBower2018_MgSiO3')
+
+    prebuilt = interior_o._ps_interp['rho_melt']
+    interior_o.ps_lookup('rho_melt', [2600.0], [1e8])
+    assert interior_o._ps_interp['rho_melt'] is prebuilt
+
+    interior_o.lookup_rho_melt = _synthetic_ps_table()
+    out = interior_o.ps_lookup('rho_melt', np.array([2000.0, 3000.0]), 50e9)
+    assert interior_o._ps_interp['rho_melt'] is not prebuilt
+    np.testing.assert_allclose(
+        out, interior_o._ps_interp['rho_melt']([2000.0, 3000.0], [50e9, 50e9])
+    )
+
+    with pytest.raises(ValueError, match='cp_melt'):
+        interior_o.ps_lookup('cp_melt', 2600.0, 1e8)
+
+
 def test_load_ps_table_invalid_filename(tmp_path):
     """Reading a nonexistent filename returns None, not raises."""
     spider_dir = str(tmp_path / 'spider')
@@ -689,6 +755,126 @@ def test_update_rheology_with_visc_true_fills_all_three_channels():
     assert interior.visc[0] / interior.visc[-1] > 1e3
 
 
+# ============================================================================
+# Interior_t.snapshot / restore: in-memory rollback of a rejected step
+# ============================================================================
+
+
+def _filled_interior(nlev_b=41):
+    interior = Interior_t(nlev_b)
+    rng = np.random.default_rng(3)
+    for name in ('tides', 'phi', 'visc', 'density', 'mass', 'shear', 'bulk', 'pres', 'temp'):
+        setattr(interior, name, rng.uniform(0.0, 1e3, interior.nlev_s))
+    interior.radius = np.linspace(3.5e6, 6.4e6, nlev_b)
+    interior._last_entropy = rng.uniform(2e3, 3e3, interior.nlev_s)
+    interior.ic = 2
+    interior.dt = 123.5
+    interior.aragog_fail_count = 2
+    interior.structure_stale = True
+    interior._spider_cumulative_time = 4.5e6
+    return interior
+
+
+def test_snapshot_restore_rolls_back_reassigned_and_mutated_state():
+    """restore() undoes both arrays replaced by a solver and arrays mutated
+    in place, along with the step scalars, and can be applied repeatedly.
+    """
+    interior = _filled_interior()
+    expected = {name: getattr(interior, name).copy() for name in ('phi', 'radius', 'shear')}
+    S_expected = interior._last_entropy.copy()
+
+    snap = interior.snapshot()
+    for _ in range(2):
+        interior.phi = np.zeros(7)  # replaced, with another length
+        interior.shear[:] = -1.0  # mutated in place
+        interior._last_entropy = None
+        interior.ic = 1
+        interior.dt = 1.0
+        interior.structure_stale = False
+        interior.escape_dt_limit = 5.0
+
+        interior.restore(snap)
+
+        for name, values in expected.items():
+            np.testing.assert_array_equal(getattr(interior, name), values)
+        np.testing.assert_array_equal(interior._last_entropy, S_expected)
+        assert interior.ic == 2 and isinstance(interior.ic, int)
+        assert interior.dt == 123.5
+        assert interior.structure_stale is True
+        assert interior.escape_dt_limit == float('inf')
+        assert interior.last_successful_struct_time == float('-inf')
+
+
+def test_snapshot_restores_absent_hot_start_entropy_as_none():
+    """A snapshot taken before Aragog's first solve restores no entropy."""
+    interior = Interior_t(5)
+    snap = interior.snapshot()
+    interior._last_entropy = np.ones(4)
+
+    interior.restore(snap)
+
+    assert interior._last_entropy is None
+
+
+def test_snapshot_memory_footprint_is_one_buffer_of_the_state():
+    """The snapshot is a single contiguous float64 buffer holding exactly
+    the scalars and the arrays, without the lookup tables, and a snapshot
+    passed back in is refilled without a new allocation.
+    """
+    from proteus.interior_energetics.common import _SNAPSHOT_SCALARS
+
+    nlev_b = 201
+    interior = _filled_interior(nlev_b)
+    # A loaded lookup table is large next to the per-level arrays and must
+    # never be part of a rollback snapshot.
+    interior.lookup_rho_melt = np.zeros((100, 100, 3))
+
+    snap = interior.snapshot()
+
+    n_values = len(_SNAPSHOT_SCALARS) + nlev_b + 10 * (nlev_b - 1)
+    assert snap.nbytes == 8 * n_values
+    assert snap.buffer.flags.c_contiguous and snap.buffer.base is None
+    assert snap.nbytes < interior.lookup_rho_melt.nbytes / 10
+
+    buffer = snap.buffer
+    interior.dt = 7.0
+    assert interior.snapshot(into=snap) is snap
+    assert snap.buffer is buffer
+    interior.dt = 0.0
+    interior.restore(snap)
+    assert interior.dt == 7.0
+
+    # A changed layout (here, the hot-start entropy dropped) gets a new buffer
+    interior._last_entropy = None
+    resized = interior.snapshot(into=snap)
+    assert resized is not snap
+    assert resized.nbytes == snap.nbytes - 8 * (nlev_b - 1)
+
+
+def test_resize_interpolates_level_arrays():
+    """resize() brings every per-level array to the new level count, keeps
+    the radial end points and leaves constant fields constant.
+    """
+    interior = _filled_interior(81)
+    interior.phi = np.full(80, 0.4)
+    r_ends = interior.radius[[0, -1]].copy()
+
+    interior.resize(41)
+
+    assert interior.nlev_b == 41 and interior.nlev_s == 40
+    assert interior.radius.shape == (41,)
+    np.testing.assert_array_equal(interior.radius[[0, -1]], r_ends)
+    for name in ('tides', 'visc', 'density', 'mass', 'shear', 'bulk', 'pres', 'temp'):
+        assert getattr(interior, name).shape == (40,)
+    np.testing.assert_allclose(interior.phi, 0.4)
+
+    # A snapshot after resizing holds the new layout
+    snap = interior.snapshot()
+    interior.phi = np.zeros(3)
+    interior.restore(snap)
+    np.testing.assert_allclose(interior.phi, 0.4)
+
+
 # ============================================================================
 # compute_initial_entropy: isentropic mode + Zalmoxis-unavailable fallback
 # ============================================================================
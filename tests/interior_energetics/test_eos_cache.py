@@ -0,0 +1,158 @@
+"""
+Unit tests for proteus.interior_energetics.eos_cache.
+
+Testing standards and documentation:
+- docs/How-to/testing.md: Running, writing, and marking tests; coverage and CI
+- docs/Explanations/test_framework.md: Test tiers, physics invariants, and quality rules
+
+Functions tested:
+- load_or_build(): opt-in gate, round trip through disk, memory-mapped arrays,
+  content-keyed invalidation, fallback when the object cannot be pickled
+- cache_key(): sensitivity to table contents and cache format version
+"""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+
+import proteus.interior_energetics.eos_cache as eos_cache
+
+pytestmark = [pytest.mark.unit, pytest.mark.timeout(30)]
+
+
+class _FakeEOS:
+    """Stand-in for EntropyEOS: a picklable object holding lookup tables."""
+
+    def __init__(self, eos_dir):
+        self.eos_dir = str(eos_dir)
+        self.table = np.linspace(0.0, 1.0, 20_000)
+        self.small = np.arange(4.0)
+
+
+def _make_eos_dir(tmp_path, content='1 2 3\n'):
+    eos_dir = tmp_path / 'spider_eos'
+    eos_dir.mkdir(exist_ok=True)
+    (eos_dir / 'density_melt.dat').write_text(content)
+    return str(eos_dir)
+
+
+def _counting_builder(eos_dir, calls):
+    def build():
+        calls.append(eos_dir)
+        return _FakeEOS(eos_dir)
+
+    return build
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    root = tmp_path / 'eos_cache'
+    monkeypatch.setenv(eos_cache.CACHE_DIR_ENV, str(root))
+    monkeypatch.delenv(eos_cache.CACHE_MAX_SIZE_ENV, raising=False)
+    return root
+
+
+def test_disabled_without_env_builds_every_time(tmp_path, monkeypatch):
+    """Without PROTEUS_EOS_CACHE_DIR the cache is a pass-through and writes
+    nothing to disk.
+    """
+    monkeypatch.delenv(eos_cache.CACHE_DIR_ENV, raising=False)
+    eos_dir = _make_eos_dir(tmp_path)
+    calls = []
+
+    eos_cache.load_or_build('entropy_eos', eos_dir, _FakeEOS, _counting_builder(eos_dir, calls))
+    eos_cache.load_or_build('entropy_eos', eos_dir, _FakeEOS, _counting_builder(eos_dir, calls))
+
+    assert len(calls) == 2
+    assert sorted(os.listdir(tmp_path)) == ['spider_eos']
+
+
+def test_second_load_hits_disk_and_maps_large_arrays(tmp_path, cache_dir):
+    """The second call, standing in for a new process, loads the stored
+    object without rebuilding; large arrays come back memory-mapped with
+    identical values, small ones are pickled inline.
+    """
+    eos_dir = _make_eos_dir(tmp_path)
+    calls = []
+
+    built = eos_cache.load_or_build(
+        'entropy_eos', eos_dir, _FakeEOS, _counting_builder(eos_dir, calls)
+    )
+    loaded = eos_cache.load_or_build(
+        'entropy_eos', eos_dir, _FakeEOS, _counting_builder(eos_dir, calls)
+    )
+
+    assert len(calls) == 1
+    assert isinstance(loaded, _FakeEOS)
+    assert isinstance(loaded.table, np.memmap)
+    assert not isinstance(loaded.small, np.memmap)
+    np.testing.assert_array_equal(loaded.table, built.table)
+    np.testing.assert_array_equal(loaded.small, built.small)
+
+
+def test_changed_table_contents_miss_the_cache(tmp_path, cache_dir):
+    """Editing a table file without changing its size still changes the key,
+    so the stale object is not served.
+    """
+    eos_dir = _make_eos_dir(tmp_path, '1 2 3\n')
+    key_before = eos_cache.cache_key('entropy_eos', eos_dir, _FakeEOS)
+    calls = []
+    eos_cache.load_or_build('entropy_eos', eos_dir, _FakeEOS, _counting_builder(eos_dir, calls))
+
+    _make_eos_dir(tmp_path, '4 5 6\n')
+    assert eos_cache.cache_key('entropy_eos', eos_dir, _FakeEOS) != key_before
+    eos_cache.load_or_build('entropy_eos', eos_dir, _FakeEOS, _counting_builder(eos_dir, calls))
+
+    assert len(calls) == 2
+
+
+def test_key_depends_on_kind_and_format_version(tmp_path, monkeypatch):
+    """The NumPy and JAX objects live in separate namespaces, and bumping the
+    cache format version invalidates every key.
+    """
+    eos_dir = _make_eos_dir(tmp_path)
+    key = eos_cache.cache_key('entropy_eos', eos_dir, _FakeEOS)
+
+    assert key.startswith('entropy_eos-')
+    assert eos_cache.cache_key('entropy_eos_jax', eos_dir, _FakeEOS) != key
+
+    monkeypatch.setattr(eos_cache, 'CACHE_FORMAT_VERSION', eos_cache.CACHE_FORMAT_VERSION + 1)
+    assert eos_cache.cache_key('entropy_eos', eos_dir, _FakeEOS) != key
+
+
+def test_unpicklable_object_is_returned_uncached(tmp_path, cache_dir):
+    """An object that cannot be pickled is still returned to the caller, and
+    no partial entry or staging directory is left behind.
+    """
+    eos_dir = _make_eos_dir(tmp_path)
+
+    def build():
+        obj = _FakeEOS(eos_dir)
+        obj.func = lambda x: x
+        return obj
+
+    obj = eos_cache.load_or_build('entropy_eos', eos_dir, _FakeEOS, build)
+
+    assert isinstance(obj, _FakeEOS)
+    assert [p for p in os.listdir(cache_dir) if not p.endswith('.lock')] == []
+
+
+def test_corrupt_entry_is_rebuilt(tmp_path, cache_dir):
+    """A truncated object file is ignored and replaced by a fresh build."""
+    eos_dir = _make_eos_dir(tmp_path)
+    calls = []
+    eos_cache.load_or_build('entropy_eos', eos_dir, _FakeEOS, _counting_builder(eos_dir, calls))
+
+    key = eos_cache.cache_key('entropy_eos', eos_dir, _FakeEOS)
+    (cache_dir / key / 'object.pkl').write_bytes(b'\x80')
+
+    eos_cache.load_or_build('entropy_eos', eos_dir, _FakeEOS, _counting_builder(eos_dir, calls))
+    loaded = eos_cache.load_or_build(
+        'entropy_eos', eos_dir, _FakeEOS, _counting_builder(eos_dir, calls)
+    )
+
+    assert len(calls) == 2
+    assert isinstance(loaded, _FakeEOS)
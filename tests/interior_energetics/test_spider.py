@@ -16,8 +16,11 @@ Functions tested:
 - _write_mesh_file(): Write SPIDER mesh file with full precision
 - _rewrite_json_solution(): Overwrite solution vector in SPIDER JSON
 - blend_mesh_files(): Clamp mesh shift by linear blending
-- remap_entropy_for_new_mesh(): Core remapping logic
+- remap_entropy_for_new_mesh(): Core remapping logic, including the
+  conservative remap onto a resized mesh (adaptive resolution)
+- _remap_mass_conservative(): Mass-conservative remap of cell averages
 - _try_spider(): SPIDER call-sequence building (EOS paths, mesh mode)
+- MyJSON: lazy field conversion and the optional binary sidecar
 """
 
 from __future__ import annotations
@@ -36,6 +39,7 @@ from proteus.interior_energetics.spider import (
     _check_eos_table_range,
     _coresize_from_mesh,
     _read_mesh_file,
+    _remap_mass_conservative,
     _rewrite_json_solution,
     _write_mesh_file,
     blend_mesh_files,
@@ -350,6 +354,7 @@ def test_mesh_convergence_trigger():
     config.interior_struct.zalmoxis.mesh_convergence_interval = 10.0
     config.planet.temperature_mode = 'isothermal'
     config.interior_struct.zalmoxis.num_levels = 50
+    config.interior_struct.zalmoxis.surrogate_tol = 0.0
     config.interior_energetics.module = 'spider'
 
     dirs = {
@@ -635,6 +640,105 @@ def test_remap_entropy_on_blended_mesh(spider_json_dir):
     np.testing.assert_allclose(S_recon_phys, S_expected, rtol=1e-12)
 
 
+def _synthetic_spider_json(path: str, r_b: np.ndarray, rho: float = 4000.0):
+    """Write a minimal SPIDER JSON with an entropy profile on mesh ``r_b``."""
+    r_s = 0.5 * (r_b[:-1] + r_b[1:])
+    S_s = 2800.0 - 300.0 * (r_s - r_s[-1]) / (r_s[0] - r_s[-1])
+    mass_s = 4.0 / 3.0 * np.pi * (r_b[:-1] ** 3 - r_b[1:] ** 3) * rho
+
+    def field(values):
+        return {'scaling': '1.0', 'values': [f'{v:.17e}' for v in values]}
+
+    jdata = {
+        'data': {
+            'radius_b': field(r_b),
+            'radius_s': field(r_s),
+            'S_s': field(S_s),
+            'mass_s': field(mass_s),
+        },
+        'solution': {
+            'subdomains': 2,
+            'subdomain data': [
+                {'subdomain': 0, 'size': len(r_b), 'scaling': '1.0', 'values': []},
+                {'subdomain': 1, 'size': 1, 'scaling': '2993.025100070677', 'values': []},
+            ],
+        },
+    }
+    with open(path, 'w') as f:
+        json.dump(jdata, f)
+    return S_s, mass_s
+
+
+def test_remap_mass_conservative_preserves_mean():
+    """Cell averages remapped onto other cells keep their mass-weighted mean,
+    and a uniform field stays uniform.
+    """
+    rng = np.random.default_rng(3)
+    mass_old = rng.uniform(1.0, 2.0, 79)
+    mass_new = rng.uniform(1.0, 2.0, 39)
+    values = rng.uniform(2000.0, 3000.0, 79)
+
+    remapped = _remap_mass_conservative(values, mass_old, mass_new)
+
+    assert remapped.shape == (39,)
+    assert np.dot(remapped, mass_new) / mass_new.sum() == pytest.approx(
+        np.dot(values, mass_old) / mass_old.sum(), rel=1e-13
+    )
+    np.testing.assert_allclose(
+        _remap_mass_conservative(np.full(79, 2500.0), mass_old, mass_new), 2500.0, rtol=1e-13
+    )
+
+
+def test_remap_entropy_resized_mesh(spider_json_dir):
+    """With allow_resize, a mesh with fewer nodes gets a solution vector of
+    the new length whose entropy keeps the mantle's mass-weighted mean.
+    """
+    json_path = os.path.join(spider_json_dir, 'resize.json')
+    r_b_old = np.linspace(6.371e6, 3.504e6, 80)
+    S_s_old, mass_s_old = _synthetic_spider_json(json_path, r_b_old)
+
+    r_b_new = np.linspace(6.371e6, 3.504e6, 40)
+    r_s_new = 0.5 * (r_b_new[:-1] + r_b_new[1:])
+    mesh_path = os.path.join(spider_json_dir, 'mesh.dat')
+    _write_mesh_file(
+        mesh_path,
+        r_b_new,
+        np.full(40, 1e9),
+        np.full(40, 4000.0),
+        np.full(40, -9.81),
+        r_s_new,
+        np.full(39, 1e9),
+        np.full(39, 4000.0),
+        np.full(39, -9.81),
+    )
+
+    assert remap_entropy_for_new_mesh(json_path, mesh_path, r_b_new[0]) is False
+    assert remap_entropy_for_new_mesh(json_path, mesh_path, r_b_new[0], allow_resize=True)
+
+    with open(json_path) as f:
+        sd = json.load(f)['solution']['subdomain data']
+    dSdxi = np.array([float(v) for v in sd[0]['values']])
+    S0 = float(sd[1]['values'][0])
+    assert len(dSdxi) == 40
+    assert sd[0]['size'] == 40
+
+    # Forward reconstruction on the new xi grid
+    radius_nondim = r_b_new[0] / RADIUS0
+    coresize = r_b_new[-1] / r_b_new[0]
+    dx_b = -radius_nondim * (1.0 - coresize) / 39
+    xi_s = radius_nondim * coresize - 0.5 * dx_b - (38 - np.arange(39)) * dx_b
+    S_recon = np.zeros(39)
+    for i in range(1, 39):
+        S_recon[i] = dSdxi[i] * (xi_s[i] - xi_s[i - 1]) + S_recon[i - 1]
+    S_recon = (S_recon + S0) * float(sd[1]['scaling'])
+
+    mass_s_new = 4.0 / 3.0 * np.pi * (r_b_new[:-1] ** 3 - r_b_new[1:] ** 3) * 4000.0
+    assert np.dot(S_recon, mass_s_new) / mass_s_new.sum() == pytest.approx(
+        np.dot(S_s_old, mass_s_old) / mass_s_old.sum(), rel=1e-12
+    )
+    assert S_recon[0] < S_recon[-1]
+
+
 # ============================================================================
 # test _coresize_from_mesh
 # ============================================================================
@@ -729,7 +833,7 @@ def test_write_mesh_file_roundtrip(spider_json_dir):
 
 @pytest.mark.unit
 def test_write_mesh_file_format(spider_json_dir):
-    """Verify the output file uses .15e format and correct header."""
+    """Verify the output file uses .17e format and correct header."""
     r_b = np.array([6.371e6, 3.504e6])
     r_s = np.array([4.937e6])
     P_b = np.array([0.0, 1.377e11])
@@ -747,7 +851,7 @@ def test_write_mesh_file_format(spider_json_dir):
         first_line = f.readline()
 
     assert header.strip() == '# 2 1'
-    # .15e format produces strings like "6.371000000000000e+06"
+    # .17e format produces strings like "6.37100000000000000e+06"
     assert 'e+' in first_line or 'e-' in first_line
 
 
@@ -1366,7 +1470,7 @@ def test_blend_mesh_malformed_file(spider_json_dir):
 
 
 # ============================================================================
-# test MyJSON, get_all_output_times, read_jsons, interp_rho_melt
+# test MyJSON (incl. binary sidecar), get_all_output_times, read_jsons, interp_rho_melt
 # ============================================================================
 
 
@@ -1471,6 +1575,74 @@ def test_myjson_get_dict_values(tmp_path):
     assert p_s[0] == pytest.approx(0.0)
 
 
+@pytest.mark.unit
+def test_myjson_string_values_scaled_vectorised(tmp_path):
+    """Field values stored as strings, as SPIDER writes them, are converted
+    and scaled; repeated access returns fresh arrays a caller may modify.
+    """
+    from proteus.interior_energetics.spider import MyJSON
+
+    fpath = tmp_path / '0.json'
+    field = {'scaling': '2.0', 'units': 'K', 'values': ['1.5e+00', '2.5e+00', '-3.0e-01']}
+    fpath.write_text(json.dumps({'data': {'temp_b': field}}))
+
+    jobj = MyJSON(str(fpath))
+    first = jobj.get_dict_values(['data', 'temp_b'])
+    np.testing.assert_allclose(first, [3.0, 5.0, -0.6])
+    first[0] = -1.0
+    assert jobj.get_dict_values(['data', 'temp_b'])[0] == pytest.approx(3.0)
+
+
+@pytest.mark.unit
+def test_myjson_sidecar_skips_json_parse(tmp_path, monkeypatch):
+    """With sidecar=True the first load writes a binary sidecar; a second
+    load of the unchanged file is served from it without parsing the JSON,
+    with identical scalars, units and scaled arrays.
+    """
+    import proteus.interior_energetics.spider as spider_mod
+    from proteus.interior_energetics.spider import MyJSON
+
+    fpath = str(tmp_path / '100.json')
+    _make_spider_json(fpath, step=7, sim_time=100.4)
+    first = MyJSON(fpath, sidecar=True)
+    expected = first.get_dict_values(['data', 'radius_b'])
+    assert os.listdir(tmp_path / '.json_cache')
+
+    def _no_parse(*args, **kwargs):
+        raise AssertionError('JSON parsed despite a valid sidecar')
+
+    monkeypatch.setattr(spider_mod.json, 'load', _no_parse)
+    second = MyJSON(fpath, sidecar=True)
+
+    assert second.loaded
+    assert second.get_dict(['step']) == 7
+    assert second.get_dict(['time_years']) == pytest.approx(100.4)
+    assert second.get_dict_units(('atmosphere', 'Fatm')) == 'W/m2'
+    assert second.get_dict_values(('atmosphere', 'temperature_surface')) == pytest.approx(
+        2500.0
+    )
+    np.testing.assert_array_equal(second.get_dict_values(['data', 'radius_b']), expected)
+
+
+@pytest.mark.unit
+def test_myjson_sidecar_invalidated_by_rewrite(tmp_path):
+    """A rewritten JSON is re-parsed rather than served from its old
+    sidecar, and the old sidecar is removed.
+    """
+    from proteus.interior_energetics.spider import MyJSON
+
+    fpath = str(tmp_path / '100.json')
+    _make_spider_json(fpath, step=1)
+    MyJSON(fpath, sidecar=True)
+
+    _make_spider_json(fpath, step=22)
+    st = os.stat(fpath)
+    os.utime(fpath, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    assert MyJSON(fpath, sidecar=True).get_dict(['step']) == 22
+    assert len(os.listdir(tmp_path / '.json_cache')) == 1
+
+
 @pytest.mark.unit
 def test_myjson_phase_boolean_arrays(tmp_path):
     """MyJSON phase boolean arrays work for staggered and basic nodes."""
@@ -1548,6 +1720,10 @@ def test_read_jsons(tmp_path):
     # 999 doesn't exist → skipped
     assert len(jsons) == 2
     assert jsons[0].data_d is not None
+    # Sidecars are opt-in
+    assert not (data_dir / '.json_cache').exists()
+    read_jsons(str(tmp_path), [0], sidecar=True)
+    assert os.listdir(data_dir / '.json_cache')
 
 
 @pytest.mark.unit
@@ -1571,6 +1747,28 @@ def test_interp_rho_melt():
     assert isinstance(rho, float)
 
 
+@pytest.mark.unit
+def test_interp_rho_melt_reuses_interpolator():
+    """interp_rho_melt builds one interpolator per table, not one per call."""
+    from proteus.interior_energetics import spider
+
+    nP, nS = 3, 4
+    P, S = np.meshgrid(np.linspace(0, 135e9, nP), np.linspace(2000, 3000, nS))
+    lookup = np.stack((P, S, 3000.0 + 1e-9 * P), axis=-1)
+
+    spider.interp_rho_melt(2500.0, 50e9, lookup)
+    interp = spider._rho_melt_interp['lookup']
+    spider.interp_rho_melt(2600.0, 60e9, lookup)
+    assert spider._rho_melt_interp['lookup'] is interp
+
+    # A different table gets its own interpolator
+    other = lookup.copy()
+    other[:, :, 2] += 100.0
+    assert spider.interp_rho_melt(2500.0, 50e9, other) == pytest.approx(
+        spider.interp_rho_melt(2500.0, 50e9, lookup) + 100.0
+    )
+
+
 # ============================================================================
 # test RunSPIDER (wrapper with retry logic)
 # ============================================================================
@@ -0,0 +1,146 @@
+"""
+Unit tests for proteus.interior_energetics.table_cache.
+
+Testing standards and documentation:
+- docs/How-to/testing.md: Running, writing, and marking tests; coverage and CI
+- docs/Explanations/test_framework.md: Test tiers, physics invariants, and quality rules
+
+Functions tested:
+- read_spider_table(): text parse on first read, memory-mapped sidecar on
+  later reads, invalidation on source change, opt-out and unwritable fallback
+- write_spider_table(): text output plus a sidecar that spares the re-parse
+- grid_row_template(): pre-formatted grid columns giving the same text
+"""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+
+import proteus.interior_energetics.table_cache as table_cache
+
+pytestmark = [pytest.mark.unit, pytest.mark.timeout(30)]
+
+_HEADER = [
+    '# 5 3 2\n',
+    '# Pressure, Entropy, Quantity\n',
+    '# column * scaling factor should be SI units\n',
+    '# scaling factors (constant) for each column given on line below\n',
+    '# 1.0e9 1.0 1.0\n',
+]
+
+
+def _write_table(path, offset=0.0):
+    rows = [
+        f'{i * 0.5} {j * 100.0} {i + 10 * j + offset}\n' for j in range(2) for i in range(3)
+    ]
+    path.write_text(''.join(_HEADER + rows))
+
+
+@pytest.fixture(autouse=True)
+def _enable_cache(monkeypatch):
+    monkeypatch.delenv(table_cache.CACHE_ENV, raising=False)
+
+
+def test_second_read_is_memory_mapped_and_identical(tmp_path, monkeypatch):
+    """The first read parses the text and writes a sidecar; the second is
+    served from the sidecar, memory-mapped, with identical header and data.
+    """
+    path = tmp_path / 'density_melt.dat'
+    _write_table(path)
+
+    header, data = table_cache.read_spider_table(str(path))
+    expected = np.loadtxt(path, skiprows=5)
+    assert header == _HEADER
+    np.testing.assert_array_equal(data, expected)
+
+    def _no_parse(path):
+        raise AssertionError('text parsed despite a valid sidecar')
+
+    monkeypatch.setattr(table_cache, '_parse', _no_parse)
+    header2, data2 = table_cache.read_spider_table(str(path))
+
+    assert isinstance(data2, np.memmap)
+    assert not data2.flags.writeable
+    assert header2 == _HEADER
+    np.testing.assert_array_equal(data2, expected)
+
+
+def test_changed_source_invalidates_and_replaces_sidecar(tmp_path):
+    """Rewriting the source serves the new values and removes the sidecar
+    of the previous version.
+    """
+    path = tmp_path / 'density_melt.dat'
+    _write_table(path)
+    table_cache.read_spider_table(str(path))
+
+    _write_table(path, offset=1000.0)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    _, data = table_cache.read_spider_table(str(path))
+
+    assert data[0, 2] == pytest.approx(1000.0)
+    cache_dir = tmp_path / table_cache.CACHE_SUBDIR
+    assert len(os.listdir(cache_dir)) == 2  # one .npy and one .json
+
+
+def test_opt_out_reads_text_and_writes_nothing(tmp_path, monkeypatch):
+    """PROTEUS_TABLE_CACHE=0 parses the text and leaves no sidecar."""
+    monkeypatch.setenv(table_cache.CACHE_ENV, '0')
+    path = tmp_path / 'density_melt.dat'
+    _write_table(path)
+
+    header, data = table_cache.read_spider_table(str(path))
+
+    assert header == _HEADER
+    assert data.shape == (6, 3)
+    assert not (tmp_path / table_cache.CACHE_SUBDIR).exists()
+
+
+def test_unwritable_cache_falls_back_to_text(tmp_path, monkeypatch):
+    """A failure to store the sidecar still returns the parsed table."""
+    path = tmp_path / 'density_melt.dat'
+    _write_table(path)
+
+    def _fail(*args):
+        raise PermissionError('read-only')
+
+    monkeypatch.setattr(table_cache, '_store', _fail)
+    header, data = table_cache.read_spider_table(str(path))
+
+    assert header == _HEADER
+    np.testing.assert_array_equal(data, np.loadtxt(path, skiprows=5))
+
+
+def test_write_spider_table_round_trips_exactly(tmp_path, monkeypatch):
+    """The written text parses back to the exact values, and the sidecar
+    written alongside it spares the next reader the parse.
+    """
+    rng = np.random.default_rng(1)
+    data = rng.uniform(-1e3, 1e3, size=(6, 3))
+    path = tmp_path / 'temperature_melt.dat'
+
+    table_cache.write_spider_table(str(path), _HEADER, data)
+
+    np.testing.assert_array_equal(np.loadtxt(path, skiprows=5), data)
+    monkeypatch.setattr(table_cache, '_parse', lambda path: pytest.fail('text parsed'))
+    header, cached = table_cache.read_spider_table(str(path))
+    assert header == _HEADER
+    np.testing.assert_array_equal(cached, data)
+
+
+def test_grid_row_template_writes_the_same_text(tmp_path):
+    """A table written through its grid's row template matches the text
+    of a plain write byte for byte.
+    """
+    P, S = np.array([0.0, 0.5, 1.0]), np.array([0.0, 100.0])
+    values = np.random.default_rng(2).uniform(0.0, 1e4, size=6)
+    data = np.column_stack([np.tile(P, 2), np.repeat(S, 3), values])
+
+    table_cache.write_spider_table(str(tmp_path / 'plain.dat'), _HEADER, data)
+    rows = table_cache.grid_row_template(P, S)
+    table_cache.write_spider_table(str(tmp_path / 'template.dat'), _HEADER, data, rows)
+
+    assert (tmp_path / 'template.dat').read_text() == (tmp_path / 'plain.dat').read_text()
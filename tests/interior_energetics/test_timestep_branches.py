@@ -2,7 +2,8 @@
 
 These tests exercise the early-Time static branch, the initial branch
 when ``hf_all`` is too short, the proportional time-step formula, the
-invalid-method error path, and the three "time until X" estimators
+PI controller with its local error estimate (``_local_error``,
+``interior_step_error``) and rejected-step limit, the invalid-method error path, and the three "time until X" estimators
 (``_estimate_solid``, ``_estimate_radeq``, ``_estimate_escape``)
 including their "already there" short-circuits.
 
@@ -21,11 +22,17 @@ import pandas as pd
 import pytest
 
 from proteus.interior_energetics.timestep import (
+    PI_BETA1,
+    PI_BETA2,
+    PI_SAFETY,
+    PI_SHRINK_MIN,
     SMALL,
     _estimate_escape,
     _estimate_radeq,
     _estimate_solid,
     _hf_from_iters,
+    _local_error,
+    interior_step_error,
     next_step,
 )
 
@@ -192,6 +199,154 @@ def test_next_step_maximum_method_returns_dt_maximum():
     assert dt2 == pytest.approx(2.5e4)
 
 
+def _pi_hf(T_magma, dt_steps):
+    """History with a T_magma trace and the given step sizes; other columns flat."""
+    times = np.concatenate([[0.0], np.cumsum(dt_steps)])
+    hf_all = _long_hf(n_rows=len(times))
+    hf_all['Time'] = times
+    hf_all['T_magma'] = np.asarray(T_magma, dtype=float)
+    return hf_all
+
+
+def test_local_error_vanishes_on_linear_trend_with_uneven_steps():
+    """A state changing linearly in time has no local error, even across
+    unequal steps, while a bend in the last step is detected. Discrimination:
+    an estimator that ignored the step ratio would flag the uneven linear
+    history.
+    """
+    dt_steps = [1.0e3, 1.0e3, 2.0e3, 4.0e3]
+    times = np.concatenate([[0.0], np.cumsum(dt_steps)])
+    linear = _pi_hf(3000.0 - 0.01 * times, dt_steps)
+    assert _local_error(linear, -1, rtol=1e-3, atol=0.02) == pytest.approx(0.0, abs=1e-9)
+
+    bent = linear.copy()
+    bent.loc[bent.index[-1], 'T_magma'] -= 30.0
+    err = _local_error(bent, -1, rtol=1e-3, atol=0.02)
+    # One of four monitored components deviates by 30 K on a ~3 K scale
+    scale = 0.02 + 1e-3 * abs(bent['T_magma'].iloc[-2])
+    assert err == pytest.approx(np.sqrt(30.0**2 / scale**2 / 4), rel=1e-9)
+
+
+def test_local_error_floors_scale_of_states_near_zero():
+    """A flux crossing zero is scored on the ``PI_SCALE_FLOOR`` scale, not
+    on ``atol`` alone. Discrimination: without the floor a 0.5 W m-2 wobble
+    in F_atm near zero scores 25 and rejects the step.
+    """
+    dt_steps = [1.0e3] * 4
+    hf_all = _pi_hf(np.full(5, 3000.0), dt_steps)
+    hf_all['F_atm'] = [0.0, 0.0, 0.0, 0.0, 0.5]
+
+    err = _local_error(hf_all, -1, rtol=1e-3, atol=0.02)
+
+    assert err == pytest.approx(np.sqrt(0.5**2 / 4), rel=1e-9)
+    assert err < 1.0
+
+
+def test_interior_step_error_scores_only_pi_interior_states():
+    """The pending interior step is scored on T_magma and Phi_global
+    against the last two rows, and only under the 'pi' method.
+    """
+    config = _build_config(method='pi')
+    config.params.dt.rtol = 1e-3
+    dt_steps = [1.0e3] * 11
+    times = np.concatenate([[0.0], np.cumsum(dt_steps)])
+    hf_all = _pi_hf(3000.0 - 0.01 * times, dt_steps)
+    t_end = float(times[-1])
+    T_pred = 3000.0 - 0.01 * (t_end + 500.0)
+    hf_row = {'Time': t_end, 'T_magma': T_pred, 'Phi_global': 1.0, 'F_atm': -1.0e6}
+
+    assert interior_step_error(config, hf_all, hf_row, t_end + 500.0) == pytest.approx(
+        0.0, abs=1e-9
+    )
+
+    hf_row['T_magma'] = T_pred - 30.0
+    err = interior_step_error(config, hf_all, hf_row, t_end + 500.0)
+    scale = 0.02 + 1e-3 * abs(hf_all['T_magma'].iloc[-1])
+    assert err == pytest.approx(np.sqrt(30.0**2 / scale**2 / 2), rel=1e-9)
+
+    assert interior_step_error(_build_config(), hf_all, hf_row, t_end + 500.0) == 0.0
+
+
+def test_next_step_caps_step_at_rejected_step_limit(caplog):
+    """A step rejected by ``run_interior`` is repeated with at most the step
+    it asked for, whatever the controller would pick otherwise.
+    """
+    config = _build_config(method='maximum', dt_max=2.5e4)
+    hf_all = _long_hf()
+    hf_row = {'Time': float(hf_all['Time'].iloc[-1])}
+    interior_o = SimpleNamespace(dt_reject_limit=300.0, escape_dt_limit=float('inf'))
+
+    with caplog.at_level(logging.INFO, logger='fwl.proteus.interior_energetics.timestep'):
+        dt = next_step(config, {}, hf_row, hf_all, step_sf=1.0, interior_o=interior_o)
+
+    assert dt == pytest.approx(300.0)
+    assert 'rejected step' in caplog.text
+
+
+def test_next_step_pi_grows_by_scale_incr_on_smooth_history():
+    """With zero local error the PI ratio saturates at ``scale_incr``."""
+    config = _build_config(method='pi')
+    dt_steps = [1.0e3] * 11
+    times = np.concatenate([[0.0], np.cumsum(dt_steps)])
+    hf_all = _pi_hf(3000.0 - 0.01 * times, dt_steps)
+    hf_row = {'Time': float(times[-1])}
+
+    dt = next_step(config, {}, hf_row, hf_all, step_sf=1.0)
+
+    assert dt == pytest.approx(1.6e3)
+
+
+def test_next_step_pi_rejects_step_with_large_error(caplog):
+    """A step whose local error exceeds 1 is rejected: the next step
+    shrinks by integral control, bounded below by ``PI_SHRINK_MIN``.
+    """
+    config = _build_config(method='pi')
+    config.params.dt.minimum = 1.0
+    config.params.dt.rtol = 1e-3
+    dt_steps = [1.0e3] * 11
+    T = np.full(12, 3000.0)
+    T[-1] = 2990.0
+    hf_all = _pi_hf(T, dt_steps)
+    hf_row = {'Time': float(hf_all['Time'].iloc[-1])}
+    err = _local_error(hf_all, -1, rtol=1e-3, atol=0.02)
+    assert err > 1.0
+
+    with caplog.at_level(logging.INFO, logger='fwl.proteus.interior_energetics.timestep'):
+        dt = next_step(config, {}, hf_row, hf_all, step_sf=1.0)
+
+    assert dt == pytest.approx(1.0e3 * max(PI_SHRINK_MIN, PI_SAFETY / np.sqrt(err)))
+    assert 'reject' in caplog.text
+
+    T[-1] = 2000.0  # far larger error: the shrink floor binds
+    dt_floor = next_step(config, {}, hf_row, _pi_hf(T, dt_steps), step_sf=1.0)
+    assert dt_floor == pytest.approx(1.0e3 * PI_SHRINK_MIN)
+
+
+def test_next_step_pi_drops_rejected_step_from_controller_memory():
+    """After a rejected step, the accepted step that follows is sized by
+    its own error alone. Discrimination: feeding the rejected error into
+    the proportional term would return a larger step.
+    """
+    config = _build_config(method='pi')
+    config.params.dt.minimum = 1.0
+    config.params.dt.rtol = 1e-3
+    dt_steps = [1.0e3] * 11
+    T = np.full(12, 3000.0)
+    T[-2] = 2990.0  # rejected step
+    T[-1] = 2980.5  # close to the straight continuation of the bend
+    hf_all = _pi_hf(T, dt_steps)
+    hf_row = {'Time': float(hf_all['Time'].iloc[-1])}
+    err = _local_error(hf_all, -1, rtol=1e-3, atol=0.02)
+    err_prev = _local_error(hf_all, -2, rtol=1e-3, atol=0.02)
+    assert err_prev > 1.0 > err
+
+    dt = next_step(config, {}, hf_row, hf_all, step_sf=1.0)
+
+    expected = 1.0e3 * PI_SAFETY * err ** (PI_BETA2 - PI_BETA1)
+    assert dt == pytest.approx(expected)
+    assert dt < 1.0e3 * PI_SAFETY * err ** (-PI_BETA1) * err_prev**PI_BETA2
+
+
 def test_next_step_unknown_method_raises_value_error(tmp_path):
     """An unrecognised method string trips the catch-all that writes a
     statusfile and raises ``ValueError``. Discrimination: the error
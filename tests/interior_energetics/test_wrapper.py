@@ -12,7 +12,7 @@ Testing standards and documentation:
 
 Functions tested:
 - update_structure_from_interior(): Trigger logic, T(r) profile building,
-  mesh blending, convergence tracking, entropy remap
+  mesh blending, convergence tracking, entropy remap, structure surrogate
 - solve_structure(): phi_crit warning, dispatch to Zalmoxis
 """
 
@@ -74,7 +74,9 @@ def _mock_config(
     config.interior_struct.zalmoxis.mesh_convergence_interval = mesh_convergence_interval
     config.planet.temperature_mode = 'isothermal'
     config.interior_struct.zalmoxis.num_levels = num_levels
+    config.interior_struct.zalmoxis.surrogate_tol = 0.0
     config.interior_energetics.module = 'spider'
+    config.interior_energetics.adaptive_levels = False
     return config
 
 
@@ -533,6 +535,52 @@ def test_tmagma_trigger():
     mock_solver.assert_called_once()
 
 
+@pytest.mark.unit
+def test_surrogate_skips_predictable_resolves(caplog):
+    """With surrogate_tol set, a dT/T trigger is answered without a re-solve
+    once earlier re-solves predict a structure change below the tolerance,
+    and a step outside the sampled range re-solves. Each decision is logged.
+    """
+    config = _mock_config(update_interval=1e5, update_min_interval=0.0)
+    config.interior_struct.zalmoxis.surrogate_tol = 1e-3
+    dirs = _mock_dirs()
+    interior_o = _mock_interior_o()
+
+    def _solve(cfg, outdir, hf_row, **kwargs):
+        dT = hf_row['T_magma'] - 3000.0
+        hf_row['R_int'] = 6.371e6 * (1.0 + 1e-7 * dT)
+        hf_row['gravity'] = 9.81 * (1.0 - 2e-7 * dT)
+        return 3.504e6, None
+
+    last = (0.0, 3000.0, 0.80)
+    structure = {'R_int': 6.371e6, 'gravity': 9.81}
+    solved = []
+    with (
+        patch('proteus.interior_struct.zalmoxis.zalmoxis_solver', side_effect=_solve) as solver,
+        patch('proteus.interior_energetics.wrapper.np.savetxt'),
+        patch('proteus.interior_energetics.wrapper.shutil.copy2'),
+        caplog.at_level('INFO', logger='fwl.proteus.interior_energetics.wrapper'),
+    ):
+        for k, T_magma in enumerate((2880.0, 2760.0, 2640.0, 2520.0, 1500.0)):
+            hf_row = {'Time': 100.0 * (k + 1), 'T_magma': T_magma, 'Phi_global': 0.80}
+            hf_row.update(structure)
+            n_calls = solver.call_count
+            result = update_structure_from_interior(dirs, config, hf_row, interior_o, *last)
+            solved.append(solver.call_count > n_calls)
+            if not solved[-1]:
+                assert result == last
+                assert hf_row['R_int'] == structure['R_int']
+            structure = {key: hf_row[key] for key in structure}
+            last = result
+
+    assert solved == [True, True, True, False, True]
+    assert dirs['_struct_surrogate'].skipped == 1
+    decisions = [r.getMessage() for r in caplog.records if 'Structure surrogate' in r.message]
+    assert len(decisions) == 5
+    assert 'skipping re-solve' in decisions[3]
+    assert 'no usable prediction' in decisions[4]
+
+
 @pytest.mark.unit
 def test_tmagma_no_trigger():
     """dT/T below threshold should not trigger."""
@@ -2252,6 +2300,88 @@ def test_run_interior_non_boundary_module_shares_dT_delta_between_caps():
     assert hf_row['T_surf'] == pytest.approx(2820.0)
 
 
+def _pi_rollback_state():
+    """History on a straight T_magma line, ending at the current row."""
+    import pandas as pd
+
+    times = np.arange(10, dtype=float) * 1000.0
+    hf_all = pd.DataFrame(
+        {
+            'Time': times,
+            'T_magma': 3000.0 - 0.01 * times,
+            'T_surf': 2800.0 - 0.01 * times,
+            'Phi_global': np.full(10, 0.4),
+            'F_int': np.full(10, 0.1),
+        }
+    )
+    hf_row = {k: float(hf_all[k].iloc[-1]) for k in hf_all.columns}
+    hf_row.update(
+        {
+            'M_mantle': 4.0e24,
+            'M_mantle_liquid': 1.0e24,
+            'M_mantle_solid': 3.0e24,
+            'M_core': 2.0e24,
+        }
+    )
+    return hf_all, hf_row
+
+
+@pytest.mark.unit
+def test_run_interior_pi_rolls_back_and_repeats_rejected_step(tmp_path):
+    """Under the 'pi' method an interior step that bends away from the
+    trend is undone and repeated with a smaller step. Discrimination: the
+    repeated step starts from the original row, not from the rejected
+    state, and the rejected step's data file is removed.
+    """
+    from proteus.interior_energetics.wrapper import run_interior
+
+    config = _make_run_interior_config(prevent_warming=False)
+    config.interior_energetics.tmagma_atol = 1.0e3
+    config.params.dt.method = 'pi'
+    config.params.dt.window = 3
+    config.params.dt.atol = 0.02
+    config.params.dt.rtol = 1e-3
+    config.params.dt.minimum = 1.0
+    config.params.dt.minimum_rel = 0.0
+    hf_all, hf_row = _pi_rollback_state()
+    start_row = dict(hf_row)
+
+    interior_o = MagicMock(spec=Interior_t)
+    interior_o.ic = 2
+    interior_o.aragog_solver = None
+    interior_o.dt_reject_limit = float('inf')
+    interior_o.rejected_steps = 0
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    (data_dir / '8000_int.nc').write_text('')
+
+    seen = []
+
+    def fake_dummy(config, dirs, hf_row, hf_all, interior_o):
+        seen.append(dict(hf_row))
+        out = {k: hf_row[k] for k in ('F_int', 'M_mantle', 'M_core', 'Phi_global')}
+        if len(seen) == 1:
+            (data_dir / '10000_int.nc').write_text('')
+            return 10000.0, {**out, 'T_magma': 2800.0, 'T_surf': 2700.0}
+        return 9200.0, {**out, 'T_magma': 2908.0, 'T_surf': 2708.0}
+
+    with (
+        patch('proteus.interior_energetics.dummy.run_dummy_int', side_effect=fake_dummy),
+        patch('proteus.interior_energetics.wrapper.update_planet_mass'),
+    ):
+        run_interior(
+            {'output': str(tmp_path)}, config, hf_all, hf_row, interior_o, verbose=False
+        )
+
+    assert len(seen) == 2
+    assert seen[1] == start_row
+    interior_o.restore.assert_called_once()
+    assert interior_o.rejected_steps == 1
+    assert interior_o.dt_reject_limit == float('inf')
+    assert hf_row['T_magma'] == pytest.approx(2908.0)
+    assert sorted(os.listdir(data_dir)) == ['8000_int.nc']
+
+
 # ============================================================================
 # determine_interior_radius: tolerance_struct + maxiter + initial bracket
 # ============================================================================
@@ -2681,6 +2811,98 @@ def test_get_nlevb_returns_per_module_levels(module, expected):
     assert isinstance(get_nlevb(config), int)
 
 
+# Synthetic SPIDER mantle for adaptive resolution: evenly spaced levels from
+# surface to CMB, density rising with depth, and an entropy profile whose
+# rheological front (solidus-to-liquidus entropy) is a tanh of given width.
+_ADAPT_R_SURF, _ADAPT_R_CMB = 6.371e6, 3.48e6
+_ADAPT_S_SOL, _ADAPT_S_LIQ = 2600.0, 2900.0
+
+
+def _adaptive_mantle(nlev_b, r_front, width, entropy=None):
+    from types import SimpleNamespace
+
+    r_b = np.linspace(_ADAPT_R_SURF, _ADAPT_R_CMB, nlev_b)
+    r_s = 0.5 * (r_b[:-1] + r_b[1:])
+    rho = 3300.0 + 2000.0 * (_ADAPT_R_SURF - r_s) / (_ADAPT_R_SURF - _ADAPT_R_CMB)
+    mass = 4.0 / 3.0 * np.pi * (r_b[:-1] ** 3 - r_b[1:] ** 3) * rho
+    if entropy is None:
+        entropy = 0.5 * (_ADAPT_S_SOL + _ADAPT_S_LIQ) + (_ADAPT_S_LIQ - _ADAPT_S_SOL) * np.tanh(
+            (r_s - r_front) / width
+        )
+    phi = np.clip((entropy - _ADAPT_S_SOL) / (_ADAPT_S_LIQ - _ADAPT_S_SOL), 0.0, 1.0)
+    return SimpleNamespace(radius=r_b, phi=phi, mass=mass, entropy=entropy)
+
+
+def _adaptive_config(adaptive=True):
+    from types import SimpleNamespace
+
+    return SimpleNamespace(
+        interior_energetics=SimpleNamespace(
+            module='spider', num_levels=120, num_levels_min=40, adaptive_levels=adaptive
+        ),
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'r_front,width,expected',
+    [
+        (5.0e6, 1.0e5, 120),  # thin front: full resolution
+        (5.0e6, 4.0e5, 54),  # broad front: 8 cells across it
+        (6.0e6, 1.5e6, 40),  # mush across most of the mantle
+        (3.6e6, 2.0e5, 120),  # front at the core-mantle boundary
+        (9.0e6, 1.0e5, 40),  # fully solid: no front
+    ],
+)
+def test_get_nlevb_adaptive_resolves_rheological_front(r_front, width, expected):
+    """With adaptive_levels, SPIDER gets enough levels for the partially
+    molten cells to span 8 levels, all of them when the front reaches the
+    CMB, and num_levels_min without a front.
+    """
+    from proteus.interior_energetics.wrapper import get_nlevb
+
+    interior_o = _adaptive_mantle(120, r_front, width)
+
+    assert get_nlevb(_adaptive_config(), interior_o) == expected
+    # Without the interior state, or with the option off, the configured count
+    assert get_nlevb(_adaptive_config()) == 120
+    assert get_nlevb(_adaptive_config(adaptive=False), interior_o) == 120
+
+
+@pytest.mark.unit
+@pytest.mark.physics_invariant
+@pytest.mark.parametrize('r_front,width', [(5.0e6, 4.0e5), (6.0e6, 1.5e6), (4.5e6, 2.5e5)])
+def test_adaptive_levels_keep_global_diagnostics_of_fixed_mesh(r_front, width):
+    """The mantle on the adaptive level count keeps the global diagnostics
+    of the fixed num_levels mesh it is remapped from: total entropy exactly,
+    global melt fraction to 1e-4 and the front position to one fixed level.
+    """
+    from proteus.interior_energetics.spider import _remap_mass_conservative
+    from proteus.interior_energetics.wrapper import get_nlevb
+
+    fixed = _adaptive_mantle(120, r_front, width)
+    nlev_b = get_nlevb(_adaptive_config(), fixed)
+    assert nlev_b < 120
+    coarse = _adaptive_mantle(nlev_b, r_front, width)
+    adapted = _adaptive_mantle(
+        nlev_b, r_front, width, _remap_mass_conservative(fixed.entropy, fixed.mass, coarse.mass)
+    )
+
+    def mean(mantle, field):
+        return np.dot(field, mantle.mass) / mantle.mass.sum()
+
+    def front_radius(mantle):
+        r_s = 0.5 * (mantle.radius[:-1] + mantle.radius[1:])
+        return np.interp(0.5, mantle.phi[::-1], r_s[::-1])
+
+    assert mean(adapted, adapted.entropy) == pytest.approx(
+        mean(fixed, fixed.entropy), rel=1e-12
+    )
+    assert abs(mean(adapted, adapted.phi) - mean(fixed, fixed.phi)) < 1e-4
+    spacing = (_ADAPT_R_SURF - _ADAPT_R_CMB) / 119
+    assert abs(front_radius(adapted) - front_radius(fixed)) < spacing
+
+
 @pytest.mark.unit
 def test_get_nlevb_invalid_module_raises_value_error():
     """get_nlevb raises ValueError for an unknown module string."""
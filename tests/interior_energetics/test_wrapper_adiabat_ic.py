@@ -1245,6 +1245,7 @@ def _monotonic_config(
                 update_dw_comp_abs=10.0,
                 mesh_max_shift=0.05,
                 global_miscibility=False,
+                surrogate_tol=0.0,
             ),
         ),
     )
@@ -0,0 +1,148 @@
+"""
+Unit tests for proteus.interior_struct.batch.
+
+Testing standards and documentation:
+- docs/How-to/testing.md: Running, writing, and marking tests; coverage and CI
+- docs/Explanations/test_framework.md: Test tiers, physics invariants, and quality rules
+
+Functions tested:
+- group_cases(): grouping by EOS fingerprint, mass ordering, skipped
+  non-Zalmoxis cases
+- split_groups(): contiguous mass runs, sized to use every worker
+- presolve_initial_structures(): no-op without a warm-start store, results
+  in input order, failed cases recorded without stopping the batch, one
+  EOS group spread over spawned workers
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+import proteus.interior_struct.batch as batch
+
+pytestmark = [pytest.mark.unit, pytest.mark.timeout(30)]
+
+
+def _config(mass, mantle_eos='PALEOS:MgSiO3', module='zalmoxis'):
+    zalmoxis = SimpleNamespace(
+        core_eos='PALEOS:iron',
+        mantle_eos=mantle_eos,
+        ice_layer_eos='',
+        mushy_zone_factor=0.8,
+        dry_mantle=True,
+    )
+    return SimpleNamespace(
+        planet=SimpleNamespace(mass_tot=mass),
+        interior_struct=SimpleNamespace(
+            module=module, core_frac_mode='mass', zalmoxis=zalmoxis
+        ),
+    )
+
+
+@pytest.fixture
+def configs(monkeypatch):
+    table = {
+        'a.toml': _config(2.0),
+        'b.toml': _config(0.5),
+        'c.toml': _config(1.0, mantle_eos='PALEOS-2phase:MgSiO3'),
+        'd.toml': _config(1.0, module='dummy'),
+        'e.toml': _config(1.0),
+    }
+    monkeypatch.setattr('proteus.config.read_config_object', lambda path: table[path])
+    return table
+
+
+def test_group_cases(configs):
+    """Cases sharing an EOS form one group in mass order; others are skipped."""
+    groups, skipped = batch.group_cases(list(configs))
+
+    assert sorted(groups) == [['b.toml', 'e.toml', 'a.toml'], ['c.toml']]
+    assert [r.config_path for r in skipped] == ['d.toml']
+    assert skipped[0].status == 'skipped'
+
+
+def test_presolve_needs_store(configs, monkeypatch):
+    """Without a warm-start store nothing is solved."""
+    monkeypatch.delenv('PROTEUS_STRUCT_CACHE_DIR', raising=False)
+    monkeypatch.setattr(batch, '_presolve_case', pytest.fail)
+
+    results = batch.presolve_initial_structures(['a.toml', 'b.toml'])
+
+    assert [r.status for r in results] == ['skipped', 'skipped']
+
+
+def test_presolve_results(configs, monkeypatch, tmp_path):
+    """Each group is solved in mass order; a failure is recorded and the
+    remaining cases are still solved.
+    """
+    monkeypatch.setenv('PROTEUS_STRUCT_CACHE_DIR', str(tmp_path))
+    order = []
+
+    def fake_case(path):
+        order.append(path)
+        if path == 'e.toml':
+            raise RuntimeError('no convergence')
+        return batch.PresolveResult(path, 'solved', R_int=float(len(order)))
+
+    monkeypatch.setattr(batch, '_presolve_case', fake_case)
+
+    paths = list(configs)
+    results = batch.presolve_initial_structures(paths, workers=1)
+
+    assert [r.config_path for r in results] == paths
+    assert [r.status for r in results] == ['solved', 'solved', 'solved', 'skipped', 'failed']
+    assert results[4].message == 'no convergence'
+    assert order.index('b.toml') < order.index('e.toml') < order.index('a.toml')
+
+
+def test_split_groups():
+    """Groups are cut into contiguous mass runs of near-equal length, so a
+    single group still fills every worker and no run mixes groups.
+    """
+    group = [f'm{i}.toml' for i in range(10)]
+
+    runs = batch.split_groups([group], 4)
+    assert [len(run) for run in runs] == [2, 3, 3, 2]
+    assert sum(runs, []) == group
+
+    runs = batch.split_groups([group[:2], ['c.toml']], 8)
+    assert runs == [['m0.toml'], ['m1.toml'], ['c.toml']]
+    assert batch.split_groups([group], 1) == [group]
+
+
+def test_presolve_spreads_one_group_over_spawned_workers(configs, monkeypatch, tmp_path):
+    """With several workers, one EOS group is solved in parallel runs by a
+    spawn-context pool, and results still come back in input order.
+    """
+    monkeypatch.setenv('PROTEUS_STRUCT_CACHE_DIR', str(tmp_path))
+    pools = []
+
+    class FakePool:
+        def __init__(self, max_workers, mp_context):
+            pools.append((max_workers, mp_context.get_start_method()))
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def map(self, fn, runs):
+            runs = list(runs)
+            pools.append(runs)
+            return [fn(run) for run in runs]
+
+    monkeypatch.setattr(batch, 'ProcessPoolExecutor', FakePool)
+    monkeypatch.setattr(
+        batch, '_presolve_case', lambda path: batch.PresolveResult(path, 'solved', R_int=1.0)
+    )
+
+    paths = ['a.toml', 'b.toml', 'e.toml']
+    results = batch.presolve_initial_structures(paths, workers=3)
+
+    assert pools[0] == (3, 'spawn')
+    assert pools[1] == [['b.toml'], ['e.toml'], ['a.toml']]
+    assert [r.config_path for r in results] == paths
+    assert all(r.status == 'solved' for r in results)
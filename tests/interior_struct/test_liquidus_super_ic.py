@@ -452,6 +452,33 @@ class TestSolveSuperliquidusAdiabat:
         # A 5 M_Earth core-mantle pressure is far above the Earth-like 135 GPa.
         assert res['P_cmb'] > 4e11
 
+    def test_cache_key_tracks_melting_curve_inputs(self, monkeypatch, tmp_path):
+        """Solves against different melting curves never share a memo entry:
+        the key follows ``mushy_zone_factor`` (the derived PALEOS solidus) and,
+        for WolfBower2018, the contents of ``melting_dir``. Discrimination: the
+        old (P_cmb, delta, mantle_eos) key is identical across all of these.
+        """
+        from proteus.interior_struct.zalmoxis import _superliquidus_cache_key
+
+        monkeypatch.setenv('FWL_DATA', str(tmp_path))
+        cfg = self._cfg()
+        cfg.interior_struct.zalmoxis.mushy_zone_factor = 0.8
+        key = _superliquidus_cache_key(cfg, 1.5e11, 500.0)
+        cfg.interior_struct.zalmoxis.mushy_zone_factor = 0.7
+        assert _superliquidus_cache_key(cfg, 1.5e11, 500.0) != key
+
+        folder = tmp_path / 'interior_lookup_tables' / 'Melting_curves' / 'Monteux-600'
+        folder.mkdir(parents=True)
+        (folder / 'solidus_P-T.dat').write_text('0 1500\n1e11 4000\n')
+        (folder / 'liquidus_P-T.dat').write_text('0 2000\n1e11 5000\n')
+        cfg.interior_struct.zalmoxis.mantle_eos = 'WolfBower2018:MgSiO3'
+        cfg.interior_struct.melting_dir = 'Monteux-600'
+        key = _superliquidus_cache_key(cfg, 1.5e11, 500.0)
+        assert key == _superliquidus_cache_key(cfg, 1.5e11, 500.0)
+
+        (folder / 'liquidus_P-T.dat').write_text('0 2100\n1e11 5200\n')
+        assert _superliquidus_cache_key(cfg, 1.5e11, 500.0) != key
+
 
 # ----------------------------------------------------------------------
 # (3) End-to-end plumbing through load_zalmoxis_configuration
@@ -0,0 +1,118 @@
+"""
+Unit tests for proteus.interior_struct.mesh_handoff.
+
+Testing standards and documentation:
+- docs/How-to/testing.md: Running, writing, and marking tests; coverage and CI
+- docs/Explanations/test_framework.md: Test tiers, physics invariants, and quality rules
+
+Functions tested:
+- publish_rows() / fetch_rows(): atomic write, in-memory reuse of published
+  files without reading them, copies parsed once, bit-exact agreement with
+  parsing, changed files re-parsed
+- publish_spider_mesh() / fetch_spider_mesh(): SPIDER mesh round trip
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+import proteus.interior_struct.mesh_handoff as mesh_handoff
+
+pytestmark = [pytest.mark.unit, pytest.mark.timeout(30)]
+
+
+def _profile(scale=1.0):
+    r = np.linspace(3.5e6, 6.371e6, 40) * scale
+    return np.column_stack(
+        (r, 1.3e11 * (1 - r / r[-1]) + 1e5, 4000 + r / 1e4, 9.8 + r / 1e7, r / 2e3)
+    )
+
+
+def _no_parse(text):
+    raise AssertionError('published file was parsed')
+
+
+def test_published_rows_served_from_memory(tmp_path, monkeypatch):
+    """A published file is neither opened nor parsed, and the kept arrays
+    equal what parsing the file returns, bit for bit.
+    """
+    path = tmp_path / 'zalmoxis_output.dat'
+    data = _profile()
+    mesh_handoff.publish_rows(str(path), data)
+    parsed = np.loadtxt(path)
+
+    def _no_open(*args, **kwargs):
+        raise AssertionError('published file was read')
+
+    monkeypatch.setattr(mesh_handoff, 'open', _no_open, raising=False)
+    kept = mesh_handoff.fetch(str(path), _no_parse)
+    np.testing.assert_array_equal(kept, parsed)
+    np.testing.assert_array_equal(kept, data)
+    assert not kept.flags.writeable
+    assert os.listdir(tmp_path) == ['zalmoxis_output.dat']
+
+
+def test_copy_is_parsed_once(tmp_path):
+    """A .prev backup copied from a published file is parsed on its first
+    read and served from memory afterwards.
+    """
+    path = tmp_path / 'zalmoxis_output.dat'
+    mesh_handoff.publish_rows(str(path), _profile())
+    prev = str(path) + '.prev'
+    shutil.copy2(path, prev)
+
+    first = mesh_handoff.fetch_rows(prev)
+    np.testing.assert_array_equal(first, _profile())
+    assert mesh_handoff.fetch(prev, _no_parse) is first
+
+
+def test_changed_file_is_parsed(tmp_path):
+    """Restoring other contents over a published file, or rewriting it in
+    place with the same size, is seen immediately.
+    """
+    path = tmp_path / 'zalmoxis_output.dat'
+    mesh_handoff.publish_rows(str(path), _profile())
+    np.savetxt(tmp_path / 'other.dat', _profile(scale=1.01))
+    shutil.copy2(tmp_path / 'other.dat', path)
+
+    np.testing.assert_array_equal(mesh_handoff.fetch_rows(str(path)), _profile(scale=1.01))
+
+    mesh_handoff.publish_rows(str(path), _profile())
+    text = path.read_text()
+    with open(path, 'r+') as f:
+        f.write(text.replace('3.5', '3.6', 1))
+    assert path.stat().st_size == len(text)
+    assert mesh_handoff.fetch_rows(str(path))[0, 0] == pytest.approx(3.6e6)
+
+
+def test_unreadable_file_raises(tmp_path):
+    """A missing or malformed file raises like parsing it directly would."""
+    with pytest.raises(OSError):
+        mesh_handoff.fetch_rows(str(tmp_path / 'missing.dat'))
+    (tmp_path / 'bad.dat').write_text('1.0 2.0\n3.0 abc\n')
+    with pytest.raises(ValueError):
+        mesh_handoff.fetch_rows(str(tmp_path / 'bad.dat'))
+
+
+def test_spider_mesh_round_trip(tmp_path):
+    """A published SPIDER mesh parses back to the same eight arrays."""
+    r_b = np.linspace(6.371e6, 3.504e6, 30)
+    r_s = 0.5 * (r_b[:-1] + r_b[1:])
+    arrays = (r_b, 1e5 + r_b / 7, 3500 + r_b / 3e3, -9.8 - r_b / 1e8)
+    arrays += (r_s, 1e5 + r_s / 7, 3500 + r_s / 3e3, -9.8 - r_s / 1e8)
+    path = tmp_path / 'spider_mesh.dat'
+    mesh_handoff.publish_spider_mesh(str(path), arrays)
+
+    parsed = mesh_handoff.parse_spider_mesh(path.read_text())
+    assert path.read_text().startswith('# 30 29\n')
+    for kept, read, original in zip(mesh_handoff.fetch_spider_mesh(str(path)), parsed, arrays):
+        np.testing.assert_array_equal(kept, read)
+        np.testing.assert_array_equal(kept, original)
+
+    path.write_text('# 30 29\n1 2 3 4\n')
+    with pytest.raises(ValueError):
+        mesh_handoff.fetch_spider_mesh(str(path))
@@ -0,0 +1,287 @@
+"""
+Unit tests for proteus.interior_struct.ps_tables.
+
+Testing standards and documentation:
+- docs/How-to/testing.md: Running, writing, and marking tests; coverage and CI
+- docs/Explanations/test_framework.md: Test tiers, physics invariants, and quality rules
+
+Functions tested:
+- generate_spider_eos_tables(): slab-parallel tables identical to the serial
+  Zalmoxis generator, serial fallback without a worker pool
+- slice_tables(): a cached set cut to a lower pressure ceiling without
+  interpolation
+- find_superset(): reuse of a cached set with a covering pressure ceiling
+- evict(): least-recently-used eviction of table sets under a size bound
+"""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+
+import proteus.interior_struct.ps_tables as ps_tables
+from proteus.interior_energetics.table_cache import read_spider_table, write_spider_table
+from proteus.utils import disk_cache
+
+pytestmark = [pytest.mark.unit, pytest.mark.timeout(120)]
+
+
+def _liquidus(P):
+    return 2800.0 * (np.asarray(P) / 1e9) ** 0.3
+
+
+def _solidus(P):
+    return 0.8 * _liquidus(P)
+
+
+def _write_table(path, latent: float = 300.0) -> None:
+    """Synthetic unified PALEOS table with a monotone entropy in T.
+
+    Entropy rises as cp ln(T) and falls with pressure; it jumps by `latent`
+    across the liquidus, which the phase column encodes.
+    """
+    rows = []
+    for P in np.logspace(8.0, 12.7, 40):
+        T_melt = float(_liquidus(P))
+        for T in np.logspace(np.log10(300.0), np.log10(2.0e4), 60):
+            liquid = T >= T_melt
+            s = 1200.0 * np.log(T / 300.0) - 150.0 * np.log(P / 1e8) + (latent if liquid else 0)
+            rho = 3300.0 * (1.0 + P / 1.3e11) ** 0.4 * (1.0 - 2e-5 * (T - 300.0))
+            cp = 1200.0 + 0.01 * T
+            phase = 'liquid' if liquid else 'solid'
+            rows.append(
+                f'{P:.10e} {T:.10e} {rho:.10e} 0 {s:.10e} {cp:.10e} {cp:.10e} 1e-5 0.3 {phase}'
+            )
+    path.write_text('\n'.join(rows) + '\n')
+
+
+def _generate(tmp_path, name, P_max=4.0e11, workers=1):
+    """Generate a table set into ``tmp_path / name``; returns (result, dir)."""
+    from zalmoxis.eos_export import generate_spider_phase_boundaries
+
+    out = tmp_path / name
+    out.mkdir()
+    kwargs = dict(
+        eos_file=str(tmp_path / 'MgSiO3.dat'),
+        solidus_func=_solidus,
+        liquidus_func=_liquidus,
+        P_range=(1e5, P_max),
+        n_P=70,
+        output_dir=str(out),
+    )
+    generate_spider_phase_boundaries(**kwargs)
+    result = ps_tables.generate_spider_eos_tables(n_S=40, workers=workers, **kwargs)
+    return result, out
+
+
+def _read_2d(path):
+    """(P [Pa], S [J/kg/K], values (nS, nP) in SI) of a SPIDER 2D table."""
+    header, data = read_spider_table(str(path))
+    nP, nS = (int(v) for v in header[0].lstrip('#').split()[1:3])
+    scales = [float(v) for v in header[4].lstrip('#').split()]
+    grid = np.asarray(data).reshape(nS, nP, 3) * scales
+    return grid[0, :, 0], grid[:, 0, 1], grid[:, :, 2]
+
+
+@pytest.mark.skipif(not ps_tables.pool_available(), reason='needs a non-daemonic process')
+def test_parallel_tables_identical_to_serial(tmp_path):
+    """Slab-parallel generation in spawned workers writes the same files,
+    byte for byte, as the serial Zalmoxis generator, and returns the same
+    grids and masks.
+    """
+    pytest.importorskip('zalmoxis.eos_export')
+    _write_table(tmp_path / 'MgSiO3.dat')
+
+    serial, serial_dir = _generate(tmp_path, 'serial', workers=1)
+    parallel, parallel_dir = _generate(tmp_path, 'parallel', workers=3)
+
+    assert sorted(os.listdir(serial_dir)) == sorted(os.listdir(parallel_dir))
+    assert len(os.listdir(serial_dir)) == 14
+    for name in os.listdir(serial_dir):
+        assert (serial_dir / name).read_bytes() == (parallel_dir / name).read_bytes(), name
+    for phase in ('solid', 'melt'):
+        np.testing.assert_array_equal(parallel['valid'][phase], serial['valid'][phase])
+        for prop, grid in serial[phase].items():
+            np.testing.assert_array_equal(parallel[phase][prop], grid)
+    np.testing.assert_array_equal(parallel['S_solid'], serial['S_solid'])
+    assert ps_tables._worker_state == {}
+
+
+def test_serial_fallback_in_daemonic_process(tmp_path, monkeypatch):
+    """Without a worker pool the Zalmoxis generator is called unchanged."""
+    eos_export = pytest.importorskip('zalmoxis.eos_export')
+    monkeypatch.setattr(ps_tables, 'pool_available', lambda: False)
+    calls = []
+    monkeypatch.setattr(
+        eos_export, 'generate_spider_eos_tables', lambda **kw: calls.append(kw) or {'ok': True}
+    )
+
+    result = ps_tables.generate_spider_eos_tables(
+        eos_file='MgSiO3.dat', solidus_func=_solidus, liquidus_func=_liquidus, workers=8
+    )
+
+    assert result == {'ok': True}
+    assert len(calls) == 1 and 'workers' not in calls[0]
+    assert ps_tables.resolve_workers(0) == 1
+
+
+def test_slabs_cover_every_column_once():
+    """Slabs are contiguous, non-empty and cover all pressure columns."""
+    for n_P, workers in ((1350, 8), (100, 3), (20, 16), (1, 4)):
+        slabs = ps_tables._slabs(n_P, workers)
+        assert slabs[0][0] == 0 and slabs[-1][1] == n_P
+        assert all(a < b for a, b in slabs)
+        assert all(prev[1] == nxt[0] for prev, nxt in zip(slabs, slabs[1:]))
+
+
+def test_slice_tables_keeps_cached_nodes(tmp_path):
+    """Tables are cut after the first pressure node at or above the
+    requested ceiling, with their values and entropy grids unchanged; the
+    phase boundary and the validity mask are cut at the same node.
+    """
+    src, dest = tmp_path / 'src', tmp_path / 'dest'
+    src.mkdir()
+    dest.mkdir()
+    P_scale, S_scale = 1e9, 4824266.84604467
+    P = np.linspace(1e5, 4.0e11, 41) / P_scale
+    S = np.linspace(1000.0, 3000.0, 5) / S_scale
+    q = 2.0 + np.sin(P[None, :]) + S[:, None]
+    header = [
+        f'# 5 {len(P)} {len(S)}\n',
+        '# Pressure [nondim], Entropy [nondim], Quantity [nondim]\n',
+        '# column * scaling factor = SI units\n',
+        '# scaling factors (constant) for each column given on line below\n',
+        f'# {P_scale} {S_scale} 1000.0\n',
+    ]
+    rows = np.column_stack([np.tile(P, len(S)), np.repeat(S, len(P)), q.ravel()])
+    write_spider_table(str(src / 'temperature_melt.dat'), header, rows)
+    header_1d = [f'# 5 {len(P)}\n', *header[1:4], f'# {P_scale} {S_scale}\n']
+    write_spider_table(
+        str(src / 'liquidus_P-S.dat'), header_1d, np.column_stack([P, 1e-4 * (1 + P)])
+    )
+    mask = np.ones((len(S), len(P)), dtype=int)
+    mask[2, 20] = 0
+    (src / 'valid_mask_melt.dat').write_text(
+        f'# melt validity mask: {len(S)} rows (entropy nodes) x {len(P)} columns '
+        '(pressure nodes), the nodes of the melt P-S tables\n'
+        + '\n'.join(' '.join(str(v) for v in row) for row in mask)
+        + '\n'
+    )
+    (src / ps_tables.CACHE_MARKER).write_text('key')
+
+    # Nodes are 1e10 Pa apart; 3.25e11 lies between nodes 32 and 33
+    P_top = ps_tables.slice_tables(str(src), str(dest), 3.25e11)
+
+    assert P_top == pytest.approx(P[33] * P_scale)
+    assert sorted(n for n in os.listdir(dest) if not n.startswith('.')) == [
+        'liquidus_P-S.dat',
+        'temperature_melt.dat',
+        'valid_mask_melt.dat',
+    ]
+    P_new, S_new, q_new = _read_2d(dest / 'temperature_melt.dat')
+    np.testing.assert_array_equal(P_new, P[:34] * P_scale)
+    np.testing.assert_array_equal(S_new, S * S_scale)
+    np.testing.assert_array_equal(q_new, q[:, :34] * 1000.0)
+
+    _, boundary = read_spider_table(str(dest / 'liquidus_P-S.dat'))
+    np.testing.assert_array_equal(boundary, np.column_stack([P, 1e-4 * (1 + P)])[:34])
+
+    new_mask = np.loadtxt(dest / 'valid_mask_melt.dat', ndmin=2).astype(int)
+    np.testing.assert_array_equal(new_mask, mask[:, :34])
+    assert 'x 34 columns' in (dest / 'valid_mask_melt.dat').read_text().splitlines()[0]
+
+
+def test_sliced_superset_holds_the_generated_values(tmp_path):
+    """A generated set cut to a lower ceiling holds, for every table, exactly
+    the values of the generated set at the kept nodes, so what a run reads
+    does not depend on interpolation.
+    """
+    pytest.importorskip('zalmoxis.eos_export')
+    _write_table(tmp_path / 'MgSiO3.dat')
+    _, superset = _generate(tmp_path, 'superset')
+    cut = tmp_path / 'cut'
+    cut.mkdir()
+
+    P_top = ps_tables.slice_tables(str(superset), str(cut), 3.5e11)
+
+    assert 3.5e11 <= P_top < 3.5e11 + 4.0e11 / 69
+    names = sorted(n for n in os.listdir(superset) if not n.startswith('.'))
+    assert sorted(n for n in os.listdir(cut) if not n.startswith('.')) == names
+    for name in names:
+        if name.startswith('valid_mask_'):
+            continue
+        header, data = read_spider_table(str(superset / name))
+        header_cut, data_cut = read_spider_table(str(cut / name))
+        assert header_cut[1:] == header[1:]
+        fields = header[0].lstrip('#').split()
+        if len(fields) == 3:
+            nP, nS = int(fields[1]), int(fields[2])
+            k = int(header_cut[0].lstrip('#').split()[1])
+            expected = np.asarray(data).reshape(nS, nP, 3)[:, :k].reshape(-1, 3)
+        else:
+            expected = np.asarray(data)[: len(data_cut)]
+            assert expected[-1, 0] * float(header[4].lstrip('#').split()[0]) >= P_top
+        np.testing.assert_array_equal(data_cut, expected, err_msg=name)
+
+
+def _cache_entry(root, P_max, nP=1350, eos='PALEOS-MgSiO3-abc', complete=True):
+    from proteus.interior_struct.zalmoxis import _ps_cache_key
+
+    key = _ps_cache_key(
+        P_max=P_max,
+        nP=nP,
+        nS=280,
+        mzf=0.8,
+        layout='unified',
+        mantle_eos=eos,
+        eos_file='/t/MgSiO3.dat',
+        solid_eos=None,
+        liquid_eos=None,
+    )
+    entry = root / key.replace('.', 'p').replace('=', '-').replace('+', '')
+    entry.mkdir(parents=True)
+    (entry / 'density_melt.dat').write_bytes(b'x' * 1000)
+    if complete:
+        (entry / 'solidus_P-S.dat').write_text('s')
+        (entry / 'liquidus_P-S.dat').write_text('l')
+        (entry / ps_tables.CACHE_MARKER).write_text(key)
+    return key, entry
+
+
+def test_find_superset_prefers_lowest_covering_ceiling(tmp_path):
+    """A request reuses the smallest cached ceiling that covers it within
+    SUPERSET_MAX_RATIO; other resolutions, EOS and incomplete sets never match.
+    """
+    root = tmp_path / 'ps_cache'
+    _cache_entry(root, 3.9e11)
+    _, best = _cache_entry(root, 3.6e11)
+    _cache_entry(root, 3.55e11, nP=1000)
+    _cache_entry(root, 3.52e11, eos='PALEOS-MgSiO3-def')
+    _cache_entry(root, 3.51e11, complete=False)
+    request, _ = _cache_entry(tmp_path / 'other', 3.5e11)
+
+    assert ps_tables.find_superset(str(root), request) == (str(best), pytest.approx(3.6e11))
+
+    too_small, _ = _cache_entry(tmp_path / 'other2', 2.5e11)
+    assert ps_tables.find_superset(str(root), too_small) is None
+    too_big, _ = _cache_entry(tmp_path / 'other3', 4.0e11)
+    assert ps_tables.find_superset(str(root), too_big) is None
+
+
+def test_evict_removes_least_recently_used_sets(tmp_path):
+    """Eviction drops the oldest table sets first and never the one in use."""
+    root = tmp_path / 'ps_cache'
+    entries = []
+    for i, P_max in enumerate((3.0e11, 3.5e11, 4.0e11)):
+        _, entry = _cache_entry(root, P_max)
+        os.utime(entry / ps_tables.CACHE_MARKER, (1000.0 + i, 1000.0 + i))
+        entries.append(entry)
+    ps_tables.touch(entries[0])
+    size = disk_cache.dir_size(str(entries[0]))
+
+    evicted = ps_tables.evict(str(root), 2 * size, keep=str(entries[2]))
+
+    assert evicted == [entries[1].name]
+    assert sorted(p.name for p in root.iterdir()) == sorted([entries[0].name, entries[2].name])
@@ -0,0 +1,104 @@
+"""
+Unit tests for proteus.interior_struct.surrogate.
+
+Testing standards and documentation:
+- docs/How-to/testing.md: Running, writing, and marking tests; coverage and CI
+- docs/Explanations/test_framework.md: Test tiers, physics invariants, and quality rules
+
+Functions tested:
+- StructureSurrogate.record() / predict(): linear response recovered from
+  earlier solves, validation before the first prediction, refusal to
+  extrapolate beyond or across unsampled state variables
+- features(): dissolved volatile fraction of the mantle
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from proteus.interior_struct.surrogate import StructureSurrogate, features
+from proteus.utils.surrogate import MIN_SOLVES
+
+pytestmark = [pytest.mark.unit, pytest.mark.timeout(30)]
+
+
+def _row(T_magma, Phi, h2o_kg=0.0):
+    """Runtime row whose structure responds linearly in log space."""
+    ln_R = math.log(6.4e6) + 2e-5 * (T_magma - 3000.0) + 0.01 * Phi
+    ln_g = math.log(9.8) - 4e-5 * (T_magma - 3000.0) - 0.02 * Phi
+    return {
+        'T_magma': T_magma,
+        'Phi_global': Phi,
+        'M_mantle': 4.0e24,
+        'H2O_kg_liquid': h2o_kg,
+        'H2_kg_liquid': 0.0,
+        'R_int': math.exp(ln_R),
+        'gravity': math.exp(ln_g),
+    }
+
+
+def test_features_volatile_fraction():
+    """Dissolved H2O and H2 are summed over the mantle mass."""
+    row = _row(3000.0, 0.9, h2o_kg=2.0e21)
+    row['H2_kg_liquid'] = 2.0e21
+    np.testing.assert_allclose(features(row), [3000.0, 0.9, 1.0e-3])
+    row['M_mantle'] = 0.0
+    assert features(row)[2] == 0.0
+
+
+def test_no_prediction_before_validated():
+    """Fewer than MIN_SOLVES solves give no prediction."""
+    surrogate = StructureSurrogate()
+    for i in range(MIN_SOLVES - 1):
+        surrogate.record(_row(3000.0 - 50.0 * i, 0.9 - 0.01 * i))
+        assert surrogate.predict(_row(2900.0, 0.88)) is None
+
+
+def test_linear_response_is_recovered():
+    """After a few solves the fitted response reproduces the structure, with a
+    predicted error of the shift plus a near-zero fit residual.
+    """
+    surrogate = StructureSurrogate()
+    for i in range(4):
+        surrogate.record(_row(3000.0 - 50.0 * i, 0.9 - 0.01 * i**2))
+
+    target = _row(2830.0, 0.8)
+    prediction = surrogate.predict(target)
+
+    assert prediction.R_int == pytest.approx(target['R_int'], rel=1e-9)
+    assert prediction.gravity == pytest.approx(target['gravity'], rel=1e-9)
+    latest = _row(2850.0, 0.81)
+    expected_shift = abs(math.log(target['gravity'] / latest['gravity']))
+    assert prediction.error == pytest.approx(expected_shift, rel=1e-6)
+    assert prediction.mesh_shift == pytest.approx(
+        abs(target['R_int'] / latest['R_int'] - 1.0), rel=1e-6
+    )
+
+
+def test_no_extrapolation():
+    """A step far beyond the sampled span, or along a state variable that has
+    not varied between solves, gives no prediction.
+    """
+    surrogate = StructureSurrogate()
+    for i in range(4):
+        surrogate.record(_row(3000.0 - 10.0 * i, 0.9 - 0.002 * i))
+
+    assert surrogate.predict(_row(2965.0, 0.893)) is not None
+    assert surrogate.predict(_row(2500.0, 0.8)) is None
+    assert surrogate.predict(_row(2965.0, 0.893, h2o_kg=1.0e21)) is None
+
+
+def test_residual_of_nonlinear_response_enters_error():
+    """A response the linear fit misses shows up in the predicted error."""
+    surrogate = StructureSurrogate()
+    for i in range(4):
+        row = _row(3000.0 - 50.0 * i, 0.9 - 0.02 * i)
+        row['R_int'] *= 1.0 + 1e-3 * i**2
+        surrogate.record(row)
+
+    prediction = surrogate.predict(_row(2850.0, 0.84))
+
+    assert prediction.error > 1e-3
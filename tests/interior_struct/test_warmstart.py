@@ -0,0 +1,137 @@
+"""
+Unit tests for proteus.interior_struct.warmstart.
+
+Testing standards and documentation:
+- docs/How-to/testing.md: Running, writing, and marking tests; coverage and CI
+- docs/Explanations/test_framework.md: Test tiers, physics invariants, and quality rules
+
+Functions tested:
+- lookup_profile() / store_profile(): opt-in gate, nearest-neighbour lookup,
+  homologous rescaling to the new mass, EOS fingerprint isolation, distance cut
+- lookup_superliquidus() / store_superliquidus(): exact-key round trip
+"""
+
+from __future__ import annotations
+
+import os
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import proteus.interior_struct.warmstart as warmstart
+
+pytestmark = [pytest.mark.unit, pytest.mark.timeout(30)]
+
+
+def _config(mass=1.0, core_frac=0.325, mantle_eos='PALEOS:MgSiO3'):
+    zalmoxis = SimpleNamespace(
+        core_eos='PALEOS:iron',
+        mantle_eos=mantle_eos,
+        ice_layer_eos=None,
+        mushy_zone_factor=0.8,
+        mantle_mass_fraction=0.0,
+        dry_mantle=True,
+    )
+    return SimpleNamespace(
+        planet=SimpleNamespace(mass_tot=mass),
+        interior_struct=SimpleNamespace(
+            core_frac=core_frac, core_frac_mode='mass', zalmoxis=zalmoxis
+        ),
+    )
+
+
+def _profile(scale=1.0):
+    radii = np.linspace(0.0, 6.4e6, 50) * scale
+    density = np.linspace(12000.0, 3500.0, 50)
+    return radii, density
+
+
+@pytest.fixture
+def store_dir(tmp_path, monkeypatch):
+    root = tmp_path / 'struct_cache'
+    monkeypatch.setenv(warmstart.STORE_DIR_ENV, str(root))
+    monkeypatch.delenv(warmstart.STORE_MAX_SIZE_ENV, raising=False)
+    monkeypatch.setattr(warmstart, '_stored', set())
+    return root
+
+
+def test_disabled_without_env(tmp_path, monkeypatch):
+    """Without PROTEUS_STRUCT_CACHE_DIR nothing is stored or found."""
+    monkeypatch.delenv(warmstart.STORE_DIR_ENV, raising=False)
+    monkeypatch.chdir(tmp_path)
+
+    warmstart.store_profile(_config(), *_profile())
+    warmstart.store_superliquidus((100, 200.0, 'PALEOS:MgSiO3'), {'cmb_T': 4000.0})
+
+    assert warmstart.lookup_profile(_config()) is None
+    assert warmstart.lookup_superliquidus((100, 200.0, 'PALEOS:MgSiO3')) is None
+    assert os.listdir(tmp_path) == []
+
+
+def test_exact_match_round_trip(store_dir):
+    """A stored profile seeds the same planet unchanged."""
+    radii, density = _profile()
+    warmstart.store_profile(_config(), radii, density)
+
+    seed_radii, seed_density = warmstart.lookup_profile(_config())
+
+    np.testing.assert_array_equal(seed_radii, radii)
+    np.testing.assert_array_equal(seed_density, density)
+
+
+def test_nearest_neighbour_is_rescaled_to_new_mass(store_dir):
+    """The closest stored mass seeds the solve, with radii and density scaled
+    homologously (R ~ M^0.282, rho ~ M / R^3).
+    """
+    for mass in (1.0, 2.0, 5.0):
+        warmstart.store_profile(_config(mass=mass), *_profile(scale=mass**0.282))
+
+    seed_radii, seed_density = warmstart.lookup_profile(_config(mass=2.2))
+
+    ratio = 2.2 / 2.0
+    radii, density = _profile(scale=2.0**0.282)
+    np.testing.assert_allclose(seed_radii, radii * ratio**0.282)
+    np.testing.assert_allclose(seed_density, density * ratio ** (1 - 3 * 0.282))
+
+
+def test_profiles_isolated_by_eos_and_distance(store_dir):
+    """A different mantle EOS never seeds, nor does a neighbour beyond
+    MAX_DISTANCE.
+    """
+    warmstart.store_profile(_config(mass=1.0), *_profile())
+
+    assert warmstart.lookup_profile(_config(mantle_eos='Seager2007:MgSiO3')) is None
+    assert warmstart.lookup_profile(_config(mass=10.0)) is None
+    assert warmstart.lookup_profile(_config(core_frac=0.6)) is None
+
+
+def test_store_profile_once_per_planet(store_dir):
+    """Re-solves of the same planet in one process do not rewrite the entry."""
+    cfg = _config()
+    warmstart.store_profile(cfg, *_profile())
+    warmstart.store_profile(cfg, *_profile(scale=2.0))
+
+    seed_radii, _ = warmstart.lookup_profile(cfg)
+    np.testing.assert_array_equal(seed_radii, _profile()[0])
+
+
+def test_superliquidus_round_trip(store_dir):
+    """Super-liquidus solves are found under the exact key only."""
+    key = (135000, 200.0, 'PALEOS:MgSiO3')
+    out = {'surface_T': 3012.5, 'S_target': 3200.0, 'cmb_T': 5100.0, 'P_cmb': 1.35e11}
+    warmstart.store_superliquidus(key, out)
+
+    assert warmstart.lookup_superliquidus(key) == out
+    assert warmstart.lookup_superliquidus((135001, 200.0, 'PALEOS:MgSiO3')) is None
+
+
+def test_unreadable_entry_is_ignored(store_dir):
+    """A corrupt profile entry is skipped rather than raising."""
+    cfg = _config()
+    warmstart.store_profile(cfg, *_profile())
+    directory = store_dir / 'profiles' / warmstart.eos_fingerprint(cfg)
+    (entry,) = directory.iterdir()
+    entry.write_bytes(b'not an npz')
+
+    assert warmstart.lookup_profile(cfg) is None
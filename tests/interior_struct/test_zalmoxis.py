@@ -13,6 +13,8 @@ Functions tested:
 - load_zalmoxis_configuration(): Build config dict from PROTEUS config
 - load_zalmoxis_solidus_liquidus_functions(): Load melting curves by EOS type
 - compute_structure_mass_desync(): Mass self-consistency diagnostic (issue #68)
+- _rebuild_columns_on_temperature(): Batched post-solve density/temperature rebuild
+- zalmoxis_solver(): Picard seeding from the persistent warm-start store
 """
 
 from __future__ import annotations
@@ -1188,6 +1190,11 @@ def _cooled_mantle_arrays(model_results: dict) -> tuple[np.ndarray, np.ndarray]:
 _MIXED_DENSITY_OFFSET = 250.0
 
 
+def _nodes_evaluated(mock):
+    """Total number of nodes passed to a mocked batched density evaluator."""
+    return sum(len(call.args[0]) for call in mock.call_args_list)
+
+
 def _run_gate_solver(
     tmp_path,
     monkeypatch,
@@ -1205,8 +1212,9 @@ def _run_gate_solver(
     curves to plausible constants, the Zalmoxis ``main`` solve to a
     converged Earth-like result, and both density evaluators used by
     the post-solve column rebuild: the bare EOS dispatch
-    (``calculate_density``, dry mantle and core nodes) and the blended
-    evaluator (``calculate_mixed_density``, wet mantle nodes). The two
+    (``calculate_density_batch``, dry mantle and core nodes) and the
+    blended evaluator (``calculate_mixed_density_batch``, wet mantle
+    nodes). The two
     fakes differ by a constant ``_MIXED_DENSITY_OFFSET`` at equal
     (P, T), so a written column discriminates which evaluator produced
     it. Returns the mocks and the hf_row.
@@ -1253,14 +1261,14 @@ def _run_gate_solver(
         {'density': None, 'radii': None, 'key': None},
     )
 
-    def _fake_density(P, mats, eos, T, sol, liq, interpolation_functions=None, **kwargs):
+    def _fake_density(P, T, mats, eos, sol, liq, interpolation_functions=None, *args):
         # Plausible monotone-in-P, decreasing-in-T condensed density.
-        return 3300.0 + 2.0e-8 * float(P) - 0.1 * (float(T) - 3000.0)
+        return 3300.0 + 2.0e-8 * np.asarray(P) - 0.1 * (np.asarray(T) - 3000.0)
 
     def _fake_mixed_density(P, T, mixture, mats, sol, liq, interp, **kwargs):
         # Bare fake plus a constant blend offset: distinguishable from
         # _fake_density at the same (P, T).
-        return _fake_density(P, mats, None, T, sol, liq) + _MIXED_DENSITY_OFFSET
+        return _fake_density(P, T, mats, None, sol, liq) + _MIXED_DENSITY_OFFSET
 
     with (
         patch.object(
@@ -1274,9 +1282,11 @@ def _run_gate_solver(
             return_value=(lambda P: 4000.0, lambda P: 5000.0),
         ),
         patch.object(zalmoxis_wrapper, 'main', **main_patch_kwargs) as main_mock,
-        patch('zalmoxis.eos.dispatch.calculate_density', side_effect=_fake_density) as rho_mock,
         patch(
-            'zalmoxis.mixing.calculate_mixed_density',
+            'zalmoxis.eos.dispatch.calculate_density_batch', side_effect=_fake_density
+        ) as rho_mock,
+        patch(
+            'zalmoxis.mixing.calculate_mixed_density_batch',
             side_effect=mixed_side_effect or _fake_mixed_density,
         ) as mixed_mock,
     ):
@@ -1371,9 +1381,10 @@ def test_zalmoxis_solver_withholds_callable_on_jax_viable_eos(
     np.testing.assert_allclose(passed_r, r_arr, rtol=0, atol=0)
     np.testing.assert_allclose(passed_t, t_arr, rtol=0, atol=0)
 
-    # The rebuild ran: one bare EOS density evaluation per radial node,
-    # and no blended evaluation on a dry solve.
-    assert rho_mock.call_count == len(model_results['radii'])
+    # The rebuild ran: one batched bare EOS evaluation per layer, covering
+    # every radial node, and no blended evaluation on a dry solve.
+    assert rho_mock.call_count == 2
+    assert _nodes_evaluated(rho_mock) == len(model_results['radii'])
     assert mixed_mock.call_count == 0
 
     # The written hand-off file carries the rebuilt (cooled) temperature
@@ -1436,7 +1447,7 @@ def test_zalmoxis_solver_init_adiabat_arrays_take_jax_dispatch(tmp_path, monkeyp
     passed_r, passed_t = kwargs['temperature_arrays']
     np.testing.assert_allclose(passed_r, r_arr, rtol=0, atol=0)
     np.testing.assert_allclose(passed_t, t_arr, rtol=0, atol=0)
-    assert rho_mock.call_count == len(model_results['radii'])
+    assert _nodes_evaluated(rho_mock) == len(model_results['radii'])
     assert mixed_mock.call_count == 0
 
     # The written temperature column carries the adiabat samples: the CMB
@@ -1458,7 +1469,7 @@ def test_zalmoxis_solver_withholds_callable_on_wet_in_envelope_profile(tmp_path,
     external callable is withheld and the JAX RHS integrates against
     the hand-off arrays. The post-solve rebuild must run
     profile-aware: mantle nodes go through the blended evaluator
-    (``calculate_mixed_density`` with the profile), core nodes through
+    (``calculate_mixed_density_batch`` with the profile), core nodes through
     the bare EOS dispatch, and the written columns carry the hand-off
     temperature and the blended density, matching what a
     callable-driven numpy solve would have written.
@@ -1501,8 +1512,9 @@ def test_zalmoxis_solver_withholds_callable_on_wet_in_envelope_profile(tmp_path,
     # through the bare EOS dispatch.
     n = len(model_results['radii'])
     cmb_index = n // 3
-    assert mixed_mock.call_count == n - cmb_index
-    assert rho_mock.call_count == cmb_index
+    assert mixed_mock.call_count == 1
+    assert _nodes_evaluated(mixed_mock) == n - cmb_index
+    assert _nodes_evaluated(rho_mock) == cmb_index
     for call in mixed_mock.call_args_list:
         assert call.kwargs['volatile_profile'] is kwargs['volatile_profile']
         # The blend evaluates the extended mantle mixture, so the
@@ -1557,13 +1569,11 @@ def test_wet_rebuild_falls_back_to_solver_density_on_non_finite_blend(tmp_path,
             return float(t_arr[0])
         return float(np.interp(r, r_arr, t_arr))
 
-    calls = {'n': 0}
-
     def _nan_first_blend(P, T, mixture, mats, sol, liq, interp, **kwargs):
-        calls['n'] += 1
-        if calls['n'] == 1:
-            return float('nan')
-        return 3300.0 + 2.0e-8 * float(P) - 0.1 * (float(T) - 3000.0) + _MIXED_DENSITY_OFFSET
+        rho = 3300.0 + 2.0e-8 * np.asarray(P) - 0.1 * (np.asarray(T) - 3000.0)
+        rho = rho + _MIXED_DENSITY_OFFSET
+        rho[0] = np.nan
+        return rho
 
     hf_extra = {
         'M_mantle_liquid': 4.0e24,
@@ -1583,7 +1593,7 @@ def test_wet_rebuild_falls_back_to_solver_density_on_non_finite_blend(tmp_path,
 
     n = len(model_results['radii'])
     cmb_index = n // 3
-    assert mixed_mock.call_count == n - cmb_index
+    assert _nodes_evaluated(mixed_mock) == n - cmb_index
 
     data = np.loadtxt(tmp_path / 'data' / 'zalmoxis_output.dat')
     rho_column = data[:, 2]
@@ -1602,6 +1612,103 @@ def test_wet_rebuild_falls_back_to_solver_density_on_non_finite_blend(tmp_path,
     assert abs(solver_rho_cmb - rho_blend_next) > 0.5 * _MIXED_DENSITY_OFFSET
 
 
+def _write_unified_table(path, rho_0: float, T_melt_0: float) -> None:
+    """Synthetic unified PALEOS table in the 10-column text layout.
+
+    Density stiffens with pressure, expands with temperature and drops by
+    6% across a power-law liquidus, which the phase column encodes.
+    """
+    rows = []
+    for P in np.logspace(8.0, 12.7, 40):
+        T_melt = T_melt_0 * (P / 1e9) ** 0.3
+        for T in np.logspace(np.log10(300.0), np.log10(2.0e4), 60):
+            liquid = T >= T_melt
+            rho = rho_0 * (1.0 + P / 1.3e11) ** 0.4 * (1.0 - 2e-5 * (T - 300.0))
+            rho *= 0.94 if liquid else 1.0
+            phase = 'liquid' if liquid else 'solid'
+            rows.append(f'{P:.10e} {T:.10e} {rho:.10e} 0 0 1e3 1e3 1e-5 0.3 {phase}')
+    path.write_text('\n'.join(rows) + '\n')
+
+
+@pytest.mark.parametrize('wet', [False, True])
+def test_rebuild_columns_matches_per_node_evaluation(tmp_path, wet):
+    """The batched column rebuild reproduces the per-node EOS evaluation.
+
+    Reference: the scalar evaluators called node by node, as the rebuild
+    did before it was batched. The unified tables are real Zalmoxis
+    lookups, and the mushy-zone factor puts part of the cooled mantle in
+    the lever-rule branch. The wet case blends a dissolved H2O component
+    per shell through the VolatileProfile.
+    """
+    dispatch = pytest.importorskip('zalmoxis.eos.dispatch')
+    mixing = pytest.importorskip('zalmoxis.mixing')
+    from proteus.interior_struct.zalmoxis import (
+        _rebuild_columns_on_temperature,
+        build_volatile_profile,
+        extend_mantle_eos_with_volatiles,
+    )
+
+    registry = {}
+    for name, rho_0, T_melt_0 in (
+        ('PALEOS:iron', 8000.0, 2500.0),
+        ('PALEOS:MgSiO3', 3300.0, 2800.0),
+        ('PALEOS:H2O', 1000.0, 600.0),
+    ):
+        path = tmp_path / (name.split(':')[1] + '.dat')
+        _write_unified_table(path, rho_0, T_melt_0)
+        registry[name] = {'eos_file': str(path), 'format': 'paleos_unified'}
+
+    model = _plausible_model_results(300)
+    radii, pressure = model['radii'], model['pressure']
+    cmb_index = len(radii) // 3
+    r_arr, t_arr = _cooled_mantle_arrays(model)
+    melt_funcs = (lambda P: 4000.0, lambda P: 5000.0)
+    mzf = 0.8
+
+    mixture = profile = None
+    if wet:
+        hf_row = {'M_mantle_liquid': 4.0e24, 'M_mantle_solid': 1.0e24, 'H2O_kg_liquid': 8.0e22}
+        profile = build_volatile_profile(hf_row, 'PALEOS:MgSiO3')
+        mantle = extend_mantle_eos_with_volatiles('PALEOS:MgSiO3', profile)
+        mixture = mixing.parse_layer_components(mantle)
+
+    rho, T = _rebuild_columns_on_temperature(
+        radii,
+        pressure,
+        model['density'],
+        cmb_index,
+        (r_arr, t_arr),
+        registry,
+        'PALEOS:iron',
+        'PALEOS:MgSiO3',
+        melt_funcs,
+        mushy_zone_factor=mzf,
+        mantle_mixture=mixture,
+        volatile_profile=profile,
+    )
+
+    cache = {}
+    rho_ref = np.empty(len(radii))
+    T_ref = np.empty(len(radii))
+    for i, (r, P) in enumerate(zip(radii, pressure)):
+        T_ref[i] = t_arr[0] if r <= r_arr[0] else np.interp(r, r_arr, t_arr)
+        if mixture is not None and i >= cmb_index:
+            rho_i = mixing.calculate_mixed_density(
+                P, T_ref[i], mixture, registry, *melt_funcs, cache, volatile_profile=profile
+            )
+        else:
+            eos = 'PALEOS:iron' if i < cmb_index else 'PALEOS:MgSiO3'
+            rho_i = dispatch.calculate_density(
+                P, registry, eos, T_ref[i], *melt_funcs, cache, mzf
+            )
+        rho_ref[i] = rho_i
+
+    np.testing.assert_array_equal(T, T_ref)
+    np.testing.assert_allclose(rho, rho_ref, rtol=1e-10, atol=0)
+    # Discrimination: the columns were re-evaluated, not passed through
+    assert np.all(np.abs(rho - model['density']) > 1.0)
+
+
 def test_zalmoxis_solver_keeps_callable_on_wet_out_of_envelope_profile(tmp_path, monkeypatch):
     """Out-of-envelope wet solves keep the evolved T(r) callable.
 
@@ -1774,6 +1881,34 @@ def test_zalmoxis_solver_retry_replaces_density_and_gravity(tmp_path, monkeypatc
     assert 0.0 < cmb_radius < hf_row['R_int']
 
 
+def test_zalmoxis_solver_seeds_from_persistent_store(tmp_path, monkeypatch):
+    """A new process seeds its first solve from the structure an earlier run stored.
+
+    ``_run_gate_solver`` resets the in-process density cache on every call,
+    so the second call stands in for a fresh run of the same planet: without
+    the store it would start cold. With ``PROTEUS_STRUCT_CACHE_DIR`` set, the
+    first call's converged columns reach the second call's ``main`` as the
+    Picard seed.
+    """
+    import proteus.interior_struct.warmstart as warmstart
+
+    monkeypatch.setenv(warmstart.STORE_DIR_ENV, str(tmp_path / 'struct_cache'))
+    monkeypatch.setattr(warmstart, '_stored', set())
+    model_results = _plausible_model_results()
+    r_arr, t_arr = _cooled_mantle_arrays(model_results)
+
+    def tf(r, P):
+        return float(np.interp(r, r_arr, t_arr))
+
+    first = _run_gate_solver(tmp_path, monkeypatch, 'Seager2007:silicate', (r_arr, t_arr), tf)
+    assert first[0].call_args.kwargs['initial_density'] is None
+
+    second = _run_gate_solver(tmp_path, monkeypatch, 'Seager2007:silicate', (r_arr, t_arr), tf)
+    kwargs = second[0].call_args.kwargs
+    np.testing.assert_array_equal(kwargs['initial_density'], model_results['density'])
+    np.testing.assert_array_equal(kwargs['initial_radii'], model_results['radii'])
+
+
 @pytest.mark.physics_invariant
 def test_structure_mass_desync_near_zero_for_self_consistent_sphere():
     """A physically self-consistent structure reads near-zero mass desync.
@@ -1957,7 +2092,7 @@ def test_read_ps_cache_pointer_returns_recorded_path_even_if_missing(tmp_path):
 # ---------------------------------------------------------------------------
 
 
-def test_atomic_write_text_publishes_complete_and_overwrites(tmp_path):
+def test_write_atomic_text_publishes_complete_and_overwrites(tmp_path):
     """The atomic marker writer replaces the target in one rename and leaves no
     temporary file behind, whether the target is new or already present.
 
@@ -1967,14 +2102,14 @@ def test_atomic_write_text_publishes_complete_and_overwrites(tmp_path):
     overwrite case pins that a stale marker is fully replaced, not appended
     to, so a second run's key does not concatenate onto the first.
     """
-    from proteus.interior_struct.zalmoxis import _atomic_write_text
+    from proteus.utils.disk_cache import write_atomic_text
 
     dest = tmp_path / '.cache_info.txt'
-    _atomic_write_text(str(dest), 'P_max-1p0e13_nP-200_nS-200')
+    write_atomic_text(str(dest), 'P_max-1p0e13_nP-200_nS-200')
     assert dest.read_text() == 'P_max-1p0e13_nP-200_nS-200'
 
     # Overwrite with a different key: content is replaced, not appended
-    _atomic_write_text(str(dest), 'P_max-2p0e13_nP-400_nS-400')
+    write_atomic_text(str(dest), 'P_max-2p0e13_nP-400_nS-400')
     assert dest.read_text() == 'P_max-2p0e13_nP-400_nS-400'
 
     # No scratch files leaked into the directory
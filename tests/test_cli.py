@@ -1572,7 +1572,7 @@ def test_absent_inference_distribution_rejects_an_installed_package():
 
 
 # ---------------------------
-# grid_summarise / grid_pack
+# grid_summarise / grid_pack / grid_presolve
 # ---------------------------
 
 
@@ -1618,6 +1618,25 @@ def test_grid_pack_dispatches(monkeypatch, tmp_path):
     assert received[0].name == 'out'
 
 
+@pytest.mark.unit
+def test_grid_presolve_dispatches(monkeypatch, tmp_path):
+    """``proteus grid-presolve -o output --workers 4`` calls presolve_grid(output, 4)."""
+    outdir = tmp_path / 'out'
+    outdir.mkdir()
+
+    received = []
+
+    import proteus.grid.manage as gm
+
+    monkeypatch.setattr(
+        gm, 'presolve_grid', lambda output, workers: received.append((output, workers))
+    )
+
+    res = runner.invoke(cli.cli, ['grid-presolve', '-o', str(outdir), '--workers', '4'])
+    assert res.exit_code == 0
+    assert received == [(str(outdir), 4)]
+
+
 # ---------------------------
 # Installer helpers
 # ---------------------------
@@ -2679,3 +2698,62 @@ def test_start_defaults_to_no_resume_no_offline(monkeypatch, tmp_path):
     inst = _FakeProteusStart.instances[0]
     assert inst.resume is False
     assert inst.offline is False
+
+
+@pytest.mark.unit
+def test_prune_cache_forwards_limits(monkeypatch, tmp_path):
+    """``proteus prune-cache`` forwards the root and limits to the pruner and
+    reports what was removed.
+    """
+    calls = []
+
+    def fake_prune(root, **kwargs):
+        calls.append((root, kwargs))
+        return 3, 2 * 1024**2
+
+    monkeypatch.setattr('proteus.utils.jax_cache.prune_compile_cache', fake_prune)
+
+    res = runner.invoke(
+        cli.cli,
+        ['prune-cache', '--path', str(tmp_path), '--max-age', '7', '--max-size', '5'],
+    )
+    assert res.exit_code == 0, res.output
+    assert calls == [
+        (
+            str(tmp_path),
+            {'max_age_days': 7.0, 'max_size': 5.0, 'keep_other_versions': False},
+        )
+    ]
+    assert 'Removed 3 files (2.0 MiB)' in res.output
+
+
+@pytest.mark.unit
+def test_get_sysimage_reports_startup_times(monkeypatch, tmp_path):
+    """``proteus get sysimage`` builds for the AGNI checkout, reports both
+    startup times, and says how to use an image written off the default path.
+    """
+    calls = []
+    image = str(tmp_path / 'image.so')
+
+    def fake_build(agni_dir, path):
+        calls.append((agni_dir, path))
+        return {'image': path, 'startup_default': 42.0, 'startup_sysimage': 3.5}
+
+    monkeypatch.setattr('proteus.utils.julia_sysimage.build_sysimage', fake_build)
+    monkeypatch.setattr(
+        'proteus.utils.coupler.get_proteus_directories', lambda: {'agni': '/opt/AGNI'}
+    )
+
+    res = runner.invoke(cli.cli, ['get', 'sysimage', '--path', image])
+    assert res.exit_code == 0, res.output
+    assert calls == [('/opt/AGNI', image)]
+    assert '42.0 s without, 3.5 s with the sysimage' in res.output
+    assert f'PROTEUS_JULIA_SYSIMAGE={image}' in res.output
+
+    def failed_build(agni_dir, path):
+        raise RuntimeError('Julia not found at julia')
+
+    monkeypatch.setattr('proteus.utils.julia_sysimage.build_sysimage', failed_build)
+    res = runner.invoke(cli.cli, ['get', 'sysimage'])
+    assert res.exit_code == 1
+    assert 'Julia not found' in res.output
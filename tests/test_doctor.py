@@ -45,6 +45,7 @@ from proteus.doctor import (
     check_fwl_data,
     check_git_module,
     check_julia,
+    check_julia_sysimage,
     check_python_package,
     doctor_entry,
     run_all_checks,
@@ -289,6 +290,41 @@ class TestCheckJulia:
         assert 'julialang' in r.fix_cmd
 
 
+class TestCheckJuliaSysimage:
+    """Julia sysimage checks."""
+
+    def test_warn_when_missing_or_stale(self):
+        """A missing or stale image warns with the build command, which
+        ``proteus update`` does not run on its own.
+        """
+        for reason in ('not built', 'AGNI sources changed'):
+            with patch('proteus.doctor.stale_reason', return_value=reason):
+                r = check_julia_sysimage()
+            assert r.status == WARN
+            assert reason in r.message
+            assert r.fix_cmd == 'proteus get sysimage'
+            assert r.auto_fixable is False
+
+    def test_pass_reports_startup_times(self):
+        """A fresh image passes and reports the startup times of its build."""
+        manifest = {'startup_default': 40.0, 'startup_sysimage': 4.0}
+        with (
+            patch('proteus.doctor.sysimage_path', return_value='/data/image.so'),
+            patch('proteus.doctor.stale_reason', return_value=None),
+            patch('proteus.doctor.read_manifest', return_value=manifest),
+        ):
+            r = check_julia_sysimage()
+        assert r.status == PASS
+        assert r.message == '/data/image.so (startup 40.0 s -> 4.0 s)'
+
+    def test_pass_when_disabled(self):
+        """PROTEUS_JULIA_SYSIMAGE=none disables the check."""
+        with patch.dict(os.environ, {'PROTEUS_JULIA_SYSIMAGE': 'none'}):
+            r = check_julia_sysimage()
+        assert r.status == PASS
+        assert 'disabled' in r.message
+
+
 class TestCheckPythonPackage:
     """Python package version checks against pyproject.toml specs."""
 
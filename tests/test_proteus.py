@@ -51,6 +51,7 @@ def _make_proteus_instance(
     config.interior_struct.module = struct_module
     config.interior_struct.zalmoxis.update_interval = 0
     config.interior_energetics.module = interior_module
+    config.interior_energetics.adaptive_levels = False
     config.interior_struct.eos_dir = 'WolfBower2018_MgSiO3'
     config.orbit.module = None
     # Attributes used during start() setup
@@ -82,7 +82,14 @@ _REVIEWED_NEUTRAL = frozenset(
         'atmos_clim.agni.grey_opacity_lw',
         'atmos_clim.agni.grey_opacity_sw',
         'atmos_clim.agni.spectral_file',
+        # Zero surrogate_tol disables the flux surrogate and its limits.
+        'atmos_clim.agni.surrogate_max_skips',
+        'atmos_clim.agni.surrogate_tol',
+        'atmos_clim.agni.surrogate_trust',
         'atmos_clim.dummy.fixed_flux',
+        # Inert unless atmos_clim.module is 'emulator'.
+        'atmos_clim.emulator.fallback',
+        'atmos_clim.emulator.table',
         'atmos_clim.janus.cloud_alpha',
         # Inert while escape.hill_clamp is pinned off for migrated configs.
         'escape.hill_clamp_frac',
@@ -93,6 +100,8 @@ _REVIEWED_NEUTRAL = frozenset(
         'interior_energetics.adams_williamson_beta',
         'interior_energetics.adams_williamson_rhos',
         'interior_energetics.adiabatic_bulk_modulus',
+        # Off by default; the level floor is inert while it is off.
+        'interior_energetics.adaptive_levels',
         'interior_energetics.aragog.atol_temperature_equivalent',
         'interior_energetics.aragog.backend',
         'interior_energetics.aragog.core_bc',
@@ -102,6 +111,7 @@ _REVIEWED_NEUTRAL = frozenset(
         'interior_energetics.aragog.phi_step_cap',
         'interior_energetics.aragog.scalar_gravity_override',
         'interior_energetics.aragog.solver_method',
+        'interior_energetics.aragog.speculative_retries',
         'interior_energetics.aragog.temperature_step_cap',
         'interior_energetics.aragog.tolerance_struct',
         'interior_energetics.boundary.T_liquidus',
@@ -137,6 +147,7 @@ _REVIEWED_NEUTRAL = frozenset(
         'interior_energetics.latent_heat_of_fusion',
         'interior_energetics.melt_cond',
         'interior_energetics.melt_log10visc',
+        'interior_energetics.num_levels_min',
         'interior_energetics.num_tolerance',
         'interior_energetics.param_utbl',
         'interior_energetics.param_utbl_const',
@@ -145,6 +156,7 @@ _REVIEWED_NEUTRAL = frozenset(
         'interior_energetics.radio_Fe',
         'interior_energetics.solid_cond',
         'interior_energetics.solid_log10visc',
+        'interior_energetics.spider.json_sidecar',
         'interior_energetics.spider.log_output',
         'interior_energetics.spider.tolerance_rel',
         'interior_energetics.spider.tolerance_struct',
@@ -157,6 +169,8 @@ _REVIEWED_NEUTRAL = frozenset(
         'interior_struct.zalmoxis.global_miscibility',
         'interior_struct.zalmoxis.lookup_nP',
         'interior_struct.zalmoxis.lookup_nS',
+        # Worker count only; the tables are identical.
+        'interior_struct.zalmoxis.lookup_workers',
         'interior_struct.zalmoxis.miscibility_max_iter',
         'interior_struct.zalmoxis.miscibility_tol',
         'interior_struct.zalmoxis.mushy_zone_factor',
@@ -165,6 +179,8 @@ _REVIEWED_NEUTRAL = frozenset(
         'interior_struct.zalmoxis.newton_relative_tolerance',
         'interior_struct.zalmoxis.newton_tol',
         'interior_struct.zalmoxis.outer_solver',
+        # Zero disables the linear-response surrogate.
+        'interior_struct.zalmoxis.surrogate_tol',
         'interior_struct.zalmoxis.update_dw_comp_abs',
         'interior_struct.zalmoxis.update_stale_ceiling',
         'interior_struct.zalmoxis.use_anderson',
@@ -210,6 +226,11 @@ _REVIEWED_NEUTRAL = frozenset(
         'outgas.lavatmos.melt_comp_name',
         'outgas.lavatmos.xatol',
         'outgas.vapourise',
+        # The compile cache changes start-up time, not results.
+        'params.compile_cache.enabled',
+        'params.compile_cache.max_size',
+        'params.compile_cache.min_compile_time',
+        'params.compile_cache.path',
         'params.dt.hysteresis_iters',
         'params.dt.hysteresis_sfinc',
         'params.dt.max_growth_factor',
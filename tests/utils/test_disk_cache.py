@@ -0,0 +1,129 @@
+"""
+Unit tests for proteus.utils.disk_cache module.
+
+Tests the helpers shared by the on-disk caches: the size bound read from the
+environment, atomic publication of files, size accounting, listing of file and
+directory entries, and least-recently-used eviction.
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+import proteus.utils.disk_cache as disk_cache
+
+pytestmark = [pytest.mark.unit, pytest.mark.timeout(30)]
+
+
+def _write(path, nbytes, mtime):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b'x' * nbytes)
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.mark.parametrize(
+    'value, expected', [(None, 7), ('', 7), ('2e3', 2000), ('512', 512), ('lots', 7)]
+)
+def test_max_size_from_env(monkeypatch, value, expected):
+    """Unset, blank and invalid values give the default; numbers may use
+    exponent notation.
+    """
+    if value is None:
+        monkeypatch.delenv('PROTEUS_TEST_MAX_SIZE', raising=False)
+    else:
+        monkeypatch.setenv('PROTEUS_TEST_MAX_SIZE', value)
+    assert disk_cache.max_size_from_env('PROTEUS_TEST_MAX_SIZE', 7) == expected
+
+
+def test_write_atomic_replaces_and_leaves_no_temporary(tmp_path):
+    """A new file lands in a created directory and an existing one is
+    replaced whole; no temporary file is left behind.
+    """
+    path = tmp_path / 'sub' / 'entry.txt'
+    disk_cache.write_atomic_text(str(path), 'first')
+    disk_cache.write_atomic(str(path), lambda f: f.write(b'second'))
+
+    assert path.read_text() == 'second'
+    assert os.listdir(path.parent) == ['entry.txt']
+
+
+def test_write_atomic_keeps_previous_file_on_failure(tmp_path):
+    """A writer that raises leaves the previous file and no temporary."""
+    path = tmp_path / 'entry.txt'
+    disk_cache.write_atomic_text(str(path), 'kept')
+
+    def fail(f):
+        f.write(b'partial')
+        raise RuntimeError('killed')
+
+    with pytest.raises(RuntimeError):
+        disk_cache.write_atomic(str(path), fail)
+    assert path.read_text() == 'kept'
+    assert os.listdir(tmp_path) == ['entry.txt']
+
+
+def test_dir_size_and_file_entries(tmp_path):
+    """Sizes include nested files; entries skip files still being written."""
+    _write(tmp_path / 'a.npz', 10, 100)
+    _write(tmp_path / 'sub' / 'b.npz', 20, 200)
+    _write(tmp_path / 'sub' / f'{disk_cache.TMP_PREFIX}c', 40, 300)
+
+    assert disk_cache.dir_size(str(tmp_path)) == 70
+    entries = sorted(disk_cache.file_entries(str(tmp_path)))
+    assert entries == [
+        (100.0, str(tmp_path / 'a.npz'), 10),
+        (200.0, str(tmp_path / 'sub' / 'b.npz'), 20),
+    ]
+
+
+def test_dir_entries_sizes_directories_and_clears_stale_staging(tmp_path):
+    """Each directory below the root is one entry sized by its contents; loose
+    files are not entries, and a staging directory is skipped, or removed once
+    stale.
+    """
+    _write(tmp_path / 'entry' / 'a.npz', 10, 100)
+    _write(tmp_path / 'entry' / 'sub' / 'b.npz', 20, 100)
+    _write(tmp_path / 'entry.lock', 5, 100)
+    fresh = tmp_path / f'{disk_cache.TMP_PREFIX}fresh'
+    stale = tmp_path / f'{disk_cache.TMP_PREFIX}stale'
+    for staging in (fresh, stale):
+        _write(staging / 'a.npz', 40, 100)
+    old = os.stat(stale).st_mtime - disk_cache.STALE_STAGING_SECS - 10
+    os.utime(stale, (old, old))
+
+    entries = disk_cache.dir_entries(str(tmp_path))
+
+    assert [(path, size) for _, path, size in entries] == [(str(tmp_path / 'entry'), 30)]
+    assert fresh.exists()
+    assert not stale.exists()
+
+
+def test_evict_lru_oldest_first_and_keep():
+    """Entries go oldest first until the total fits; the kept entry stays
+    even when it is the oldest, and a larger total evicts more.
+    """
+    entries = [(3.0, 'new', 10), (1.0, 'old', 10), (2.0, 'mid', 10)]
+    removed = []
+
+    assert disk_cache.evict_lru(entries, 20, removed.append) == ['old']
+    assert disk_cache.evict_lru(entries, 10, removed.append, keep='old') == ['mid', 'new']
+    assert disk_cache.evict_lru(entries, 30, removed.append, total=50) == ['old', 'mid']
+    assert removed == ['old', 'mid', 'new', 'old', 'mid']
+
+
+def test_remove_if_stale(tmp_path):
+    """Only staging directories older than STALE_STAGING_SECS are removed."""
+    fresh = tmp_path / '.tmp-fresh'
+    stale = tmp_path / '.tmp-stale'
+    fresh.mkdir()
+    stale.mkdir()
+    old = os.stat(stale).st_mtime - disk_cache.STALE_STAGING_SECS - 10
+    os.utime(stale, (old, old))
+
+    disk_cache.remove_if_stale(str(fresh))
+    disk_cache.remove_if_stale(str(stale))
+
+    assert fresh.exists()
+    assert not stale.exists()
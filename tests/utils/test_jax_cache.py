@@ -0,0 +1,133 @@
+"""
+Unit tests for proteus.utils.jax_cache module.
+
+Tests configuration of the persistent JAX compilation cache from
+``params.compile_cache``, hit/miss reporting around solver calls, and pruning
+of stale cache entries.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from types import SimpleNamespace
+
+import pytest
+
+import proteus.utils.jax_cache as jax_cache
+
+pytestmark = [pytest.mark.unit, pytest.mark.timeout(30)]
+
+
+def _config(enabled=True, path='auto'):
+    cc = SimpleNamespace(enabled=enabled, path=path, max_size=1.0, min_compile_time=0.5)
+    return SimpleNamespace(params=SimpleNamespace(compile_cache=cc))
+
+
+def _write(path, nbytes, mtime):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b'x' * nbytes)
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def counters(monkeypatch):
+    monkeypatch.setattr(jax_cache, '_counts', {'hits': 0, 'misses': 0})
+    monkeypatch.setattr(jax_cache, '_active_dir', '/cache')
+
+
+@pytest.mark.unit
+def test_setup_disabled_returns_none(monkeypatch):
+    """With ``enabled = false`` nothing is configured, even if JAX exists."""
+    monkeypatch.setattr(jax_cache, '_active_dir', None)
+    assert jax_cache.setup_compile_cache(_config(enabled=False)) is None
+    assert jax_cache._active_dir is None
+
+
+@pytest.mark.unit
+def test_resolve_cache_root_auto_uses_fwl_data(monkeypatch, tmp_path):
+    """``"auto"`` resolves below FWL_DATA; explicit paths are made absolute."""
+    monkeypatch.setenv('FWL_DATA', str(tmp_path))
+    assert jax_cache.resolve_cache_root('auto') == os.path.join(str(tmp_path), 'jax_cache')
+    assert os.path.isabs(jax_cache.resolve_cache_root('rel/cache'))
+
+
+@pytest.mark.unit
+def test_setup_namespaces_by_jax_version_and_honours_env(monkeypatch, tmp_path):
+    """The configured root gets a per-version subdirectory; an exported
+    JAX_COMPILATION_CACHE_DIR is used verbatim instead.
+    """
+    jax = pytest.importorskip('jax')
+    monkeypatch.setattr(jax_cache, '_active_dir', None)
+    monkeypatch.setattr(jax_cache, '_register_listener', lambda: None)
+    monkeypatch.setattr(jax.config, 'update', lambda *a, **kw: None)
+    monkeypatch.delenv('JAX_COMPILATION_CACHE_DIR', raising=False)
+
+    cache_dir = jax_cache.setup_compile_cache(_config(path=str(tmp_path)))
+    assert cache_dir == os.path.join(str(tmp_path), f'jax-{jax_cache._jax_version()}')
+    assert os.path.isdir(cache_dir)
+
+    grid_dir = str(tmp_path / 'grid_jax_cache')
+    monkeypatch.setenv('JAX_COMPILATION_CACHE_DIR', grid_dir)
+    assert jax_cache.setup_compile_cache(_config(path=str(tmp_path))) == grid_dir
+
+
+@pytest.mark.unit
+def test_event_listener_counts_hits_and_misses(counters):
+    """Only the cache hit and miss events are counted."""
+    jax_cache._on_event(jax_cache._HIT_EVENT)
+    jax_cache._on_event(jax_cache._MISS_EVENT)
+    jax_cache._on_event(jax_cache._MISS_EVENT)
+    jax_cache._on_event('/jax/compilation_cache/compile_requests_use_cache')
+
+    assert jax_cache._counts == {'hits': 1, 'misses': 2}
+
+
+@pytest.mark.unit
+def test_report_logs_delta_with_labels(counters, caplog):
+    """The report covers only the block's own events and names its key;
+    a block that compiles nothing stays silent.
+    """
+    jax_cache._on_event(jax_cache._MISS_EVENT)
+
+    with caplog.at_level(logging.INFO, logger='fwl.proteus.utils.jax_cache'):
+        with jax_cache.compile_cache_report('aragog', n_stag=40, eos='abc'):
+            jax_cache._on_event(jax_cache._HIT_EVENT)
+            jax_cache._on_event(jax_cache._HIT_EVENT)
+        with jax_cache.compile_cache_report('aragog', n_stag=40, eos='abc'):
+            pass
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert messages == [
+        'JAX compilation cache [aragog n_stag=40, eos=abc]: 2 hit(s), 0 miss(es)'
+    ]
+
+
+@pytest.mark.unit
+def test_prune_removes_other_versions_old_and_excess_entries(monkeypatch, tmp_path):
+    """Pruning drops other JAX versions, then entries older than the age
+    limit, then the least recently used entries above the size limit.
+    """
+    monkeypatch.setattr(jax_cache, '_jax_version', lambda: '1.0')
+    now = 1.0e9
+    monkeypatch.setattr(jax_cache.time, 'time', lambda: now)
+
+    _write(tmp_path / 'jax-0.9' / 'stale-cache', 100, now)
+    current = tmp_path / 'jax-1.0'
+    _write(current / 'ancient-cache', 100, now - 30 * 86400.0)
+    _write(current / 'older-cache', 600, now - 2 * 86400.0)
+    _write(current / 'newer-cache', 600, now - 86400.0)
+
+    removed, freed = jax_cache.prune_compile_cache(
+        str(tmp_path), max_age_days=7.0, max_size=1000 / 1024**3
+    )
+
+    assert (removed, freed) == (3, 800)
+    assert sorted(os.listdir(tmp_path)) == ['jax-1.0']
+    assert os.listdir(current) == ['newer-cache']
+
+
+@pytest.mark.unit
+def test_prune_missing_root_is_noop(tmp_path):
+    """A cache root that was never created prunes to nothing."""
+    assert jax_cache.prune_compile_cache(str(tmp_path / 'absent')) == (0, 0)
@@ -0,0 +1,235 @@
+"""
+Unit tests for proteus.utils.julia_sysimage module.
+
+Tests where the sysimage is looked for, the freshness check that keeps runs
+off images built for another Julia or AGNI, the selection done before juliacall
+starts, the build, validation and timing sequence (with Julia replaced), and
+that the AGNI workload passes the keywords agni.py passes.
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import os
+import re
+import sys
+
+import pytest
+
+import proteus.atmos_clim.agni as agni_mod
+import proteus.utils.julia_sysimage as sysimage
+
+pytestmark = [pytest.mark.unit, pytest.mark.timeout(30)]
+
+
+@pytest.fixture
+def env(monkeypatch, tmp_path):
+    """Isolated FWL_DATA, Julia depot and AGNI checkout, with Julia 1.12.1,
+    before juliacall is imported.
+    """
+    monkeypatch.delitem(sys.modules, 'juliacall', raising=False)
+    monkeypatch.setenv('FWL_DATA', str(tmp_path / 'fwl'))
+    monkeypatch.setenv('JULIA_DEPOT_PATH', str(tmp_path / 'depot'))
+    monkeypatch.delenv(sysimage.SYSIMAGE_ENV, raising=False)
+    monkeypatch.delenv(sysimage._JULIACALL_ENV, raising=False)
+    monkeypatch.setattr(sysimage, '_julia_version', lambda exe: '1.12.1')
+    monkeypatch.setattr(sysimage, '_juliacall_version', lambda: '0.9.26')
+
+    agni = tmp_path / 'AGNI'
+    (agni / 'src').mkdir(parents=True)
+    (agni / 'src' / 'AGNI.jl').write_text('module AGNI end\n')
+    (agni / 'Project.toml').write_text('name = "AGNI"\n')
+    (agni / 'Manifest.toml').write_text('julia_version = "1.12.1"\n')
+    return agni
+
+
+def _install(agni, julia='1.12.1'):
+    """Write an image and its manifest at the default path, as a build would."""
+    image = sysimage.default_sysimage_path()
+    os.makedirs(os.path.dirname(image))
+    with open(image, 'wb') as hdl:
+        hdl.write(b'\0')
+    manifest = {
+        'image': image,
+        'agni_dir': str(agni),
+        'fingerprint': sysimage.environment_fingerprint(str(agni), julia),
+        'startup_default': 40.0,
+        'startup_sysimage': 4.0,
+    }
+    with open(sysimage.manifest_path(image), 'w') as hdl:
+        json.dump(manifest, hdl)
+    return image
+
+
+def test_sysimage_path_default_override_and_disable(env, monkeypatch, tmp_path):
+    """The image defaults to FWL_DATA; PROTEUS_JULIA_SYSIMAGE moves or disables it."""
+    assert sysimage.sysimage_path() == os.path.join(
+        str(tmp_path / 'fwl'), 'julia_sysimage', sysimage.SYSIMAGE_NAME
+    )
+    monkeypatch.setenv(sysimage.SYSIMAGE_ENV, 'rel/image.so')
+    assert sysimage.sysimage_path() == os.path.abspath('rel/image.so')
+    monkeypatch.setenv(sysimage.SYSIMAGE_ENV, 'None')
+    assert sysimage.sysimage_path() is None
+
+
+def test_select_fresh_image(env):
+    """A fresh image is handed to juliacall."""
+    image = _install(env)
+
+    assert sysimage.stale_reason(image) is None
+    assert sysimage.select_sysimage() == image
+    assert os.environ[sysimage._JULIACALL_ENV] == image
+    assert sysimage.active_sysimage() == image
+
+
+def test_select_skips_missing_and_respects_explicit(env, monkeypatch):
+    """Without an image nothing is set; an explicit juliacall sysimage wins."""
+    assert sysimage.select_sysimage() is None
+    assert sysimage._JULIACALL_ENV not in os.environ
+
+    _install(env)
+    monkeypatch.setenv(sysimage._JULIACALL_ENV, '/other/image.so')
+    assert sysimage.select_sysimage() == '/other/image.so'
+
+
+def test_select_after_juliacall_import_only_reports(env, monkeypatch):
+    """Once juliacall is loaded Julia has started, so a fresh image found by a
+    later import site is not selected and the image in use is reported.
+    """
+    _install(env)
+    monkeypatch.setitem(sys.modules, 'juliacall', object())
+
+    assert sysimage.select_sysimage() is None
+    assert sysimage._JULIACALL_ENV not in os.environ
+
+
+@pytest.mark.parametrize(
+    'change, reason',
+    [
+        ('julia', 'built for Julia 1.11.8, found 1.12.1'),
+        ('source', 'AGNI sources changed'),
+        ('manifest', "AGNI's Manifest.toml changed"),
+        ('lovepy', 'default Julia environment (LovePy) changed'),
+    ],
+)
+def test_stale_image_is_skipped(env, caplog, change, reason):
+    """An image built for another Julia, AGNI or LovePy is not used, with a warning."""
+    image = _install(env, julia='1.11.8' if change == 'julia' else '1.12.1')
+    if change == 'source':
+        (env / 'src' / 'solver.jl').write_text('solve() = 1\n')
+    elif change == 'manifest':
+        (env / 'Manifest.toml').write_text('julia_version = "1.12.2"\n')
+    elif change == 'lovepy':
+        manifest = sysimage._default_env_manifest('1.12.1') or os.path.join(
+            os.environ['JULIA_DEPOT_PATH'], 'environments', 'v1.12', 'Manifest.toml'
+        )
+        os.makedirs(os.path.dirname(manifest), exist_ok=True)
+        with open(manifest, 'w') as hdl:
+            hdl.write('[[deps.LovePy]]\n')
+
+    assert sysimage.stale_reason(image) == reason
+    assert sysimage.select_sysimage() is None
+    assert sysimage._JULIACALL_ENV not in os.environ
+    assert 'proteus get sysimage' in caplog.text
+
+
+def test_build_validates_times_and_installs(env, monkeypatch):
+    """The build runs PackageCompiler, times the workload without and with the
+    staged image, then moves the image into place with its manifest.
+    """
+    calls = []
+    clock = iter([0.0, 300.0, 300.0, 340.0, 340.0, 344.0])
+    monkeypatch.setattr(sysimage.time, 'perf_counter', lambda: next(clock))
+    monkeypatch.setattr(sysimage, '_has_lovepy', lambda exe, env: True)
+
+    def fake_run(cmd, env=None, **kwargs):
+        calls.append(cmd)
+        if cmd[-1].endswith('build.jl'):
+            with open(env[sysimage._IMAGE_ENV], 'wb') as hdl:
+                hdl.write(b'\0')
+        return sysimage.subprocess.CompletedProcess(cmd, 0, '', '')
+
+    monkeypatch.setattr(sysimage.subprocess, 'run', fake_run)
+
+    manifest = sysimage.build_sysimage(str(env))
+
+    image = sysimage.default_sysimage_path()
+    assert manifest['image'] == image
+    assert os.path.isfile(image)
+    assert sysimage.read_manifest(image) == manifest
+    assert manifest['startup_default'] == 40.0
+    assert manifest['startup_sysimage'] == 4.0
+    assert manifest['lovepy'] is True
+    assert not any(a.startswith('--sysimage') for a in calls[1])
+    assert calls[2][-2] == '--sysimage=' + os.path.join(
+        os.path.dirname(image), 'build', sysimage.SYSIMAGE_NAME
+    )
+    with open(calls[1][-1]) as hdl:
+        assert 'using LovePy' in hdl.read()
+    assert sysimage.stale_reason(image) is None
+
+
+def test_build_rejects_invalid_image(env, monkeypatch):
+    """An image that Julia cannot start from is not installed."""
+
+    def fake_run(cmd, env=None, **kwargs):
+        failed = any(a.startswith('--sysimage') for a in cmd)
+        return sysimage.subprocess.CompletedProcess(cmd, int(failed), '', 'bad image')
+
+    monkeypatch.setattr(sysimage.subprocess, 'run', fake_run)
+    monkeypatch.setattr(sysimage, '_has_lovepy', lambda exe, env: False)
+
+    with pytest.raises(RuntimeError, match='bad image'):
+        sysimage.build_sysimage(str(env))
+    assert not os.path.exists(sysimage.default_sysimage_path())
+
+
+def test_build_requires_julia_and_agni(env, monkeypatch, tmp_path):
+    """A missing AGNI checkout or Julia binary stops the build early."""
+    with pytest.raises(RuntimeError, match='No AGNI checkout'):
+        sysimage.build_sysimage(str(tmp_path / 'missing'))
+    monkeypatch.setattr(sysimage, '_julia_version', lambda exe: None)
+    with pytest.raises(RuntimeError, match='Julia not found'):
+        sysimage.build_sysimage(str(env))
+
+
+def _agni_keywords(func: str) -> set[str]:
+    """Keywords agni.py passes to the AGNI function bound as ``func``."""
+    with open(agni_mod.__file__) as hdl:
+        tree = ast.parse(hdl.read())
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and getattr(node.func, 'attr', None) == func:
+            names |= {kw.arg for kw in node.keywords if kw.arg}
+        # setup! takes its keywords from the setup_kwargs dict
+        elif isinstance(node, ast.Assign) and func == 'setup_b':
+            target = ast.unparse(node.targets[0])
+            if target == 'setup_kwargs':
+                names |= {kw.arg for kw in node.value.keywords}
+            elif target.startswith('setup_kwargs['):
+                names.add(node.targets[0].slice.value)
+    return names
+
+
+def _workload_keywords(call: str) -> set[str]:
+    """Keywords given to ``call(...)`` in the AGNI precompile workload."""
+    body = sysimage.PRECOMPILE_WORKLOAD.split(call + '(', 1)[1].split('\n    )', 1)[0]
+    return set(re.findall(r'([^\s(;,]+)=', body.split(';', 1)[1]))
+
+
+@pytest.mark.parametrize(
+    ('julia', 'python'),
+    [
+        ('AGNI.atmosphere.setup!', 'setup_b'),
+        ('AGNI.solver.solve_energy!', 'solve_energy_b'),
+        ('AGNI.solver.solve_transparent!', 'solve_transparent_b'),
+    ],
+)
+def test_workload_passes_the_keywords_agni_passes(julia, python):
+    """The workload compiles the keyword methods a run calls, so it passes
+    the same keyword set as agni.py.
+    """
+    expected = _agni_keywords(python)
+    assert expected
+    assert _workload_keywords(julia) == expected
@@ -0,0 +1,58 @@
+"""
+Unit tests for proteus.utils.surrogate.
+
+Tests the linear response shared by the structure and AGNI flux surrogates:
+the fit around the latest solve, its residuals against later solves, and the
+refusal to extrapolate.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from proteus.utils.surrogate import EXTRAPOLATION_LIMIT, MIN_SOLVES, LinearResponse
+
+pytestmark = [pytest.mark.unit, pytest.mark.timeout(30)]
+
+
+def _solve(x):
+    """Results linear in the inputs."""
+    return np.array([3.0 * x[0] - x[1], 0.5 * x[1]])
+
+
+def _error(predicted, actual):
+    return np.max(np.abs(predicted - actual))
+
+
+def test_linear_response_recovers_linear_results():
+    """Around the latest solve the fit reproduces linear results, and the
+    residuals it scored against later solves vanish.
+    """
+    fit = LinearResponse()
+    for x in ([1.0, 2.0], [1.5, 2.0], [1.2, 2.6], [1.4, 2.3]):
+        fit.add(np.array(x), _solve(x), _error)
+
+    assert len(fit) == 4 >= MIN_SOLVES
+    assert fit.validated
+    assert fit.residual == pytest.approx(0.0, abs=1e-12)
+    x = np.array([1.3, 2.4])
+    np.testing.assert_allclose(fit.latest + fit.response(x), _solve(x), rtol=1e-12)
+
+
+def test_linear_response_refuses_unsampled_and_distant_inputs():
+    """An input that never varied, or a step beyond the sampled span, gives
+    no response; clearing forgets the history.
+    """
+    fit = LinearResponse()
+    assert fit.response(np.array([1.0, 2.0])) is None
+    for x in ([1.0, 2.0], [1.5, 2.0]):
+        fit.add(np.array(x), _solve(x), _error)
+    assert not fit.validated
+
+    assert fit.response(np.array([1.2, 2.1])) is None
+    assert fit.response(np.array([1.5 + 0.5 * (EXTRAPOLATION_LIMIT + 0.1), 2.0])) is None
+    assert fit.response(np.array([1.2, 2.0])) is not None
+
+    fit.clear()
+    assert len(fit) == 0
@@ -47,10 +47,11 @@ MERGE_SITES = [
     ('atmos_clim/agni.py', 'run_agni', {'albedo': 'bond_albedo'}),
     ('atmos_clim/janus.py', 'RunJANUS', {'albedo': 'bond_albedo'}),
     ('atmos_clim/dummy.py', 'RunDummyAtm', {'albedo': 'bond_albedo'}),
+    ('atmos_clim/emulator.py', 'run_emulator', {'albedo': 'bond_albedo'}),
     ('interior_energetics/spider.py', 'ReadSPIDER', {}),
     ('interior_energetics/aragog.py', '_build_helpfile_output', {}),
     ('interior_energetics/aragog_jax.py', '_extract_output', {}),
-    ('interior_energetics/boundary.py', 'run_solver', {}),
+    ('interior_energetics/boundary.py', 'step_output', {}),
     ('interior_energetics/dummy.py', 'run_dummy_int', {}),
 ]
 
@@ -86,13 +87,15 @@ SUPPRESSED_DYNAMIC_WRITES = {
     ('proteus.py', 'start'),
     ('atmos_clim/wrapper.py', 'carry_converged_levels'),
     ('atmos_clim/wrapper.py', 'run_atmosphere'),
-    ('interior_energetics/wrapper.py', 'run_interior'),
+    ('interior_energetics/wrapper.py', '_advance_interior'),
     # The mass-ratio loop assembles its key in a local; EXTRA_PRODUCERS
     # declares the full expansion for it.
     ('outgas/wrapper.py', 'run_outgassing'),
     # hf_row.update(saved) restores of pre-call snapshots.
     ('interior_energetics/wrapper.py', '_solve_structure_with_adiabat_or_rollback'),
     ('interior_energetics/wrapper.py', 'update_structure_from_interior'),
+    # Rollback of a rejected interior step to its pre-step row.
+    ('interior_energetics/wrapper.py', 'restore'),
 }
 
 # Producers that assemble their key through a local variable the visitor
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""Accuracy of adaptive SPIDER resolution against the fixed mesh.
+
+Runs a Zalmoxis-structure configuration with SPIDER twice, once on
+``num_levels`` evenly spaced levels throughout and once with
+``interior_energetics.adaptive_levels``, and compares the global diagnostics
+of the two runs on the fixed run's time axis: the largest relative
+difference of each column, the final values, the number of coupling
+iterations and the wall time. The runs are otherwise
+identical: each gets a copy of the configuration with SPIDER selected and
+only the option and the output directory changed.
+
+Usage
+-----
+    python tools/benchmark_adaptive_levels.py input/chili/intercomp/earth.toml
+    python tools/benchmark_adaptive_levels.py case.toml --num-levels-min 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import tomlkit
+
+from proteus import Proteus
+
+DIAGNOSTICS = ('T_magma', 'Phi_global', 'R_int', 'F_int', 'T_surf')
+
+
+def _run(config_path: Path, adaptive: bool, num_levels_min: int, tmpdir: str) -> dict:
+    """Run one configuration and return its helpfile and wall time."""
+    label = 'adaptive' if adaptive else 'fixed'
+    with open(config_path) as f:
+        doc = tomlkit.load(f)
+    energetics = doc.setdefault('interior_energetics', tomlkit.table())
+    energetics['module'] = 'spider'
+    energetics['adaptive_levels'] = adaptive
+    energetics['num_levels_min'] = num_levels_min
+    params = doc.setdefault('params', tomlkit.table())
+    params.setdefault('out', tomlkit.table())['path'] = (
+        f'benchmark_adaptive_levels/{config_path.stem}_{label}'
+    )
+    run_path = os.path.join(tmpdir, f'{config_path.stem}_{label}.toml')
+    with open(run_path, 'w') as f:
+        tomlkit.dump(doc, f)
+
+    t0 = time.perf_counter()
+    runner = Proteus(config_path=run_path)
+    runner.start(offline=True)
+    return {'hf': runner.hf_all, 'wall': time.perf_counter() - t0}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('config', help='configuration file with a Zalmoxis structure')
+    parser.add_argument(
+        '--num-levels-min', type=int, default=40, help='coarsest adaptive level count'
+    )
+    args = parser.parse_args()
+    config_path = Path(args.config)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fixed = _run(config_path, False, args.num_levels_min, tmpdir)
+        adaptive = _run(config_path, True, args.num_levels_min, tmpdir)
+
+    t_fixed = fixed['hf']['Time'].to_numpy(dtype=float)
+    t_adapt = adaptive['hf']['Time'].to_numpy(dtype=float)
+    common = t_fixed[t_fixed <= t_adapt[-1]]
+
+    print(f'{"run":10s} {"iters":>6s} {"time [yr]":>10s} {"wall [s]":>9s}')
+    for label, run, t in (('fixed', fixed, t_fixed), ('adaptive', adaptive, t_adapt)):
+        print(f'{label:10s} {len(t):6d} {t[-1]:10.3e} {run["wall"]:9.1f}')
+    print()
+    print(f'{"diagnostic":12s} {"max rel diff":>13s} {"final fixed":>12s} {"final adapt":>12s}')
+    for key in DIAGNOSTICS:
+        if key not in fixed['hf'] or key not in adaptive['hf']:
+            continue
+        y_fixed = fixed['hf'][key].to_numpy(dtype=float)[: len(common)]
+        y_adapt = np.interp(common, t_adapt, adaptive['hf'][key].to_numpy(dtype=float))
+        scale = np.maximum(np.abs(y_fixed), 1e-30)
+        diff = float(np.max(np.abs(y_adapt - y_fixed) / scale)) if len(common) else np.nan
+        print(f'{key:12s} {diff:13.2e} {y_fixed[-1]:12.4e} {y_adapt[-1]:12.4e}')
+
+
+if __name__ == '__main__':
+    main()
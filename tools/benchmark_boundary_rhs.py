@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+"""Benchmark of the boundary interior ODE: method-chain RHS versus compiled RHS.
+
+``BoundaryRunner.thermal_rhs`` evaluates the thermal ODE through a chain of
+runner methods, and BDF estimates its Jacobian by finite differences. The
+production path in ``BoundaryRunner.run_solver`` integrates the closed-form
+kernel with its analytic Jacobian instead. This script integrates one long
+cooling run, from a molten mantle through solidification, with both and
+reports the wall time, the evaluation counts and the final-state agreement.
+
+Usage
+-----
+    python tools/benchmark_boundary_rhs.py
+    python tools/benchmark_boundary_rhs.py --years 3e6 --viscosity-model 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from types import SimpleNamespace
+
+import numpy as np
+from scipy.integrate import solve_ivp
+
+from proteus.interior_energetics.boundary import BoundaryRunner, _thermal_kernel
+from proteus.utils.constants import M_earth, R_earth, secs_per_year
+
+
+def _runner(viscosity_model: int) -> BoundaryRunner:
+    """Earth-like runner with radiogenic heating, built from the defaults."""
+    boundary = SimpleNamespace(
+        T_solidus=1420.0,
+        T_liquidus=2020.0,
+        critical_rayleigh_number=1e3,
+        nusselt_exponent=1.0 / 3.0,
+        silicate_heat_capacity=1.2e3,
+        atm_heat_capacity_const=True,
+        atm_heat_capacity=1.7e4,
+        silicate_density=4500.0,
+        thermal_conductivity=4.2,
+        thermal_diffusivity=1e-6,
+        thermal_expansivity=2e-5,
+        viscosity_model=viscosity_model,
+        dynamic_viscosity=3.8e9,
+        activation_energy=3.5e5,
+        creep_parameter=26,
+        viscosity_prefactor=2.4e-4,
+        viscosity_activation_temp=4600.0,
+        logging=False,
+    )
+    config = SimpleNamespace(
+        interior_energetics=SimpleNamespace(
+            rtol=1e-6,
+            atol=1e-9,
+            boundary=boundary,
+            rfront_loc=0.4,
+            phase_transition_width=0.2,
+            heat_radiogenic=True,
+            heat_tidal=False,
+            tmagma_atol=1e6,
+            latent_heat_of_fusion=4.0e5,
+            const_log10visc=2.0,
+            solid_log10visc=22.0,
+            melt_log10visc=2.0,
+            radio_tref=4.567,
+            radio_U=0.031,
+            radio_Th=0.124,
+            radio_K=310,
+        ),
+        interior_struct=SimpleNamespace(core_frac=0.55, core_frac_mode='radius', module='self'),
+        planet=SimpleNamespace(tsurf_init=3500.0),
+        star=SimpleNamespace(age_ini=0.1),
+    )
+    hf_row = {
+        'Time': 0.0,
+        'R_int': R_earth,
+        'M_core': 0.325 * M_earth,
+        'M_atm': 1e18,
+        'F_atm': 100.0,
+    }
+    interior = SimpleNamespace(ic=1, tides=[0.0])
+    return BoundaryRunner(config, {}, hf_row, None, interior, SimpleNamespace())
+
+
+def _timed(func) -> tuple[float, object]:
+    t0 = time.perf_counter()
+    out = func()
+    return time.perf_counter() - t0, out
+
+
+def _per_call(func, n: int = 2000) -> float:
+    t0 = time.perf_counter()
+    for _ in range(n):
+        func()
+    return (time.perf_counter() - t0) / n
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--years', type=float, default=1e7, help='integration span [yr]')
+    parser.add_argument(
+        '--viscosity-model', type=int, default=2, choices=(1, 2, 3), help='viscosity model'
+    )
+    args = parser.parse_args()
+
+    runner = _runner(args.viscosity_model)
+    y0 = [runner.T_p_0, runner.T_surf_0 - 500.0]
+    t_span = (0.0, args.years * secs_per_year)
+    tol = dict(method='BDF', rtol=runner.rtol, atol=runner.atol)
+    constants = runner.rhs_constants()
+
+    def reference():
+        return solve_ivp(runner.thermal_rhs, t_span, y0, **tol)
+
+    def compiled():
+        return solve_ivp(
+            lambda t, y: _thermal_kernel(float(t), *y.tolist(), constants, False),
+            t_span,
+            y0,
+            jac=lambda t, y: _thermal_kernel(float(t), *y.tolist(), constants, True),
+            **tol,
+        )
+
+    t_ref, ref = _timed(reference)
+    t_new, new = _timed(compiled)
+
+    print(f'{args.years:.1e} yr, viscosity model {args.viscosity_model}')
+    for name, wall, sol in (
+        ('method chain, FD Jacobian', t_ref, ref),
+        ('compiled', t_new, new),
+    ):
+        print(
+            f'  {name:26s}: {wall * 1e3:9.1f} ms  steps {len(sol.t):6d}  '
+            f'nfev {sol.nfev:6d}  njev {sol.njev:4d}  T_p {sol.y[0, -1]:8.2f} K'
+        )
+    rel = np.max(np.abs(new.y[:, -1] - ref.y[:, -1]) / np.abs(ref.y[:, -1]))
+    print(f'  final-state relative difference: {rel:.1e}')
+    print(f'  speed-up                       : {t_ref / t_new:9.1f} x')
+
+    y = ref.y[:, len(ref.t) // 2].tolist()
+    t = float(ref.t[len(ref.t) // 2])
+    per_rhs = _per_call(lambda: runner.thermal_rhs(t, y))
+    per_kernel = _per_call(lambda: _thermal_kernel(t, y[0], y[1], constants, False))
+    per_jac = _per_call(lambda: _thermal_kernel(t, y[0], y[1], constants, True))
+    print(f'  per RHS call, method chain     : {per_rhs * 1e6:9.2f} us')
+    print(f'  per RHS call, compiled         : {per_kernel * 1e6:9.2f} us')
+    print(f'  per Jacobian call, analytic    : {per_jac * 1e6:9.2f} us')
+
+
+if __name__ == '__main__':
+    main()
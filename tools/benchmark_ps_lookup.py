@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""Micro-benchmark of P-S table lookups: per-point versus prebuilt batched.
+
+``spider.ReadSPIDER`` evaluates the melt-density and heat-capacity P-S tables
+at every mantle node. The per-point path builds a new scipy
+``RegularGridInterpolator`` for each node; the batched path evaluates all
+nodes in one call on the interpolator that ``Interior_t`` prebuilds when it
+loads the table. This script times both on a synthetic table of SPIDER's
+production size and checks that they agree.
+
+Usage
+-----
+    python tools/benchmark_ps_lookup.py
+    python tools/benchmark_ps_lookup.py --nodes 200 --repeat 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from proteus.interior_energetics.common import PSInterpolator
+from proteus.interior_energetics.spider import _interp_ps_lookup
+
+
+def _table(nP: int, nS: int) -> np.ndarray:
+    P = np.linspace(0.0, 1.0e12, nP)
+    S = np.linspace(100.0, 4000.0, nS)
+    table = np.zeros((nS, nP, 3))
+    table[..., 0] = P[None, :]
+    table[..., 1] = S[:, None]
+    table[..., 2] = 3000.0 + 1e-8 * P[None, :] + 0.2 * S[:, None]
+    return table
+
+
+def _best_of(func, repeat: int) -> float:
+    best = np.inf
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--nodes', type=int, default=100, help='mantle nodes per lookup')
+    parser.add_argument('--nP', type=int, default=2020, help='table pressure points')
+    parser.add_argument('--nS', type=int, default=125, help='table entropy points')
+    parser.add_argument('--repeat', type=int, default=20, help='timing repetitions')
+    args = parser.parse_args()
+
+    table = _table(args.nP, args.nS)
+    rng = np.random.default_rng(0)
+    S = rng.uniform(200.0, 3900.0, args.nodes)
+    P = rng.uniform(1e5, 1.4e11, args.nodes)
+
+    interp = PSInterpolator(table)
+
+    def per_point():
+        return np.array([_interp_ps_lookup(s, p, table) for s, p in zip(S, P)])
+
+    def batched():
+        return interp(S, P)
+
+    np.testing.assert_allclose(batched(), per_point(), rtol=1e-12)
+
+    t_point = _best_of(per_point, args.repeat)
+    t_batch = _best_of(batched, args.repeat)
+    t_build = _best_of(lambda: PSInterpolator(table), args.repeat)
+
+    print(f'table {args.nS} x {args.nP}, {args.nodes} nodes, best of {args.repeat}')
+    print(f'  per-point lookups  : {t_point * 1e3:10.3f} ms')
+    print(f'  batched, prebuilt  : {t_batch * 1e3:10.3f} ms')
+    print(f'  interpolator build : {t_build * 1e3:10.3f} ms (once per table)')
+    print(f'  speed-up           : {t_point / t_batch:10.1f} x')
+
+
+if __name__ == '__main__':
+    main()
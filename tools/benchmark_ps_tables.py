@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""Benchmark of P-S table generation and reuse: serial, slab-parallel, cut.
+
+Times the serial Zalmoxis generation of the SPIDER P-S tables against the
+slab-parallel one of ``ps_tables.generate_spider_eos_tables`` and checks
+that both write the same files. With ``PROTEUS_PS_CACHE_DIR`` set, a run
+whose tables differ from a cached set only by a slightly lower pressure
+ceiling cuts that set (``ps_tables.slice_tables``) instead of generating its
+own; the script also times that cut from a set generated at ``--headroom``
+times the requested ceiling.
+
+Usage
+-----
+    python tools/benchmark_ps_tables.py $FWL_DATA/.../PALEOS_MgSiO3_unified.dat
+    python tools/benchmark_ps_tables.py table.dat --nP 600 --nS 150 --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import filecmp
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from zalmoxis.eos_export import generate_spider_phase_boundaries
+from zalmoxis.melting_curves import get_solidus_liquidus_functions
+
+from proteus.interior_struct import ps_tables
+
+
+_, _liquidus = get_solidus_liquidus_functions('Stixrude14-solidus', 'PALEOS-liquidus')
+
+
+def _solidus(P):
+    return 0.8 * np.asarray(_liquidus(P))
+
+
+def _generate(eos_file: str, out: Path, P_max: float, nP: int, nS: int, workers: int) -> float:
+    """Generate a table set into `out` and return the wall time [s]."""
+    out.mkdir()
+    kwargs = dict(
+        eos_file=eos_file,
+        solidus_func=_solidus,
+        liquidus_func=_liquidus,
+        P_range=(1e5, P_max),
+        n_P=nP,
+        output_dir=str(out),
+    )
+    t0 = time.perf_counter()
+    generate_spider_phase_boundaries(**kwargs)
+    ps_tables.generate_spider_eos_tables(n_S=nS, workers=workers, **kwargs)
+    return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('eos_file', help='PALEOS unified MgSiO3 table')
+    parser.add_argument('--P-max', type=float, default=3.5e11, help='requested ceiling [Pa]')
+    parser.add_argument('--headroom', type=float, default=1.2, help='cached/requested ceiling')
+    parser.add_argument('--nP', type=int, default=1350, help='pressure points')
+    parser.add_argument('--nS', type=int, default=280, help='entropy points')
+    parser.add_argument('--workers', type=int, default=0, help='0 = one per core')
+    args = parser.parse_args()
+    if not 1.0 <= args.headroom <= ps_tables.SUPERSET_MAX_RATIO:
+        parser.error(f'--headroom must lie in [1, {ps_tables.SUPERSET_MAX_RATIO}]')
+    workers = ps_tables.resolve_workers(args.workers)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp = Path(tmpdir)
+        grid = (args.P_max, args.nP, args.nS)
+        t_serial = _generate(args.eos_file, tmp / 'serial', *grid, workers=1)
+        t_parallel = _generate(args.eos_file, tmp / 'parallel', *grid, workers=workers)
+        names = sorted(n for n in os.listdir(tmp / 'serial') if not n.startswith('.'))
+        _, mismatch, errors = filecmp.cmpfiles(
+            tmp / 'serial', tmp / 'parallel', names, shallow=False
+        )
+
+        superset = tmp / 'superset'
+        _generate(args.eos_file, superset, args.headroom * args.P_max, *grid[1:], workers)
+        # The first cut parses the superset text, later ones read the
+        # binary sidecars the first left behind
+        t_cut = []
+        for name in ('cut', 'cut_again'):
+            (tmp / name).mkdir()
+            t0 = time.perf_counter()
+            P_top = ps_tables.slice_tables(str(superset), str(tmp / name), args.P_max)
+            t_cut.append(time.perf_counter() - t0)
+
+    print(f'tables {args.nS} x {args.nP}, P_max {args.P_max:.2e} Pa')
+    print(f'  serial generation   : {t_serial:10.2f} s')
+    print(
+        f'  parallel generation : {t_parallel:10.2f} s   ({t_serial / t_parallel:.1f} x, '
+        f'{workers} workers, {len(mismatch) + len(errors)} of {len(names)} files differ)'
+    )
+    print(f'  cut from {args.headroom * args.P_max:.2e} Pa to {P_top:.2e} Pa:')
+    print(f'    cold              : {t_cut[0]:10.2f} s   ({t_serial / t_cut[0]:.1f} x)')
+    print(f'    warm              : {t_cut[1]:10.2f} s   ({t_serial / t_cut[1]:.1f} x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""Benchmark of coupling step controllers: 'pi' versus 'adaptive'.
+
+Runs each reference configuration once per ``params.dt.method`` and reports
+the number of coupling iterations, the simulated time reached, the wall time,
+the number of steps taken at ``dt.minimum`` and, for the PI controller, the
+number of interior steps it rolled back and repeated and the number of
+completed steps whose local error still exceeded 1. The runs are otherwise identical: each method
+gets a copy of the configuration with only the step method and the output
+directory changed.
+
+By default ``input/dummy.toml`` and ``input/minimal.toml`` are run; pass
+other configuration files to benchmark those instead.
+
+Usage
+-----
+    python tools/benchmark_timestep.py
+    python tools/benchmark_timestep.py input/tutorials/tutorial_earth.toml --methods pi
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import tomlkit
+
+from proteus import Proteus
+from proteus.interior_energetics.timestep import _local_error
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_CONFIGS = ('input/dummy.toml', 'input/minimal.toml')
+
+
+def _run(config_path: Path, method: str, tmpdir: str) -> dict:
+    """Run one configuration with `method` and summarise the helpfile."""
+    with open(config_path) as f:
+        doc = tomlkit.load(f)
+    params = doc.setdefault('params', tomlkit.table())
+    params.setdefault('dt', tomlkit.table())['method'] = method
+    params.setdefault('out', tomlkit.table())['path'] = (
+        f'benchmark_timestep/{config_path.stem}_{method}'
+    )
+    run_path = os.path.join(tmpdir, f'{config_path.stem}_{method}.toml')
+    with open(run_path, 'w') as f:
+        tomlkit.dump(doc, f)
+
+    t0 = time.perf_counter()
+    runner = Proteus(config_path=run_path)
+    runner.start(offline=True)
+    wall = time.perf_counter() - t0
+
+    hf = runner.hf_all
+    dt_cfg = runner.config.params.dt
+    steps = np.diff(hf['Time'].to_numpy(dtype=float))
+    floor = dt_cfg.minimum + dt_cfg.minimum_rel * hf['Time'].to_numpy(dtype=float)[:-1]
+    over = sum(
+        _local_error(hf, i, dt_cfg.rtol, dt_cfg.atol) > 1.0 for i in range(-len(hf) + 2, 0)
+    )
+    return {
+        'iters': len(hf),
+        'time': float(hf['Time'].iloc[-1]),
+        'wall': wall,
+        'at_min': int(np.sum(steps <= floor * (1 + 1e-9))),
+        'repeated': runner.interior_o.rejected_steps if method == 'pi' else None,
+        'over': over if method == 'pi' else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('configs', nargs='*', help='configuration files to benchmark')
+    parser.add_argument(
+        '--methods',
+        nargs='+',
+        default=['adaptive', 'pi'],
+        choices=['adaptive', 'pi', 'proportional', 'maximum'],
+        help='step methods to compare',
+    )
+    args = parser.parse_args()
+    configs = [Path(c) for c in args.configs] or [ROOT / c for c in DEFAULT_CONFIGS]
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for config_path in configs:
+            for method in args.methods:
+                rows.append((config_path.name, method, _run(config_path, method, tmpdir)))
+
+    print(
+        f'{"config":24s} {"method":10s} {"iters":>6s} {"time [yr]":>10s} '
+        f'{"wall [s]":>9s} {"at min":>7s} {"repeated":>9s} {"err > 1":>8s}'
+    )
+    for name, method, r in rows:
+        repeated = '-' if r['repeated'] is None else str(r['repeated'])
+        over = '-' if r['over'] is None else str(r['over'])
+        print(
+            f'{name:24s} {method:10s} {r["iters"]:6d} {r["time"]:10.3e} '
+            f'{r["wall"]:9.1f} {r["at_min"]:7d} {repeated:>9s} {over:>8s}'
+        )
+
+
+if __name__ == '__main__':
+    main()
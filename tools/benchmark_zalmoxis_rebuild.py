@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+"""Benchmark of the post-solve Zalmoxis column rebuild: per-node loop versus batched.
+
+After a JAX structure solve, ``zalmoxis_solver`` re-evaluates the density and
+temperature columns against the evolved temperature profile. This script runs
+that rebuild on an Earth-like structure at several radial resolutions, with the
+production EOS tables of a PROTEUS configuration, once with the per-node scalar
+evaluation it replaced and once with ``_rebuild_columns_on_temperature``. It
+reports the wall time of each and the largest relative density difference.
+The loop builds its EOS interpolators on every call, as it did in production;
+the batched rebuild keeps them for the life of the process.
+
+The temperature profile runs from 4500 K at the core-mantle boundary to 1800 K
+at the surface, so the mantle crosses the mushy zone. ``--wet`` dissolves 2% H2O
+in the melt and rebuilds the mantle through the blended evaluator.
+
+Usage
+-----
+    python tools/benchmark_zalmoxis_rebuild.py
+    python tools/benchmark_zalmoxis_rebuild.py input/minimal.toml --levels 150 1000 --wet
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+from zalmoxis.eos.dispatch import calculate_density
+from zalmoxis.mixing import calculate_mixed_density, parse_layer_components
+
+from proteus.config import read_config_object
+from proteus.interior_struct.zalmoxis import (
+    _rebuild_columns_on_temperature,
+    build_volatile_profile,
+    extend_mantle_eos_with_volatiles,
+    load_zalmoxis_material_dictionaries,
+    load_zalmoxis_solidus_liquidus_functions,
+)
+from proteus.utils.constants import R_earth
+
+
+def _structure(n: int) -> dict:
+    """Earth-like radial profile with `n` nodes, core-mantle boundary at 0.55 R."""
+    radii = np.linspace(1.0e3, R_earth, n)
+    x = radii / R_earth
+    return {
+        'radii': radii,
+        'pressure': 3.6e11 * (1.0 - x**2) ** 1.2 + 1e5,
+        'density': np.where(x < 0.55, 11000.0, 4500.0) - 1500.0 * x,
+        'cmb_index': int(np.searchsorted(radii, 0.55 * R_earth)),
+        'temperature_arrays': (
+            np.linspace(0.55 * R_earth, R_earth, 120),
+            np.linspace(4500.0, 1800.0, 120),
+        ),
+    }
+
+
+def _per_node(s, mat_dicts, core_eos, mantle_eos, melt_funcs, mzf, mixture, profile):
+    """The rebuild as it ran before batching: one scalar evaluation per node."""
+    r_ref, T_ref = s['temperature_arrays']
+    sol_f, liq_f = melt_funcs if melt_funcs is not None else (None, None)
+    cache: dict = {}
+    rho = np.zeros(len(s['radii']))
+    T = np.zeros(len(s['radii']))
+    for i in range(len(s['radii'])):
+        r, P = float(s['radii'][i]), float(s['pressure'][i])
+        T[i] = float(T_ref[0]) if r <= float(r_ref[0]) else float(np.interp(r, r_ref, T_ref))
+        if mixture is not None and i >= s['cmb_index']:
+            rho_i = calculate_mixed_density(
+                P, T[i], mixture, mat_dicts, sol_f, liq_f, cache, volatile_profile=profile
+            )
+            if rho_i is not None and not np.isfinite(rho_i):
+                rho_i = None
+        else:
+            eos = core_eos if i < s['cmb_index'] else mantle_eos
+            rho_i = calculate_density(
+                P,
+                mat_dicts,
+                eos,
+                T[i],
+                sol_f,
+                liq_f,
+                interpolation_functions=cache,
+                mushy_zone_factor=mzf,
+            )
+        rho[i] = float(rho_i) if rho_i is not None else float(s['density'][i])
+    return rho, T
+
+
+def _best_of(func, repeat: int) -> tuple[float, object]:
+    best, out = np.inf, None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = func()
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        'config', nargs='?', default='input/all_options.toml', help='PROTEUS configuration'
+    )
+    parser.add_argument(
+        '--levels',
+        type=int,
+        nargs='+',
+        default=[150, 300, 600, 1200],
+        help='radial resolutions to benchmark',
+    )
+    parser.add_argument('--wet', action='store_true', help='rebuild a wet mantle')
+    parser.add_argument('--repeat', type=int, default=3, help='best-of repetitions')
+    args = parser.parse_args()
+
+    config = read_config_object(args.config)
+    zc = config.interior_struct.zalmoxis
+    mat_dicts = load_zalmoxis_material_dictionaries()
+    melt_funcs = load_zalmoxis_solidus_liquidus_functions(zc.mantle_eos, config)
+
+    mixture = profile = None
+    if args.wet:
+        hf_row = {'M_mantle_liquid': 4.0e24, 'M_mantle_solid': 0.0, 'H2O_kg_liquid': 8.0e22}
+        profile = build_volatile_profile(hf_row, zc.mantle_eos)
+        mixture = parse_layer_components(
+            extend_mantle_eos_with_volatiles(zc.mantle_eos, profile)
+        )
+
+    eos = (mat_dicts, zc.core_eos, zc.mantle_eos, melt_funcs)
+    # Write the on-disk interpolator caches so neither side parses table text
+    _per_node(_structure(8), *eos, zc.mushy_zone_factor, mixture, profile)
+
+    print(f'{zc.core_eos} / {mixture.components if args.wet else zc.mantle_eos}')
+    print(
+        f'{"levels":>7s} {"loop [ms]":>10s} {"batched [ms]":>13s} {"speed-up":>9s} {"max rel":>9s}'
+    )
+    for n in args.levels:
+        s = _structure(n)
+        t_loop, (rho_loop, _) = _best_of(
+            lambda: _per_node(s, *eos, zc.mushy_zone_factor, mixture, profile), args.repeat
+        )
+        t_batch, (rho_batch, _) = _best_of(
+            lambda: _rebuild_columns_on_temperature(
+                s['radii'],
+                s['pressure'],
+                s['density'],
+                s['cmb_index'],
+                s['temperature_arrays'],
+                *eos,
+                mushy_zone_factor=zc.mushy_zone_factor,
+                mantle_mixture=mixture,
+                volatile_profile=profile,
+            ),
+            args.repeat,
+        )
+        rel = np.max(np.abs(rho_batch - rho_loop) / np.abs(rho_loop))
+        print(
+            f'{n:7d} {t_loop * 1e3:10.2f} {t_batch * 1e3:13.2f} '
+            f'{t_loop / t_batch:8.1f}x {rel:9.1e}'
+        )
+
+
+if __name__ == '__main__':
+    main()
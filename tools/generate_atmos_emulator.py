@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+"""Generate a table for the tabulated atmosphere emulator.
+
+Solves a design of atmosphere states with the AGNI or JANUS settings of a
+PROTEUS config, in parallel, and writes the converged solves to a table that
+``atmos_clim.module = "emulator"`` interpolates (see
+``proteus.atmos_clim.emulator``). The design holds every corner of the domain
+with every pure gas, plus a Latin hypercube of interior states.
+
+Give equal bounds to hold an axis fixed; runs using the table must then have
+that value. The spectral file, surface state, stellar spectrum and escape
+level of the config are fixed in the table.
+
+Usage
+-----
+    python tools/generate_atmos_emulator.py input/minimal.toml table.npz \\
+        --gases H2O CO2 --T_magma 1500 3500 --P_surf 1 1000 \\
+        --F_ins 100 10000 --gravity 9.81 9.81 --samples 400 --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+
+from proteus.atmos_clim.emulator import INPUT_KEYS, design_points, generate_table
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('config', help='PROTEUS config with the solver settings')
+    parser.add_argument('output', help='table to write (.npz)')
+    parser.add_argument('--gases', nargs='+', required=True, help='gases to tabulate')
+    for key, unit in zip(INPUT_KEYS, ('K', 'bar', 'W m-2', 'm s-2')):
+        parser.add_argument(
+            f'--{key}',
+            nargs=2,
+            type=float,
+            required=True,
+            metavar=('LOW', 'HIGH'),
+            help=f'bounds of {key} [{unit}]',
+        )
+    parser.add_argument('--samples', type=int, default=200, help='interior samples')
+    parser.add_argument('--seed', type=int, default=0, help='Latin hypercube seed')
+    parser.add_argument('--workers', type=int, default=1, help='processes; 0 for one per core')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s %(message)s')
+
+    bounds = {key: tuple(getattr(args, key)) for key in INPUT_KEYS}
+    design = design_points(bounds, args.gases, args.samples, seed=args.seed)
+    table = generate_table(args.config, design, args.gases, args.output, workers=args.workers)
+    print(f'Tabulated {len(table.points)} of {len(design)} states into {args.output}')
+
+
+if __name__ == '__main__':
+    main()
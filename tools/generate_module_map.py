@@ -53,6 +53,11 @@ DISPATCH_SITES = [
             'agni': ('atmos_clim/agni.py', 'run_agni', 'Radiative-convective solver (Julia)'),
             'janus': ('atmos_clim/janus.py', 'RunJANUS', 'Convective adiabat profile'),
             'dummy': ('atmos_clim/dummy.py', 'RunDummyAtm', 'Grey-body placeholder'),
+            'emulator': (
+                'atmos_clim/emulator.py',
+                'run_emulator',
+                'Interpolated table of AGNI/JANUS solves',
+            ),
         },
     },
     {
@@ -268,7 +273,12 @@ def scan_compared_options(path: Path, dotted: tuple[str, str]) -> set:
     def is_target(node) -> bool:
         if isinstance(node, ast.Name) and node.id in aliases:
             return True
-        if isinstance(node, ast.Call) and node.args:  # str(config.x.module)
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id == 'str'
+            and node.args
+        ):  # str(config.x.module)
             return is_target(node.args[0])
         if not isinstance(node, ast.Attribute):
             return False